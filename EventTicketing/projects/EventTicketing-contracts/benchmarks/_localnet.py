@@ -0,0 +1,146 @@
+# benchmarks/_localnet.py
+# Benchmark betiklerinin ortak LocalNet kurulum yardımcıları.
+
+from __future__ import annotations
+
+import statistics
+import time
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+
+from algokit_utils import (
+    AlgoAmount,
+    AlgorandClient,
+    AssetOptInParams,
+    PaymentParams,
+    SigningAccount,
+)
+
+from smart_contracts.artifacts.event_ticketing.event_ticketing_client import (
+    EventTicketingClient,
+    EventTicketingFactory,
+)
+from smart_contracts.event_ticketing.deploy_config import app_funding, fund_and_mint
+
+
+def localnet() -> AlgorandClient:
+    """LocalNet'e bağlı AlgorandClient döndürür."""
+    return AlgorandClient.default_localnet()
+
+
+def funded_account(algorand: AlgorandClient, algos: float = 10) -> SigningAccount:
+    """Rastgele bir hesap oluşturur ve LocalNet dispenser'ından fonlar."""
+    account = algorand.account.random()
+    algorand.account.ensure_funded(
+        account_to_fund=account.address,
+        dispenser_account=algorand.account.localnet_dispenser().address,
+        min_spending_balance=AlgoAmount.from_algo(algos),
+    )
+    return account
+
+
+def deploy_event(
+    algorand: AlgorandClient,
+    deployer: SigningAccount,
+    *,
+    name: str = "Benchmark Etkinliği",
+    price: int = 1_000,
+    total: int = 1_000,
+    max_per_address: int = 0,
+) -> EventTicketingClient:
+    """Yeni bir EventTicketing uygulaması oluşturur, fonlar ve biletleri basar."""
+    # Fonlama giriş bit haritası MBR'sini de içerdiğinden büyük etkinlikler için dağıtıcıyı tamamla
+    algorand.account.ensure_funded(
+        account_to_fund=deployer.address,
+        dispenser_account=algorand.account.localnet_dispenser().address,
+        min_spending_balance=AlgoAmount.from_micro_algo(app_funding(total, price).micro_algo + 1_000_000),
+    )
+    factory = algorand.client.get_typed_app_factory(EventTicketingFactory, default_sender=deployer.address)
+    client, _ = factory.send.create.create_application(args=(name, price, total, max_per_address))
+    fund_and_mint(client, deployer.signer, total, price)
+    return client
+
+
+def opt_in(algorand: AlgorandClient, account: SigningAccount, client: EventTicketingClient) -> None:
+    """Alıcıyı bilet ASA'sına opt-in yapar."""
+    algorand.send.asset_opt_in(
+        AssetOptInParams(sender=account.address, asset_id=client.state.global_state.sale_params.ticket_asa_id)
+    )
+
+
+def funded_accounts(algorand: AlgorandClient, n: int, algos: float = 1) -> list[SigningAccount]:
+    """n rastgele hesabı 16'lık ödeme gruplarıyla fonlar."""
+    dispenser = algorand.account.localnet_dispenser()
+    accounts = [algorand.account.random() for _ in range(n)]
+    for start in range(0, n, 16):
+        group = algorand.new_group()
+        for account in accounts[start : start + 16]:
+            group.add_payment(
+                PaymentParams(sender=dispenser.address, receiver=account.address, amount=AlgoAmount.from_algo(algos))
+            )
+        group.send()
+    return accounts
+
+
+def opt_in_all(algorand: AlgorandClient, accounts: list[SigningAccount], client: EventTicketingClient) -> None:
+    """Hesapları 16'lık gruplarla bilet ASA'sına opt-in yapar."""
+    asset_id = client.state.global_state.sale_params.ticket_asa_id
+    for start in range(0, len(accounts), 16):
+        group = algorand.new_group()
+        for account in accounts[start : start + 16]:
+            group.add_asset_opt_in(AssetOptInParams(sender=account.address, asset_id=asset_id))
+        group.send()
+
+
+def buyer_client(client: EventTicketingClient, buyer: SigningAccount) -> EventTicketingClient:
+    """Aynı uygulama için alıcıyı varsayılan imzalayıcı yapan bir client kopyası döndürür."""
+    return client.clone(default_sender=buyer.address, default_signer=buyer.signer)
+
+
+# --------------------------------------------------------------------
+# Ölçüm yardımcıları
+# --------------------------------------------------------------------
+@contextmanager
+def stopwatch() -> Iterator[Callable[[], float]]:
+    """`with stopwatch() as elapsed:` bloğu; elapsed() geçen saniyeyi döndürür."""
+    start = time.perf_counter()
+    end: float | None = None
+
+    def elapsed() -> float:
+        return (end if end is not None else time.perf_counter()) - start
+
+    try:
+        yield elapsed
+    finally:
+        end = time.perf_counter()
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """Basit yüzdelik (nearest-rank)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def print_table(headers: Sequence[str], rows: Sequence[Sequence[object]]) -> None:
+    """Sonuçları hizalı bir tablo olarak yazdırır."""
+    cells = [[str(h) for h in headers], *[[_fmt(c) for c in row] for row in rows]]
+    widths = [max(len(r[i]) for r in cells) for i in range(len(headers))]
+    for n, row in enumerate(cells):
+        print("  ".join(c.ljust(w) for c, w in zip(row, widths, strict=True)))
+        if n == 0:
+            print("  ".join("-" * w for w in widths))
+
+
+def _fmt(value: object) -> str:
+    if isinstance(value, float):
+        return f"{value:,.2f}"
+    if isinstance(value, int):
+        return f"{value:,}"
+    return str(value)
+
+
+def mean(samples: Sequence[float]) -> float:
+    return statistics.fmean(samples) if samples else 0.0
@@ -0,0 +1,112 @@
+# benchmarks/analytics.py
+# Sütunlu satış analizleri: sentetik 10 milyon satış üzerinde saatlik gelir,
+# satış eğrisi ve tükenme süresi; saatlik gelir için Python döngüsü karşılaştırması.
+# LocalNet gerekmez.
+#
+# Kullanım:
+#   poetry run python -m benchmarks.analytics --sales 10000000 --apps 5000
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+from collections import defaultdict
+from pathlib import Path
+
+import numpy as np
+
+from benchmarks._localnet import print_table, stopwatch
+from smart_contracts.event_ticketing.analytics import (
+    SECONDS_PER_HOUR,
+    SalesColumns,
+    revenue_by_hour,
+    sell_through,
+    time_to_sellout,
+    top_buyers,
+    write_csv,
+    write_parquet,
+)
+
+FIRST_ROUND = 40_000_000
+SECONDS_PER_ROUND = 3
+# Python döngüsü karşılaştırması bu kadar satırla sınırlı (sonra ölçeklenir)
+LOOP_SAMPLE = 1_000_000
+
+
+def _synthetic(n: int, apps: int, buyers: int) -> tuple[SalesColumns, dict[int, int]]:
+    rng = np.random.default_rng(42)
+    round_ = np.sort(rng.integers(FIRST_ROUND, FIRST_ROUND + n // 20, n))
+    count = np.where(rng.random(n) < 0.9, 1, rng.integers(2, 9, n))
+    app_id = 1_000 + rng.integers(0, apps, n)
+    price = 1_000_000 + (app_id % 50) * 100_000
+    sales = SalesColumns(
+        round=round_,
+        app_id=app_id,
+        amount=count * price,
+        count=count,
+        timestamp=1_700_000_000 + (round_ - FIRST_ROUND) * SECONDS_PER_ROUND,
+        buyer_id=rng.integers(0, buyers, n),
+        buyers=np.array([f"B{i}" for i in range(buyers)]),
+    )
+    # Etkinliklerin yaklaşık yarısı tükensin
+    sold = np.bincount(app_id - 1_000, weights=count, minlength=apps).astype(np.int64)
+    totals = {1_000 + i: int(s if i % 2 else s + 100) for i, s in enumerate(sold)}
+    return sales, totals
+
+
+def _revenue_by_hour_loop(sales: SalesColumns, n: int) -> dict[tuple[int, int], int]:
+    revenue: dict[tuple[int, int], int] = defaultdict(int)
+    app_ids, stamps, amounts = sales.app_id[:n].tolist(), sales.timestamp[:n].tolist(), sales.amount[:n].tolist()
+    for app_id, ts, amount in zip(app_ids, stamps, amounts, strict=True):
+        revenue[(app_id, ts // SECONDS_PER_HOUR)] += amount
+    return revenue
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="NumPy satış analizleri ölçümü")
+    parser.add_argument("--sales", type=int, default=10_000_000)
+    parser.add_argument("--apps", type=int, default=5_000)
+    parser.add_argument("--buyers", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    with stopwatch() as elapsed:
+        sales, totals = _synthetic(args.sales, args.apps, args.buyers)
+    print(f"\n{args.sales:,} sentetik satış üretildi: {elapsed():.2f} sn\n")
+
+    rows: list[list[object]] = []
+    for name, run in (
+        ("revenue_by_hour", lambda: revenue_by_hour(sales)),
+        ("sell_through", lambda: sell_through(sales, totals)),
+        ("time_to_sellout", lambda: time_to_sellout(sales, totals)),
+        ("top_buyers(10)", lambda: top_buyers(sales)),
+    ):
+        with stopwatch() as elapsed:
+            table = run()
+        rows.append([name, elapsed(), args.sales / elapsed(), len(next(iter(table.values())))])
+
+    sample = min(LOOP_SAMPLE, args.sales)
+    with stopwatch() as elapsed:
+        _revenue_by_hour_loop(sales, sample)
+    loop_seconds = elapsed() * args.sales / sample
+    loop_name = f"revenue_by_hour (Python döngüsü, {sample:,} satırdan ölçekli)"
+    rows.append([loop_name, loop_seconds, args.sales / loop_seconds, ""])
+    print_table(["analiz", "sn", "satış/sn", "sonuç satırı"], rows)
+
+    out = Path(tempfile.mkdtemp())
+    sellout = time_to_sellout(sales, totals)
+    export_rows: list[list[object]] = []
+    with stopwatch() as elapsed:
+        write_csv(sellout, out / "sellout.csv")
+    export_rows.append(["CSV", elapsed()])
+    try:
+        with stopwatch() as elapsed:
+            write_parquet(sellout, out / "sellout.parquet")
+        export_rows.append(["Parquet", elapsed()])
+    except ImportError as e:
+        export_rows.append(["Parquet", str(e)])
+    print(f"\ntime_to_sellout dışa aktarma ({len(sellout['app_id']):,} satır, {out})\n")
+    print_table(["biçim", "sn"], export_rows)
+
+
+if __name__ == "__main__":
+    main()
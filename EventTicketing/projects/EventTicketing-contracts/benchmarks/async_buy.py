@@ -0,0 +1,146 @@
+# benchmarks/async_buy.py
+# AsyncEventTicketingClient ile eşzamanlı bilet alımı: 1 / 100 / 1000 eşzamanlı
+# görevde onaylanan alım/sn ve gecikme; aynı yük için senkron client + iş
+# parçacığı havuzu (mevcut geçici çözüm) karşılaştırması. Her eşzamanlılık
+# düzeyi kendi alıcılarıyla yeni bir etkinlikte çalışır.
+#
+# Kullanım (LocalNet açık olmalı):
+#   poetry run python -m benchmarks.async_buy --buys 1000 --concurrency 1 100 1000
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+from algokit_utils import AlgoAmount, AlgorandClient, CommonAppCallParams, PaymentParams, SigningAccount
+
+from benchmarks._localnet import (
+    buyer_client,
+    deploy_event,
+    funded_account,
+    funded_accounts,
+    localnet,
+    mean,
+    opt_in_all,
+    percentile,
+    print_table,
+    stopwatch,
+)
+from smart_contracts.artifacts.event_ticketing.event_ticketing_client import EventTicketingClient
+from smart_contracts.event_ticketing.async_algod import AsyncAlgodClient
+from smart_contracts.event_ticketing.async_client import AsyncEventTicketingClient
+
+TICKET_PRICE = 1_000
+INNER_FEE = AlgoAmount.from_micro_algo(1_000)
+
+
+def _payment(client: EventTicketingClient | AsyncEventTicketingClient, buyer: str, tag: str) -> PaymentParams:
+    # Aynı round'da aynı alıcının özdeş işlemleri çakışmasın diye not benzersiz
+    return PaymentParams(
+        sender=buyer,
+        receiver=client.app_address,
+        amount=AlgoAmount.from_micro_algo(TICKET_PRICE),
+        note=tag.encode(),
+    )
+
+
+def _prepare(
+    algorand: AlgorandClient, deployer: SigningAccount, buys: int, workers: int
+) -> tuple[EventTicketingClient, list[SigningAccount]]:
+    client = deploy_event(algorand, deployer, price=TICKET_PRICE, total=buys)
+    accounts = funded_accounts(algorand, min(workers, buys))
+    opt_in_all(algorand, accounts, client)
+    return client, accounts
+
+
+async def _async_run(
+    algod: AsyncAlgodClient, client: EventTicketingClient, accounts: list[SigningAccount], buys: int
+) -> tuple[float, list[float]]:
+    tickets = iter(range(buys))
+    latencies: list[float] = []
+
+    async def worker(account: SigningAccount) -> None:
+        buyer = AsyncEventTicketingClient(
+            algod, client.app_id, default_sender=account.address, default_signer=account.signer
+        )
+        for n in tickets:
+            start = time.perf_counter()
+            # Bilet ASA'sı ve alıcı kutusu referanslarını client ekler
+            await buyer.send.buy_ticket(
+                args=(_payment(buyer, account.address, f"async-{n}"),),
+                params=CommonAppCallParams(extra_fee=INNER_FEE),
+            )
+            latencies.append(time.perf_counter() - start)
+
+    with stopwatch() as elapsed:
+        await asyncio.gather(*(worker(a) for a in accounts))
+    return elapsed(), latencies
+
+
+def _threaded_run(client: EventTicketingClient, accounts: list[SigningAccount], buys: int) -> tuple[float, list[float]]:
+    clients = [buyer_client(client, a) for a in accounts]
+    counter: Iterator[int] = itertools.count()
+    latencies: list[float] = []
+
+    def worker(buyer: EventTicketingClient, account: SigningAccount) -> None:
+        while (n := next(counter)) < buys:
+            start = time.perf_counter()
+            buyer.send.buy_ticket(
+                args=(buyer.algorand.create_transaction.payment(_payment(buyer, account.address, f"thread-{n}")),),
+                params=CommonAppCallParams(extra_fee=INNER_FEE),
+            )
+            latencies.append(time.perf_counter() - start)
+
+    with stopwatch() as elapsed, ThreadPoolExecutor(max_workers=len(accounts)) as pool:
+        for future in [pool.submit(worker, c, a) for c, a in zip(clients, accounts, strict=True)]:
+            future.result()
+    return elapsed(), latencies
+
+
+def _row(name: str, concurrency: int, seconds: float, latencies: list[float]) -> list[object]:
+    return [
+        name,
+        concurrency,
+        len(latencies),
+        len(latencies) / seconds if seconds else 0.0,
+        mean(latencies) * 1_000,
+        percentile(latencies, 95) * 1_000,
+    ]
+
+
+async def _async_level(
+    algorand: AlgorandClient, client: EventTicketingClient, accounts: list[SigningAccount], buys: int
+) -> tuple[float, list[float]]:
+    async with AsyncAlgodClient.from_algod(algorand.client.algod, max_connections=len(accounts)) as algod:
+        return await _async_run(algod, client, accounts, buys)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Async client ile eşzamanlı bilet alımı")
+    parser.add_argument("--buys", type=int, default=1_000, help="her düzey ve yol için alım sayısı")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 100, 1_000])
+    parser.add_argument("--skip-threads", action="store_true", help="iş parçacığı havuzu karşılaştırmasını atla")
+    args = parser.parse_args()
+
+    algorand = localnet()
+    deployer = funded_account(algorand, 100)
+    rows: list[list[object]] = []
+    for concurrency in args.concurrency:
+        print(f"{concurrency} eşzamanlı görev: etkinlik ve {min(concurrency, args.buys)} alıcı hazırlanıyor...")
+        client, accounts = _prepare(algorand, deployer, args.buys, concurrency)
+        seconds, latencies = asyncio.run(_async_level(algorand, client, accounts, args.buys))
+        rows.append(_row("asyncio", concurrency, seconds, latencies))
+        if not args.skip_threads:
+            client, accounts = _prepare(algorand, deployer, args.buys, concurrency)
+            rows.append(_row("iş parçacığı havuzu", concurrency, *_threaded_run(client, accounts, args.buys)))
+
+    print(f"\nDüzey başına {args.buys} alım (buy_ticket, pay + app call)\n")
+    print_table(["yol", "eşzamanlı", "alım", "alım/sn", "ort. gecikme (ms)", "p95 (ms)"], rows)
+
+
+if __name__ == "__main__":
+    main()
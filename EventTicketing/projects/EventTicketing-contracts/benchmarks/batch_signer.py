@@ -0,0 +1,116 @@
+# benchmarks/batch_signer.py
+# Çevrimdışı toplu imzalama: 8 alıcılı (16 işlemlik) pay + buy_ticket grupları
+# EventTicketingComposer ile kurulur; AccountTransactionSigner ile tek tek imzalama
+# ile BatchSigner'ın farklı işçi sayılarındaki imza/sn değerleri karşılaştırılır.
+# Gruplar sabit suggested params ile kurulduğundan LocalNet gerekmez.
+#
+# Kullanım:
+#   poetry run python -m benchmarks.batch_signer --groups 2000 --workers 0 1 2 4 8
+
+from __future__ import annotations
+
+import argparse
+import base64
+import math
+import os
+
+from algokit_utils import AlgoAmount, AlgorandClient, CommonAppCallParams, PaymentParams
+from algosdk import account, encoding
+from algosdk.atomic_transaction_composer import AccountTransactionSigner, TransactionWithSigner
+from algosdk.transaction import SuggestedParams, Transaction
+from algosdk.v2client.algod import AlgodClient
+
+from benchmarks._localnet import print_table, stopwatch
+from smart_contracts.artifacts.event_ticketing.event_ticketing_client import EventTicketingClient
+from smart_contracts.event_ticketing.batch_signer import BatchSigner, unsigned_group
+from smart_contracts.event_ticketing.ledger import purchase_box_name
+
+APP_ID = 1_000
+ASA_ID = 1_001
+BUYERS_PER_GROUP = 8
+
+
+def _offline_client() -> EventTicketingClient:
+    algorand = AlgorandClient.from_clients(AlgodClient("a" * 64, "http://127.0.0.1:1"))
+    sp = SuggestedParams(0, 1, 1_001, base64.b64encode(bytes(32)).decode(), min_fee=1_000, flat_fee=False)
+    algorand.set_suggested_params_cache(sp, until=math.inf)
+    return EventTicketingClient(app_id=APP_ID, algorand=algorand)
+
+
+def _build(groups: int, keys: list[str]) -> list[list[Transaction]]:
+    client = _offline_client()
+    signers = [(account.address_from_private_key(k), AccountTransactionSigner(k)) for k in keys]
+    built = []
+    for n in range(groups):
+        group = client.new_group()
+        for i in range(BUYERS_PER_GROUP):
+            sender, signer = signers[(n * BUYERS_PER_GROUP + i) % len(signers)]
+            payment = client.algorand.create_transaction.payment(
+                PaymentParams(
+                    sender=sender,
+                    receiver=client.app_address,
+                    amount=AlgoAmount.from_micro_algo(1_000),
+                    note=f"{n}:{i}".encode(),
+                )
+            )
+            group.buy_ticket(
+                args=(TransactionWithSigner(payment, signer),),
+                params=CommonAppCallParams(
+                    sender=sender,
+                    signer=signer,
+                    note=f"{n}:{i}".encode(),
+                    # Çevrimdışı kurulumda simulate yok; referanslar elle verilir
+                    asset_references=[ASA_ID],
+                    box_references=[purchase_box_name(sender)],
+                ),
+            )
+        built.append(unsigned_group(group))
+    return built
+
+
+def _sequential(groups: list[list[Transaction]], keys: list[str]) -> float:
+    # Mevcut yol: her işlem AccountTransactionSigner ile tek çekirdekte
+    signers = {account.address_from_private_key(k): AccountTransactionSigner(k) for k in keys}
+    with stopwatch() as elapsed:
+        for group in groups:
+            blob = b""
+            for txn in group:
+                (signed,) = signers[txn.sender].sign_transactions([txn], [0])
+                blob += base64.b64decode(encoding.msgpack_encode(signed))
+    return elapsed()
+
+
+def _batched(groups: list[list[Transaction]], keys: list[str], workers: int, chunk: int) -> float:
+    # İşçilerin başlatılması (anahtar yükleme dahil) ölçüme dahil
+    with stopwatch() as elapsed, BatchSigner(keys, workers=workers, chunk_groups=chunk) as signer:
+        for _ in signer.sign_groups(groups):
+            pass
+    return elapsed()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Süreç havuzuyla çevrimdışı toplu imzalama")
+    parser.add_argument("--groups", type=int, default=2_000)
+    parser.add_argument("--accounts", type=int, default=1_000, help="farklı imzalayan hesap sayısı")
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 1, 2, 4, os.cpu_count() or 1])
+    parser.add_argument("--chunk", type=int, default=32, help="görev başına grup")
+    args = parser.parse_args()
+
+    keys = [account.generate_account()[0] for _ in range(args.accounts)]
+    print(f"{args.groups} grup kuruluyor ({args.groups * BUYERS_PER_GROUP * 2} işlem)...")
+    groups = _build(args.groups, keys)
+    signatures = sum(len(g) for g in groups)
+
+    base = _sequential(groups, keys)
+    rows: list[list[object]] = [["AccountTransactionSigner (sıralı)", "-", signatures / base, 1.0]]
+    for workers in sorted(set(args.workers)):
+        seconds = _batched(groups, keys, workers, args.chunk)
+        name = "BatchSigner (süreç içi)" if workers == 0 else "BatchSigner"
+        rows.append([name, workers, signatures / seconds, base / seconds])
+
+    print(f"\n{signatures} imza, {os.cpu_count()} çekirdek\n")
+    print_table(["yol", "işçi", "imza/sn", "hızlanma"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+# benchmarks/bulk_buy.py
+# BulkBuyer yük testi: N alıcı için 16 işlemlik gruplar, eşzamanlı gönderim,
+# sonunda onaylanan bilet/sn raporu.
+#
+# Kullanım (LocalNet açık olmalı):
+#   poetry run python -m benchmarks.bulk_buy --buyers 800 --workers 8 --in-flight 16
+
+from __future__ import annotations
+
+import argparse
+
+from benchmarks._localnet import deploy_event, funded_account, funded_accounts, localnet, opt_in_all
+from smart_contracts.event_ticketing.bulk_buy import BulkBuyer, Buyer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="BulkBuyer yük testi")
+    parser.add_argument("--buyers", type=int, default=800)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--in-flight", type=int, default=16)
+    args = parser.parse_args()
+
+    algorand = localnet()
+    deployer = funded_account(algorand, 10)
+    client = deploy_event(algorand, deployer, total=args.buyers)
+
+    print(f"{args.buyers} alıcı fonlanıyor ve opt-in yapılıyor...")
+    accounts = funded_accounts(algorand, args.buyers)
+    opt_in_all(algorand, accounts, client)
+
+    bulk = BulkBuyer(client, workers=args.workers, max_in_flight=args.in_flight)
+    failed = 0
+    for result in bulk.run(Buyer.from_account(a) for a in accounts):
+        if not result.ok:
+            failed += 1
+            if failed <= 5:
+                print(f"  başarısız: {result.buyer.address} -> {result.error}")
+
+    print(f"\n{bulk.report}")
+    print(f"Satılan (global state): {client.state.global_state.tickets_sold}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+# benchmarks/buy_tickets.py
+# buy_ticket (bilet başına pay + app call) ile buy_tickets (tek pay + tek app call)
+# yollarını ücret, opcode maliyeti ve onaylanan bilet/sn açısından karşılaştırır.
+#
+# Kullanım (LocalNet açık olmalı):
+#   poetry run python -m benchmarks.buy_tickets --seats 6 --orders 20
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+
+from algokit_utils import AlgoAmount, CommonAppCallParams, PaymentParams, SigningAccount
+
+from benchmarks._localnet import (
+    buyer_client,
+    deploy_event,
+    funded_account,
+    localnet,
+    opt_in,
+    print_table,
+    stopwatch,
+)
+from smart_contracts.artifacts.event_ticketing.event_ticketing_client import (
+    EventTicketingClient,
+    EventTicketingComposer,
+)
+
+TICKET_PRICE = 1_000
+# Inner AssetTransfer ücreti dış çağrıdan havuzlanır
+INNER_FEE = AlgoAmount.from_micro_algo(1_000)
+
+
+def _single_group(client: EventTicketingClient, buyer: SigningAccount, seats: int, tag: str) -> EventTicketingComposer:
+    """Her koltuk için ayrı pay + buy_ticket çifti (mevcut yol)."""
+    group = client.new_group()
+    for i in range(seats):
+        payment = client.algorand.create_transaction.payment(
+            PaymentParams(
+                sender=buyer.address,
+                receiver=client.app_address,
+                amount=AlgoAmount.from_micro_algo(TICKET_PRICE),
+                note=f"{tag}-pay-{i}".encode(),
+            )
+        )
+        group.buy_ticket(
+            args=(payment,),
+            params=CommonAppCallParams(extra_fee=INNER_FEE, note=f"{tag}-buy-{i}".encode()),
+        )
+    return group
+
+
+def _batched_group(client: EventTicketingClient, buyer: SigningAccount, seats: int, tag: str) -> EventTicketingComposer:
+    """Tek pay + tek buy_tickets çağrısı (toplu yol)."""
+    payment = client.algorand.create_transaction.payment(
+        PaymentParams(
+            sender=buyer.address,
+            receiver=client.app_address,
+            amount=AlgoAmount.from_micro_algo(TICKET_PRICE * seats),
+            note=f"{tag}-pay".encode(),
+        )
+    )
+    return client.new_group().buy_tickets(
+        args=(payment, seats),
+        params=CommonAppCallParams(extra_fee=INNER_FEE, note=f"{tag}-buy".encode()),
+    )
+
+
+GroupBuilder = Callable[[EventTicketingClient, SigningAccount, int, str], EventTicketingComposer]
+
+
+def _run(
+    name: str, build: GroupBuilder, client: EventTicketingClient, buyer: SigningAccount, args: argparse.Namespace
+) -> list[object]:
+    # Opcode maliyeti ve işlem sayısı simulate ile ölçülür
+    sim = build(client, buyer, args.seats, f"{name}-sim").simulate(allow_unnamed_resources=True)
+    group = sim.simulate_response["txn-groups"][0]
+    budget = group["app-budget-consumed"]
+    txn_count = len(group["txn-results"])
+
+    fees = 0
+    with stopwatch() as elapsed:
+        for order in range(args.orders):
+            result = build(client, buyer, args.seats, f"{name}-{order}").send()
+            fees += sum(c["txn"]["txn"].get("fee", 0) for c in result.confirmations)
+    seconds = elapsed()
+
+    tickets = args.orders * args.seats
+    return [name, txn_count, budget, fees // args.orders, tickets / seconds if seconds else 0.0]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="buy_ticket vs buy_tickets karşılaştırması")
+    parser.add_argument("--seats", type=int, default=6, help="sipariş başına koltuk (<= 8)")
+    parser.add_argument("--orders", type=int, default=20, help="her yol için gönderilecek sipariş sayısı")
+    args = parser.parse_args()
+
+    algorand = localnet()
+    deployer = funded_account(algorand, 50)
+    buyer = funded_account(algorand, 50)
+
+    # Her iki yol + simulate çağrıları için yeterli arz
+    total = 2 * (args.orders + 1) * args.seats
+    client = deploy_event(algorand, deployer, price=TICKET_PRICE, total=total)
+    opt_in(algorand, buyer, client)
+    client = buyer_client(client, buyer)
+
+    rows = [
+        _run("buy_ticket", _single_group, client, buyer, args),
+        _run("buy_tickets", _batched_group, client, buyer, args),
+    ]
+    print(f"\nSipariş başına {args.seats} koltuk, yol başına {args.orders} sipariş\n")
+    print_table(["yol", "txn/sipariş", "opcode", "ücret (µAlgo)/sipariş", "bilet/sn"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+# benchmarks/costs.py
+# Her ABI metodu için opcode bütçesi, inner işlem sayısı, ücret ve program boyutu
+# regresyon takibi. Senaryolar simulate ile çalıştırılır (zincire yazılmaz);
+# sonuçlar benchmarks/cost_baseline.json ile karşılaştırılır.
+#
+# Kullanım (LocalNet açık olmalı):
+#   poetry run python -m benchmarks.costs                 # baseline ile karşılaştır
+#   poetry run python -m benchmarks.costs --update        # baseline'ı yeniden yaz
+#   poetry run python -m benchmarks.costs --threshold 0.1 # %10 tolerans
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from algokit_utils import (
+    AlgoAmount,
+    AlgorandClient,
+    CommonAppCallCreateParams,
+    CommonAppCallParams,
+    PaymentParams,
+    SendAtomicTransactionComposerResults,
+    SigningAccount,
+)
+
+from benchmarks._localnet import buyer_client, deploy_event, funded_account, localnet, opt_in, print_table
+from smart_contracts.artifacts.event_ticketing.event_ticketing_client import (
+    EventTicketingClient,
+    EventTicketingFactory,
+)
+from smart_contracts.event_ticketing.checkin import checkin_box_references
+from smart_contracts.event_ticketing.deploy_config import app_funding
+
+BASELINE_PATH = Path(__file__).parent / "cost_baseline.json"
+DEFAULT_THRESHOLD = 0.05
+TICKET_PRICE = 1_000
+BATCH_SEATS = 6
+INNER_FEE = AlgoAmount.from_micro_algo(1_000)
+
+Metrics = dict[str, int]
+Costs = dict[str, Metrics]
+
+
+def _count_inner(txn_result: dict[str, Any]) -> int:
+    inner = txn_result.get("inner-txns", [])
+    return len(inner) + sum(_count_inner(i) for i in inner)
+
+
+def _group_metrics(result: SendAtomicTransactionComposerResults) -> Metrics:
+    group = result.simulate_response["txn-groups"][0]
+    txn_results = [r["txn-result"] for r in group["txn-results"]]
+    return {
+        "opcode_budget": int(group.get("app-budget-consumed", 0)),
+        "inner_txns": sum(_count_inner(r) for r in txn_results),
+        "fees": sum(int(r["txn"]["txn"].get("fee", 0)) for r in txn_results),
+        "txns": len(txn_results),
+    }
+
+
+def _simulate(composer: Any) -> SendAtomicTransactionComposerResults:  # noqa: ANN401 - iki composer türü
+    return composer.simulate(allow_unnamed_resources=True)
+
+
+def _payment(client: EventTicketingClient, sender: str, amount: int, note: str) -> Any:  # noqa: ANN401
+    return client.algorand.create_transaction.payment(
+        PaymentParams(
+            sender=sender, receiver=client.app_address, amount=AlgoAmount.from_micro_algo(amount), note=note.encode()
+        )
+    )
+
+
+def measure_costs(algorand: AlgorandClient, deployer: SigningAccount) -> Costs:
+    """Tüm ABI metotlarını simulate eder ve metrikleri döndürür."""
+    factory = EventTicketingFactory(algorand, default_sender=deployer.address, default_signer=deployer.signer)
+    create_args = ("Maliyet Testi", TICKET_PRICE, 100, 0)
+
+    costs: Costs = {}
+    costs["create_application"] = _group_metrics(
+        _simulate(
+            algorand.new_group().add_app_create_method_call(
+                factory.params.create.create_application(args=create_args, params=CommonAppCallCreateParams())
+            )
+        )
+    )
+
+    # mint_tickets henüz basılmamış bir uygulamada simulate edilir
+    fresh, _ = factory.send.create.create_application(args=create_args)
+    algorand.send.payment(
+        PaymentParams(
+            sender=deployer.address, receiver=fresh.app_address, amount=app_funding(create_args[2], TICKET_PRICE)
+        )
+    )
+    costs["mint_tickets"] = _group_metrics(
+        _simulate(fresh.new_group().mint_tickets(params=CommonAppCallParams(extra_fee=INNER_FEE)))
+    )
+
+    # Satış metotları basılmış bir uygulamada, opt-in yapmış bir alıcıyla
+    client = deploy_event(algorand, deployer, price=TICKET_PRICE, total=100)
+    creator_client = client
+    buyer = funded_account(algorand, 5)
+    opt_in(algorand, buyer, client)
+    client = buyer_client(client, buyer)
+
+    scenarios: dict[str, Callable[[], SendAtomicTransactionComposerResults]] = {
+        "buy_ticket": lambda: _simulate(
+            client.new_group().buy_ticket(
+                args=(_payment(client, buyer.address, TICKET_PRICE, "cost-buy"),),
+                params=CommonAppCallParams(extra_fee=INNER_FEE),
+            )
+        ),
+        f"buy_tickets[{BATCH_SEATS}]": lambda: _simulate(
+            client.new_group().buy_tickets(
+                args=(_payment(client, buyer.address, TICKET_PRICE * BATCH_SEATS, "cost-buy-many"), BATCH_SEATS),
+                params=CommonAppCallParams(extra_fee=INNER_FEE),
+            )
+        ),
+        "get_sale_info": lambda: _simulate(client.new_group().get_sale_info()),
+        f"redeem_batch[{BATCH_SEATS}]": lambda: _simulate(
+            creator_client.new_group().redeem_batch(
+                args=(list(range(BATCH_SEATS)),),
+                params=CommonAppCallParams(box_references=checkin_box_references(100)),
+            )
+        ),
+    }
+    for name, run in scenarios.items():
+        costs[name] = _group_metrics(run())
+
+    app = algorand.app.get_by_id(client.app_id)
+    costs["program"] = {
+        "approval_bytes": len(app.approval_program),
+        "clear_bytes": len(app.clear_state_program),
+    }
+    return costs
+
+
+def compare(current: Costs, baseline: Costs, threshold: float) -> list[str]:
+    """Eşiği aşan artışları açıklayan satırlar döndürür (boş liste = regresyon yok)."""
+    regressions = []
+    for scenario, metrics in current.items():
+        for metric, value in metrics.items():
+            base = baseline.get(scenario, {}).get(metric)
+            if base is None:
+                continue
+            if value > base * (1 + threshold):
+                regressions.append(f"{scenario}.{metric}: {base} -> {value} (+{(value - base) / max(base, 1):.1%})")
+    return regressions
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> Costs | None:
+    return json.loads(path.read_text(encoding="utf-8")) if path.exists() else None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Opcode/ücret regresyon kontrolü")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="izin verilen göreli artış")
+    parser.add_argument("--update", action="store_true", help="baseline dosyasını mevcut sonuçlarla yeniden yaz")
+    args = parser.parse_args()
+
+    baseline = load_baseline(args.baseline)
+    if baseline is None and not args.update:
+        sys.exit(f"Baseline bulunamadı: {args.baseline}; '--update' ile oluşturun")
+
+    algorand = localnet()
+    current = measure_costs(algorand, funded_account(algorand, 20))
+
+    rows = []
+    for scenario, metrics in current.items():
+        for metric, value in metrics.items():
+            base = (baseline or {}).get(scenario, {}).get(metric)
+            rows.append([scenario, metric, "-" if base is None else base, value])
+    print_table(["senaryo", "metrik", "baseline", "şimdi"], rows)
+
+    if args.update or baseline is None:
+        args.baseline.write_text(json.dumps(current, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        print(f"\nBaseline yazıldı: {args.baseline}")
+        return
+
+    regressions = compare(current, baseline, args.threshold)
+    if regressions:
+        print(f"\nREGRESYON (eşik %{args.threshold * 100:.0f}):")
+        for line in regressions:
+            print(f"  {line}")
+        sys.exit(1)
+    print("\nRegresyon yok.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# benchmarks/deploy.py
+# Etkinlik başına deploy süresi: eski yol (create, ayrı fonlama, ayrı mint = 3 onay)
+# ile yeni yol (create + tek grupta fonlama/mint = 2 onay) karşılaştırması.
+#
+# Kullanım (LocalNet açık olmalı):
+#   poetry run python -m benchmarks.deploy --events 10
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from algokit_utils import AlgoAmount, AlgorandClient, CommonAppCallParams, PaymentParams, SigningAccount
+
+from benchmarks._localnet import funded_account, localnet, mean, percentile, print_table
+from smart_contracts.artifacts.event_ticketing.event_ticketing_client import EventTicketingFactory
+from smart_contracts.event_ticketing.checkin import checkin_box_references
+from smart_contracts.event_ticketing.deploy_config import (
+    MAX_PER_ADDRESS,
+    TICKET_PRICE,
+    TOTAL_TICKETS,
+    app_funding,
+    fund_and_mint,
+)
+
+
+def _separate(algorand: AlgorandClient, factory: EventTicketingFactory, deployer: SigningAccount, name: str) -> None:
+    client, _ = factory.send.create.create_application(args=(name, TICKET_PRICE, TOTAL_TICKETS, MAX_PER_ADDRESS))
+    algorand.send.payment(
+        PaymentParams(
+            sender=deployer.address, receiver=client.app_address, amount=app_funding(TOTAL_TICKETS, TICKET_PRICE)
+        )
+    )
+    client.send.mint_tickets(
+        params=CommonAppCallParams(
+            extra_fee=AlgoAmount.from_micro_algo(2_000), box_references=checkin_box_references(TOTAL_TICKETS)
+        )
+    )
+
+
+def _grouped(algorand: AlgorandClient, factory: EventTicketingFactory, deployer: SigningAccount, name: str) -> None:
+    client, _ = factory.send.create.create_application(args=(name, TICKET_PRICE, TOTAL_TICKETS, MAX_PER_ADDRESS))
+    fund_and_mint(client, deployer.signer, TOTAL_TICKETS, TICKET_PRICE)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Deploy süresi karşılaştırması")
+    parser.add_argument("--events", type=int, default=10, help="her yol için dağıtılacak etkinlik sayısı")
+    args = parser.parse_args()
+
+    algorand = localnet()
+    # Her etkinlik temel fonlama + alıcı kutusu MBR rezervi ister
+    deployer = funded_account(algorand, 10 + 2 * args.events * app_funding(TOTAL_TICKETS, TICKET_PRICE).algo)
+    factory = EventTicketingFactory(algorand, default_sender=deployer.address, default_signer=deployer.signer)
+
+    rows = []
+    for label, path in (("ayrı fonlama + mint", _separate), ("tek grup fonlama + mint", _grouped)):
+        samples = []
+        for i in range(args.events):
+            t0 = time.perf_counter()
+            path(algorand, factory, deployer, f"bench-{label}-{i}")
+            samples.append(time.perf_counter() - t0)
+        rows.append([label, mean(samples), percentile(samples, 50), percentile(samples, 99)])
+
+    print(f"\nEtkinlik başına deploy süresi (sn), yol başına {args.events} etkinlik\n")
+    print_table(["yol", "ortalama", "p50", "p99"], rows)
+
+
+if __name__ == "__main__":
+    main()
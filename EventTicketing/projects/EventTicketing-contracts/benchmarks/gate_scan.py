@@ -0,0 +1,110 @@
+# benchmarks/gate_scan.py
+# Kapı okutma servisi: bellekteki sahip dizininde sorgu/sn ile yeniden başlatma
+# süresi (indexer'dan tam tarama vs. anlık görüntü + eksik blokların uygulanması).
+#
+# Kullanım (LocalNet ve indexer açık olmalı):
+#   poetry run python -m benchmarks.gate_scan --buyers 400 --lookups 1000000
+
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Any
+
+from algosdk import account, encoding
+
+from benchmarks._localnet import (
+    deploy_event,
+    funded_account,
+    funded_accounts,
+    localnet,
+    opt_in_all,
+    print_table,
+    stopwatch,
+)
+from smart_contracts.event_ticketing.bulk_buy import BulkBuyer, Buyer
+from smart_contracts.event_ticketing.gate import GateScanService, HolderIndex
+
+
+def _rate(probe: Callable[[Any], bool], items: Sequence[Any], n: int) -> tuple[float, float]:
+    started = time.perf_counter()
+    for i in range(n):
+        probe(items[i % len(items)])
+    seconds = time.perf_counter() - started
+    return n / seconds, seconds / n * 1e6
+
+
+def _lookups(index: HolderIndex, addresses: list[str], n: int) -> list[list[object]]:
+    keys = [encoding.decode_address(a) for a in addresses]
+    return [
+        ["holds(adres)", *_rate(index.holds, addresses, n)],
+        ["holds_key(açık anahtar)", *_rate(index.holds_key, keys, n)],
+    ]
+
+
+def _wait_for_indexer(service: GateScanService, round_: int, timeout: float = 30) -> None:
+    indexer = service.client.algorand.client.indexer
+    deadline = time.monotonic() + timeout
+    while int(indexer.health()["round"]) < round_:
+        if time.monotonic() > deadline:
+            raise TimeoutError("Indexer LocalNet'e yetişemedi")
+        time.sleep(0.2)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Kapı okutma servisi ölçümü")
+    parser.add_argument("--buyers", type=int, default=400)
+    parser.add_argument("--lookups", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    algorand = localnet()
+    deployer = funded_account(algorand, 10)
+    client = deploy_event(algorand, deployer, total=args.buyers)
+
+    print(f"{args.buyers} alıcı fonlanıyor, opt-in yapılıyor ve bilet alıyor...")
+    accounts = funded_accounts(algorand, args.buyers)
+    opt_in_all(algorand, accounts, client)
+    half = len(accounts) // 2
+    for _ in BulkBuyer(client).run(Buyer.from_account(a) for a in accounts[:half]):
+        pass
+
+    snapshot = Path(tempfile.mkdtemp()) / "gate.snapshot"
+    service = GateScanService(client, snapshot_path=snapshot)
+    _wait_for_indexer(service, int(algorand.client.algod.status()["last-round"]))
+
+    with stopwatch() as full_scan:
+        service.load()
+    holders = len(service.index)
+
+    # Anlık görüntüden sonra satış sürer; yeniden başlatma eksik blokları uygular
+    for _ in BulkBuyer(client).run(Buyer.from_account(a) for a in accounts[half:]):
+        pass
+    restarted = GateScanService(client, snapshot_path=snapshot)
+    start_round = HolderIndex.load(snapshot).round
+    with stopwatch() as resume:
+        restarted.load()
+    caught_up = restarted.index.round - start_round
+
+    print(f"\nSahip: {holders} -> {len(restarted.index)}\n")
+    print_table(
+        ["yeniden başlatma", "sn"],
+        [
+            ["tam tarama (indexer)", full_scan()],
+            [f"anlık görüntü + {caught_up} blok", resume()],
+        ],
+    )
+
+    # Yarısı sahip, yarısı rastgele (sahip olmayan) adres
+    strangers = [account.generate_account()[1] for _ in range(len(accounts))]
+    probes = [a.address for a in accounts] + strangers
+    random.shuffle(probes)
+    print(f"\n{args.lookups:,} sorgu (%50 sahip)\n")
+    print_table(["sorgu", "sorgu/sn", "µs/sorgu"], _lookups(restarted.index, probes, args.lookups))
+
+
+if __name__ == "__main__":
+    main()
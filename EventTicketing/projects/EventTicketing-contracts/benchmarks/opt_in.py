@@ -0,0 +1,133 @@
+# benchmarks/opt_in.py
+# İlk kez alım yapanlar için opt-in karşılaştırması:
+#   1) doğrudan buy_ticket; reddedilirse opt-in ve yeniden deneme,
+#   2) her alımda opt-in sorgusu; gerekiyorsa ayrı bir opt-in işlemi,
+#   3) buy_with_opt_in: opt-in aynı atomik grupta, durum önbellekte.
+# Her yol yeni alıcılarla kendi etkinliğinde çalışır; aynı alıcılar ardından
+# ikinci bir alım yapar. Reddedilen gönderimler, alım başına gecikme ve algod
+# opt-in sorguları raporlanır.
+#
+# Kullanım (LocalNet açık olmalı):
+#   poetry run python -m benchmarks.opt_in --buyers 50
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import time
+from collections.abc import Callable
+
+from algokit_utils import AlgoAmount, AssetOptInParams, CommonAppCallParams, PaymentParams, SigningAccount
+from algosdk.error import AlgodHTTPError
+
+from benchmarks._localnet import deploy_event, funded_account, funded_accounts, localnet, mean, percentile, print_table
+from smart_contracts.artifacts.event_ticketing.event_ticketing_client import EventTicketingClient
+from smart_contracts.event_ticketing.bulk_buy import INNER_TXN_FEE, Buyer
+from smart_contracts.event_ticketing.opt_in import OptInCache, buy_with_opt_in
+
+TICKET_PRICE = 1_000
+
+
+@dataclasses.dataclass
+class _Counters:
+    rejected: int = 0
+    lookups: int = 0
+
+
+Purchase = Callable[[EventTicketingClient, Buyer, _Counters], None]
+
+
+def _plain_buy(client: EventTicketingClient, buyer: Buyer) -> None:
+    payment = client.algorand.create_transaction.payment(
+        PaymentParams(
+            sender=buyer.address,
+            receiver=client.app_address,
+            amount=AlgoAmount.from_micro_algo(TICKET_PRICE),
+            note=f"opt-in:{time.time_ns()}".encode(),
+        )
+    )
+    client.send.buy_ticket(
+        args=(payment,),
+        params=CommonAppCallParams(sender=buyer.address, signer=buyer.signer, extra_fee=INNER_TXN_FEE),
+    )
+
+
+def _send_opt_in(client: EventTicketingClient, buyer: Buyer, asset_id: int) -> None:
+    client.algorand.send.asset_opt_in(AssetOptInParams(sender=buyer.address, signer=buyer.signer, asset_id=asset_id))
+
+
+def _retry_after_rejection(client: EventTicketingClient, buyer: Buyer, counters: _Counters) -> None:
+    try:
+        _plain_buy(client, buyer)
+    except Exception:  # opt-in eksikliği nedeniyle reddedilen grup
+        counters.rejected += 1
+        _send_opt_in(client, buyer, client.state.global_state.sale_params.ticket_asa_id)
+        _plain_buy(client, buyer)
+
+
+def _check_every_time(client: EventTicketingClient, buyer: Buyer, counters: _Counters) -> None:
+    asset_id = client.state.global_state.sale_params.ticket_asa_id
+    counters.lookups += 1
+    try:
+        client.algorand.client.algod.account_asset_info(buyer.address, asset_id)
+    except AlgodHTTPError as e:
+        if e.code != 404:
+            raise
+        _send_opt_in(client, buyer, asset_id)
+    _plain_buy(client, buyer)
+
+
+def _bundled(cache: OptInCache) -> Purchase:
+    def purchase(client: EventTicketingClient, buyer: Buyer, counters: _Counters) -> None:
+        buy_with_opt_in(client, buyer, cache=cache)
+        counters.lookups = cache.stats.lookups
+
+    return purchase
+
+
+def _measure(client: EventTicketingClient, accounts: list[SigningAccount], purchase: Purchase) -> list[object]:
+    buyers = [Buyer.from_account(a) for a in accounts]
+    counters = _Counters()
+    latencies: dict[str, list[float]] = {"ilk": [], "tekrar": []}
+    for samples in latencies.values():
+        for buyer in buyers:
+            start = time.perf_counter()
+            purchase(client, buyer, counters)
+            samples.append(time.perf_counter() - start)
+    first, repeat = latencies["ilk"], latencies["tekrar"]
+    return [
+        f"%{counters.rejected / len(buyers) * 100:.1f}",
+        mean(first) * 1_000,
+        percentile(first, 95) * 1_000,
+        mean(repeat) * 1_000,
+        counters.lookups,
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="İlk alımda otomatik ASA opt-in ölçümü")
+    parser.add_argument("--buyers", type=int, default=50, help="yol başına yeni alıcı")
+    args = parser.parse_args()
+
+    algorand = localnet()
+    deployer = funded_account(algorand, 100)
+    paths: list[tuple[str, Purchase]] = [
+        ("reddedilince opt-in + yeniden dene", _retry_after_rejection),
+        ("her alımda sorgu + ayrı opt-in", _check_every_time),
+        ("buy_with_opt_in (aynı grup, önbellek)", _bundled(OptInCache())),
+    ]
+    rows: list[list[object]] = []
+    for name, purchase in paths:
+        client = deploy_event(algorand, deployer, price=TICKET_PRICE, total=args.buyers * 2)
+        accounts = funded_accounts(algorand, args.buyers)
+        rows.append([name, *_measure(client, accounts, purchase)])
+
+    print(f"\nYol başına {args.buyers} yeni alıcı, her biri iki alım\n")
+    print_table(
+        ["yol", "reddedilen ilk alım", "ilk alım ort. (ms)", "ilk alım p95 (ms)", "tekrar ort. (ms)", "opt-in sorgusu"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
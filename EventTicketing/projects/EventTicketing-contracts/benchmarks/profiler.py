@@ -0,0 +1,230 @@
+# benchmarks/profiler.py
+# Kaynak satırı bazında opcode profili. Senaryolar (create, mint, N adet buy_ticket)
+# simulate ile tam exec trace açık olarak çalıştırılır; çalışan her PC, puya'nın
+# ürettiği EventTicketing.approval.puya.map üzerinden contract.py satırına eşlenir.
+#
+# Çıktılar:
+#   - en çok opcode harcayan satırlar tablosu (satır, opcode sayısı, en sık opcode'lar)
+#   - flamegraph uyumlu "collapsed stack" dosyası (senaryo;subroutine;satır sayı)
+#
+# Kullanım (LocalNet açık, kontrat `algokit project run build` ile derlenmiş olmalı):
+#   poetry run python -m benchmarks.profiler --buys 8 --top 20
+#   flamegraph.pl profile.folded > profile.svg
+
+from __future__ import annotations
+
+import argparse
+import collections
+import dataclasses
+import json
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from algokit_utils import (
+    AlgoAmount,
+    AlgorandClient,
+    CommonAppCallCreateParams,
+    CommonAppCallParams,
+    PaymentParams,
+    SendAtomicTransactionComposerResults,
+    SigningAccount,
+)
+from algosdk.source_map import SourceMap
+from algosdk.v2client.models import SimulateTraceConfig
+
+from benchmarks._localnet import buyer_client, deploy_event, funded_account, localnet, opt_in, print_table
+from smart_contracts.artifacts.event_ticketing.event_ticketing_client import EventTicketingFactory
+from smart_contracts.event_ticketing.deploy_config import app_funding
+
+ARTIFACTS = Path(__file__).parent.parent / "smart_contracts" / "artifacts" / "event_ticketing"
+APPROVAL_MAP = ARTIFACTS / "EventTicketing.approval.puya.map"
+DEFAULT_COLLAPSED = Path("profile.folded")
+TICKET_PRICE = 1_000
+MAX_PAIRS_PER_GROUP = 8
+INNER_FEE = AlgoAmount.from_micro_algo(1_000)
+TRACE_CONFIG = SimulateTraceConfig(enable=True)
+
+
+# --------------------------------------------------------------------
+# Kaynak haritası
+# --------------------------------------------------------------------
+@dataclasses.dataclass(frozen=True)
+class ProgramMap:
+    source: Path
+    source_lines: list[str]
+    # PC -> 1 tabanlı kaynak satırı (eşlemesi olmayan PC'ler yok)
+    pc_to_line: dict[int, int]
+    pc_to_op: dict[int, str]
+    # (başlangıç PC, subroutine adı), PC'ye göre sıralı
+    subroutines: list[tuple[int, str]]
+
+    @classmethod
+    def load(cls, map_path: Path = APPROVAL_MAP) -> ProgramMap:
+        raw = json.loads(map_path.read_text(encoding="utf-8"))
+        source = (map_path.parent / raw["sources"][0]).resolve()
+        segments = raw["mappings"].split(";")
+        decoded = SourceMap(raw)
+        offset = int(raw.get("op_pc_offset", 0))
+
+        events: dict[int, dict[str, Any]] = {int(pc) + offset: e for pc, e in raw.get("pc_events", {}).items()}
+        return cls(
+            source=source,
+            source_lines=source.read_text(encoding="utf-8").splitlines() if source.exists() else [],
+            # SourceMap boş segmentlerde son satırı taşır; boş segment = eşleme yok
+            pc_to_line={pc + offset: line + 1 for pc, line in decoded.pc_to_line.items() if segments[pc]},
+            pc_to_op={pc: e["op"] for pc, e in events.items() if "op" in e},
+            subroutines=sorted((pc, _short_name(e["subroutine"])) for pc, e in events.items() if "subroutine" in e),
+        )
+
+    def subroutine_of(self, pc: int) -> str:
+        name = "?"
+        for start, sub in self.subroutines:
+            if start > pc:
+                break
+            name = sub
+        return name
+
+    def line_label(self, line: int | None) -> str:
+        return f"{self.source.name}:{line}" if line is not None else f"{self.source.name}:?"
+
+    def source_text(self, line: int) -> str:
+        return self.source_lines[line - 1].strip() if 0 < line <= len(self.source_lines) else ""
+
+
+def _short_name(subroutine: str) -> str:
+    # "smart_contracts.event_ticketing.contract.EventTicketing.buy_ticket[routing]" -> "buy_ticket[routing]"
+    return subroutine.rsplit(".", 1)[-1]
+
+
+# --------------------------------------------------------------------
+# Profil toplama
+# --------------------------------------------------------------------
+@dataclasses.dataclass
+class LineProfile:
+    program: ProgramMap
+    ops_by_line: collections.Counter[int | None] = dataclasses.field(default_factory=collections.Counter)
+    opcodes_by_line: dict[int | None, collections.Counter[str]] = dataclasses.field(
+        default_factory=lambda: collections.defaultdict(collections.Counter)
+    )
+    stacks: collections.Counter[str] = dataclasses.field(default_factory=collections.Counter)
+    total_ops: int = 0
+
+    def add_trace(self, scenario: str, pcs: Iterable[int]) -> None:
+        """Bir approval program trace'indeki PC'leri satır ve çağrı yığınına dağıtır."""
+        stack: list[str] = []
+        previous_op = ""
+        for pc in pcs:
+            sub = self.program.subroutine_of(pc)
+            if not stack or previous_op == "callsub":
+                stack.append(sub)
+            elif previous_op == "retsub" and len(stack) > 1:
+                stack.pop()
+            else:
+                # match/b ile yönlendirme (routing) aynı çerçevede kalır
+                stack[-1] = sub
+
+            op = self.program.pc_to_op.get(pc, "?")
+            line = self.program.pc_to_line.get(pc)
+            self.ops_by_line[line] += 1
+            self.opcodes_by_line[line][op.split(" ", 1)[0]] += 1
+            self.stacks[";".join([scenario, *stack, self.program.line_label(line)])] += 1
+            self.total_ops += 1
+            previous_op = op.split(" ", 1)[0]
+
+    def add_simulation(self, scenario: str, result: SendAtomicTransactionComposerResults) -> None:
+        for txn_group in result.simulate_response["txn-groups"]:
+            for txn_result in txn_group["txn-results"]:
+                trace = txn_result.get("exec-trace", {}).get("approval-program-trace")
+                if trace:
+                    self.add_trace(scenario, (step["pc"] for step in trace))
+
+    def hot_lines(self, top: int) -> list[list[object]]:
+        rows: list[list[object]] = []
+        for line, ops in self.ops_by_line.most_common(top):
+            common = ", ".join(f"{op}×{n}" for op, n in self.opcodes_by_line[line].most_common(3))
+            text = self.program.source_text(line) if line is not None else "(eşlemesiz)"
+            rows.append([self.program.line_label(line), ops, f"{ops / self.total_ops:.1%}", common, text[:60]])
+        return rows
+
+    def write_collapsed(self, path: Path) -> None:
+        lines = [f"{stack} {count}" for stack, count in sorted(self.stacks.items())]
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+# --------------------------------------------------------------------
+# Senaryo
+# --------------------------------------------------------------------
+def _simulate(composer: Any) -> SendAtomicTransactionComposerResults:  # noqa: ANN401 - iki composer türü
+    return composer.simulate(allow_unnamed_resources=True, exec_trace_config=TRACE_CONFIG)
+
+
+def profile_scenario(algorand: AlgorandClient, deployer: SigningAccount, buys: int) -> LineProfile:
+    """create + mint + `buys` adet buy_ticket senaryosunu simulate eder ve profili döndürür."""
+    profile = LineProfile(ProgramMap.load())
+    factory = EventTicketingFactory(algorand, default_sender=deployer.address, default_signer=deployer.signer)
+    create_args = ("Profil Etkinliği", TICKET_PRICE, max(buys, 1), 0)
+
+    profile.add_simulation(
+        "create_application",
+        _simulate(
+            algorand.new_group().add_app_create_method_call(
+                factory.params.create.create_application(args=create_args, params=CommonAppCallCreateParams())
+            )
+        ),
+    )
+
+    fresh, _ = factory.send.create.create_application(args=create_args)
+    algorand.send.payment(
+        PaymentParams(
+            sender=deployer.address, receiver=fresh.app_address, amount=app_funding(create_args[2], TICKET_PRICE)
+        )
+    )
+    profile.add_simulation(
+        "mint_tickets", _simulate(fresh.new_group().mint_tickets(params=CommonAppCallParams(extra_fee=INNER_FEE)))
+    )
+
+    client = deploy_event(algorand, deployer, price=TICKET_PRICE, total=max(buys, 1))
+    buyer = funded_account(algorand, 1 + buys * TICKET_PRICE / 1_000_000)
+    opt_in(algorand, buyer, client)
+    client = buyer_client(client, buyer)
+
+    # Simulate zincire yazmadığından her grup aynı başlangıç durumunu görür
+    for start in range(0, buys, MAX_PAIRS_PER_GROUP):
+        group = client.new_group()
+        for i in range(start, min(buys, start + MAX_PAIRS_PER_GROUP)):
+            payment = algorand.create_transaction.payment(
+                PaymentParams(
+                    sender=buyer.address,
+                    receiver=client.app_address,
+                    amount=AlgoAmount.from_micro_algo(TICKET_PRICE),
+                    note=f"profile:{i}".encode(),
+                )
+            )
+            group.buy_ticket(
+                args=(payment,), params=CommonAppCallParams(extra_fee=INNER_FEE, note=f"profile:{i}".encode())
+            )
+        profile.add_simulation("buy_ticket", _simulate(group))
+
+    return profile
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="contract.py satır bazında opcode profili")
+    parser.add_argument("--buys", type=int, default=8, help="simulate edilecek buy_ticket sayısı")
+    parser.add_argument("--top", type=int, default=20, help="tabloda gösterilecek satır sayısı")
+    parser.add_argument("--collapsed", type=Path, default=DEFAULT_COLLAPSED, help="collapsed stack çıktı dosyası")
+    args = parser.parse_args()
+
+    algorand = localnet()
+    profile = profile_scenario(algorand, funded_account(algorand, 20), args.buys)
+
+    print(f"Toplam çalışan opcode: {profile.total_ops:,}\n")
+    print_table(["satır", "opcode", "pay", "en sık", "kaynak"], profile.hot_lines(args.top))
+
+    profile.write_collapsed(args.collapsed)
+    print(f"\nCollapsed stack yazıldı: {args.collapsed}")
+
+
+if __name__ == "__main__":
+    main()
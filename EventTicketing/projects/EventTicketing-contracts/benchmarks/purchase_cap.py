@@ -0,0 +1,65 @@
+# benchmarks/purchase_cap.py
+# Bot taraması senaryosu: birkaç adres, adres başına sınırın (max_per_address)
+# çok üzerinde buy_ticket çağrısı dener. Aynı yük iki kez çalıştırılır:
+#   - ön kontrol kapalı: fazla çağrılar zincirde reddedilir; başarısız çağrı
+#     bulunduğu atomik grubu (8 alıcı) da düşürür
+#   - ön kontrol açık: BulkBuyer sınırı aşacak çağrıları hiç göndermez
+#
+# Kullanım (LocalNet açık olmalı):
+#   poetry run python -m benchmarks.purchase_cap --bots 8 --attempts 10 --cap 2
+
+from __future__ import annotations
+
+import argparse
+
+from benchmarks._localnet import deploy_event, funded_account, funded_accounts, localnet, opt_in_all, print_table
+from smart_contracts.event_ticketing.bulk_buy import BulkBuyer, Buyer
+
+
+def _run(label: str, *, precheck: bool, bots: int, attempts: int, cap: int) -> list[object]:
+    algorand = localnet()
+    deployer = funded_account(algorand, 10)
+    client = deploy_event(algorand, deployer, name=f"Bot testi ({label})", total=bots * attempts, max_per_address=cap)
+    accounts = funded_accounts(algorand, bots)
+    opt_in_all(algorand, accounts, client)
+
+    # Botlar sırayla değil, iç içe geçmiş şekilde saldırır
+    load = [Buyer.from_account(a) for _ in range(attempts) for a in accounts]
+    bulk = BulkBuyer(client, precheck=precheck)
+    for _ in bulk.run(load):
+        pass
+
+    report = bulk.report
+    submitted = report.tickets_confirmed + report.tickets_failed
+    failed_rate = report.tickets_failed / submitted if submitted else 0.0
+    return [
+        label,
+        len(load),
+        submitted,
+        report.tickets_confirmed,
+        report.tickets_failed,
+        report.tickets_skipped,
+        f"{failed_rate:.1%}",
+        report.seconds,
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Adres başına sınır: bot taraması yük testi")
+    parser.add_argument("--bots", type=int, default=8)
+    parser.add_argument("--attempts", type=int, default=10, help="bot başına buy_ticket denemesi")
+    parser.add_argument("--cap", type=int, default=2, help="max_per_address")
+    args = parser.parse_args()
+
+    rows = [
+        _run("ön kontrol kapalı", precheck=False, bots=args.bots, attempts=args.attempts, cap=args.cap),
+        _run("ön kontrol açık", precheck=True, bots=args.bots, attempts=args.attempts, cap=args.cap),
+    ]
+    print(f"\n{args.bots} bot x {args.attempts} deneme, adres başına sınır {args.cap}\n")
+    print_table(
+        ["mod", "deneme", "gönderilen", "onaylanan", "başarısız", "gönderilmedi", "başarısız oranı", "sn"], rows
+    )
+
+
+if __name__ == "__main__":
+    main()
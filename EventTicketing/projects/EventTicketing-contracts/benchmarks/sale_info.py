@@ -0,0 +1,60 @@
+# benchmarks/sale_info.py
+# Vitrin okuma yükü: _GlobalState özellik başına okuma (3 algod isteği) ile
+# get_sale_info() simulate çağrısının (1 algod isteği) istek/sn ve p99 gecikme karşılaştırması.
+#
+# Kullanım (LocalNet açık olmalı):
+#   poetry run python -m benchmarks.sale_info --polls 500
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+
+from benchmarks._localnet import deploy_event, funded_account, localnet, mean, percentile, print_table
+from smart_contracts.artifacts.event_ticketing.event_ticketing_client import EventTicketingClient
+from smart_contracts.event_ticketing.sale_info import fetch_sale_info
+
+
+def _per_field(client: EventTicketingClient) -> object:
+    gs = client.state.global_state
+    return (gs.sale_params, gs.tickets_sold, gs.event_name)
+
+
+def _snapshot(client: EventTicketingClient) -> object:
+    return fetch_sale_info(client)
+
+
+def _measure(
+    name: str, read: Callable[[EventTicketingClient], object], client: EventTicketingClient, polls: int
+) -> list[object]:
+    read(client)  # ısınma
+    latencies: list[float] = []
+    started = time.perf_counter()
+    for _ in range(polls):
+        t0 = time.perf_counter()
+        read(client)
+        latencies.append((time.perf_counter() - t0) * 1000)
+    seconds = time.perf_counter() - started
+    return [name, polls / seconds, mean(latencies), percentile(latencies, 50), percentile(latencies, 99)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Global state okuma karşılaştırması")
+    parser.add_argument("--polls", type=int, default=500, help="her yöntem için okuma sayısı")
+    args = parser.parse_args()
+
+    algorand = localnet()
+    deployer = funded_account(algorand, 10)
+    client = deploy_event(algorand, deployer)
+
+    rows = [
+        _measure("özellik başına (3 istek)", _per_field, client, args.polls),
+        _measure("get_sale_info (1 istek)", _snapshot, client, args.polls),
+    ]
+    print(f"\n{args.polls} okuma\n")
+    print_table(["yöntem", "görüntü/sn", "ort. ms", "p50 ms", "p99 ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# benchmarks/sales_index.py
+# SQLite satış dizini: sentetik bir satış geçmişinin (varsayılan 1 milyon satış)
+# toplu eklenme hızı ve rapor sorgularının gecikmesi. LocalNet gerekmez.
+#
+# Kullanım:
+#   poetry run python -m benchmarks.sales_index --sales 1000000 --apps 100
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+from algosdk import encoding
+
+from benchmarks._localnet import mean, percentile, print_table, stopwatch
+from smart_contracts.event_ticketing.sales_db import SalesIndex
+from smart_contracts.event_ticketing.stream import SaleCursor, SaleEvent
+
+FIRST_ROUND = 1_000
+# Ortalama blok başına satış (~3.3 sn blok, yoğun satış)
+SALES_PER_ROUND = 40
+BATCH_SALES = 50_000
+
+
+def _synthetic_sales(n: int, apps: int, buyers: list[str]) -> Iterator[SaleEvent]:
+    rng = random.Random(42)
+    for i in range(n):
+        round_ = FIRST_ROUND + i // SALES_PER_ROUND
+        count = 1 if rng.random() < 0.9 else rng.randint(2, 8)
+        yield SaleEvent(
+            app_id=1_000 + rng.randrange(apps),
+            buyer=rng.choice(buyers),
+            count=count,
+            amount=count * 1_000_000,
+            round=round_,
+            timestamp=1_700_000_000 + round_ * 3,
+            txid=f"{i:052d}",
+            cursor=SaleCursor(round_, i % SALES_PER_ROUND),
+            sold_after=None,
+        )
+
+
+def _batches(sales: Iterator[SaleEvent], size: int) -> Iterator[list[SaleEvent]]:
+    batch: list[SaleEvent] = []
+    for sale in sales:
+        batch.append(sale)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _query(name: str, run: Callable[[int], object], apps: int, repeats: int) -> list[object]:
+    latencies: list[float] = []
+    for i in range(repeats):
+        t0 = time.perf_counter()
+        run(1_000 + i % apps)
+        latencies.append((time.perf_counter() - t0) * 1000)
+    return [name, mean(latencies), percentile(latencies, 50), percentile(latencies, 99)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SQLite satış dizini ölçümü")
+    parser.add_argument("--sales", type=int, default=1_000_000)
+    parser.add_argument("--apps", type=int, default=100)
+    parser.add_argument("--buyers", type=int, default=200_000)
+    parser.add_argument("--repeats", type=int, default=200)
+    args = parser.parse_args()
+
+    buyers = [encoding.encode_address(os.urandom(32)) for _ in range(args.buyers)]
+    path = Path(tempfile.mkdtemp()) / "sales.db"
+    with SalesIndex(path) as db:
+        with stopwatch() as elapsed:
+            for batch in _batches(_synthetic_sales(args.sales, args.apps, buyers), BATCH_SALES):
+                # Her parti checkpoint ile birlikte tek işlemde (ingest'in yaptığı gibi)
+                db.insert_sales(batch, checkpoint=batch[-1].round)
+        print(f"\n{args.sales:,} satış eklendi: {elapsed():.2f} sn ({args.sales / elapsed():,.0f} satış/sn)")
+        print(f"Veritabanı: {path.stat().st_size / 1e6:,.1f} MB, checkpoint round {db.checkpoint}\n")
+
+        mid_round = FIRST_ROUND + args.sales // SALES_PER_ROUND // 2
+        some_buyer = buyers[0]
+        rows = [
+            _query("summary", db.summary, args.apps, args.repeats),
+            _query("sales_per_minute", db.sales_per_minute, args.apps, args.repeats),
+            _query("top_buyers(10)", db.top_buyers, args.apps, args.repeats),
+            _query("revenue(aralık)", lambda a: db.revenue(a, from_round=mid_round), args.apps, args.repeats),
+            _query("purchases_of(alıcı)", lambda _: db.purchases_of(some_buyer), args.apps, args.repeats),
+        ]
+    print_table(["sorgu (etkinlik başına)", "ort. ms", "p50 ms", "p99 ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
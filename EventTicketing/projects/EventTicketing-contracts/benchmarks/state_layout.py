@@ -0,0 +1,95 @@
+# benchmarks/state_layout.py
+# Global state yerleşimi karşılaştırması: satış parametreleri ayrı anahtarlarda
+# (eski yerleşim: asa_id, price, total, max) ile tek paketli "params" değerinde
+# (SaleParams) tutulan iki uygulamada buy_ticket / buy_tickets / get_sale_info
+# simulate edilir; opcode bütçesi ve global state boyutu yan yana yazdırılır.
+#
+# Eski yerleşim artık bu ağaçta derlenmediğinden, karşılaştırılacak uygulama
+# önceki bir sürümden dağıtılmış olmalıdır (basılmış ve fonlanmış):
+#   git worktree add ../et-legacy <eski-commit>
+#   (cd ../et-legacy && algokit project deploy localnet)
+#
+# Kullanım (LocalNet açık olmalı):
+#   poetry run python -m benchmarks.state_layout --legacy-app-id 1234
+#
+# Paketli yerleşimin kalıcı takibi benchmarks.costs baseline'ı üzerinden yapılır.
+
+from __future__ import annotations
+
+import argparse
+
+from algokit_utils import AlgorandClient, AssetOptInParams, CommonAppCallParams
+
+from benchmarks._localnet import buyer_client, deploy_event, funded_account, localnet, print_table
+from benchmarks.costs import BATCH_SEATS, INNER_FEE, Metrics, _group_metrics, _payment, _simulate
+from smart_contracts.artifacts.event_ticketing.event_ticketing_client import EventTicketingClient
+from smart_contracts.event_ticketing.sale_info import fetch_sale_info
+
+TICKET_PRICE = 1_000
+
+
+def _measure(algorand: AlgorandClient, client: EventTicketingClient) -> dict[str, Metrics]:
+    # get_sale_info iki yerleşimde de aynı imzaya sahip; ASA ve fiyat buradan okunur
+    info = fetch_sale_info(client).info
+    buyer = funded_account(algorand, 1 + (BATCH_SEATS + 1) * info.ticket_price / 1_000_000)
+    algorand.send.asset_opt_in(AssetOptInParams(sender=buyer.address, asset_id=info.ticket_asa_id))
+    client = buyer_client(client, buyer)
+
+    metrics = {
+        "buy_ticket": _group_metrics(
+            _simulate(
+                client.new_group().buy_ticket(
+                    args=(_payment(client, buyer.address, info.ticket_price, "layout-buy"),),
+                    params=CommonAppCallParams(extra_fee=INNER_FEE),
+                )
+            )
+        ),
+        f"buy_tickets[{BATCH_SEATS}]": _group_metrics(
+            _simulate(
+                client.new_group().buy_tickets(
+                    args=(
+                        _payment(client, buyer.address, info.ticket_price * BATCH_SEATS, "layout-buy-many"),
+                        BATCH_SEATS,
+                    ),
+                    params=CommonAppCallParams(extra_fee=INNER_FEE),
+                )
+            )
+        ),
+        "get_sale_info": _group_metrics(_simulate(client.new_group().get_sale_info())),
+    }
+
+    app = algorand.app.get_by_id(client.app_id)
+    metrics["global_state"] = {
+        "keys": app.global_ints + app.global_byte_slices,
+        "ints": app.global_ints,
+        "byte_slices": app.global_byte_slices,
+    }
+    return metrics
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Ayrı anahtar / paketli global state karşılaştırması")
+    parser.add_argument("--legacy-app-id", type=int, required=True, help="eski yerleşimle dağıtılmış uygulama")
+    args = parser.parse_args()
+
+    algorand = localnet()
+    deployer = funded_account(algorand, 20)
+    legacy = algorand.client.get_typed_app_client_by_id(
+        EventTicketingClient, app_id=args.legacy_app_id, default_sender=deployer.address
+    )
+    packed = deploy_event(algorand, deployer, name="Paketli yerleşim", price=TICKET_PRICE, total=100)
+
+    before = _measure(algorand, legacy)
+    after = _measure(algorand, packed)
+
+    rows = []
+    for scenario, metrics in after.items():
+        for metric, value in metrics.items():
+            old = before.get(scenario, {}).get(metric)
+            delta = "-" if old is None else f"{value - old:+,}"
+            rows.append([scenario, metric, "-" if old is None else old, value, delta])
+    print_table(["senaryo", "metrik", "ayrı anahtarlar", "paketli", "fark"], rows)
+
+
+if __name__ == "__main__":
+    main()
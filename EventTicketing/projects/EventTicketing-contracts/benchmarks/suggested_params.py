@@ -0,0 +1,140 @@
+# benchmarks/suggested_params.py
+# SuggestedParamsProvider ölçümü: iş parçacığı başına ayrı AlgorandClient ile
+# buy_ticket alımları; suggested params önbelleksiz, algokit'in client başına
+# 3 sn önbelleği, paylaşılan sağlayıcı (TTL) ve round takibi yapan sağlayıcı
+# ile. Her yol için alım/sn ve algod'a giden suggested_params istek sayısı.
+#
+# Kullanım (LocalNet açık olmalı):
+#   poetry run python -m benchmarks.suggested_params --buys 400 --threads 8
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+from algokit_utils import AlgoAmount, AlgorandClient, CommonAppCallParams, PaymentParams, SigningAccount
+from algosdk.transaction import SuggestedParams
+
+from benchmarks._localnet import (
+    deploy_event,
+    funded_account,
+    funded_accounts,
+    localnet,
+    opt_in_all,
+    print_table,
+    stopwatch,
+)
+from smart_contracts.artifacts.event_ticketing.event_ticketing_client import EventTicketingClient
+from smart_contracts.event_ticketing.suggested_params import SuggestedParamsProvider, enable_params_cache
+
+TICKET_PRICE = 1_000
+INNER_FEE = AlgoAmount.from_micro_algo(1_000)
+
+
+class _FetchCounter:
+    """Sarılan AlgorandClient'ların algod.suggested_params çağrılarını sayar"""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def wrap(self, algorand: AlgorandClient) -> AlgorandClient:
+        fetch = algorand.client.algod.suggested_params
+
+        def counted(**kwargs: object) -> SuggestedParams:
+            with self._lock:
+                self.count += 1
+            return fetch(**kwargs)
+
+        algorand.client.algod.suggested_params = counted  # type: ignore[method-assign]
+        return algorand
+
+
+def _without_cache(algorand: AlgorandClient) -> None:
+    algorand.set_suggested_params_cache_timeout(0)
+
+
+def _measure(
+    algorand: AlgorandClient,
+    deployer: SigningAccount,
+    buys: int,
+    threads: int,
+    setup: Callable[[AlgorandClient], object],
+) -> tuple[float, int]:
+    client = deploy_event(algorand, deployer, price=TICKET_PRICE, total=buys)
+    accounts = funded_accounts(algorand, threads)
+    opt_in_all(algorand, accounts, client)
+
+    # Gerçek kullanımdaki gibi her iş parçacığının kendi AlgorandClient'ı var
+    fetches = _FetchCounter()
+    buyers = []
+    for account in accounts:
+        buyer = fetches.wrap(localnet())
+        setup(buyer)
+        buyers.append(
+            buyer.client.get_typed_app_client_by_id(
+                EventTicketingClient,
+                app_id=client.app_id,
+                default_sender=account.address,
+                default_signer=account.signer,
+            )
+        )
+
+    counter: Iterator[int] = itertools.count()
+
+    def worker(buyer: EventTicketingClient, address: str) -> None:
+        while (n := next(counter)) < buys:
+            payment = buyer.algorand.create_transaction.payment(
+                PaymentParams(
+                    sender=address,
+                    receiver=buyer.app_address,
+                    amount=AlgoAmount.from_micro_algo(TICKET_PRICE),
+                    note=f"params-{n}".encode(),
+                )
+            )
+            buyer.send.buy_ticket(args=(payment,), params=CommonAppCallParams(extra_fee=INNER_FEE))
+
+    with stopwatch() as elapsed, ThreadPoolExecutor(max_workers=threads) as pool:
+        jobs = [pool.submit(worker, b, a.address) for b, a in zip(buyers, accounts, strict=True)]
+        for future in jobs:
+            future.result()
+    return buys / elapsed(), fetches.count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Paylaşılan suggested params önbelleği ölçümü")
+    parser.add_argument("--buys", type=int, default=400, help="her yol için alım sayısı")
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    algorand = localnet()
+    deployer = funded_account(algorand, 100)
+    rows: list[list[object]] = []
+
+    def row(name: str, setup: Callable[[AlgorandClient], object], extra_fetches: Callable[[], int]) -> int:
+        rate, fetches = _measure(algorand, deployer, args.buys, args.threads, setup)
+        fetches += extra_fetches()
+        rows.append([name, rate, fetches, fetches / args.buys])
+        return fetches
+
+    baseline = row("önbelleksiz", _without_cache, lambda: 0)
+    row("algokit önbelleği (client başına 3 sn)", lambda a: None, lambda: 0)
+
+    for name, follow in (("paylaşılan sağlayıcı (TTL)", False), ("paylaşılan sağlayıcı + round takibi", True)):
+        # Tüm alıcı client'ları tek sağlayıcıyı paylaşır; algod çağrıları sağlayıcıda sayılır
+        provider = SuggestedParamsProvider(algorand.client.algod)
+        if follow:
+            provider.start()
+        fetches = row(name, lambda a, p=provider: enable_params_cache(a, p), lambda p=provider: p.stats.fetches)
+        provider.stop()
+        print(f"{name}: {provider.stats}; önbelleksize göre {baseline - fetches} algod çağrısı kazanıldı")
+
+    print(f"\n{args.threads} iş parçacığı, yol başına {args.buys} alım (ödeme + buy_ticket grubu)\n")
+    print_table(["yol", "alım/sn", "algod suggested_params", "alım başına"], rows)
+
+
+if __name__ == "__main__":
+    main()
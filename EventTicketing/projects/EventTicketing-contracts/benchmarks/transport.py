@@ -0,0 +1,74 @@
+# benchmarks/transport.py
+# Paylaşılan AlgodTransport ölçümü: iş parçacığı başına ayrı AlgorandClient
+# (istek başına yeni bağlantı) ile tek keep-alive havuzunu paylaşan client'lar;
+# suggested params, hesap bilgisi ve uygulama durumu okumalarında istek/sn ve
+# havuz metrikleri (birleştirme, yeniden kullanım, bekleme).
+#
+# Kullanım (LocalNet açık olmalı):
+#   poetry run python -m benchmarks.transport --threads 32 --requests 200
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from algokit_utils import AlgorandClient
+
+from benchmarks._localnet import deploy_event, funded_account, localnet, print_table, stopwatch
+from smart_contracts.event_ticketing.transport import AlgodTransport, pooled
+
+
+def _workload(algorand: AlgorandClient, app_id: int, address: str) -> Callable[[int], None]:
+    algod = algorand.client.algod
+
+    def run(requests: int) -> None:
+        for n in range(requests):
+            match n % 3:
+                case 0:
+                    algod.suggested_params()
+                case 1:
+                    algod.account_info(address)
+                case _:
+                    algod.application_info(app_id)
+
+    return run
+
+
+def _measure(clients: list[AlgorandClient], app_id: int, address: str, requests: int) -> float:
+    jobs = [_workload(c, app_id, address) for c in clients]
+    with stopwatch() as elapsed, ThreadPoolExecutor(max_workers=len(clients)) as pool:
+        for future in [pool.submit(job, requests) for job in jobs]:
+            future.result()
+    return len(clients) * requests / elapsed()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Paylaşılan algod bağlantı havuzu ölçümü")
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=200, help="iş parçacığı başına istek")
+    parser.add_argument("--max-connections", type=int, default=16)
+    args = parser.parse_args()
+
+    algorand = localnet()
+    deployer = funded_account(algorand, 10)
+    app_id = deploy_event(algorand, deployer, total=10).app_id
+
+    rows: list[list[object]] = []
+    separate = [localnet() for _ in range(args.threads)]
+    rows.append(["ayrı AlgorandClient'lar", _measure(separate, app_id, deployer.address, args.requests), "", "", ""])
+
+    for coalesce in (False, True):
+        with AlgodTransport(max_connections=args.max_connections, coalesce_gets=coalesce) as transport:
+            shared = [pooled(algorand, transport) for _ in range(args.threads)]
+            rate = _measure(shared, app_id, deployer.address, args.requests)
+            m = transport.metrics
+        name = "paylaşılan havuz" + (" + birleştirme" if coalesce else "")
+        rows.append([name, rate, m.coalesced, f"%{m.reuse_ratio * 100:.1f}", m.mean_wait_ms])
+
+    print(f"\n{args.threads} iş parçacığı x {args.requests} istek, havuz {args.max_connections} bağlantı\n")
+    print_table(["yol", "istek/sn", "birleştirilen", "yeniden kullanım", "ort. bekleme (ms)"], rows)
+
+
+if __name__ == "__main__":
+    main()
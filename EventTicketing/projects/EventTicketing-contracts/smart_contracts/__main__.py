@@ -2,27 +2,39 @@
 # --- BAŞLANGIÇ: __main__.py dosyasının tamamı ---
 from __future__ import annotations
 
+import argparse
 import dataclasses
+import functools
+import hashlib
 import importlib
+import importlib.metadata
+import json
 import logging
 import os
 import subprocess
 import sys
+import time
 from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from shutil import rmtree
+from shutil import copy2, rmtree
+from typing import TYPE_CHECKING
 
 from dotenv import load_dotenv
 
 # --- Gerekli Import'ları Ekleyelim ---
 try:
-    from algokit_utils import AlgorandClient, get_localnet_default_account, get_account_from_environment
+    from algokit_utils import AlgorandClient, get_account_from_environment, get_localnet_default_account
+    from algosdk.account import address_from_private_key
     from algosdk.atomic_transaction_composer import AccountTransactionSigner
 except ImportError:
     print("HATA: algokit_utils veya algosdk bulunamadı. Lütfen 'poetry install' komutunu çalıştırdığınızdan emin olun.")
     sys.exit(1)
 # ------------------------------------
 
+if TYPE_CHECKING:
+    from smart_contracts.event_ticketing.suggested_params import SuggestedParamsProvider
+
 
 # --------------------------------------------------------------------
 # Logging & env
@@ -43,6 +55,13 @@ artifact_root = root_path / "artifacts"
 # Kontrat klasörünün adı (tek bir uygulamayı hedefliyoruz)
 DEFAULT_CONTRACT_NAME = "event_ticketing"
 
+# Derleme çıktılarının içerik adresli önbelleği (artifacts/.build_cache/<kontrat>/<anahtar>/)
+build_cache_root = artifact_root / ".build_cache"
+COMPILE_FLAGS = ["--output-source-map", "--output-arc56", "--output-teal"]
+# BUILD_CACHE=0 ile önbellek devre dışı bırakılır
+BUILD_CACHE_ENABLED = os.environ.get("BUILD_CACHE", "1") != "0"
+BUILD_CACHE_KEEP = 10
+
 # --------------------------------------------------------------------
 # Data modeli
 # --------------------------------------------------------------------
@@ -88,9 +107,18 @@ def import_deploy_if_exists(folder: Path) -> Callable[[object, int, AccountTrans
         return None
 
 
+def _contract_folders() -> list[str]:
+    """smart_contracts/ altında contract.py içeren tüm klasörler (artifacts hariç)."""
+    return sorted(
+        d.name
+        for d in root_path.iterdir()
+        if d.is_dir() and d != artifact_root and not d.name.startswith((".", "_")) and (d / "contract.py").exists()
+    )
+
+
 def discover_contracts(target_name: str | None = None) -> list[SmartContract]:
-    # Bizim basit yapımız için sadece varsayılan klasörü arayalım
-    names = [target_name] if target_name else [DEFAULT_CONTRACT_NAME]
+    # Hedef verilmezse contract.py içeren her klasör bir kontrattır
+    names = [target_name] if target_name else (_contract_folders() or [DEFAULT_CONTRACT_NAME])
     results: list[SmartContract] = []
     for name in names:
         folder = root_path / name
@@ -126,12 +154,116 @@ def _ensure_pkg_init(pyfile: Path) -> None:
 def _client_output_path(output_dir: Path, contract_name: str, ext: str = "py") -> Path:
     return output_dir / f"{contract_name}_client.{ext}"
 
+# --------------------------------------------------------------------
+# Build önbelleği
+# --------------------------------------------------------------------
+@dataclasses.dataclass
+class BuildCacheStats:
+    hits: int = 0
+    misses: int = 0
+    saved_seconds: float = 0.0
+
+    def summary(self) -> str:
+        return f"Build önbelleği: {self.hits} isabet, {self.misses} ıskalama, ~{self.saved_seconds:.1f} sn kazanıldı"
+
+
+build_cache_stats = BuildCacheStats()
+
+
+@functools.cache
+def _tool_versions() -> str:
+    """Çıktıyı etkileyen araç sürümleri (puyapy, client generator, algokit CLI)."""
+    versions = []
+    for dist in ("puyapy", "algokit-client-generator"):
+        try:
+            versions.append(f"{dist}={importlib.metadata.version(dist)}")
+        except importlib.metadata.PackageNotFoundError:
+            versions.append(f"{dist}=?")
+    try:
+        res = subprocess.run(["algokit", "--version"], text=True, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        versions.append(f"algokit={res.stdout.strip()}")
+    except OSError:
+        versions.append("algokit=?")
+    return ";".join(versions)
+
+
+def _build_cache_key(contract_path: Path, contract_name: str) -> str:
+    h = hashlib.sha256()
+    h.update(contract_path.read_bytes())
+    h.update(_tool_versions().encode())
+    h.update(" ".join(COMPILE_FLAGS).encode())
+    h.update(contract_name.encode())
+    return h.hexdigest()[:32]
+
+
+def _copy_files(src: Path, dst: Path) -> None:
+    dst.mkdir(parents=True, exist_ok=True)
+    for f in src.iterdir():
+        if f.is_file():
+            copy2(f, dst / f.name)
+
+
+def _restore_from_cache(key: str, output_dir: Path, contract_name: str) -> Path | None:
+    """Önbellekte varsa çıktıları output_dir'e geri yükler ve .arc56.json yolunu döndürür."""
+    entry = build_cache_root / contract_name / key
+    meta_file = entry / "build.json"
+    if not meta_file.exists():
+        return None
+    meta = json.loads(meta_file.read_text(encoding="utf-8"))
+    files = entry / "files"
+
+    # output_dir zaten bu anahtarla üretildiyse hiçbir şey kopyalanmaz
+    last = build_cache_root / contract_name / "LAST"
+    up_to_date = (
+        last.exists()
+        and last.read_text(encoding="utf-8").strip() == key
+        and all((output_dir / f.name).exists() for f in files.iterdir())
+    )
+    if not up_to_date:
+        if output_dir.exists():
+            rmtree(output_dir)
+        _copy_files(files, output_dir)
+        last.write_text(key, encoding="utf-8")
+
+    build_cache_stats.hits += 1
+    build_cache_stats.saved_seconds += float(meta.get("seconds", 0.0))
+    logger.info(f"Build önbelleği isabeti ({contract_name}, {key[:12]}); derleme ve client üretimi atlandı")
+    spec_files = list(output_dir.glob("*.arc56.json"))
+    return spec_files[0] if spec_files else None
+
+
+def _store_in_cache(key: str, output_dir: Path, contract_name: str, seconds: float) -> None:
+    contract_cache = build_cache_root / contract_name
+    entry = contract_cache / key
+    if entry.exists():
+        rmtree(entry)
+    _copy_files(output_dir, entry / "files")
+    meta = {"key": key, "tools": _tool_versions(), "flags": COMPILE_FLAGS, "seconds": round(seconds, 3)}
+    (entry / "build.json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    (contract_cache / "LAST").write_text(key, encoding="utf-8")
+
+    # En eski kayıtları buda
+    entries = sorted((d for d in contract_cache.iterdir() if d.is_dir()), key=lambda d: d.stat().st_mtime)
+    for old in entries[:-BUILD_CACHE_KEEP]:
+        rmtree(old)
+
+
 def build(output_dir: Path, contract_path: Path, contract_name: str) -> Path | None:
     """
     Kontratı derler (compile) ve typed client oluşturur (generate).
     .arc56.json dosyasının yolunu döndürür.
+    Kaynak, araç sürümleri ve derleme bayrakları değişmediyse çıktılar
+    build önbelleğinden geri yüklenir.
     """
     output_dir = output_dir.resolve()
+    cache_key = _build_cache_key(contract_path, contract_name) if BUILD_CACHE_ENABLED else None
+    if cache_key:
+        cached_spec = _restore_from_cache(cache_key, output_dir, contract_name)
+        if cached_spec is not None:
+            return cached_spec
+        build_cache_stats.misses += 1
+    started = time.perf_counter()
+
     if output_dir.exists():
         rmtree(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -141,8 +273,8 @@ def build(output_dir: Path, contract_path: Path, contract_name: str) -> Path | N
     compile_cmd = [
         "algokit", "compile", "py",
         str(contract_path.resolve()),
-        f"--out-dir={str(output_dir)}",
-        "--output-source-map", "--output-arc56", "--output-teal",
+        f"--out-dir={output_dir!s}",
+        *COMPILE_FLAGS,
     ]
     logger.debug(f"Running command: {' '.join(compile_cmd)}")
     res = subprocess.run(compile_cmd, text=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
@@ -178,26 +310,37 @@ def build(output_dir: Path, contract_path: Path, contract_name: str) -> Path | N
         raise RuntimeError("Typed client oluşturma BAŞARISIZ OLDU")
 
     logger.info(f"Typed client oluşturuldu: {client_out}")
+    if cache_key:
+        _store_in_cache(cache_key, output_dir, contract_name, time.perf_counter() - started)
     return spec_path
 
 
 # --------------------------------------------------------------------
 # Deploy (LocalNet)
 # --------------------------------------------------------------------
+# Süreç boyunca tek suggested params önbelleği; ilk client'ın algod'u ile kurulur
+_params_provider: SuggestedParamsProvider | None = None
+
+
 def _get_algorand_context() -> tuple[AlgorandClient, AccountTransactionSigner]:
     """
     LocalNet için (algo_client, creator_signer) döndürür.
     (DÜZELTİLDİ: Account yerine AccountTransactionSigner döndürür)
     """
+    # Aynı süreçteki tüm client'lar tek keep-alive bağlantı havuzunu ve suggested params önbelleğini paylaşır
+    from smart_contracts.event_ticketing.suggested_params import enable_params_cache
+    from smart_contracts.event_ticketing.transport import pooled
+
+    global _params_provider
+    algo = pooled(AlgorandClient.default_localnet())
+    _params_provider = enable_params_cache(algo, _params_provider)
     try:
-        algo = AlgorandClient.default_localnet()
         creator_account = get_localnet_default_account(algo)
         creator_signer = AccountTransactionSigner(creator_account.private_key) # Bu bizim anahtar düzeltmemizdi
         logger.info(f"LocalNet varsayılan imzalayıcısı bulundu: {creator_account.address}")
         return algo, creator_signer
     except Exception as e:
         logger.warning(f"LocalNet varsayılan hesabı alınamadı: {e}. .env (CREATOR_MNEMONIC) deneniyor...")
-        algo = AlgorandClient.default_localnet()
         creator_account = get_account_from_environment(algo, "CREATOR")
         creator_signer = AccountTransactionSigner(creator_account.private_key)
         logger.info(f".env dosyasından imzalayıcı yüklendi: {creator_account.address}")
@@ -206,7 +349,7 @@ def _get_algorand_context() -> tuple[AlgorandClient, AccountTransactionSigner]:
 
 def _load_typed_client(contract_name: str):
     """Oluşturulan typed client'ı import eder"""
-    module_name = f"smart_contracts.artifacts.{contract_name}_client"
+    module_name = f"smart_contracts.artifacts.{contract_name}.{contract_name}_client"
     if str(root_path.parent) not in sys.path:
         sys.path.insert(0, str(root_path.parent))
     return importlib.import_module(module_name)
@@ -223,17 +366,16 @@ def deploy_contract(contract: SmartContract) -> None:
         raise FileNotFoundError(f"Artifacts klasörü {out_dir} adresinde bulunamadı; önce 'build' çalıştırın.")
 
     algo, creator_signer = _get_algorand_context()
+    creator_address = address_from_private_key(creator_signer.private_key)
     app_id = 0  # Yeni oluşturma
 
+    # Typed factory (ör. EventTicketingFactory) uygulamayı oluşturur;
+    # deploy_config.deploy gerisini (fonlama + mint) tek grupta yapar
     client_mod = _load_typed_client(contract.name)
-    EventTicketingClient = getattr(client_mod, "EventTicketingClient")
-
-    # Client'ı doğru imzalayıcı (signer) ile oluştur
-    app_client = EventTicketingClient(
-        algod_client=algo.client.algod,
-        app_id=app_id,
-        signer=creator_signer,
+    factory_cls = next(
+        v for k, v in vars(client_mod).items() if k.endswith("Factory") and isinstance(v, type)
     )
+    app_factory = factory_cls(algo, default_sender=creator_address, default_signer=creator_signer)
 
     if not contract.deploy:
         logger.warning(f"{contract.name} için deploy() fonksiyonu bulunamadı; dağıtım atlanıyor.")
@@ -241,37 +383,130 @@ def deploy_contract(contract: SmartContract) -> None:
 
     logger.info(f"Dağıtılıyor (deploying) {contract.name} ...")
     # deploy_config.py'deki fonksiyona doğru argümanları (signer dahil) iletiyoruz
-    contract.deploy(app_client, app_id, creator_signer)
+    contract.deploy(app_factory, app_id, creator_signer)
     logger.info(f"Dağıtım (deploy) {contract.name} için tamamlandı.")
 
 
 # --------------------------------------------------------------------
 # CLI (build / deploy / all)
 # --------------------------------------------------------------------
-def main(action: str, target_contract_name: str | None = None) -> None:
+@dataclasses.dataclass
+class PipelineTiming:
+    name: str
+    build_seconds: float | None = None
+    cache_hit: bool | None = None
+    deploy_seconds: float | None = None
+    error: str | None = None
+
+
+@dataclasses.dataclass(frozen=True)
+class _BuildOutcome:
+    name: str
+    seconds: float
+    cache_hit: bool
+    saved_seconds: float
+
+
+def _build_job(name: str, contract_path: Path) -> _BuildOutcome:
+    """Process pool içinde tek bir kontratı derler (önbellek istatistiği sonuçla döner)."""
+    hits_before, saved_before = build_cache_stats.hits, build_cache_stats.saved_seconds
+    started = time.perf_counter()
+    build(artifact_root / name, contract_path, name)
+    return _BuildOutcome(
+        name=name,
+        seconds=time.perf_counter() - started,
+        cache_hit=build_cache_stats.hits > hits_before,
+        saved_seconds=build_cache_stats.saved_seconds - saved_before,
+    )
+
+
+def _timed_deploy(contract: SmartContract) -> float:
+    started = time.perf_counter()
+    deploy_contract(contract)
+    return time.perf_counter() - started
+
+
+def run_pipeline(contracts: list[SmartContract], *, do_build: bool, do_deploy: bool, jobs: int) -> list[PipelineTiming]:
+    """
+    Derlemeleri `jobs` işlemli bir havuzda paralel çalıştırır; her kontratın
+    deploy'u yalnızca kendi derlemesi bittiğinde (diğerlerini beklemeden) başlar.
+    """
+    timings = {c.name: PipelineTiming(name=c.name) for c in contracts}
+    by_name = {c.name: c for c in contracts}
+    deploys: dict[Future[float], str] = {}
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as deploy_pool:
+        if do_build:
+            with ProcessPoolExecutor(max_workers=max(1, jobs)) as build_pool:
+                builds = {build_pool.submit(_build_job, c.name, c.path): c.name for c in contracts}
+                for fut in as_completed(builds):
+                    name = builds[fut]
+                    try:
+                        outcome = fut.result()
+                    except Exception as e:
+                        logger.error(f"--- {name}: build BAŞARISIZ: {e}")
+                        timings[name].error = f"build: {e}"
+                        continue
+                    timings[name].build_seconds = outcome.seconds
+                    timings[name].cache_hit = outcome.cache_hit
+                    if outcome.cache_hit:
+                        build_cache_stats.hits += 1
+                        build_cache_stats.saved_seconds += outcome.saved_seconds
+                    elif BUILD_CACHE_ENABLED:
+                        build_cache_stats.misses += 1
+                    logger.info(f"--- {name}: build ({outcome.seconds:.2f} sn) ---")
+                    if do_deploy:
+                        deploys[deploy_pool.submit(_timed_deploy, by_name[name])] = name
+        elif do_deploy:
+            deploys = {deploy_pool.submit(_timed_deploy, c): c.name for c in contracts}
+
+        for fut in as_completed(deploys):
+            name = deploys[fut]
+            try:
+                timings[name].deploy_seconds = fut.result()
+                logger.info(f"--- {name}: deploy ({timings[name].deploy_seconds:.2f} sn) ---")
+            except Exception as e:
+                logger.error(f"--- {name}: deploy BAŞARISIZ: {e}")
+                timings[name].error = f"deploy: {e}"
+
+    return [timings[c.name] for c in contracts]
+
+
+def _print_timings(timings: list[PipelineTiming]) -> None:
+    def sec(v: float | None) -> str:
+        return "-" if v is None else f"{v:.2f}"
+
+    rows = [["kontrat", "build (sn)", "önbellek", "deploy (sn)", "durum"]]
+    for t in timings:
+        cache = "-" if t.cache_hit is None else ("isabet" if t.cache_hit else "ıskalama")
+        rows.append([t.name, sec(t.build_seconds), cache, sec(t.deploy_seconds), t.error or "OK"])
+    widths = [max(len(r[i]) for r in rows) for i in range(len(rows[0]))]
+    lines = ["  ".join(c.ljust(w) for c, w in zip(r, widths, strict=True)) for r in rows]
+    lines.insert(1, "  ".join("-" * w for w in widths))
+    print("\n" + "\n".join(lines))
+
+
+def main(action: str, target_contract_name: str | None = None, jobs: int | None = None) -> None:
     contracts = discover_contracts(target_contract_name)
     if not contracts:
-        logger.error("Dağıtılacak geçerli bir kontrat bulunamadı. (smart_contracts/event_ticketing/contract.py var mı?)")
+        logger.error(
+            "Dağıtılacak geçerli bir kontrat bulunamadı. (smart_contracts/event_ticketing/contract.py var mı?)"
+        )
         sys.exit(1)
 
     match action:
-        case "build":
-            for c in contracts:
-                logger.info(f"--- {c.name}: build ---")
-                build(artifact_root / c.name, c.path, c.name)
-
-        case "deploy":
-            for c in contracts:
-                logger.info(f"--- {c.name}: deploy ---")
-                deploy_contract(c)
-
-        case "all":
-            for c in contracts:
-                logger.info(f"--- {c.name}: build ---")
-                build(artifact_root / c.name, c.path, c.name)
-                logger.info(f"--- {c.name}: deploy ---")
-                deploy_contract(c)
-                logger.info(f"--- {c.name}: done ---")
+        case "build" | "deploy" | "all":
+            timings = run_pipeline(
+                contracts,
+                do_build=action in {"build", "all"},
+                do_deploy=action in {"deploy", "all"},
+                jobs=jobs or min(len(contracts), os.cpu_count() or 1),
+            )
+            _print_timings(timings)
+            if BUILD_CACHE_ENABLED and action != "deploy":
+                logger.info(build_cache_stats.summary())
+            if any(t.error for t in timings):
+                sys.exit(1)
 
         case _:
             logger.error(f"Bilinmeyen eylem: {action}")
@@ -279,14 +514,21 @@ def main(action: str, target_contract_name: str | None = None) -> None:
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m smart_contracts")
+    parser.add_argument(
+        "args", nargs="*", metavar="[eylem] [kontrat]", help="build | deploy | all, ardından isteğe bağlı kontrat adı"
+    )
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="paralel derleme/deploy sayısı")
+    cli = parser.parse_args()
+
     action = "all"
     target = None
 
-    if len(sys.argv) > 2:
-        action = sys.argv[1]
-        target = sys.argv[2]
-    elif len(sys.argv) > 1:
-        a = sys.argv[1]
+    if len(cli.args) > 1:
+        action = cli.args[0]
+        target = cli.args[1]
+    elif len(cli.args) > 0:
+        a = cli.args[0]
         if a in {"build", "deploy", "all"}:
             action = a
         else:
@@ -294,6 +536,6 @@ if __name__ == "__main__":
             action = "all"
 
     logger.info(f"Eylem: {action}" + (f" | Kontrat: {target}" if target else ""))
-    main(action, target)
+    main(action, target, cli.jobs)
 
 # --- SON: __main__.py dosyasının tamamı ---
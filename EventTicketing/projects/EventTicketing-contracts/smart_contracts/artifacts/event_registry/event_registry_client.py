@@ -0,0 +1,1110 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^3.0.0
+
+# common
+import dataclasses
+import typing
+# core algosdk
+import algosdk
+from algosdk.transaction import OnComplete
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.source_map import SourceMap
+from algosdk.transaction import Transaction
+from algosdk.v2client.models import SimulateTraceConfig
+# utils
+import algokit_utils
+from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
+
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "name": "mbr_payment"}, {"type": "string", "name": "event_name"}, {"type": "uint64", "name": "ticket_price"}, {"type": "uint64", "name": "total_tickets"}], "name": "create_event", "returns": {"type": "uint64"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "event_id"}], "name": "mint_tickets", "returns": {"type": "uint64"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "event_id"}, {"type": "pay", "name": "payment"}], "name": "buy_ticket", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "event_id"}], "name": "get_event", "returns": {"type": "(address,uint64,uint64,uint64,uint64,string)", "struct": "EventInfo"}, "events": [], "readonly": true, "recommendations": {}}], "name": "EventRegistry", "state": {"keys": {"box": {}, "global": {"next_event_id": {"key": "bmV4dA==", "keyType": "AVMBytes", "valueType": "AVMUint64", "desc": "S\u0131radaki etkinlik ID"}}, "local": {}}, "maps": {"box": {"events": {"keyType": "uint64", "valueType": "EventInfo", "prefix": "ZQ=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 1}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"EventInfo": [{"name": "organizer", "type": "address"}, {"name": "ticket_price", "type": "uint64"}, {"name": "total_tickets", "type": "uint64"}, {"name": "tickets_sold", "type": "uint64"}, {"name": "ticket_asa_id", "type": "uint64"}, {"name": "event_name", "type": "string"}]}, "byteCode": {"approval": "CyAEAQgABCYEAWUEbmV4dAQVH3x1BOg+7/UxGEAAAykiZzEbQQAnMRkURDEYRCuCAwRtRQ3KBN/OubYEneodNTYaAI4EAAsAkgE9AacAMRkUMRgUEEQiQzEWIglJOBAiEkQ2GgFJJFmBAghLARUSRElXAgA2GgJJFSMSRDYaA0kVIxJESwQ4BzIKEkRPBDgITwMVgU0IgZADC4HEEwgyDwgPRCQpZURJIggpTGcxAE8DUE8CUIASAAAAAAAAAAAAAAAAAAAAAABCUE8CUEwWKEsBUEm8SE8CvypMULAiQzYaAUkVIxJEF0lAAC8xFkQxFiIJSTgQgQYSREk4GDIIEkRJJMIaKxJEOD5JFSVLAQ8lSwJPAk1MUhdFAUkWKExQSb1FAURJvkhMMQBLASSBILoSREmBOCO6FxREsUsBgUBZSwIVTwNOAlJXAgBLAYEoI7oXMgpHA7IssiuyKrIpJLIkJLIjsiKABlRJQ0tFVLIlsiaBA7IQJLIBs7Q8FkyBOEsCuypMULAiQzYaAUkVIxJEFzEWIglJOBAiEkRMFihMUEm9RQFESYEwI7oXSwGBKCO6F0sBDURLAYE4I7oXSURLAzgISwOBICO6FxJETwM4B0sDJIEguhJEsTEAIrISshSyESWyECSyAbMiCBaBMEy7IkM2GgFJFSMSRBcWKExQSb1FAUS+SCpMULAiQw==", "clear": "C4EBQw=="}, "desc": "\n    \u00c7ok etkinlikli kay\u0131t defteri.\n    Her etkinlik ayr\u0131 bir uygulama yerine bir kutuda (event_id anahtar\u0131yla) tutulur;\n    tek uygulama binlerce k\u00fc\u00e7\u00fck etkinli\u011fe hizmet eder.\n    ", "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAxIDggMCA0CiAgICBieXRlY2Jsb2NrIDB4NjUgMHg2ZTY1Nzg3NCAweDE1MWY3Yzc1IDB4ZTgzZWVmZjUKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF9yZWdpc3RyeS9jb250cmFjdC5weTo1MgogICAgLy8gc2VsZi5uZXh0X2V2ZW50X2lkID0gR2xvYmFsU3RhdGUoVUludDY0KDEpLCBrZXk9YiJuZXh0IiwgZGVzY3JpcHRpb249IlPEsXJhZGFraSBldGtpbmxpayBJRCIpCiAgICBieXRlY18xIC8vIDB4NmU2NTc4NzQKICAgIGludGNfMCAvLyAxCiAgICBhcHBfZ2xvYmFsX3B1dAoKbWFpbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfcmVnaXN0cnkvY29udHJhY3QucHk6NDEKICAgIC8vIGNsYXNzIEV2ZW50UmVnaXN0cnkoQVJDNENvbnRyYWN0KToKICAgIHR4biBOdW1BcHBBcmdzCiAgICBieiBtYWluX19fYWxnb3B5X2RlZmF1bHRfY3JlYXRlQDEzCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIG11c3QgYmUgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydAogICAgYnl0ZWNfMyAvLyBtZXRob2QgImNyZWF0ZV9ldmVudChwYXksc3RyaW5nLHVpbnQ2NCx1aW50NjQpdWludDY0IgogICAgcHVzaGJ5dGVzcyAweDZkNDUwZGNhIDB4ZGZjZWI5YjYgMHg5ZGVhMWQzNSAvLyBtZXRob2QgIm1pbnRfdGlja2V0cyh1aW50NjQpdWludDY0IiwgbWV0aG9kICJidXlfdGlja2V0KHVpbnQ2NCxwYXkpdm9pZCIsIG1ldGhvZCAiZ2V0X2V2ZW50KHVpbnQ2NCkoYWRkcmVzcyx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsc3RyaW5nKSIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIGNyZWF0ZV9ldmVudCBtaW50X3RpY2tldHMgYnV5X3RpY2tldCBnZXRfZXZlbnQKICAgIGVycgoKbWFpbl9fX2FsZ29weV9kZWZhdWx0X2NyZWF0ZUAxMzoKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICAmJgogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBtdXN0IGJlIE5vT3AgJiYgY2FuIG9ubHkgY2FsbCB3aGVuIGNyZWF0aW5nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmV2ZW50X3JlZ2lzdHJ5LmNvbnRyYWN0LkV2ZW50UmVnaXN0cnkuY3JlYXRlX2V2ZW50W3JvdXRpbmddKCkgLT4gdm9pZDoKY3JlYXRlX2V2ZW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU1LTU2CiAgICAvLyAjIC0tLSAxKSBFdGtpbmxpayBvbHXFn3R1cm1hIChrdXR1ICsgQVNBIE1CUidzaSBvcmdhbml6YXTDtnJkZW4pIC0tLQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18wIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMCAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgaW50Y18yIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIHB1c2hpbnQgMiAvLyAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIGR1cAogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzEgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzEgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF9yZWdpc3RyeS9jb250cmFjdC5weTo2NAogICAgLy8gYXNzZXJ0IG1icl9wYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsICLDlmRlbWUgYnUga29udHJhdGEgeWFwxLFsbWFsxLEiCiAgICBkaWcgNAogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIMOWZGVtZSBidSBrb250cmF0YSB5YXDEsWxtYWzEsQogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY1CiAgICAvLyBhc3NlcnQgbWJyX3BheW1lbnQuYW1vdW50ID49IHNlbGYuX2V2ZW50X2RlcG9zaXQoZXZlbnRfbmFtZSksICJEZXBveml0byBrdXR1IHZlIEFTQSBNQlInc2luaSBrYXLFn8SxbGFtxLF5b3IiCiAgICB1bmNvdmVyIDQKICAgIGd0eG5zIEFtb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0OC0xNDkKICAgIC8vICMgRXRraW5saWsga3V0dXN1ICsgdXlndWxhbWFuxLFuIHR1dGFjYcSfxLEgYmlsZXQgQVNBJ3PEsQogICAgLy8gYm94X2J5dGVzID0gVUludDY0KEVWRU5UX0JPWF9LRVlfU0laRSArIEVWRU5UX0lORk9fRklYRURfU0laRSkgKyBldmVudF9uYW1lLmJ5dGVzLmxlbmd0aAogICAgdW5jb3ZlciAzCiAgICBsZW4KICAgIHB1c2hpbnQgNzcgLy8gNzcKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF9yZWdpc3RyeS9jb250cmFjdC5weToxNTIKICAgIC8vICsgVUludDY0KEJPWF9CWVRFX01JTl9CQUxBTkNFKSAqIGJveF9ieXRlcwogICAgcHVzaGludCA0MDAgLy8gNDAwCiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfcmVnaXN0cnkvY29udHJhY3QucHk6MTUxCiAgICAvLyBVSW50NjQoQk9YX0ZMQVRfTUlOX0JBTEFOQ0UpCiAgICBwdXNoaW50IDI1MDAgLy8gMjUwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1MS0xNTIKICAgIC8vIFVJbnQ2NChCT1hfRkxBVF9NSU5fQkFMQU5DRSkKICAgIC8vICsgVUludDY0KEJPWF9CWVRFX01JTl9CQUxBTkNFKSAqIGJveF9ieXRlcwogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1MwogICAgLy8gKyBHbG9iYWwuYXNzZXRfY3JlYXRlX21pbl9iYWxhbmNlCiAgICBnbG9iYWwgQXNzZXRDcmVhdGVNaW5CYWxhbmNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfcmVnaXN0cnkvY29udHJhY3QucHk6MTUxLTE1MwogICAgLy8gVUludDY0KEJPWF9GTEFUX01JTl9CQUxBTkNFKQogICAgLy8gKyBVSW50NjQoQk9YX0JZVEVfTUlOX0JBTEFOQ0UpICogYm94X2J5dGVzCiAgICAvLyArIEdsb2JhbC5hc3NldF9jcmVhdGVfbWluX2JhbGFuY2UKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF9yZWdpc3RyeS9jb250cmFjdC5weTo2NQogICAgLy8gYXNzZXJ0IG1icl9wYXltZW50LmFtb3VudCA+PSBzZWxmLl9ldmVudF9kZXBvc2l0KGV2ZW50X25hbWUpLCAiRGVwb3ppdG8ga3V0dSB2ZSBBU0EgTUJSJ3Npbmkga2FyxZ/EsWxhbcSxeW9yIgogICAgPj0KICAgIGFzc2VydCAvLyBEZXBveml0byBrdXR1IHZlIEFTQSBNQlInc2luaSBrYXLFn8SxbGFtxLF5b3IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF9yZWdpc3RyeS9jb250cmFjdC5weTo2NwogICAgLy8gZXZlbnRfaWQgPSBzZWxmLm5leHRfZXZlbnRfaWQudmFsdWUKICAgIGludGNfMiAvLyAwCiAgICBieXRlY18xIC8vIDB4NmU2NTc4NzQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5uZXh0X2V2ZW50X2lkIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY4CiAgICAvLyBzZWxmLm5leHRfZXZlbnRfaWQudmFsdWUgPSBldmVudF9pZCArIFVJbnQ2NCgxKQogICAgZHVwCiAgICBpbnRjXzAgLy8gMQogICAgKwogICAgYnl0ZWNfMSAvLyAweDZlNjU3ODc0CiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcwCiAgICAvLyBvcmdhbml6ZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY5LTc2CiAgICAvLyBzZWxmLmV2ZW50c1tldmVudF9pZF0gPSBFdmVudEluZm8oCiAgICAvLyAgICAgb3JnYW5pemVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICB0aWNrZXRfcHJpY2U9YXJjNC5VSW50NjQodGlja2V0X3ByaWNlKSwKICAgIC8vICAgICB0b3RhbF90aWNrZXRzPWFyYzQuVUludDY0KHRvdGFsX3RpY2tldHMpLAogICAgLy8gICAgIHRpY2tldHNfc29sZD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICB0aWNrZXRfYXNhX2lkPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGV2ZW50X25hbWU9YXJjNC5TdHJpbmcoZXZlbnRfbmFtZSksCiAgICAvLyApCiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDA0MgogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY5CiAgICAvLyBzZWxmLmV2ZW50c1tldmVudF9pZF0gPSBFdmVudEluZm8oCiAgICBzd2FwCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4NjUKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF9yZWdpc3RyeS9jb250cmFjdC5weTo2OS03NgogICAgLy8gc2VsZi5ldmVudHNbZXZlbnRfaWRdID0gRXZlbnRJbmZvKAogICAgLy8gICAgIG9yZ2FuaXplcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgdGlja2V0X3ByaWNlPWFyYzQuVUludDY0KHRpY2tldF9wcmljZSksCiAgICAvLyAgICAgdG90YWxfdGlja2V0cz1hcmM0LlVJbnQ2NCh0b3RhbF90aWNrZXRzKSwKICAgIC8vICAgICB0aWNrZXRzX3NvbGQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgdGlja2V0X2FzYV9pZD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBldmVudF9uYW1lPWFyYzQuU3RyaW5nKGV2ZW50X25hbWUpLAogICAgLy8gKQogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIHVuY292ZXIgMgogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU1LTU2CiAgICAvLyAjIC0tLSAxKSBFdGtpbmxpayBvbHXFn3R1cm1hIChrdXR1ICsgQVNBIE1CUidzaSBvcmdhbml6YXTDtnJkZW4pIC0tLQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBieXRlY18yIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmV2ZW50X3JlZ2lzdHJ5LmNvbnRyYWN0LkV2ZW50UmVnaXN0cnkubWludF90aWNrZXRzW3JvdXRpbmddKCkgLT4gdm9pZDoKbWludF90aWNrZXRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc5LTgwCiAgICAvLyAjIC0tLSAyKSBNaW50IHRpY2tldHMgKEFTQSkgLS0tCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzEgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgyLTgzCiAgICAvLyAjIGV2ZW50X2lkID0gMDogYXluxLEgZ3J1cHRhIGhlbWVuIMO2bmNlIG9sdcWfdHVydWxhbiBldGtpbmxpayAoSUQgaXN0ZW1jaWRlIHRhaG1pbiBlZGlsbWV6KQogICAgLy8gaWYgZXZlbnRfaWQgPT0gVUludDY0KDApOgogICAgYm56IG1pbnRfdGlja2V0c19hZnRlcl9pZl9lbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF9yZWdpc3RyeS9jb250cmFjdC5weToxMzctMTM4CiAgICAvLyAjIEJpciDDtm5jZWtpIGdydXAgacWfbGVtaSBidSB1eWd1bGFtYXlhIGNyZWF0ZV9ldmVudCDDp2HEn3LEsXPEsSBvbG1hbMSxOyBBQkkgZMO2bsO8xZ/DvCBzb24gbG9nJ2RhZMSxcgogICAgLy8gYXNzZXJ0IFR4bi5ncm91cF9pbmRleCA+IFVJbnQ2NCgwKSwgIkdydXB0YSDDtm5jZWtpIGNyZWF0ZV9ldmVudCDDp2HEn3LEsXPEsSB5b2siCiAgICB0eG4gR3JvdXBJbmRleAogICAgYXNzZXJ0IC8vIEdydXB0YSDDtm5jZWtpIGNyZWF0ZV9ldmVudCDDp2HEn3LEsXPEsSB5b2sKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF9yZWdpc3RyeS9jb250cmFjdC5weToxMzkKICAgIC8vIGNhbGwgPSBndHhuLkFwcGxpY2F0aW9uQ2FsbFRyYW5zYWN0aW9uKFR4bi5ncm91cF9pbmRleCAtIFVJbnQ2NCgxKSkKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzAgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgcHVzaGludCA2IC8vIGFwcGwKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBhcHBsCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfcmVnaXN0cnkvY29udHJhY3QucHk6MTQwCiAgICAvLyBhc3NlcnQgY2FsbC5hcHBfaWQgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQsICJHcnVwdGEgw7ZuY2VraSBjcmVhdGVfZXZlbnQgw6dhxJ9yxLFzxLEgeW9rIgogICAgZHVwCiAgICBndHhucyBBcHBsaWNhdGlvbklECiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uSUQKICAgID09CiAgICBhc3NlcnQgLy8gR3J1cHRhIMO2bmNla2kgY3JlYXRlX2V2ZW50IMOnYcSfcsSxc8SxIHlvawogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MQogICAgLy8gYXNzZXJ0IGNhbGwuYXBwX2FyZ3MoMCkgPT0gYXJjNC5hcmM0X3NpZ25hdHVyZSgKICAgIGR1cAogICAgaW50Y18yIC8vIDAKICAgIGd0eG5zYXMgQXBwbGljYXRpb25BcmdzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfcmVnaXN0cnkvY29udHJhY3QucHk6MTQxLTE0MwogICAgLy8gYXNzZXJ0IGNhbGwuYXBwX2FyZ3MoMCkgPT0gYXJjNC5hcmM0X3NpZ25hdHVyZSgKICAgIC8vICAgICBFdmVudFJlZ2lzdHJ5LmNyZWF0ZV9ldmVudAogICAgLy8gKSwgIkdydXB0YSDDtm5jZWtpIGNyZWF0ZV9ldmVudCDDp2HEn3LEsXPEsSB5b2siCiAgICBieXRlY18zIC8vIG1ldGhvZCAiY3JlYXRlX2V2ZW50KHBheSxzdHJpbmcsdWludDY0LHVpbnQ2NCl1aW50NjQiCiAgICA9PQogICAgYXNzZXJ0IC8vIEdydXB0YSDDtm5jZWtpIGNyZWF0ZV9ldmVudCDDp2HEn3LEsXPEsSB5b2sKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF9yZWdpc3RyeS9jb250cmFjdC5weToxNDQKICAgIC8vIHJldHVybiBvcC5idG9pKGNhbGwubGFzdF9sb2dbQVJDNF9SRVRVUk5fUFJFRklYX1NJWkU6XSkKICAgIGd0eG5zIExhc3RMb2cKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gNAogICAgZGlnIDEKICAgID49CiAgICBpbnRjXzMgLy8gNAogICAgZGlnIDIKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICBzd2FwCiAgICBzdWJzdHJpbmczCiAgICBidG9pCiAgICBidXJ5IDEKCm1pbnRfdGlja2V0c19hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfcmVnaXN0cnkvY29udHJhY3QucHk6ODUKICAgIC8vIGFzc2VydCBldmVudF9pZCBpbiBzZWxmLmV2ZW50cywgIkV0a2lubGlrIGJ1bHVuYW1hZMSxIgogICAgZHVwCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4NjUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBFdGtpbmxpayBidWx1bmFtYWTEsQogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg2CiAgICAvLyByZWNvcmQgPSBzZWxmLmV2ZW50c1tldmVudF9pZF0uY29weSgpCiAgICBkdXAKICAgIGJveF9nZXQKICAgIHBvcAogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg3CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSByZWNvcmQub3JnYW5pemVyLm5hdGl2ZSwgIlNhZGVjZSBldGtpbmxpayBvcmdhbml6YXTDtnLDvCBiaWxldCBiYXNhYmlsaXIiCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfcmVnaXN0cnkvY29udHJhY3QucHk6ODYtODcKICAgIC8vIHJlY29yZCA9IHNlbGYuZXZlbnRzW2V2ZW50X2lkXS5jb3B5KCkKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHJlY29yZC5vcmdhbml6ZXIubmF0aXZlLCAiU2FkZWNlIGV0a2lubGlrIG9yZ2FuaXphdMO2csO8IGJpbGV0IGJhc2FiaWxpciIKICAgIGRpZyAxCiAgICBpbnRjXzIgLy8gMAogICAgcHVzaGludCAzMiAvLyAzMgogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF9yZWdpc3RyeS9jb250cmFjdC5weTo4NwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gcmVjb3JkLm9yZ2FuaXplci5uYXRpdmUsICJTYWRlY2UgZXRraW5saWsgb3JnYW5pemF0w7Zyw7wgYmlsZXQgYmFzYWJpbGlyIgogICAgPT0KICAgIGFzc2VydCAvLyBTYWRlY2UgZXRraW5saWsgb3JnYW5pemF0w7Zyw7wgYmlsZXQgYmFzYWJpbGlyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfcmVnaXN0cnkvY29udHJhY3QucHk6ODgKICAgIC8vIGFzc2VydCByZWNvcmQudGlja2V0X2FzYV9pZC5uYXRpdmUgPT0gVUludDY0KDApLCAiQmlsZXRsZXIgemF0ZW4gYmFzxLFsbcSxxZ8iCiAgICBkdXAKICAgIHB1c2hpbnQgNTYgLy8gNTYKICAgIGludGNfMSAvLyA4CiAgICBib3hfZXh0cmFjdAogICAgYnRvaQogICAgIQogICAgYXNzZXJ0IC8vIEJpbGV0bGVyIHphdGVuIGJhc8SxbG3EscWfCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfcmVnaXN0cnkvY29udHJhY3QucHk6OTAtMTAwCiAgICAvLyBjcmVhdGVkX2Fzc2V0X2lkID0gYWxnb3B5Lml0eG4uQXNzZXRDb25maWcoCiAgICAvLyAgICAgYXNzZXRfbmFtZT1yZWNvcmQuZXZlbnRfbmFtZS5uYXRpdmUsCiAgICAvLyAgICAgdW5pdF9uYW1lPSJUSUNLRVQiLAogICAgLy8gICAgIHRvdGFsPXJlY29yZC50b3RhbF90aWNrZXRzLm5hdGl2ZSwKICAgIC8vICAgICBkZWNpbWFscz0wLAogICAgLy8gICAgIGRlZmF1bHRfZnJvemVuPUZhbHNlLAogICAgLy8gICAgIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICByZXNlcnZlPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgZnJlZXplPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgY2xhd2JhY2s9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICkuc3VibWl0KCkuY3JlYXRlZF9hc3NldC5pZAogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkxCiAgICAvLyBhc3NldF9uYW1lPXJlY29yZC5ldmVudF9uYW1lLm5hdGl2ZSwKICAgIGRpZyAxCiAgICBwdXNoaW50IDY0IC8vIDY0CiAgICBleHRyYWN0X3VpbnQxNgogICAgZGlnIDIKICAgIGxlbgogICAgdW5jb3ZlciAzCiAgICBjb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkzCiAgICAvLyB0b3RhbD1yZWNvcmQudG90YWxfdGlja2V0cy5uYXRpdmUsCiAgICBkaWcgMQogICAgcHVzaGludCA0MCAvLyA0MAogICAgaW50Y18xIC8vIDgKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfcmVnaXN0cnkvY29udHJhY3QucHk6OTYKICAgIC8vIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfcmVnaXN0cnkvY29udHJhY3QucHk6OTctOTkKICAgIC8vIHJlc2VydmU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vIGZyZWV6ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gY2xhd2JhY2s9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGR1cG4gMwogICAgaXR4bl9maWVsZCBDb25maWdBc3NldENsYXdiYWNrCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0RnJlZXplCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0UmVzZXJ2ZQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldE1hbmFnZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF9yZWdpc3RyeS9jb250cmFjdC5weTo5NQogICAgLy8gZGVmYXVsdF9mcm96ZW49RmFsc2UsCiAgICBpbnRjXzIgLy8gMAogICAgaXR4bl9maWVsZCBDb25maWdBc3NldERlZmF1bHRGcm96ZW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF9yZWdpc3RyeS9jb250cmFjdC5weTo5NAogICAgLy8gZGVjaW1hbHM9MCwKICAgIGludGNfMiAvLyAwCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0RGVjaW1hbHMKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRUb3RhbAogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkyCiAgICAvLyB1bml0X25hbWU9IlRJQ0tFVCIsCiAgICBwdXNoYnl0ZXMgIlRJQ0tFVCIKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRVbml0TmFtZQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldE5hbWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF9yZWdpc3RyeS9jb250cmFjdC5weTo5MAogICAgLy8gY3JlYXRlZF9hc3NldF9pZCA9IGFsZ29weS5pdHhuLkFzc2V0Q29uZmlnKAogICAgcHVzaGludCAzIC8vIGFjZmcKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMiAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkwLTEwMAogICAgLy8gY3JlYXRlZF9hc3NldF9pZCA9IGFsZ29weS5pdHhuLkFzc2V0Q29uZmlnKAogICAgLy8gICAgIGFzc2V0X25hbWU9cmVjb3JkLmV2ZW50X25hbWUubmF0aXZlLAogICAgLy8gICAgIHVuaXRfbmFtZT0iVElDS0VUIiwKICAgIC8vICAgICB0b3RhbD1yZWNvcmQudG90YWxfdGlja2V0cy5uYXRpdmUsCiAgICAvLyAgICAgZGVjaW1hbHM9MCwKICAgIC8vICAgICBkZWZhdWx0X2Zyb3plbj1GYWxzZSwKICAgIC8vICAgICBtYW5hZ2VyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgcmVzZXJ2ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGZyZWV6ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGNsYXdiYWNrPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyApLnN1Ym1pdCgpLmNyZWF0ZWRfYXNzZXQuaWQKICAgIGl0eG5fc3VibWl0CiAgICBpdHhuIENyZWF0ZWRBc3NldElECiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfcmVnaXN0cnkvY29udHJhY3QucHk6MTAyCiAgICAvLyByZWNvcmQudGlja2V0X2FzYV9pZCA9IGFyYzQuVUludDY0KGNyZWF0ZWRfYXNzZXRfaWQpCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfcmVnaXN0cnkvY29udHJhY3QucHk6MTAyLTEwMwogICAgLy8gcmVjb3JkLnRpY2tldF9hc2FfaWQgPSBhcmM0LlVJbnQ2NChjcmVhdGVkX2Fzc2V0X2lkKQogICAgLy8gc2VsZi5ldmVudHNbZXZlbnRfaWRdID0gcmVjb3JkLmNvcHkoKQogICAgc3dhcAogICAgcHVzaGludCA1NiAvLyA1NgogICAgZGlnIDIKICAgIGJveF9yZXBsYWNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfcmVnaXN0cnkvY29udHJhY3QucHk6NzktODAKICAgIC8vICMgLS0tIDIpIE1pbnQgdGlja2V0cyAoQVNBKSAtLS0KICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgYnl0ZWNfMiAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5ldmVudF9yZWdpc3RyeS5jb250cmFjdC5FdmVudFJlZ2lzdHJ5LmJ1eV90aWNrZXRbcm91dGluZ10oKSAtPiB2b2lkOgpidXlfdGlja2V0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNi0xMDcKICAgIC8vICMgLS0tIDMpIEJ1eSB0aWNrZXQgKMO2ZGVtZSBkb8SfcnVkYW4gb3JnYW5pemF0w7ZyZSkgLS0tCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzEgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzAgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18wIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwOQogICAgLy8gYXNzZXJ0IGV2ZW50X2lkIGluIHNlbGYuZXZlbnRzLCAiRXRraW5saWsgYnVsdW5hbWFkxLEiCiAgICBzd2FwCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4NjUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBFdGtpbmxpayBidWx1bmFtYWTEsQogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMC0xMTEKICAgIC8vIHJlY29yZCA9IHNlbGYuZXZlbnRzW2V2ZW50X2lkXS5jb3B5KCkKICAgIC8vIHNvbGQgPSByZWNvcmQudGlja2V0c19zb2xkLm5hdGl2ZQogICAgZHVwCiAgICBwdXNoaW50IDQ4IC8vIDQ4CiAgICBpbnRjXzEgLy8gOAogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF9yZWdpc3RyeS9jb250cmFjdC5weToxMTEKICAgIC8vIHNvbGQgPSByZWNvcmQudGlja2V0c19zb2xkLm5hdGl2ZQogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMgogICAgLy8gYXNzZXJ0IHNvbGQgPCByZWNvcmQudG90YWxfdGlja2V0cy5uYXRpdmUsICJCaWxldGxlciB0w7xrZW5kaSIKICAgIGRpZyAxCiAgICBwdXNoaW50IDQwIC8vIDQwCiAgICBpbnRjXzEgLy8gOAogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKICAgIGRpZyAxCiAgICA+CiAgICBhc3NlcnQgLy8gQmlsZXRsZXIgdMO8a2VuZGkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF9yZWdpc3RyeS9jb250cmFjdC5weToxMTMKICAgIC8vIGFzYV9pZCA9IHJlY29yZC50aWNrZXRfYXNhX2lkLm5hdGl2ZQogICAgZGlnIDEKICAgIHB1c2hpbnQgNTYgLy8gNTYKICAgIGludGNfMSAvLyA4CiAgICBib3hfZXh0cmFjdAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNAogICAgLy8gYXNzZXJ0IGFzYV9pZCAhPSBVSW50NjQoMCksICJCaWxldCBzYXTEscWfxLEgaGVuw7x6IGJhxZ9sYW1hZMSxIgogICAgZHVwCiAgICBhc3NlcnQgLy8gQmlsZXQgc2F0xLHFn8SxIGhlbsO8eiBiYcWfbGFtYWTEsQogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNgogICAgLy8gYXNzZXJ0IHBheW1lbnQuYW1vdW50ID09IHJlY29yZC50aWNrZXRfcHJpY2UubmF0aXZlLCAiw5ZkZW1lIG1pa3RhcsSxIGJpbGV0IGZpeWF0xLF5bGEgZcWfbGXFn21peW9yIgogICAgZGlnIDMKICAgIGd0eG5zIEFtb3VudAogICAgZGlnIDMKICAgIHB1c2hpbnQgMzIgLy8gMzIKICAgIGludGNfMSAvLyA4CiAgICBib3hfZXh0cmFjdAogICAgYnRvaQogICAgPT0KICAgIGFzc2VydCAvLyDDlmRlbWUgbWlrdGFyxLEgYmlsZXQgZml5YXTEsXlsYSBlxZ9sZcWfbWl5b3IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF9yZWdpc3RyeS9jb250cmFjdC5weToxMTctMTE4CiAgICAvLyAjIEdlbGlyIHV5Z3VsYW1hZGEgYmlyaWttZXo7IG9yZ2FuaXphdMO2cmxlciBhcmFzxLEgbXVoYXNlYmUgZ2VyZWttZXoKICAgIC8vIGFzc2VydCBwYXltZW50LnJlY2VpdmVyID09IHJlY29yZC5vcmdhbml6ZXIubmF0aXZlLCAiw5ZkZW1lIGV0a2lubGlrIG9yZ2FuaXphdMO2csO8bmUgeWFwxLFsbWFsxLEiCiAgICB1bmNvdmVyIDMKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBkaWcgMwogICAgaW50Y18yIC8vIDAKICAgIHB1c2hpbnQgMzIgLy8gMzIKICAgIGJveF9leHRyYWN0CiAgICA9PQogICAgYXNzZXJ0IC8vIMOWZGVtZSBldGtpbmxpayBvcmdhbml6YXTDtnLDvG5lIHlhcMSxbG1hbMSxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfcmVnaXN0cnkvY29udHJhY3QucHk6MTIwLTEyNAogICAgLy8gYWxnb3B5Lml0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PWFzYV9pZCwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1UeG4uc2VuZGVyLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD0xLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMgogICAgLy8gYXNzZXRfcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF9yZWdpc3RyeS9jb250cmFjdC5weToxMjMKICAgIC8vIGFzc2V0X2Ftb3VudD0xLAogICAgaW50Y18wIC8vIDEKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF9yZWdpc3RyeS9jb250cmFjdC5weToxMjAKICAgIC8vIGFsZ29weS5pdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBpbnRjXzMgLy8gYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMiAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMC0xMjQKICAgIC8vIGFsZ29weS5pdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1hc2FfaWQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9MSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfcmVnaXN0cnkvY29udHJhY3QucHk6MTI2CiAgICAvLyByZWNvcmQudGlja2V0c19zb2xkID0gYXJjNC5VSW50NjQoc29sZCArIFVJbnQ2NCgxKSkKICAgIGludGNfMCAvLyAxCiAgICArCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfcmVnaXN0cnkvY29udHJhY3QucHk6MTI2LTEyNwogICAgLy8gcmVjb3JkLnRpY2tldHNfc29sZCA9IGFyYzQuVUludDY0KHNvbGQgKyBVSW50NjQoMSkpCiAgICAvLyBzZWxmLmV2ZW50c1tldmVudF9pZF0gPSByZWNvcmQuY29weSgpCiAgICBwdXNoaW50IDQ4IC8vIDQ4CiAgICBzd2FwCiAgICBib3hfcmVwbGFjZQogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNi0xMDcKICAgIC8vICMgLS0tIDMpIEJ1eSB0aWNrZXQgKMO2ZGVtZSBkb8SfcnVkYW4gb3JnYW5pemF0w7ZyZSkgLS0tCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuZXZlbnRfcmVnaXN0cnkuY29udHJhY3QuRXZlbnRSZWdpc3RyeS5nZXRfZXZlbnRbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfZXZlbnQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfcmVnaXN0cnkvY29udHJhY3QucHk6MTI5LTEzMAogICAgLy8gIyAtLS0gNCkgRXRraW5saWsgYmlsZ2lzaSAoc2FsdCBva3VudXIpIC0tLQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18xIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfcmVnaXN0cnkvY29udHJhY3QucHk6MTMyCiAgICAvLyBhc3NlcnQgZXZlbnRfaWQgaW4gc2VsZi5ldmVudHMsICJFdGtpbmxpayBidWx1bmFtYWTEsSIKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHg2NQogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIEV0a2lubGlrIGJ1bHVuYW1hZMSxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfcmVnaXN0cnkvY29udHJhY3QucHk6MTMzCiAgICAvLyByZXR1cm4gc2VsZi5ldmVudHNbZXZlbnRfaWRdCiAgICBib3hfZ2V0CiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF9yZWdpc3RyeS9jb250cmFjdC5weToxMjktMTMwCiAgICAvLyAjIC0tLSA0KSBFdGtpbmxpayBiaWxnaXNpIChzYWx0IG9rdW51cikgLS0tCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzIgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4K", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [448], "errorMessage": "Bilet sat\u0131\u015f\u0131 hen\u00fcz ba\u015flamad\u0131"}, {"pc": [439], "errorMessage": "Biletler t\u00fckendi"}, {"pc": [314], "errorMessage": "Biletler zaten bas\u0131lm\u0131\u015f"}, {"pc": [162], "errorMessage": "Depozito kutu ve ASA MBR'sini kar\u015f\u0131lam\u0131yor"}, {"pc": [292, 422, 517], "errorMessage": "Etkinlik bulunamad\u0131"}, {"pc": [238, 256, 263], "errorMessage": "Grupta \u00f6nceki create_event \u00e7a\u011fr\u0131s\u0131 yok"}, {"pc": [42], "errorMessage": "OnCompletion must be NoOp"}, {"pc": [85], "errorMessage": "OnCompletion must be NoOp && can only call when creating"}, {"pc": [306], "errorMessage": "Sadece etkinlik organizat\u00f6r\u00fc bilet basabilir"}, {"pc": [166], "errorMessage": "check self.next_event_id exists"}, {"pc": [103], "errorMessage": "invalid array length header"}, {"pc": [111], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.uint8>"}, {"pc": [123, 131, 230, 401, 507], "errorMessage": "invalid number of bytes for arc4.uint64"}, {"pc": [249], "errorMessage": "transaction type is appl"}, {"pc": [97, 412], "errorMessage": "transaction type is pay"}, {"pc": [139], "errorMessage": "\u00d6deme bu kontrata yap\u0131lmal\u0131"}, {"pc": [473], "errorMessage": "\u00d6deme etkinlik organizat\u00f6r\u00fcne yap\u0131lmal\u0131"}, {"pc": [461], "errorMessage": "\u00d6deme miktar\u0131 bilet fiyat\u0131yla e\u015fle\u015fmiyor"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+
+def _parse_abi_args(args: object | None = None) -> list[object] | None:
+    """Helper to parse ABI args into the format expected by underlying client"""
+    if args is None:
+        return None
+
+    def convert_dataclass(value: object) -> object:
+        if dataclasses.is_dataclass(value):
+            return tuple(convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
+        elif isinstance(value, (list, tuple)):
+            return type(value)(convert_dataclass(item) for item in value)
+        return value
+
+    match args:
+        case tuple():
+            method_args = list(args)
+        case _ if dataclasses.is_dataclass(args):
+            method_args = [getattr(args, field.name) for field in dataclasses.fields(args)]
+        case _:
+            raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
+
+    return [
+        convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        for arg in method_args
+    ] if method_args else None
+
+def _init_dataclass(cls: type, data: dict) -> object:
+    """
+    Recursively instantiate a dataclass of type `cls` from `data`.
+
+    For each field on the dataclass, if the field type is also a dataclass
+    and the corresponding data is a dict, instantiate that field recursively.
+    """
+    field_values = {}
+    for field in dataclasses.fields(cls):
+        field_value = data.get(field.name)
+        # Check if the field expects another dataclass and the value is a dict.
+        if dataclasses.is_dataclass(field.type) and isinstance(field_value, dict):
+            field_values[field.name] = _init_dataclass(typing.cast(type, field.type), field_value)
+        else:
+            field_values[field.name] = field_value
+    return cls(**field_values)
+
+@dataclasses.dataclass(frozen=True)
+class EventInfo:
+    """Struct for EventInfo"""
+    organizer: str
+    ticket_price: int
+    total_tickets: int
+    tickets_sold: int
+    ticket_asa_id: int
+    event_name: str
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CreateEventArgs:
+    """Dataclass for create_event arguments"""
+    mbr_payment: algokit_utils.AppMethodCallTransactionArgument
+    event_name: str
+    ticket_price: int
+    total_tickets: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "create_event(pay,string,uint64,uint64)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class MintTicketsArgs:
+    """Dataclass for mint_tickets arguments"""
+    event_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "mint_tickets(uint64)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class BuyTicketArgs:
+    """Dataclass for buy_ticket arguments"""
+    event_id: int
+    payment: algokit_utils.AppMethodCallTransactionArgument
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "buy_ticket(uint64,pay)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetEventArgs:
+    """Dataclass for get_event arguments"""
+    event_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_event(uint64)(address,uint64,uint64,uint64,uint64,string)"
+
+
+class EventRegistryParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def create_event(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, str, int, int] | CreateEventArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_event(pay,string,uint64,uint64)uint64",
+            "args": method_args,
+        }))
+
+    def mint_tickets(
+        self,
+        args: tuple[int] | MintTicketsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "mint_tickets(uint64)uint64",
+            "args": method_args,
+        }))
+
+    def buy_ticket(
+        self,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | BuyTicketArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "buy_ticket(uint64,pay)void",
+            "args": method_args,
+        }))
+
+    def get_event(
+        self,
+        args: tuple[int] | GetEventArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_event(uint64)(address,uint64,uint64,uint64,uint64,string)",
+            "args": method_args,
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> algokit_utils.AppCallParams:
+        return self.app_client.params.bare.clear_state(
+            params,
+            
+        )
+
+
+class EventRegistryCreateTransactionParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def create_event(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, str, int, int] | CreateEventArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_event(pay,string,uint64,uint64)uint64",
+            "args": method_args,
+        }))
+
+    def mint_tickets(
+        self,
+        args: tuple[int] | MintTicketsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "mint_tickets(uint64)uint64",
+            "args": method_args,
+        }))
+
+    def buy_ticket(
+        self,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | BuyTicketArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "buy_ticket(uint64,pay)void",
+            "args": method_args,
+        }))
+
+    def get_event(
+        self,
+        args: tuple[int] | GetEventArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_event(uint64)(address,uint64,uint64,uint64,uint64,string)",
+            "args": method_args,
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> Transaction:
+        return self.app_client.create_transaction.bare.clear_state(
+            params,
+            
+        )
+
+
+class EventRegistrySend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def create_event(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, str, int, int] | CreateEventArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_event(pay,string,uint64,uint64)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def mint_tickets(
+        self,
+        args: tuple[int] | MintTicketsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "mint_tickets(uint64)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def buy_ticket(
+        self,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | BuyTicketArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "buy_ticket(uint64,pay)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def get_event(
+        self,
+        args: tuple[int] | GetEventArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[EventInfo]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_event(uint64)(address,uint64,uint64,uint64,uint64,string)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(EventInfo, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[EventInfo], parsed_response)
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        return self.app_client.send.bare.clear_state(
+            params,
+            send_params=send_params,
+        )
+
+
+class GlobalStateValue(typing.TypedDict):
+    """Shape of global_state state key values"""
+    next_event_id: int
+
+class EventRegistryState:
+    """Methods to access state for the current EventRegistry app"""
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def global_state(
+        self
+    ) -> "_GlobalState":
+            """Methods to access global_state for the current app"""
+            return _GlobalState(self.app_client)
+
+    @property
+    def box(
+        self
+    ) -> "_BoxState":
+            """Methods to access box for the current app"""
+            return _BoxState(self.app_client)
+
+class _GlobalState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+
+    def get_all(self) -> GlobalStateValue:
+        """Get all current keyed values from global_state state"""
+        result = self.app_client.state.global_state.get_all()
+        if not result:
+            return typing.cast(GlobalStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.global_state.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return typing.cast(GlobalStateValue, converted)
+
+    @property
+    def next_event_id(self) -> int:
+        """Get the current value of the next_event_id key in global_state state"""
+        value = self.app_client.state.global_state.get_value("next_event_id")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+class _BoxState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {
+            "EventInfo": EventInfo
+        }
+
+    def get_all(self) -> dict[str, typing.Any]:
+        """Get all current keyed values from box state"""
+        result = self.app_client.state.box.get_all()
+        if not result:
+            return {}
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.box.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return converted
+
+    @property
+    def events(self) -> "_MapState[int, EventInfo]":
+        """Get values from the events map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "events",
+            self._struct_classes.get("EventInfo")
+        )
+
+_KeyType = typing.TypeVar("_KeyType")
+_ValueType = typing.TypeVar("_ValueType")
+
+class _AppClientStateMethodsProtocol(typing.Protocol):
+    def get_map(self, map_name: str) -> dict[typing.Any, typing.Any]:
+        ...
+    def get_map_value(self, map_name: str, key: typing.Any) -> typing.Any | None:
+        ...
+
+class _MapState(typing.Generic[_KeyType, _ValueType]):
+    """Generic class for accessing state maps with strongly typed keys and values"""
+
+    def __init__(self, state_accessor: _AppClientStateMethodsProtocol, map_name: str,
+                struct_class: typing.Type[_ValueType] | None = None):
+        self._state_accessor = state_accessor
+        self._map_name = map_name
+        self._struct_class = struct_class
+
+    def get_map(self) -> dict[_KeyType, _ValueType]:
+        """Get all current values in the map"""
+        result = self._state_accessor.get_map(self._map_name)
+        if self._struct_class and result:
+            return {k: _init_dataclass(self._struct_class, v) if isinstance(v, dict) else v
+                    for k, v in result.items()}  # type: ignore
+        return typing.cast(dict[_KeyType, _ValueType], result or {})
+
+    def get_value(self, key: _KeyType) -> _ValueType | None:
+        """Get a value from the map by key"""
+        key_value = dataclasses.asdict(key) if dataclasses.is_dataclass(key) else key  # type: ignore
+        value = self._state_accessor.get_map_value(self._map_name, key_value)
+        if value is not None and self._struct_class and isinstance(value, dict):
+            return _init_dataclass(self._struct_class, value)  # type: ignore
+        return typing.cast(_ValueType | None, value)
+
+
+class EventRegistryClient:
+    """Client for interacting with EventRegistry smart contract"""
+
+    @typing.overload
+    def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
+    
+    @typing.overload
+    def __init__(
+        self,
+        *,
+        algorand: _AlgoKitAlgorandClient,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None: ...
+
+    def __init__(
+        self,
+        app_client: algokit_utils.AppClient | None = None,
+        *,
+        algorand: _AlgoKitAlgorandClient | None = None,
+        app_id: int | None = None,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None:
+        if app_client:
+            self.app_client = app_client
+        elif algorand and app_id:
+            self.app_client = algokit_utils.AppClient(
+                algokit_utils.AppClientParams(
+                    algorand=algorand,
+                    app_spec=APP_SPEC,
+                    app_id=app_id,
+                    app_name=app_name,
+                    default_sender=default_sender,
+                    default_signer=default_signer,
+                    approval_source_map=approval_source_map,
+                    clear_source_map=clear_source_map,
+                )
+            )
+        else:
+            raise ValueError("Either app_client or algorand and app_id must be provided")
+    
+        self.params = EventRegistryParams(self.app_client)
+        self.create_transaction = EventRegistryCreateTransactionParams(self.app_client)
+        self.send = EventRegistrySend(self.app_client)
+        self.state = EventRegistryState(self.app_client)
+
+    @staticmethod
+    def from_creator_and_name(
+        creator_address: str,
+        app_name: str,
+        algorand: _AlgoKitAlgorandClient,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+    ) -> "EventRegistryClient":
+        return EventRegistryClient(
+            algokit_utils.AppClient.from_creator_and_name(
+                creator_address=creator_address,
+                app_name=app_name,
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+                ignore_cache=ignore_cache,
+                app_lookup_cache=app_lookup_cache,
+            )
+        )
+    
+    @staticmethod
+    def from_network(
+        algorand: _AlgoKitAlgorandClient,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "EventRegistryClient":
+        return EventRegistryClient(
+            algokit_utils.AppClient.from_network(
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+    
+    @property
+    def app_address(self) -> str:
+        return self.app_client.app_address
+    
+    @property
+    def app_name(self) -> str:
+        return self.app_client.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_client.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_client.algorand
+
+    def clone(
+        self,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "EventRegistryClient":
+        return EventRegistryClient(
+            self.app_client.clone(
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    def new_group(self) -> "EventRegistryComposer":
+        return EventRegistryComposer(self)
+
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["create_event(pay,string,uint64,uint64)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["mint_tickets(uint64)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["buy_ticket(uint64,pay)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_event(uint64)(address,uint64,uint64,uint64,uint64,string)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> EventInfo | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None: ...
+
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | EventInfo | None | int:
+        """Decode ABI return value for the given method."""
+        if return_value is None:
+            return None
+    
+        arc56_method = self.app_spec.get_arc56_method(method)
+        decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
+    
+        # If method returns a struct, convert the dict to appropriate dataclass
+        if (arc56_method and
+            arc56_method.returns and
+            arc56_method.returns.struct and
+            isinstance(decoded, dict)):
+            struct_class = globals().get(arc56_method.returns.struct)
+            if struct_class:
+                return struct_class(**typing.cast(dict, decoded))
+        return decoded
+
+
+@dataclasses.dataclass(frozen=True)
+class EventRegistryBareCallCreateParams(algokit_utils.AppClientBareCallCreateParams):
+    """Parameters for creating EventRegistry contract with bare calls"""
+    on_complete: typing.Literal[OnComplete.NoOpOC] | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallCreateParams:
+        return algokit_utils.AppClientBareCallCreateParams(**self.__dict__)
+
+class EventRegistryFactory(algokit_utils.TypedAppFactoryProtocol[EventRegistryBareCallCreateParams, None, None]):
+    """Factory for deploying and managing EventRegistryClient smart contracts"""
+
+    def __init__(
+        self,
+        algorand: _AlgoKitAlgorandClient,
+        *,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        version: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ):
+        self.app_factory = algokit_utils.AppFactory(
+            params=algokit_utils.AppFactoryParams(
+                algorand=algorand,
+                app_spec=APP_SPEC,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                version=version,
+                compilation_params=compilation_params,
+            )
+        )
+        self.params = EventRegistryFactoryParams(self.app_factory)
+        self.create_transaction = EventRegistryFactoryCreateTransaction(self.app_factory)
+        self.send = EventRegistryFactorySend(self.app_factory)
+
+    @property
+    def app_name(self) -> str:
+        return self.app_factory.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_factory.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_factory.algorand
+
+    def deploy(
+        self,
+        *,
+        on_update: algokit_utils.OnUpdate | None = None,
+        on_schema_break: algokit_utils.OnSchemaBreak | None = None,
+        create_params: EventRegistryBareCallCreateParams | None = None,
+        update_params: None = None,
+        delete_params: None = None,
+        existing_deployments: algokit_utils.ApplicationLookup | None = None,
+        ignore_cache: bool = False,
+        app_name: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> tuple[EventRegistryClient, algokit_utils.AppFactoryDeployResult]:
+        """Deploy the application"""
+        deploy_response = self.app_factory.deploy(
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            create_params=create_params.to_algokit_utils_params() if create_params else None,
+            update_params=update_params,
+            delete_params=delete_params,
+            existing_deployments=existing_deployments,
+            ignore_cache=ignore_cache,
+            app_name=app_name,
+            compilation_params=compilation_params,
+            send_params=send_params,
+        )
+
+        return EventRegistryClient(deploy_response[0]), deploy_response[1]
+
+    def get_app_client_by_creator_and_name(
+        self,
+        creator_address: str,
+        app_name: str,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> EventRegistryClient:
+        """Get an app client by creator address and name"""
+        return EventRegistryClient(
+            self.app_factory.get_app_client_by_creator_and_name(
+                creator_address,
+                app_name,
+                default_sender,
+                default_signer,
+                ignore_cache,
+                app_lookup_cache,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+    def get_app_client_by_id(
+        self,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> EventRegistryClient:
+        """Get an app client by app ID"""
+        return EventRegistryClient(
+            self.app_factory.get_app_client_by_id(
+                app_id,
+                app_name,
+                default_sender,
+                default_signer,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+
+class EventRegistryFactoryParams:
+    """Parameters for creating transactions for EventRegistry contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = EventRegistryFactoryCreateParams(app_factory)
+        self.update = EventRegistryFactoryUpdateParams(app_factory)
+        self.delete = EventRegistryFactoryDeleteParams(app_factory)
+
+class EventRegistryFactoryCreateParams:
+    """Parameters for 'create' operations of EventRegistry contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateParams:
+        """Creates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            compilation_params=compilation_params)
+
+    def create_event(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, str, int, int] | CreateEventArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the create_event(pay,string,uint64,uint64)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "create_event(pay,string,uint64,uint64)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def mint_tickets(
+        self,
+        args: tuple[int] | MintTicketsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the mint_tickets(uint64)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "mint_tickets(uint64)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def buy_ticket(
+        self,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | BuyTicketArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the buy_ticket(uint64,pay)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "buy_ticket(uint64,pay)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_event(
+        self,
+        args: tuple[int] | GetEventArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_event(uint64)(address,uint64,uint64,uint64,uint64,string) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_event(uint64)(address,uint64,uint64,uint64,uint64,string)",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+class EventRegistryFactoryUpdateParams:
+    """Parameters for 'update' operations of EventRegistry contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppUpdateParams:
+        """Updates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_update(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            )
+
+class EventRegistryFactoryDeleteParams:
+    """Parameters for 'delete' operations of EventRegistry contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppDeleteParams:
+        """Deletes an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_delete(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            )
+
+
+class EventRegistryFactoryCreateTransaction:
+    """Create transactions for EventRegistry contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = EventRegistryFactoryCreateTransactionCreate(app_factory)
+
+
+class EventRegistryFactoryCreateTransactionCreate:
+    """Create new instances of EventRegistry contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+    ) -> Transaction:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.create_transaction.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+        )
+
+
+class EventRegistryFactorySend:
+    """Send calls to EventRegistry contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = EventRegistryFactorySendCreate(app_factory)
+
+
+class EventRegistryFactorySendCreate:
+    """Send create calls to EventRegistry contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ) -> tuple[EventRegistryClient, algokit_utils.SendAppCreateTransactionResult]:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        result = self.app_factory.send.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            send_params=send_params,
+            compilation_params=compilation_params
+        )
+        return EventRegistryClient(result[0]), result[1]
+
+
+class EventRegistryComposer:
+    """Composer for creating transaction groups for EventRegistry contract calls"""
+
+    def __init__(self, client: "EventRegistryClient"):
+        self.client = client
+        self._composer = client.algorand.new_group()
+        self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+
+    def create_event(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, str, int, int] | CreateEventArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "EventRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.create_event(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "create_event(pay,string,uint64,uint64)uint64", v
+            )
+        )
+        return self
+
+    def mint_tickets(
+        self,
+        args: tuple[int] | MintTicketsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "EventRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.mint_tickets(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "mint_tickets(uint64)uint64", v
+            )
+        )
+        return self
+
+    def buy_ticket(
+        self,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | BuyTicketArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "EventRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.buy_ticket(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "buy_ticket(uint64,pay)void", v
+            )
+        )
+        return self
+
+    def get_event(
+        self,
+        args: tuple[int] | GetEventArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "EventRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_event(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_event(uint64)(address,uint64,uint64,uint64,uint64,string)", v
+            )
+        )
+        return self
+
+    def clear_state(
+        self,
+        *,
+        args: list[bytes] | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "EventRegistryComposer":
+        params=params or algokit_utils.CommonAppCallParams()
+        self._composer.add_app_call(
+            self.client.params.clear_state(
+                algokit_utils.AppClientBareCallParams(
+                    **{
+                        **dataclasses.asdict(params),
+                        "args": args
+                    }
+                )
+            )
+        )
+        return self
+    
+    def add_transaction(
+        self, txn: Transaction, signer: TransactionSigner | None = None
+    ) -> "EventRegistryComposer":
+        self._composer.add_transaction(txn, signer)
+        return self
+    
+    def composer(self) -> algokit_utils.TransactionComposer:
+        return self._composer
+    
+    def simulate(
+        self,
+        allow_more_logs: bool | None = None,
+        allow_empty_signatures: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        exec_trace_config: SimulateTraceConfig | None = None,
+        simulation_round: int | None = None,
+        skip_signatures: bool | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.simulate(
+            allow_more_logs=allow_more_logs,
+            allow_empty_signatures=allow_empty_signatures,
+            allow_unnamed_resources=allow_unnamed_resources,
+            extra_opcode_budget=extra_opcode_budget,
+            exec_trace_config=exec_trace_config,
+            simulation_round=simulation_round,
+            skip_signatures=skip_signatures,
+        )
+    
+    def send(
+        self,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.send(send_params)
@@ -19,7 +19,7 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [{"type": "string", "name": "event_name"}, {"type": "uint64", "name": "ticket_price"}, {"type": "uint64", "name": "total_tickets"}], "name": "create_application", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "mint_tickets", "returns": {"type": "uint64"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "name": "payment"}], "name": "buy_ticket", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}], "name": "EventTicketing", "state": {"keys": {"box": {}, "global": {"ticket_asa_id": {"key": "YXNhX2lk", "keyType": "AVMBytes", "valueType": "AVMUint64", "desc": "Mint edilen bilet ASA ID"}, "ticket_price": {"key": "cHJpY2U=", "keyType": "AVMBytes", "valueType": "AVMUint64", "desc": "Bilet fiyat\u0131 (\u00b5Algo)"}, "total_tickets": {"key": "dG90YWw=", "keyType": "AVMBytes", "valueType": "AVMUint64", "desc": "Toplam bilet"}, "tickets_sold": {"key": "c29sZA==", "keyType": "AVMBytes", "valueType": "AVMUint64", "desc": "Sat\u0131lan bilet"}, "event_name": {"key": "bmFtZQ==", "keyType": "AVMBytes", "valueType": "AVMString", "desc": "Etkinlik ad\u0131"}}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 1, "ints": 4}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "byteCode": {"approval": "CyADAAEIJgUGYXNhX2lkBXRvdGFsBHNvbGQEbmFtZQVwcmljZTEZFEQxGEEAFoICBICyAQAEZTaAuDYaAI4CAEYAlQCABArw0U82GgCOAQABADYaAUkiWYECCEsBFRJEVwIANhoCSRUkEkQXNhoDSRUkEkQXK08DZycETwJnKUxnKiJnKCJnI0MxADIJEkQiKGVEFESxIitlRCIpZUQyCkcDsiyyK7IqsikisiQisiOyIoAGVElDS0VUsiWyJoEDshAisgGztDwoSwFnFoAEFR98dUxQsCNDMRYjCUk4ECMSRCIqZUQiKWVESwENRCIoZURJREsCOAgiJwRlRBJETwI4BzIKEkSxMQAjshKyFLIRgQSyECKyAbMjCCpMZyND", "clear": "C4EBQw=="}, "desc": "\n    Event Ticketing Ak\u0131ll\u0131 Kontrat\u0131\n    Biletleri ASA/NFT olarak basar ve satar.\n    ", "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgOAogICAgYnl0ZWNibG9jayAweDYxNzM2MTVmNjk2NCAweDc0NmY3NDYxNmMgMHg3MzZmNmM2NCAweDZlNjE2ZDY1IDB4NzA3MjY5NjM2NQogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToxNgogICAgLy8gY2xhc3MgRXZlbnRUaWNrZXRpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gbXVzdCBiZSBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYnogbWFpbl9jcmVhdGVfTm9PcEA4CiAgICBwdXNoYnl0ZXNzIDB4ODBiMjAxMDAgMHg2NTM2ODBiOCAvLyBtZXRob2QgIm1pbnRfdGlja2V0cygpdWludDY0IiwgbWV0aG9kICJidXlfdGlja2V0KHBheSl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWludF90aWNrZXRzIGJ1eV90aWNrZXQKICAgIGVycgoKbWFpbl9jcmVhdGVfTm9PcEA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToxNgogICAgLy8gY2xhc3MgRXZlbnRUaWNrZXRpbmcoQVJDNENvbnRyYWN0KToKICAgIHB1c2hieXRlcyAweDBhZjBkMTRmIC8vIG1ldGhvZCAiY3JlYXRlX2FwcGxpY2F0aW9uKHN0cmluZyx1aW50NjQsdWludDY0KXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBjcmVhdGVfYXBwbGljYXRpb24KICAgIGVycgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5ldmVudF90aWNrZXRpbmcuY29udHJhY3QuRXZlbnRUaWNrZXRpbmcuY3JlYXRlX2FwcGxpY2F0aW9uW3JvdXRpbmddKCkgLT4gdm9pZDoKY3JlYXRlX2FwcGxpY2F0aW9uOgogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weTozNi0zNwogICAgLy8gIyAtLS0gMSkgQ3JlYXRlIC8gSW5pdCAtLS0KICAgIC8vIEBhcmM0LmFiaW1ldGhvZChjcmVhdGU9InJlcXVpcmUiKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgcHVzaGludCAyIC8vIDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6NDQKICAgIC8vIHNlbGYuZXZlbnRfbmFtZS52YWx1ZSA9IGV2ZW50X25hbWUKICAgIGJ5dGVjXzMgLy8gMHg2ZTYxNmQ2NQogICAgdW5jb3ZlciAzCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weTo0NQogICAgLy8gc2VsZi50aWNrZXRfcHJpY2UudmFsdWUgPSB0aWNrZXRfcHJpY2UKICAgIGJ5dGVjIDQgLy8gMHg3MDcyNjk2MzY1CiAgICB1bmNvdmVyIDIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjQ2CiAgICAvLyBzZWxmLnRvdGFsX3RpY2tldHMudmFsdWUgPSB0b3RhbF90aWNrZXRzCiAgICBieXRlY18xIC8vIDB4NzQ2Zjc0NjE2YwogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6NDcKICAgIC8vIHNlbGYudGlja2V0c19zb2xkLnZhbHVlID0gVUludDY0KDApCiAgICBieXRlY18yIC8vIDB4NzM2ZjZjNjQKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weTo0OAogICAgLy8gc2VsZi50aWNrZXRfYXNhX2lkLnZhbHVlID0gVUludDY0KDApCiAgICBieXRlY18wIC8vIDB4NjE3MzYxNWY2OTY0CiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6MzYtMzcKICAgIC8vICMgLS0tIDEpIENyZWF0ZSAvIEluaXQgLS0tCiAgICAvLyBAYXJjNC5hYmltZXRob2QoY3JlYXRlPSJyZXF1aXJlIikKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuZXZlbnRfdGlja2V0aW5nLmNvbnRyYWN0LkV2ZW50VGlja2V0aW5nLm1pbnRfdGlja2V0c1tyb3V0aW5nXSgpIC0+IHZvaWQ6Cm1pbnRfdGlja2V0czoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6NTMtNTQKICAgIC8vICMgU2FkZWNlIGt1cnVjdQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywgIlNhZGVjZSBrb250cmF0IGt1cnVjdXN1IGJpbGV0IGJhc2FiaWxpciIKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBTYWRlY2Uga29udHJhdCBrdXJ1Y3VzdSBiaWxldCBiYXNhYmlsaXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6NTUtNTYKICAgIC8vICMgRGFoYSDDtm5jZSBiYXPEsWxtYWTEsSBtxLE/CiAgICAvLyBhc3NlcnQgc2VsZi50aWNrZXRfYXNhX2lkLnZhbHVlID09IFVJbnQ2NCgwKSwgIkJpbGV0bGVyIHphdGVuIGJhc8SxbG3EscWfIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gMHg2MTczNjE1ZjY5NjQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50aWNrZXRfYXNhX2lkIGV4aXN0cwogICAgIQogICAgYXNzZXJ0IC8vIEJpbGV0bGVyIHphdGVuIGJhc8SxbG3EscWfCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjU4LTY4CiAgICAvLyBjcmVhdGVkX2Fzc2V0X2lkID0gYWxnb3B5Lml0eG4uQXNzZXRDb25maWcoCiAgICAvLyAgICAgYXNzZXRfbmFtZT1zZWxmLmV2ZW50X25hbWUudmFsdWUsCiAgICAvLyAgICAgdW5pdF9uYW1lPSJUSUNLRVQiLAogICAgLy8gICAgIHRvdGFsPXNlbGYudG90YWxfdGlja2V0cy52YWx1ZSwKICAgIC8vICAgICBkZWNpbWFscz0wLAogICAgLy8gICAgIGRlZmF1bHRfZnJvemVuPUZhbHNlLAogICAgLy8gICAgIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICByZXNlcnZlPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgZnJlZXplPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgY2xhd2JhY2s9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICkuc3VibWl0KCkuY3JlYXRlZF9hc3NldC5pZAogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weTo1OQogICAgLy8gYXNzZXRfbmFtZT1zZWxmLmV2ZW50X25hbWUudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAweDZlNjE2ZDY1CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZXZlbnRfbmFtZSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6NjEKICAgIC8vIHRvdGFsPXNlbGYudG90YWxfdGlja2V0cy52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vIDB4NzQ2Zjc0NjE2YwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX3RpY2tldHMgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjY0CiAgICAvLyBtYW5hZ2VyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weTo2NS02NwogICAgLy8gcmVzZXJ2ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gZnJlZXplPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyBjbGF3YmFjaz1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgZHVwbiAzCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0Q2xhd2JhY2sKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRGcmVlemUKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRSZXNlcnZlCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0TWFuYWdlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weTo2MwogICAgLy8gZGVmYXVsdF9mcm96ZW49RmFsc2UsCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBDb25maWdBc3NldERlZmF1bHRGcm96ZW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6NjIKICAgIC8vIGRlY2ltYWxzPTAsCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBDb25maWdBc3NldERlY2ltYWxzCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0VG90YWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6NjAKICAgIC8vIHVuaXRfbmFtZT0iVElDS0VUIiwKICAgIHB1c2hieXRlcyAiVElDS0VUIgogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFVuaXROYW1lCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0TmFtZQogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weTo1OAogICAgLy8gY3JlYXRlZF9hc3NldF9pZCA9IGFsZ29weS5pdHhuLkFzc2V0Q29uZmlnKAogICAgcHVzaGludCAzIC8vIGFjZmcKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weTo1OC02OAogICAgLy8gY3JlYXRlZF9hc3NldF9pZCA9IGFsZ29weS5pdHhuLkFzc2V0Q29uZmlnKAogICAgLy8gICAgIGFzc2V0X25hbWU9c2VsZi5ldmVudF9uYW1lLnZhbHVlLAogICAgLy8gICAgIHVuaXRfbmFtZT0iVElDS0VUIiwKICAgIC8vICAgICB0b3RhbD1zZWxmLnRvdGFsX3RpY2tldHMudmFsdWUsCiAgICAvLyAgICAgZGVjaW1hbHM9MCwKICAgIC8vICAgICBkZWZhdWx0X2Zyb3plbj1GYWxzZSwKICAgIC8vICAgICBtYW5hZ2VyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgcmVzZXJ2ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGZyZWV6ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGNsYXdiYWNrPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyApLnN1Ym1pdCgpLmNyZWF0ZWRfYXNzZXQuaWQKICAgIGl0eG5fc3VibWl0CiAgICBpdHhuIENyZWF0ZWRBc3NldElECiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjcwCiAgICAvLyBzZWxmLnRpY2tldF9hc2FfaWQudmFsdWUgPSBjcmVhdGVkX2Fzc2V0X2lkCiAgICBieXRlY18wIC8vIDB4NjE3MzYxNWY2OTY0CiAgICBkaWcgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6NTAtNTEKICAgIC8vICMgLS0tIDIpIE1pbnQgdGlja2V0cyAoQVNBKSAtLS0KICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaXRvYgogICAgcHVzaGJ5dGVzIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmV2ZW50X3RpY2tldGluZy5jb250cmFjdC5FdmVudFRpY2tldGluZy5idXlfdGlja2V0W3JvdXRpbmddKCkgLT4gdm9pZDoKYnV5X3RpY2tldDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6NzMtNzQKICAgIC8vICMgLS0tIDMpIEJ1eSB0aWNrZXQgKGF0b21pYyB3aXRoIHBheW1lbnQpIC0tLQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6NzYKICAgIC8vIGFzc2VydCBzZWxmLnRpY2tldHNfc29sZC52YWx1ZSA8IHNlbGYudG90YWxfdGlja2V0cy52YWx1ZSwgIkJpbGV0bGVyIHTDvGtlbmRpIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gMHg3MzZmNmM2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRpY2tldHNfc29sZCBleGlzdHMKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vIDB4NzQ2Zjc0NjE2YwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX3RpY2tldHMgZXhpc3RzCiAgICBkaWcgMQogICAgPgogICAgYXNzZXJ0IC8vIEJpbGV0bGVyIHTDvGtlbmRpCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5Ojc3CiAgICAvLyBhc3NlcnQgc2VsZi50aWNrZXRfYXNhX2lkLnZhbHVlICE9IFVJbnQ2NCgwKSwgIkJpbGV0IHNhdMSxxZ/EsSBoZW7DvHogYmHFn2xhbWFkxLEiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAweDYxNzM2MTVmNjk2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRpY2tldF9hc2FfaWQgZXhpc3RzCiAgICBkdXAKICAgIGFzc2VydCAvLyBCaWxldCBzYXTEscWfxLEgaGVuw7x6IGJhxZ9sYW1hZMSxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5Ojc5CiAgICAvLyBhc3NlcnQgcGF5bWVudC5hbW91bnQgPT0gc2VsZi50aWNrZXRfcHJpY2UudmFsdWUsICLDlmRlbWUgbWlrdGFyxLEgYmlsZXQgZml5YXTEsXlsYSBlxZ9sZcWfbWl5b3IiCiAgICBkaWcgMgogICAgZ3R4bnMgQW1vdW50CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAweDcwNzI2OTYzNjUKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50aWNrZXRfcHJpY2UgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIMOWZGVtZSBtaWt0YXLEsSBiaWxldCBmaXlhdMSxeWxhIGXFn2xlxZ9taXlvcgogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weTo4MAogICAgLy8gYXNzZXJ0IHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgIsOWZGVtZSBidSBrb250cmF0YSB5YXDEsWxtYWzEsSIKICAgIHVuY292ZXIgMgogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIMOWZGVtZSBidSBrb250cmF0YSB5YXDEsWxtYWzEsQogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weTo4Mi04NwogICAgLy8gIyBORlQgdHJhbnNmZXJpIChpbm5lciB0eCkKICAgIC8vIGFsZ29weS5pdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1zZWxmLnRpY2tldF9hc2FfaWQudmFsdWUsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9MSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6ODUKICAgIC8vIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5Ojg2CiAgICAvLyBhc3NldF9hbW91bnQ9MSwKICAgIGludGNfMSAvLyAxCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjgyLTgzCiAgICAvLyAjIE5GVCB0cmFuc2ZlcmkgKGlubmVyIHR4KQogICAgLy8gYWxnb3B5Lml0eG4uQXNzZXRUcmFuc2ZlcigKICAgIHB1c2hpbnQgNCAvLyBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjgyLTg3CiAgICAvLyAjIE5GVCB0cmFuc2ZlcmkgKGlubmVyIHR4KQogICAgLy8gYWxnb3B5Lml0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYudGlja2V0X2FzYV9pZC52YWx1ZSwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1UeG4uc2VuZGVyLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD0xLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6ODkKICAgIC8vIHNlbGYudGlja2V0c19zb2xkLnZhbHVlID0gc2VsZi50aWNrZXRzX3NvbGQudmFsdWUgKyBVSW50NjQoMSkKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlY18yIC8vIDB4NzM2ZjZjNjQKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjczLTc0CiAgICAvLyAjIC0tLSAzKSBCdXkgdGlja2V0IChhdG9taWMgd2l0aCBwYXltZW50KSAtLS0KICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgo=", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [243], "errorMessage": "Bilet sat\u0131\u015f\u0131 hen\u00fcz ba\u015flamad\u0131"}, {"pc": [237], "errorMessage": "Biletler t\u00fckendi"}, {"pc": [148], "errorMessage": "Biletler zaten bas\u0131lm\u0131\u015f"}, {"pc": [40], "errorMessage": "OnCompletion must be NoOp"}, {"pc": [142], "errorMessage": "Sadece kontrat kurucusu bilet basabilir"}, {"pc": [153], "errorMessage": "check self.event_name exists"}, {"pc": [146, 241], "errorMessage": "check self.ticket_asa_id exists"}, {"pc": [252], "errorMessage": "check self.ticket_price exists"}, {"pc": [229], "errorMessage": "check self.tickets_sold exists"}, {"pc": [157, 233], "errorMessage": "check self.total_tickets exists"}, {"pc": [87], "errorMessage": "invalid array length header"}, {"pc": [95], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.uint8>"}, {"pc": [106, 115], "errorMessage": "invalid number of bytes for arc4.uint64"}, {"pc": [225], "errorMessage": "transaction type is pay"}, {"pc": [262], "errorMessage": "\u00d6deme bu kontrata yap\u0131lmal\u0131"}, {"pc": [254], "errorMessage": "\u00d6deme miktar\u0131 bilet fiyat\u0131yla e\u015fle\u015fmiyor"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [{"type": "string", "name": "event_name"}, {"type": "uint64", "name": "ticket_price"}, {"type": "uint64", "name": "total_tickets"}, {"type": "uint64", "name": "max_per_address"}], "name": "create_application", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "mint_tickets", "returns": {"type": "uint64"}, "events": [{"args": [{"type": "uint64", "name": "asa_id"}, {"type": "uint64", "name": "total"}], "name": "TicketsMinted", "desc": "ARC-28 olay\u0131: mint_tickets sonunda bilet ASA's\u0131 ve toplam arz"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "name": "payment"}], "name": "buy_ticket", "returns": {"type": "void"}, "events": [{"args": [{"type": "address", "name": "buyer"}, {"type": "uint64", "name": "count"}, {"type": "uint64", "name": "sold_after"}], "name": "TicketSold", "desc": "ARC-28 olay\u0131: buy_ticket / buy_tickets ba\u015f\u0131na bir log kayd\u0131"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "name": "payment"}, {"type": "uint64", "name": "count"}], "name": "buy_tickets", "returns": {"type": "void"}, "events": [{"args": [{"type": "address", "name": "buyer"}, {"type": "uint64", "name": "count"}, {"type": "uint64", "name": "sold_after"}], "name": "TicketSold", "desc": "ARC-28 olay\u0131: buy_ticket / buy_tickets ba\u015f\u0131na bir log kayd\u0131"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_sale_info", "returns": {"type": "(uint64,uint64,uint64,uint64,string)", "struct": "SaleInfo"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "buyer"}], "name": "get_purchase", "returns": {"type": "(uint64,uint64,uint64)", "struct": "PurchaseRecord"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "ticket_index"}], "name": "redeem", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint32[]", "name": "indices"}], "name": "redeem_batch", "returns": {"type": "uint32[]"}, "events": [], "readonly": false, "recommendations": {}}], "name": "EventTicketing", "state": {"keys": {"box": {"checkins": {"key": "Y2hlY2tpbg==", "keyType": "AVMBytes", "valueType": "AVMBytes"}}, "global": {"sale_params": {"key": "cGFyYW1z", "keyType": "AVMBytes", "valueType": "SaleParams", "desc": "Fiyat, toplam, ASA, s\u0131n\u0131r"}, "tickets_sold": {"key": "c29sZA==", "keyType": "AVMBytes", "valueType": "AVMUint64", "desc": "Sat\u0131lan bilet"}, "event_name": {"key": "bmFtZQ==", "keyType": "AVMBytes", "valueType": "AVMString", "desc": "Etkinlik ad\u0131"}}, "local": {}}, "maps": {"box": {"purchases": {"keyType": "address", "valueType": "PurchaseRecord", "prefix": "cA=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 2, "ints": 1}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"PurchaseRecord": [{"name": "count", "type": "uint64"}, {"name": "first_round", "type": "uint64"}, {"name": "last_round", "type": "uint64"}], "SaleInfo": [{"name": "ticket_asa_id", "type": "uint64"}, {"name": "ticket_price", "type": "uint64"}, {"name": "total_tickets", "type": "uint64"}, {"name": "tickets_sold", "type": "uint64"}, {"name": "event_name", "type": "string"}], "SaleParams": [{"name": "ticket_price", "type": "uint64"}, {"name": "total_tickets", "type": "uint64"}, {"name": "ticket_asa_id", "type": "uint64"}, {"name": "max_per_address", "type": "uint64"}]}, "byteCode": {"approval": "CyAEAAEIBCYIBnBhcmFtcwRzb2xkBBUffHUEbmFtZQgAAAAAAAAAAAdjaGVja2luBKAzppcDBoEBMRkURDEYQQA5ggcEgLIBAARlNoC4BCYcMakEzmqemwTvkXq0BAONYKQEm/H4sTYaAI4HAEwA0wFCAb0B+AIqAkUAgARgE6opNhoAjgEAAQA2GgFJIlmBAghLARUSRFcCADYaAkkVJBJENhoDSRUkEkQ2GgRJFSQSRCtPBGdOAlAnBFBMUChMZykiZyNDMQAyCRJEIihlREmBEFsURElXCAhLASRbSYGAgAQORLEiK2VEMgpHA7IssiuyKrIpIrIkIrIjSwGyIoAGVElDS0VUsiWyJoEDshAisgGztDxLA1cACEwWTwRXGAhPAksEUEsCUExQKExnTIEHCCQKJwVMuURJTwJQgASRKFTOTFCwKkxQsCNDMRYjCUk4ECMSRCIoZUQiKWVESwEkW0sBDURLAYEQW0lESwM4CEsDIlsSRE8DOAcyChJEsTEAI7ISshSyESWyECKyAbMjCClLAWcxAE8CgRhbI0yIAbQxAEwWTIAIAAAAAAAAAAFQTFAnBkxQsCNDMRYjCUk4ECMSRDYaAUkVJBJESRdJRCIoZURJgRBbSUQiKWVESwMISwIkW0sBD0RLBTgISwMiW0sFCxJETwU4BzIKEkSxMQBLBLISshRMshElshAisgGzKUsBZzEATwKBGFtMTwNPAogBMTEATBZMTwJQTFAnBkxQsCNDIihlRElXEAhLAVcACE8CVwgIIillRBYiK2VESRUWVwYCTFBPBE8EUE8DUE8CUIACACJQTFAqTFCwI0M2GgFJFYEgEkSAAXBMUL6AGAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAE4CTSpMULAjQzYaAUkVJBJEFzEAMgkSRCIoZUQkW4gA4EQjQyJJgABJNhoBRwIiWUlOAkklC4ECCE8CFRJEMQAyCRJEgSgLgQoISTIMDUEAGLGBBrIQgQWyGScHsh4nB7IfIrIBs0L/4SIoZUQkW0UEgAIAAEUGIkUFSwRLAgxBADNLAlcCAEsFJQtKJVhFCVpLBIgAa0AAE0sFSUsIUEwiWSMIFlcGAlwARQZLBCMIRQVC/8UqSwZQsCNDigMAgAFwi/1QSTIGFicETFAnBFBMvk1JIluL/giL/0EACIsCi/8OQQAXI0SLAhaLAVcICDIGFk4CUExQiwBMv4kiQv/migIBi/6L/wxEi/4kCkmL/iQYSU8CJwVMI7pJTwJTIxJBAAQijACJiwKLASNUJwWLAE8CuyOMAIk=", "clear": "C4EBQw=="}, "desc": "\n    Event Ticketing Ak\u0131ll\u0131 Kontrat\u0131\n    Biletleri ASA/NFT olarak basar ve satar.\n    ", "events": [{"args": [{"type": "uint64", "name": "asa_id"}, {"type": "uint64", "name": "total"}], "name": "TicketsMinted", "desc": "ARC-28 olay\u0131: mint_tickets sonunda bilet ASA's\u0131 ve toplam arz"}, {"args": [{"type": "address", "name": "buyer"}, {"type": "uint64", "name": "count"}, {"type": "uint64", "name": "sold_after"}], "name": "TicketSold", "desc": "ARC-28 olay\u0131: buy_ticket / buy_tickets ba\u015f\u0131na bir log kayd\u0131"}], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgOCA0CiAgICBieXRlY2Jsb2NrIDB4NzA2MTcyNjE2ZDczIDB4NzM2ZjZjNjQgMHgxNTFmN2M3NSAweDZlNjE2ZDY1IDB4MDAwMDAwMDAwMDAwMDAwMCAweDYzNjg2NTYzNmI2OTZlIDB4YTAzM2E2OTcgMHgwNjgxMDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6NzgKICAgIC8vIGNsYXNzIEV2ZW50VGlja2V0aW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIG11c3QgYmUgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJ6IG1haW5fY3JlYXRlX05vT3BAMTMKICAgIHB1c2hieXRlc3MgMHg4MGIyMDEwMCAweDY1MzY4MGI4IDB4MjYxYzMxYTkgMHhjZTZhOWU5YiAweGVmOTE3YWI0IDB4MDM4ZDYwYTQgMHg5YmYxZjhiMSAvLyBtZXRob2QgIm1pbnRfdGlja2V0cygpdWludDY0IiwgbWV0aG9kICJidXlfdGlja2V0KHBheSl2b2lkIiwgbWV0aG9kICJidXlfdGlja2V0cyhwYXksdWludDY0KXZvaWQiLCBtZXRob2QgImdldF9zYWxlX2luZm8oKSh1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsc3RyaW5nKSIsIG1ldGhvZCAiZ2V0X3B1cmNoYXNlKGFkZHJlc3MpKHVpbnQ2NCx1aW50NjQsdWludDY0KSIsIG1ldGhvZCAicmVkZWVtKHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJyZWRlZW1fYmF0Y2godWludDMyW10pdWludDMyW10iCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtaW50X3RpY2tldHMgYnV5X3RpY2tldCBidXlfdGlja2V0cyBnZXRfc2FsZV9pbmZvIGdldF9wdXJjaGFzZSByZWRlZW0gcmVkZWVtX2JhdGNoCiAgICBlcnIKCm1haW5fY3JlYXRlX05vT3BAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5Ojc4CiAgICAvLyBjbGFzcyBFdmVudFRpY2tldGluZyhBUkM0Q29udHJhY3QpOgogICAgcHVzaGJ5dGVzIDB4NjAxM2FhMjkgLy8gbWV0aG9kICJjcmVhdGVfYXBwbGljYXRpb24oc3RyaW5nLHVpbnQ2NCx1aW50NjQsdWludDY0KXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBjcmVhdGVfYXBwbGljYXRpb24KICAgIGVycgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5ldmVudF90aWNrZXRpbmcuY29udHJhY3QuRXZlbnRUaWNrZXRpbmcuY3JlYXRlX2FwcGxpY2F0aW9uW3JvdXRpbmddKCkgLT4gdm9pZDoKY3JlYXRlX2FwcGxpY2F0aW9uOgogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToxMDEtMTAyCiAgICAvLyAjIC0tLSAxKSBDcmVhdGUgLyBJbml0IC0tLQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBwdXNoaW50IDIgLy8gMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToxMTAKICAgIC8vIHNlbGYuZXZlbnRfbmFtZS52YWx1ZSA9IGV2ZW50X25hbWUKICAgIGJ5dGVjXzMgLy8gMHg2ZTYxNmQ2NQogICAgdW5jb3ZlciA0CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToxMTEtMTE2CiAgICAvLyBzZWxmLnNhbGVfcGFyYW1zLnZhbHVlID0gU2FsZVBhcmFtcygKICAgIC8vICAgICB0aWNrZXRfcHJpY2U9YXJjNC5VSW50NjQodGlja2V0X3ByaWNlKSwKICAgIC8vICAgICB0b3RhbF90aWNrZXRzPWFyYzQuVUludDY0KHRvdGFsX3RpY2tldHMpLAogICAgLy8gICAgIHRpY2tldF9hc2FfaWQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgbWF4X3Blcl9hZGRyZXNzPWFyYzQuVUludDY0KG1heF9wZXJfYWRkcmVzcyksCiAgICAvLyApCiAgICBjb3ZlciAyCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6MTE0CiAgICAvLyB0aWNrZXRfYXNhX2lkPWFyYzQuVUludDY0KDApLAogICAgYnl0ZWMgNCAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6MTExLTExNgogICAgLy8gc2VsZi5zYWxlX3BhcmFtcy52YWx1ZSA9IFNhbGVQYXJhbXMoCiAgICAvLyAgICAgdGlja2V0X3ByaWNlPWFyYzQuVUludDY0KHRpY2tldF9wcmljZSksCiAgICAvLyAgICAgdG90YWxfdGlja2V0cz1hcmM0LlVJbnQ2NCh0b3RhbF90aWNrZXRzKSwKICAgIC8vICAgICB0aWNrZXRfYXNhX2lkPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIG1heF9wZXJfYWRkcmVzcz1hcmM0LlVJbnQ2NChtYXhfcGVyX2FkZHJlc3MpLAogICAgLy8gKQogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6MTExCiAgICAvLyBzZWxmLnNhbGVfcGFyYW1zLnZhbHVlID0gU2FsZVBhcmFtcygKICAgIGJ5dGVjXzAgLy8gMHg3MDYxNzI2MTZkNzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6MTExLTExNgogICAgLy8gc2VsZi5zYWxlX3BhcmFtcy52YWx1ZSA9IFNhbGVQYXJhbXMoCiAgICAvLyAgICAgdGlja2V0X3ByaWNlPWFyYzQuVUludDY0KHRpY2tldF9wcmljZSksCiAgICAvLyAgICAgdG90YWxfdGlja2V0cz1hcmM0LlVJbnQ2NCh0b3RhbF90aWNrZXRzKSwKICAgIC8vICAgICB0aWNrZXRfYXNhX2lkPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIG1heF9wZXJfYWRkcmVzcz1hcmM0LlVJbnQ2NChtYXhfcGVyX2FkZHJlc3MpLAogICAgLy8gKQogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6MTE3CiAgICAvLyBzZWxmLnRpY2tldHNfc29sZC52YWx1ZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMSAvLyAweDczNmY2YzY0CiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6MTAxLTEwMgogICAgLy8gIyAtLS0gMSkgQ3JlYXRlIC8gSW5pdCAtLS0KICAgIC8vIEBhcmM0LmFiaW1ldGhvZChjcmVhdGU9InJlcXVpcmUiKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5ldmVudF90aWNrZXRpbmcuY29udHJhY3QuRXZlbnRUaWNrZXRpbmcubWludF90aWNrZXRzW3JvdXRpbmddKCkgLT4gdm9pZDoKbWludF90aWNrZXRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToxMjItMTIzCiAgICAvLyAjIFNhZGVjZSBrdXJ1Y3UKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJTYWRlY2Uga29udHJhdCBrdXJ1Y3VzdSBiaWxldCBiYXNhYmlsaXIiCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gU2FkZWNlIGtvbnRyYXQga3VydWN1c3UgYmlsZXQgYmFzYWJpbGlyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjEyNAogICAgLy8gcGFyYW1zID0gc2VsZi5zYWxlX3BhcmFtcy52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gMHg3MDYxNzI2MTZkNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zYWxlX3BhcmFtcyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6MTI1LTEyNgogICAgLy8gIyBEYWhhIMO2bmNlIGJhc8SxbG1hZMSxIG3EsT8KICAgIC8vIGFzc2VydCBwYXJhbXMudGlja2V0X2FzYV9pZC5uYXRpdmUgPT0gVUludDY0KDApLCAiQmlsZXRsZXIgemF0ZW4gYmFzxLFsbcSxxZ8iCiAgICBkdXAKICAgIHB1c2hpbnQgMTYgLy8gMTYKICAgIGV4dHJhY3RfdWludDY0CiAgICAhCiAgICBhc3NlcnQgLy8gQmlsZXRsZXIgemF0ZW4gYmFzxLFsbcSxxZ8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6MTI4CiAgICAvLyBwYXJhbXMudG90YWxfdGlja2V0cy5uYXRpdmUgPD0gVUludDY0KENIRUNLSU5fTUFYX1RJQ0tFVFMpCiAgICBkdXAKICAgIGV4dHJhY3QgOCA4CiAgICBkaWcgMQogICAgaW50Y18yIC8vIDgKICAgIGV4dHJhY3RfdWludDY0CiAgICBkdXAKICAgIHB1c2hpbnQgNjU1MzYgLy8gNjU1MzYKICAgIDw9CiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjEyNy0xMjkKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgcGFyYW1zLnRvdGFsX3RpY2tldHMubmF0aXZlIDw9IFVJbnQ2NChDSEVDS0lOX01BWF9USUNLRVRTKQogICAgLy8gKSwgIkdpcmnFnyBiaXQgaGFyaXRhc8SxIGnDp2luIGJpbGV0IHNhecSxc8SxIMOnb2sgYsO8ecO8ayIKICAgIGFzc2VydCAvLyBHaXJpxZ8gYml0IGhhcml0YXPEsSBpw6dpbiBiaWxldCBzYXnEsXPEsSDDp29rIGLDvHnDvGsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6MTMxLTE0MQogICAgLy8gY3JlYXRlZF9hc3NldF9pZCA9IGFsZ29weS5pdHhuLkFzc2V0Q29uZmlnKAogICAgLy8gICAgIGFzc2V0X25hbWU9c2VsZi5ldmVudF9uYW1lLnZhbHVlLAogICAgLy8gICAgIHVuaXRfbmFtZT0iVElDS0VUIiwKICAgIC8vICAgICB0b3RhbD1wYXJhbXMudG90YWxfdGlja2V0cy5uYXRpdmUsCiAgICAvLyAgICAgZGVjaW1hbHM9MCwKICAgIC8vICAgICBkZWZhdWx0X2Zyb3plbj1GYWxzZSwKICAgIC8vICAgICBtYW5hZ2VyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgcmVzZXJ2ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGZyZWV6ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGNsYXdiYWNrPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyApLnN1Ym1pdCgpLmNyZWF0ZWRfYXNzZXQuaWQKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6MTMyCiAgICAvLyBhc3NldF9uYW1lPXNlbGYuZXZlbnRfbmFtZS52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vIDB4NmU2MTZkNjUKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5ldmVudF9uYW1lIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToxMzcKICAgIC8vIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjEzOC0xNDAKICAgIC8vIHJlc2VydmU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vIGZyZWV6ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gY2xhd2JhY2s9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGR1cG4gMwogICAgaXR4bl9maWVsZCBDb25maWdBc3NldENsYXdiYWNrCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0RnJlZXplCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0UmVzZXJ2ZQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldE1hbmFnZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6MTM2CiAgICAvLyBkZWZhdWx0X2Zyb3plbj1GYWxzZSwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0RGVmYXVsdEZyb3plbgogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToxMzUKICAgIC8vIGRlY2ltYWxzPTAsCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBDb25maWdBc3NldERlY2ltYWxzCiAgICBkaWcgMQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFRvdGFsCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjEzMwogICAgLy8gdW5pdF9uYW1lPSJUSUNLRVQiLAogICAgcHVzaGJ5dGVzICJUSUNLRVQiCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0VW5pdE5hbWUKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXROYW1lCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjEzMQogICAgLy8gY3JlYXRlZF9hc3NldF9pZCA9IGFsZ29weS5pdHhuLkFzc2V0Q29uZmlnKAogICAgcHVzaGludCAzIC8vIGFjZmcKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToxMzEtMTQxCiAgICAvLyBjcmVhdGVkX2Fzc2V0X2lkID0gYWxnb3B5Lml0eG4uQXNzZXRDb25maWcoCiAgICAvLyAgICAgYXNzZXRfbmFtZT1zZWxmLmV2ZW50X25hbWUudmFsdWUsCiAgICAvLyAgICAgdW5pdF9uYW1lPSJUSUNLRVQiLAogICAgLy8gICAgIHRvdGFsPXBhcmFtcy50b3RhbF90aWNrZXRzLm5hdGl2ZSwKICAgIC8vICAgICBkZWNpbWFscz0wLAogICAgLy8gICAgIGRlZmF1bHRfZnJvemVuPUZhbHNlLAogICAgLy8gICAgIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICByZXNlcnZlPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgZnJlZXplPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgY2xhd2JhY2s9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICkuc3VibWl0KCkuY3JlYXRlZF9hc3NldC5pZAogICAgaXR4bl9zdWJtaXQKICAgIGl0eG4gQ3JlYXRlZEFzc2V0SUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6MTQ0CiAgICAvLyB0aWNrZXRfcHJpY2U9cGFyYW1zLnRpY2tldF9wcmljZSwKICAgIGRpZyAzCiAgICBleHRyYWN0IDAgOAogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToxNDYKICAgIC8vIHRpY2tldF9hc2FfaWQ9YXJjNC5VSW50NjQoY3JlYXRlZF9hc3NldF9pZCksCiAgICBzd2FwCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE0NwogICAgLy8gbWF4X3Blcl9hZGRyZXNzPXBhcmFtcy5tYXhfcGVyX2FkZHJlc3MsCiAgICB1bmNvdmVyIDQKICAgIGV4dHJhY3QgMjQgOAogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToxNDMtMTQ4CiAgICAvLyBzZWxmLnNhbGVfcGFyYW1zLnZhbHVlID0gU2FsZVBhcmFtcygKICAgIC8vICAgICB0aWNrZXRfcHJpY2U9cGFyYW1zLnRpY2tldF9wcmljZSwKICAgIC8vICAgICB0b3RhbF90aWNrZXRzPXBhcmFtcy50b3RhbF90aWNrZXRzLAogICAgLy8gICAgIHRpY2tldF9hc2FfaWQ9YXJjNC5VSW50NjQoY3JlYXRlZF9hc3NldF9pZCksCiAgICAvLyAgICAgbWF4X3Blcl9hZGRyZXNzPXBhcmFtcy5tYXhfcGVyX2FkZHJlc3MsCiAgICAvLyApCiAgICB1bmNvdmVyIDIKICAgIGRpZyA0CiAgICBjb25jYXQKICAgIGRpZyAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToxNDMKICAgIC8vIHNlbGYuc2FsZV9wYXJhbXMudmFsdWUgPSBTYWxlUGFyYW1zKAogICAgYnl0ZWNfMCAvLyAweDcwNjE3MjYxNmQ3MwogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToxNDMtMTQ4CiAgICAvLyBzZWxmLnNhbGVfcGFyYW1zLnZhbHVlID0gU2FsZVBhcmFtcygKICAgIC8vICAgICB0aWNrZXRfcHJpY2U9cGFyYW1zLnRpY2tldF9wcmljZSwKICAgIC8vICAgICB0b3RhbF90aWNrZXRzPXBhcmFtcy50b3RhbF90aWNrZXRzLAogICAgLy8gICAgIHRpY2tldF9hc2FfaWQ9YXJjNC5VSW50NjQoY3JlYXRlZF9hc3NldF9pZCksCiAgICAvLyAgICAgbWF4X3Blcl9hZGRyZXNzPXBhcmFtcy5tYXhfcGVyX2FkZHJlc3MsCiAgICAvLyApCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToxNTEKICAgIC8vIHNpemU9KHBhcmFtcy50b3RhbF90aWNrZXRzLm5hdGl2ZSArIFVJbnQ2NCg3KSkgLy8gVUludDY0KDgpCiAgICBzd2FwCiAgICBwdXNoaW50IDcgLy8gNwogICAgKwogICAgaW50Y18yIC8vIDgKICAgIC8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6MTQ5LTE1MAogICAgLy8gIyBTxLFmxLFybGFybGEgZG9sdSBnaXJpxZ8gYml0IGhhcml0YXPEsSAoa2ltc2UgaGVuw7x6IGdpcm1lZGkpCiAgICAvLyBhc3NlcnQgc2VsZi5jaGVja2lucy5jcmVhdGUoCiAgICBieXRlYyA1IC8vIDB4NjM2ODY1NjM2YjY5NmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6MTQ5LTE1MgogICAgLy8gIyBTxLFmxLFybGFybGEgZG9sdSBnaXJpxZ8gYml0IGhhcml0YXPEsSAoa2ltc2UgaGVuw7x6IGdpcm1lZGkpCiAgICAvLyBhc3NlcnQgc2VsZi5jaGVja2lucy5jcmVhdGUoCiAgICAvLyAgICAgc2l6ZT0ocGFyYW1zLnRvdGFsX3RpY2tldHMubmF0aXZlICsgVUludDY0KDcpKSAvLyBVSW50NjQoOCkKICAgIC8vICksICJHaXJpxZ8gYml0IGhhcml0YXPEsSB6YXRlbiB2YXIiCiAgICBzd2FwCiAgICBib3hfY3JlYXRlCiAgICBhc3NlcnQgLy8gR2lyacWfIGJpdCBoYXJpdGFzxLEgemF0ZW4gdmFyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE1MwogICAgLy8gYXJjNC5lbWl0KFRpY2tldHNNaW50ZWQoYXNhX2lkPWFyYzQuVUludDY0KGNyZWF0ZWRfYXNzZXRfaWQpLCB0b3RhbD1wYXJhbXMudG90YWxfdGlja2V0cykpCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHg5MTI4NTRjZSAvLyBtZXRob2QgIlRpY2tldHNNaW50ZWQodWludDY0LHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToxMTktMTIwCiAgICAvLyAjIC0tLSAyKSBNaW50IHRpY2tldHMgKEFTQSkgLS0tCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGJ5dGVjXzIgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuZXZlbnRfdGlja2V0aW5nLmNvbnRyYWN0LkV2ZW50VGlja2V0aW5nLmJ1eV90aWNrZXRbcm91dGluZ10oKSAtPiB2b2lkOgpidXlfdGlja2V0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToxNTYtMTU3CiAgICAvLyAjIC0tLSAzKSBCdXkgdGlja2V0IChhdG9taWMgd2l0aCBwYXltZW50KSAtLS0KICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE1OS0xNjAKICAgIC8vICMgxLBraSBnbG9iYWwgb2t1bWE6IHBha2V0bGkgcGFyYW1ldHJlbGVyICsgc2F5YcOnCiAgICAvLyBwYXJhbXMgPSBzZWxmLnNhbGVfcGFyYW1zLnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAweDcwNjE3MjYxNmQ3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnNhbGVfcGFyYW1zIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToxNjEKICAgIC8vIHNvbGQgPSBzZWxmLnRpY2tldHNfc29sZC52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gMHg3MzZmNmM2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRpY2tldHNfc29sZCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6MTYyCiAgICAvLyBhc3NlcnQgc29sZCA8IHBhcmFtcy50b3RhbF90aWNrZXRzLm5hdGl2ZSwgIkJpbGV0bGVyIHTDvGtlbmRpIgogICAgZGlnIDEKICAgIGludGNfMiAvLyA4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgZGlnIDEKICAgID4KICAgIGFzc2VydCAvLyBCaWxldGxlciB0w7xrZW5kaQogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToxNjMKICAgIC8vIGFzYV9pZCA9IHBhcmFtcy50aWNrZXRfYXNhX2lkLm5hdGl2ZQogICAgZGlnIDEKICAgIHB1c2hpbnQgMTYgLy8gMTYKICAgIGV4dHJhY3RfdWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE2NAogICAgLy8gYXNzZXJ0IGFzYV9pZCAhPSBVSW50NjQoMCksICJCaWxldCBzYXTEscWfxLEgaGVuw7x6IGJhxZ9sYW1hZMSxIgogICAgZHVwCiAgICBhc3NlcnQgLy8gQmlsZXQgc2F0xLHFn8SxIGhlbsO8eiBiYcWfbGFtYWTEsQogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToxNjYKICAgIC8vIGFzc2VydCBwYXltZW50LmFtb3VudCA9PSBwYXJhbXMudGlja2V0X3ByaWNlLm5hdGl2ZSwgIsOWZGVtZSBtaWt0YXLEsSBiaWxldCBmaXlhdMSxeWxhIGXFn2xlxZ9taXlvciIKICAgIGRpZyAzCiAgICBndHhucyBBbW91bnQKICAgIGRpZyAzCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50NjQKICAgID09CiAgICBhc3NlcnQgLy8gw5ZkZW1lIG1pa3RhcsSxIGJpbGV0IGZpeWF0xLF5bGEgZcWfbGXFn21peW9yCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE2NwogICAgLy8gYXNzZXJ0IHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgIsOWZGVtZSBidSBrb250cmF0YSB5YXDEsWxtYWzEsSIKICAgIHVuY292ZXIgMwogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIMOWZGVtZSBidSBrb250cmF0YSB5YXDEsWxtYWzEsQogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToxNjktMTc0CiAgICAvLyAjIE5GVCB0cmFuc2ZlcmkgKGlubmVyIHR4KQogICAgLy8gYWxnb3B5Lml0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PWFzYV9pZCwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1UeG4uc2VuZGVyLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD0xLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToxNzIKICAgIC8vIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE3MwogICAgLy8gYXNzZXRfYW1vdW50PTEsCiAgICBpbnRjXzEgLy8gMQogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToxNjktMTcwCiAgICAvLyAjIE5GVCB0cmFuc2ZlcmkgKGlubmVyIHR4KQogICAgLy8gYWxnb3B5Lml0eG4uQXNzZXRUcmFuc2ZlcigKICAgIGludGNfMyAvLyBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE2OS0xNzQKICAgIC8vICMgTkZUIHRyYW5zZmVyaSAoaW5uZXIgdHgpCiAgICAvLyBhbGdvcHkuaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9YXNhX2lkLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PTEsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToxNzYKICAgIC8vIHNlbGYudGlja2V0c19zb2xkLnZhbHVlID0gc29sZCArIFVJbnQ2NCgxKQogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjXzEgLy8gMHg3MzZmNmM2NAogICAgZGlnIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE3NwogICAgLy8gc2VsZi5fcmVjb3JkX3B1cmNoYXNlKFR4bi5zZW5kZXIsIFVJbnQ2NCgxKSwgcGFyYW1zLm1heF9wZXJfYWRkcmVzcy5uYXRpdmUpCiAgICB0eG4gU2VuZGVyCiAgICB1bmNvdmVyIDIKICAgIHB1c2hpbnQgMjQgLy8gMjQKICAgIGV4dHJhY3RfdWludDY0CiAgICBpbnRjXzEgLy8gMQogICAgc3dhcAogICAgY2FsbHN1YiBfcmVjb3JkX3B1cmNoYXNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE3OAogICAgLy8gYXJjNC5lbWl0KFRpY2tldFNvbGQoYnV5ZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLCBjb3VudD1hcmM0LlVJbnQ2NCgxKSwgc29sZF9hZnRlcj1hcmM0LlVJbnQ2NChzb2xkICsgMSkpKQogICAgdHhuIFNlbmRlcgogICAgc3dhcAogICAgaXRvYgogICAgc3dhcAogICAgcHVzaGJ5dGVzIDB4MDAwMDAwMDAwMDAwMDAwMQogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjIDYgLy8gbWV0aG9kICJUaWNrZXRTb2xkKGFkZHJlc3MsdWludDY0LHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToxNTYtMTU3CiAgICAvLyAjIC0tLSAzKSBCdXkgdGlja2V0IChhdG9taWMgd2l0aCBwYXltZW50KSAtLS0KICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5ldmVudF90aWNrZXRpbmcuY29udHJhY3QuRXZlbnRUaWNrZXRpbmcuYnV5X3RpY2tldHNbcm91dGluZ10oKSAtPiB2b2lkOgpidXlfdGlja2V0czoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6MTgwLTE4MQogICAgLy8gIyAtLS0gNCkgQnV5IG1hbnkgdGlja2V0cyAodGVrIMO2ZGVtZSArIHRlayBpbm5lciB0eCkgLS0tCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgZHVwCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE4MwogICAgLy8gYXNzZXJ0IGNvdW50ID4gVUludDY0KDApLCAiQmlsZXQgYWRlZGkgc8SxZsSxciBvbGFtYXoiCiAgICBkdXAKICAgIGFzc2VydCAvLyBCaWxldCBhZGVkaSBzxLFmxLFyIG9sYW1hegogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToxODQKICAgIC8vIHBhcmFtcyA9IHNlbGYuc2FsZV9wYXJhbXMudmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vIDB4NzA2MTcyNjE2ZDczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc2FsZV9wYXJhbXMgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE4NQogICAgLy8gYXNhX2lkID0gcGFyYW1zLnRpY2tldF9hc2FfaWQubmF0aXZlCiAgICBkdXAKICAgIHB1c2hpbnQgMTYgLy8gMTYKICAgIGV4dHJhY3RfdWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE4NgogICAgLy8gYXNzZXJ0IGFzYV9pZCAhPSBVSW50NjQoMCksICJCaWxldCBzYXTEscWfxLEgaGVuw7x6IGJhxZ9sYW1hZMSxIgogICAgZHVwCiAgICBhc3NlcnQgLy8gQmlsZXQgc2F0xLHFn8SxIGhlbsO8eiBiYcWfbGFtYWTEsQogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToxODgtMTg5CiAgICAvLyAjIEthbGFuIGFyeiB0ZWsgc2VmZXJkZSBrb250cm9sIGVkaWxpcgogICAgLy8gc29sZCA9IHNlbGYudGlja2V0c19zb2xkLnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAweDczNmY2YzY0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudGlja2V0c19zb2xkIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToxOTAKICAgIC8vIGFzc2VydCBzb2xkICsgY291bnQgPD0gcGFyYW1zLnRvdGFsX3RpY2tldHMubmF0aXZlLCAiWWV0ZXJsaSBiaWxldCBrYWxtYWTEsSIKICAgIGRpZyAzCiAgICArCiAgICBkaWcgMgogICAgaW50Y18yIC8vIDgKICAgIGV4dHJhY3RfdWludDY0CiAgICBkaWcgMQogICAgPj0KICAgIGFzc2VydCAvLyBZZXRlcmxpIGJpbGV0IGthbG1hZMSxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE5MwogICAgLy8gcGF5bWVudC5hbW91bnQgPT0gY291bnQgKiBwYXJhbXMudGlja2V0X3ByaWNlLm5hdGl2ZQogICAgZGlnIDUKICAgIGd0eG5zIEFtb3VudAogICAgZGlnIDMKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZGlnIDUKICAgICoKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE5Mi0xOTQKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgcGF5bWVudC5hbW91bnQgPT0gY291bnQgKiBwYXJhbXMudGlja2V0X3ByaWNlLm5hdGl2ZQogICAgLy8gKSwgIsOWZGVtZSBtaWt0YXLEsSBiaWxldCBhZGVkaSB4IGZpeWF0IGlsZSBlxZ9sZcWfbWl5b3IiCiAgICBhc3NlcnQgLy8gw5ZkZW1lIG1pa3RhcsSxIGJpbGV0IGFkZWRpIHggZml5YXQgaWxlIGXFn2xlxZ9taXlvcgogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToxOTUKICAgIC8vIGFzc2VydCBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsICLDlmRlbWUgYnUga29udHJhdGEgeWFwxLFsbWFsxLEiCiAgICB1bmNvdmVyIDUKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyDDlmRlbWUgYnUga29udHJhdGEgeWFwxLFsbWFsxLEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6MTk3LTIwMgogICAgLy8gIyBUw7xtIGJpbGV0bGVyIHRlayBiaXIgaW5uZXIgQXNzZXRUcmFuc2ZlciBpbGUgZ8O2bmRlcmlsaXIKICAgIC8vIGFsZ29weS5pdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1hc2FfaWQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9Y291bnQsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjIwMAogICAgLy8gYXNzZXRfcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIHR4biBTZW5kZXIKICAgIGRpZyA0CiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIHN3YXAKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE5Ny0xOTgKICAgIC8vICMgVMO8bSBiaWxldGxlciB0ZWsgYmlyIGlubmVyIEFzc2V0VHJhbnNmZXIgaWxlIGfDtm5kZXJpbGlyCiAgICAvLyBhbGdvcHkuaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgaW50Y18zIC8vIGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6MTk3LTIwMgogICAgLy8gIyBUw7xtIGJpbGV0bGVyIHRlayBiaXIgaW5uZXIgQXNzZXRUcmFuc2ZlciBpbGUgZ8O2bmRlcmlsaXIKICAgIC8vIGFsZ29weS5pdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1hc2FfaWQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9Y291bnQsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToyMDQKICAgIC8vIHNlbGYudGlja2V0c19zb2xkLnZhbHVlID0gc29sZCArIGNvdW50CiAgICBieXRlY18xIC8vIDB4NzM2ZjZjNjQKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToyMDUKICAgIC8vIHNlbGYuX3JlY29yZF9wdXJjaGFzZShUeG4uc2VuZGVyLCBjb3VudCwgcGFyYW1zLm1heF9wZXJfYWRkcmVzcy5uYXRpdmUpCiAgICB0eG4gU2VuZGVyCiAgICB1bmNvdmVyIDIKICAgIHB1c2hpbnQgMjQgLy8gMjQKICAgIGV4dHJhY3RfdWludDY0CiAgICBzd2FwCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMgogICAgY2FsbHN1YiBfcmVjb3JkX3B1cmNoYXNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjIwNwogICAgLy8gVGlja2V0U29sZChidXllcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksIGNvdW50PWFyYzQuVUludDY0KGNvdW50KSwgc29sZF9hZnRlcj1hcmM0LlVJbnQ2NChzb2xkICsgY291bnQpKQogICAgdHhuIFNlbmRlcgogICAgc3dhcAogICAgaXRvYgogICAgc3dhcAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToyMDYtMjA4CiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgVGlja2V0U29sZChidXllcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksIGNvdW50PWFyYzQuVUludDY0KGNvdW50KSwgc29sZF9hZnRlcj1hcmM0LlVJbnQ2NChzb2xkICsgY291bnQpKQogICAgLy8gKQogICAgYnl0ZWMgNiAvLyBtZXRob2QgIlRpY2tldFNvbGQoYWRkcmVzcyx1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE4MC0xODEKICAgIC8vICMgLS0tIDQpIEJ1eSBtYW55IHRpY2tldHMgKHRlayDDtmRlbWUgKyB0ZWsgaW5uZXIgdHgpIC0tLQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmV2ZW50X3RpY2tldGluZy5jb250cmFjdC5FdmVudFRpY2tldGluZy5nZXRfc2FsZV9pbmZvW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3NhbGVfaW5mbzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6MjEzCiAgICAvLyBwYXJhbXMgPSBzZWxmLnNhbGVfcGFyYW1zLnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAweDcwNjE3MjYxNmQ3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnNhbGVfcGFyYW1zIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToyMTUKICAgIC8vIHRpY2tldF9hc2FfaWQ9cGFyYW1zLnRpY2tldF9hc2FfaWQsCiAgICBkdXAKICAgIGV4dHJhY3QgMTYgOAogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToyMTYKICAgIC8vIHRpY2tldF9wcmljZT1wYXJhbXMudGlja2V0X3ByaWNlLAogICAgZGlnIDEKICAgIGV4dHJhY3QgMCA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjIxNwogICAgLy8gdG90YWxfdGlja2V0cz1wYXJhbXMudG90YWxfdGlja2V0cywKICAgIHVuY292ZXIgMgogICAgZXh0cmFjdCA4IDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6MjE4CiAgICAvLyB0aWNrZXRzX3NvbGQ9YXJjNC5VSW50NjQoc2VsZi50aWNrZXRzX3NvbGQudmFsdWUpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gMHg3MzZmNmM2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRpY2tldHNfc29sZCBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6MjE5CiAgICAvLyBldmVudF9uYW1lPWFyYzQuU3RyaW5nKHNlbGYuZXZlbnRfbmFtZS52YWx1ZSksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAweDZlNjE2ZDY1CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZXZlbnRfbmFtZSBleGlzdHMKICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjIxNC0yMjAKICAgIC8vIHJldHVybiBTYWxlSW5mbygKICAgIC8vICAgICB0aWNrZXRfYXNhX2lkPXBhcmFtcy50aWNrZXRfYXNhX2lkLAogICAgLy8gICAgIHRpY2tldF9wcmljZT1wYXJhbXMudGlja2V0X3ByaWNlLAogICAgLy8gICAgIHRvdGFsX3RpY2tldHM9cGFyYW1zLnRvdGFsX3RpY2tldHMsCiAgICAvLyAgICAgdGlja2V0c19zb2xkPWFyYzQuVUludDY0KHNlbGYudGlja2V0c19zb2xkLnZhbHVlKSwKICAgIC8vICAgICBldmVudF9uYW1lPWFyYzQuU3RyaW5nKHNlbGYuZXZlbnRfbmFtZS52YWx1ZSksCiAgICAvLyApCiAgICB1bmNvdmVyIDQKICAgIHVuY292ZXIgNAogICAgY29uY2F0CiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweDAwMjIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjIxMC0yMTEKICAgIC8vICMgLS0tIDUpIFNhdMSxxZ8gYmlsZ2lzaSAoc2FsdCBva3VudXIsIHRlayDDp2HEn3LEsWRhIHTDvG0gZHVydW0pIC0tLQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18yIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmV2ZW50X3RpY2tldGluZy5jb250cmFjdC5FdmVudFRpY2tldGluZy5nZXRfcHVyY2hhc2Vbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfcHVyY2hhc2U6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjIyMi0yMjMKICAgIC8vICMgLS0tIDYpIEFsxLFjxLEga2F5ZMSxIChzYWx0IG9rdW51cjsga2F5ZMSxIG9sbWF5YW4gYWRyZXMgacOnaW4gc8SxZsSxciBrYXnEsXQpIC0tLQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCAzMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjIyNQogICAgLy8gcmV0dXJuIHNlbGYucHVyY2hhc2VzLmdldCgKICAgIHB1c2hieXRlcyAweDcwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjIyNS0yMjgKICAgIC8vIHJldHVybiBzZWxmLnB1cmNoYXNlcy5nZXQoCiAgICAvLyAgICAgYnV5ZXIubmF0aXZlLAogICAgLy8gICAgIGRlZmF1bHQ9UHVyY2hhc2VSZWNvcmQoYXJjNC5VSW50NjQoMCksIGFyYzQuVUludDY0KDApLCBhcmM0LlVJbnQ2NCgwKSksCiAgICAvLyApCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6MjI3CiAgICAvLyBkZWZhdWx0PVB1cmNoYXNlUmVjb3JkKGFyYzQuVUludDY0KDApLCBhcmM0LlVJbnQ2NCgwKSwgYXJjNC5VSW50NjQoMCkpLAogICAgcHVzaGJ5dGVzIDB4MDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjIyNS0yMjgKICAgIC8vIHJldHVybiBzZWxmLnB1cmNoYXNlcy5nZXQoCiAgICAvLyAgICAgYnV5ZXIubmF0aXZlLAogICAgLy8gICAgIGRlZmF1bHQ9UHVyY2hhc2VSZWNvcmQoYXJjNC5VSW50NjQoMCksIGFyYzQuVUludDY0KDApLCBhcmM0LlVJbnQ2NCgwKSksCiAgICAvLyApCiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6MjIyLTIyMwogICAgLy8gIyAtLS0gNikgQWzEsWPEsSBrYXlkxLEgKHNhbHQgb2t1bnVyOyBrYXlkxLEgb2xtYXlhbiBhZHJlcyBpw6dpbiBzxLFmxLFyIGthecSxdCkgLS0tCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzIgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuZXZlbnRfdGlja2V0aW5nLmNvbnRyYWN0LkV2ZW50VGlja2V0aW5nLnJlZGVlbVtyb3V0aW5nXSgpIC0+IHZvaWQ6CnJlZGVlbToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6MjQ2LTI0NwogICAgLy8gIyAtLS0gNykgS2FwxLFkYSBiaWxldCBva3V0bWEgKGJpdCBoYXJpdGFzxLEpIC0tLQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI0OQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywgIlNhZGVjZSBrb250cmF0IGt1cnVjdXN1IGJpbGV0IG9rdXRhYmlsaXIiCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gU2FkZWNlIGtvbnRyYXQga3VydWN1c3UgYmlsZXQgb2t1dGFiaWxpcgogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToyNTAKICAgIC8vIHRvdGFsID0gc2VsZi5zYWxlX3BhcmFtcy52YWx1ZS50b3RhbF90aWNrZXRzLm5hdGl2ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gMHg3MDYxNzI2MTZkNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zYWxlX3BhcmFtcyBleGlzdHMKICAgIGludGNfMiAvLyA4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToyNTEKICAgIC8vIGFzc2VydCBzZWxmLl9yZWRlZW0odGlja2V0X2luZGV4LCB0b3RhbCksICJCaWxldCB6YXRlbiBrdWxsYW7EsWxtxLHFnyIKICAgIGNhbGxzdWIgX3JlZGVlbQogICAgYXNzZXJ0IC8vIEJpbGV0IHphdGVuIGt1bGxhbsSxbG3EscWfCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI0Ni0yNDcKICAgIC8vICMgLS0tIDcpIEthcMSxZGEgYmlsZXQgb2t1dG1hIChiaXQgaGFyaXRhc8SxKSAtLS0KICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5ldmVudF90aWNrZXRpbmcuY29udHJhY3QuRXZlbnRUaWNrZXRpbmcucmVkZWVtX2JhdGNoW3JvdXRpbmddKCkgLT4gdm9pZDoKcmVkZWVtX2JhdGNoOgogICAgaW50Y18wIC8vIDAKICAgIGR1cAogICAgcHVzaGJ5dGVzICIiCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6MjUzCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cG4gMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGR1cAogICAgY292ZXIgMgogICAgZHVwCiAgICBpbnRjXzMgLy8gNAogICAgKgogICAgcHVzaGludCAyIC8vIDIKICAgICsKICAgIHVuY292ZXIgMgogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50MzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI1Ny0yNTgKICAgIC8vICMgR2XDp2VybGkgYmlsZXRsZXJpIGnFn2FyZXRsZXI7IHphdGVuIGt1bGxhbsSxbG3EscWfIG9sYW5sYXLEsSBkw7ZuZMO8csO8ciAoZ3J1cCBkw7zFn21leikKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJTYWRlY2Uga29udHJhdCBrdXJ1Y3VzdSBiaWxldCBva3V0YWJpbGlyIgogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIFNhZGVjZSBrb250cmF0IGt1cnVjdXN1IGJpbGV0IG9rdXRhYmlsaXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6MjU5LTI2MAogICAgLy8gIyBVenVuIHBhcnRpbGVyZGUgZWtzaWsgYsO8dMOnZSBncnVwIMO8Y3JldCBrcmVkaXNpbmRlbiBvcC11cCBpbGUgdGFtYW1sYW7EsXIKICAgIC8vIGVuc3VyZV9idWRnZXQoaW5kaWNlcy5sZW5ndGggKiBVSW50NjQoUkVERUVNX09QU19QRVJfVElDS0VUKSwgT3BVcEZlZVNvdXJjZS5Hcm91cENyZWRpdCkKICAgIHB1c2hpbnQgNDAgLy8gNDAKICAgICoKICAgIHB1c2hpbnQgMTAgLy8gMTAKICAgICsKCnJlZGVlbV9iYXRjaF93aGlsZV90b3BAOToKICAgIGR1cAogICAgZ2xvYmFsIE9wY29kZUJ1ZGdldAogICAgPgogICAgYnogcmVkZWVtX2JhdGNoX2FmdGVyX3doaWxlQDE0CiAgICBpdHhuX2JlZ2luCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgcHVzaGludCA1IC8vIERlbGV0ZUFwcGxpY2F0aW9uCiAgICBpdHhuX2ZpZWxkIE9uQ29tcGxldGlvbgogICAgYnl0ZWMgNyAvLyAweDA2ODEwMQogICAgaXR4bl9maWVsZCBBcHByb3ZhbFByb2dyYW0KICAgIGJ5dGVjIDcgLy8gMHgwNjgxMDEKICAgIGl0eG5fZmllbGQgQ2xlYXJTdGF0ZVByb2dyYW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIGIgcmVkZWVtX2JhdGNoX3doaWxlX3RvcEA5CgpyZWRlZW1fYmF0Y2hfYWZ0ZXJfd2hpbGVAMTQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI2MQogICAgLy8gdG90YWwgPSBzZWxmLnNhbGVfcGFyYW1zLnZhbHVlLnRvdGFsX3RpY2tldHMubmF0aXZlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAweDcwNjE3MjYxNmQ3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnNhbGVfcGFyYW1zIGV4aXN0cwogICAgaW50Y18yIC8vIDgKICAgIGV4dHJhY3RfdWludDY0CiAgICBidXJ5IDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6MjYyCiAgICAvLyByZWplY3RlZCA9IGFyYzQuRHluYW1pY0FycmF5W2FyYzQuVUludDMyXSgpCiAgICBwdXNoYnl0ZXMgMHgwMDAwCiAgICBidXJ5IDYKICAgIGludGNfMCAvLyAwCiAgICBidXJ5IDUKCnJlZGVlbV9iYXRjaF9mb3JfaGVhZGVyQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI2MwogICAgLy8gZm9yIGluZGV4IGluIGluZGljZXM6CiAgICBkaWcgNAogICAgZGlnIDIKICAgIDwKICAgIGJ6IHJlZGVlbV9iYXRjaF9hZnRlcl9mb3JANwogICAgZGlnIDIKICAgIGV4dHJhY3QgMiAwCiAgICBkaWcgNQogICAgaW50Y18zIC8vIDQKICAgICoKICAgIGR1cDIKICAgIGludGNfMyAvLyA0CiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogaW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ1cnkgOQogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToyNjQKICAgIC8vIGlmIG5vdCBzZWxmLl9yZWRlZW0oaW5kZXgubmF0aXZlLCB0b3RhbCk6CiAgICBleHRyYWN0X3VpbnQzMgogICAgZGlnIDQKICAgIGNhbGxzdWIgX3JlZGVlbQogICAgYm56IHJlZGVlbV9iYXRjaF9hZnRlcl9pZl9lbHNlQDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6MjY1CiAgICAvLyByZWplY3RlZC5hcHBlbmQoaW5kZXgpCiAgICBkaWcgNQogICAgZHVwCiAgICBkaWcgOAogICAgY29uY2F0IC8vIG9uIGVycm9yOiBtYXggYXJyYXkgbGVuZ3RoIGV4Y2VlZGVkCiAgICBzd2FwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgcmVwbGFjZTIgMAogICAgYnVyeSA2CgpyZWRlZW1fYmF0Y2hfYWZ0ZXJfaWZfZWxzZUA1OgogICAgZGlnIDQKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBidXJ5IDUKICAgIGIgcmVkZWVtX2JhdGNoX2Zvcl9oZWFkZXJAMgoKcmVkZWVtX2JhdGNoX2FmdGVyX2ZvckA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToyNTMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgYnl0ZWNfMiAvLyAweDE1MWY3Yzc1CiAgICBkaWcgNgogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuZXZlbnRfdGlja2V0aW5nLmNvbnRyYWN0LkV2ZW50VGlja2V0aW5nLl9yZWNvcmRfcHVyY2hhc2UoYnV5ZXI6IGJ5dGVzLCBjb3VudDogdWludDY0LCBsaW1pdDogdWludDY0KSAtPiB2b2lkOgpfcmVjb3JkX3B1cmNoYXNlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToyMzAtMjMxCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9yZWNvcmRfcHVyY2hhc2Uoc2VsZiwgYnV5ZXI6IEFjY291bnQsIGNvdW50OiBVSW50NjQsIGxpbWl0OiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAzIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6MjMyLTIzMwogICAgLy8gIyBUZWsga3V0dSBva3VtYXPEsToga2F5xLF0IHlva3NhIGlsayBhbMSxbSBidSByb3VuZCdkdXIKICAgIC8vIHJlY29yZCA9IHNlbGYucHVyY2hhc2VzLmdldCgKICAgIHB1c2hieXRlcyAweDcwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjIzMi0yMzYKICAgIC8vICMgVGVrIGt1dHUgb2t1bWFzxLE6IGthecSxdCB5b2tzYSBpbGsgYWzEsW0gYnUgcm91bmQnZHVyCiAgICAvLyByZWNvcmQgPSBzZWxmLnB1cmNoYXNlcy5nZXQoCiAgICAvLyAgICAgYnV5ZXIsCiAgICAvLyAgICAgZGVmYXVsdD1QdXJjaGFzZVJlY29yZChhcmM0LlVJbnQ2NCgwKSwgYXJjNC5VSW50NjQoR2xvYmFsLnJvdW5kKSwgYXJjNC5VSW50NjQoMCkpLAogICAgLy8gKS5jb3B5KCkKICAgIGZyYW1lX2RpZyAtMwogICAgY29uY2F0CiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6MjM1CiAgICAvLyBkZWZhdWx0PVB1cmNoYXNlUmVjb3JkKGFyYzQuVUludDY0KDApLCBhcmM0LlVJbnQ2NChHbG9iYWwucm91bmQpLCBhcmM0LlVJbnQ2NCgwKSksCiAgICBnbG9iYWwgUm91bmQKICAgIGl0b2IKICAgIGJ5dGVjIDQgLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjIDQgLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6MjMyLTIzNgogICAgLy8gIyBUZWsga3V0dSBva3VtYXPEsToga2F5xLF0IHlva3NhIGlsayBhbMSxbSBidSByb3VuZCdkdXIKICAgIC8vIHJlY29yZCA9IHNlbGYucHVyY2hhc2VzLmdldCgKICAgIC8vICAgICBidXllciwKICAgIC8vICAgICBkZWZhdWx0PVB1cmNoYXNlUmVjb3JkKGFyYzQuVUludDY0KDApLCBhcmM0LlVJbnQ2NChHbG9iYWwucm91bmQpLCBhcmM0LlVJbnQ2NCgwKSksCiAgICAvLyApLmNvcHkoKQogICAgc3dhcAogICAgYm94X2dldAogICAgc2VsZWN0CiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6MjM3CiAgICAvLyBuZXdfY291bnQgPSByZWNvcmQuY291bnQubmF0aXZlICsgY291bnQKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZnJhbWVfZGlnIC0yCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjIzOC0yMzkKICAgIC8vICMgQWzEsWPEsSBrYXlkxLFuZGFraSBzYXlhw6csIGFkcmVzIGJhxZ/EsW5hIHPEsW7EsXLEsW4gZGEgc2F5YWPEsWTEsXIgKDAgPSBzxLFuxLFyc8SxeikKICAgIC8vIGFzc2VydCBsaW1pdCA9PSBVSW50NjQoMCkgb3IgbmV3X2NvdW50IDw9IGxpbWl0LCAiQWRyZXMgYmHFn8SxbmEgYmlsZXQgc8SxbsSxcsSxIGHFn8SxbGTEsSIKICAgIGZyYW1lX2RpZyAtMQogICAgYnogX3JlY29yZF9wdXJjaGFzZV9ib29sX3RydWVAMgogICAgZnJhbWVfZGlnIDIKICAgIGZyYW1lX2RpZyAtMQogICAgPD0KICAgIGJ6IF9yZWNvcmRfcHVyY2hhc2VfYm9vbF9mYWxzZUAzCgpfcmVjb3JkX3B1cmNoYXNlX2Jvb2xfdHJ1ZUAyOgogICAgaW50Y18xIC8vIDEKCl9yZWNvcmRfcHVyY2hhc2VfYm9vbF9tZXJnZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToyMzgtMjM5CiAgICAvLyAjIEFsxLFjxLEga2F5ZMSxbmRha2kgc2F5YcOnLCBhZHJlcyBiYcWfxLFuYSBzxLFuxLFyxLFuIGRhIHNheWFjxLFkxLFyICgwID0gc8SxbsSxcnPEsXopCiAgICAvLyBhc3NlcnQgbGltaXQgPT0gVUludDY0KDApIG9yIG5ld19jb3VudCA8PSBsaW1pdCwgIkFkcmVzIGJhxZ/EsW5hIGJpbGV0IHPEsW7EsXLEsSBhxZ/EsWxkxLEiCiAgICBhc3NlcnQgLy8gQWRyZXMgYmHFn8SxbmEgYmlsZXQgc8SxbsSxcsSxIGHFn8SxbGTEsQogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToyNDEKICAgIC8vIGNvdW50PWFyYzQuVUludDY0KG5ld19jb3VudCksCiAgICBmcmFtZV9kaWcgMgogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToyNDIKICAgIC8vIGZpcnN0X3JvdW5kPXJlY29yZC5maXJzdF9yb3VuZCwKICAgIGZyYW1lX2RpZyAxCiAgICBleHRyYWN0IDggOAogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToyNDMKICAgIC8vIGxhc3Rfcm91bmQ9YXJjNC5VSW50NjQoR2xvYmFsLnJvdW5kKSwKICAgIGdsb2JhbCBSb3VuZAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToyNDAtMjQ0CiAgICAvLyBzZWxmLnB1cmNoYXNlc1tidXllcl0gPSBQdXJjaGFzZVJlY29yZCgKICAgIC8vICAgICBjb3VudD1hcmM0LlVJbnQ2NChuZXdfY291bnQpLAogICAgLy8gICAgIGZpcnN0X3JvdW5kPXJlY29yZC5maXJzdF9yb3VuZCwKICAgIC8vICAgICBsYXN0X3JvdW5kPWFyYzQuVUludDY0KEdsb2JhbC5yb3VuZCksCiAgICAvLyApCiAgICBjb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIDAKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIHJldHN1YgoKX3JlY29yZF9wdXJjaGFzZV9ib29sX2ZhbHNlQDM6CiAgICBpbnRjXzAgLy8gMAogICAgYiBfcmVjb3JkX3B1cmNoYXNlX2Jvb2xfbWVyZ2VANAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5ldmVudF90aWNrZXRpbmcuY29udHJhY3QuRXZlbnRUaWNrZXRpbmcuX3JlZGVlbSh0aWNrZXRfaW5kZXg6IHVpbnQ2NCwgdG90YWw6IHVpbnQ2NCkgLT4gdWludDY0OgpfcmVkZWVtOgogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToyNjgtMjY5CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9yZWRlZW0oc2VsZiwgdGlja2V0X2luZGV4OiBVSW50NjQsIHRvdGFsOiBVSW50NjQpIC0+IGJvb2w6CiAgICBwcm90byAyIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6MjcwCiAgICAvLyBhc3NlcnQgdGlja2V0X2luZGV4IDwgdG90YWwsICJHZcOnZXJzaXogYmlsZXQgbnVtYXJhc8SxIgogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgIDwKICAgIGFzc2VydCAvLyBHZcOnZXJzaXogYmlsZXQgbnVtYXJhc8SxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI3MQogICAgLy8gb2Zmc2V0ID0gdGlja2V0X2luZGV4IC8vIFVJbnQ2NCg4KQogICAgZnJhbWVfZGlnIC0yCiAgICBpbnRjXzIgLy8gOAogICAgLwogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI3MgogICAgLy8gYml0ID0gdGlja2V0X2luZGV4ICUgVUludDY0KDgpCiAgICBmcmFtZV9kaWcgLTIKICAgIGludGNfMiAvLyA4CiAgICAlCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToyNzMKICAgIC8vIGNodW5rID0gc2VsZi5jaGVja2lucy5leHRyYWN0KG9mZnNldCwgVUludDY0KDEpKQogICAgYnl0ZWMgNSAvLyAweDYzNjg2NTYzNmI2OTZlCiAgICBzd2FwCiAgICBpbnRjXzEgLy8gMQogICAgYm94X2V4dHJhY3QKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZXZlbnRfdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI3NAogICAgLy8gaWYgb3AuZ2V0Yml0KGNodW5rLCBiaXQpID09IFVJbnQ2NCgxKToKICAgIGdldGJpdAogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBieiBfcmVkZWVtX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2V2ZW50X3RpY2tldGluZy9jb250cmFjdC5weToyNzUKICAgIC8vIHJldHVybiBGYWxzZQogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgpfcmVkZWVtX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6Mjc2CiAgICAvLyBzZWxmLmNoZWNraW5zLnJlcGxhY2Uob2Zmc2V0LCBvcC5zZXRiaXRfYnl0ZXMoY2h1bmssIGJpdCwgQ0hFQ0tFRF9JTikpCiAgICBmcmFtZV9kaWcgMgogICAgZnJhbWVfZGlnIDEKICAgIGludGNfMSAvLyAxCiAgICBzZXRiaXQKICAgIGJ5dGVjIDUgLy8gMHg2MzY4NjU2MzZiNjk2ZQogICAgZnJhbWVfZGlnIDAKICAgIHVuY292ZXIgMgogICAgYm94X3JlcGxhY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ldmVudF90aWNrZXRpbmcvY29udHJhY3QucHk6Mjc3CiAgICAvLyByZXR1cm4gVHJ1ZQogICAgaW50Y18xIC8vIDEKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [898], "errorMessage": "Adres ba\u015f\u0131na bilet s\u0131n\u0131r\u0131 a\u015f\u0131ld\u0131"}, {"pc": [465], "errorMessage": "Bilet adedi s\u0131f\u0131r olamaz"}, {"pc": [365, 475], "errorMessage": "Bilet sat\u0131\u015f\u0131 hen\u00fcz ba\u015flamad\u0131"}, {"pc": [700], "errorMessage": "Bilet zaten kullan\u0131lm\u0131\u015f"}, {"pc": [358], "errorMessage": "Biletler t\u00fckendi"}, {"pc": [213], "errorMessage": "Biletler zaten bas\u0131lm\u0131\u015f"}, {"pc": [932], "errorMessage": "Ge\u00e7ersiz bilet numaras\u0131"}, {"pc": [228], "errorMessage": "Giri\u015f bit haritas\u0131 i\u00e7in bilet say\u0131s\u0131 \u00e7ok b\u00fcy\u00fck"}, {"pc": [313], "errorMessage": "Giri\u015f bit haritas\u0131 zaten var"}, {"pc": [60], "errorMessage": "OnCompletion must be NoOp"}, {"pc": [203], "errorMessage": "Sadece kontrat kurucusu bilet basabilir"}, {"pc": [690, 734], "errorMessage": "Sadece kontrat kurucusu bilet okutabilir"}, {"pc": [490], "errorMessage": "Yeterli bilet kalmad\u0131"}, {"pc": [233, 593], "errorMessage": "check self.event_name exists"}, {"pc": [207, 346, 469, 570, 694, 775], "errorMessage": "check self.sale_params exists"}, {"pc": [350, 479, 588], "errorMessage": "check self.tickets_sold exists"}, {"pc": [808], "errorMessage": "index access is out of bounds"}, {"pc": [142, 714], "errorMessage": "invalid array length header"}, {"pc": [728], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.uint32>"}, {"pc": [150], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.uint8>"}, {"pc": [634], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [161, 169, 177, 461, 683], "errorMessage": "invalid number of bytes for arc4.uint64"}, {"pc": [825], "errorMessage": "max array length exceeded"}, {"pc": [342, 453], "errorMessage": "transaction type is pay"}, {"pc": [383, 511], "errorMessage": "\u00d6deme bu kontrata yap\u0131lmal\u0131"}, {"pc": [503], "errorMessage": "\u00d6deme miktar\u0131 bilet adedi x fiyat ile e\u015fle\u015fmiyor"}, {"pc": [375], "errorMessage": "\u00d6deme miktar\u0131 bilet fiyat\u0131yla e\u015fle\u015fmiyor"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
 APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
@@ -64,6 +64,31 @@ def _init_dataclass(cls: type, data: dict) -> object:
             field_values[field.name] = field_value
     return cls(**field_values)
 
+@dataclasses.dataclass(frozen=True)
+class PurchaseRecord:
+    """Struct for PurchaseRecord"""
+    count: int
+    first_round: int
+    last_round: int
+
+@dataclasses.dataclass(frozen=True)
+class SaleInfo:
+    """Struct for SaleInfo"""
+    ticket_asa_id: int
+    ticket_price: int
+    total_tickets: int
+    tickets_sold: int
+    event_name: str
+
+@dataclasses.dataclass(frozen=True)
+class SaleParams:
+    """Struct for SaleParams"""
+    ticket_price: int
+    total_tickets: int
+    ticket_asa_id: int
+    max_per_address: int
+
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class BuyTicketArgs:
     """Dataclass for buy_ticket arguments"""
@@ -73,16 +98,54 @@ class BuyTicketArgs:
     def abi_method_signature(self) -> str:
         return "buy_ticket(pay)void"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class BuyTicketsArgs:
+    """Dataclass for buy_tickets arguments"""
+    payment: algokit_utils.AppMethodCallTransactionArgument
+    count: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "buy_tickets(pay,uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetPurchaseArgs:
+    """Dataclass for get_purchase arguments"""
+    buyer: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_purchase(address)(uint64,uint64,uint64)"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class RedeemArgs:
+    """Dataclass for redeem arguments"""
+    ticket_index: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "redeem(uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class RedeemBatchArgs:
+    """Dataclass for redeem_batch arguments"""
+    indices: list[int]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "redeem_batch(uint32[])uint32[]"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class CreateApplicationArgs:
     """Dataclass for create_application arguments"""
     event_name: str
     ticket_price: int
     total_tickets: int
+    max_per_address: int
 
     @property
     def abi_method_signature(self) -> str:
-        return "create_application(string,uint64,uint64)void"
+        return "create_application(string,uint64,uint64,uint64)void"
 
 
 class EventTicketingParams:
@@ -113,16 +176,79 @@ class EventTicketingParams:
             "args": method_args,
         }))
 
+    def buy_tickets(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int] | BuyTicketsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "buy_tickets(pay,uint64)void",
+            "args": method_args,
+        }))
+
+    def get_sale_info(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_sale_info()(uint64,uint64,uint64,uint64,string)",
+        }))
+
+    def get_purchase(
+        self,
+        args: tuple[str] | GetPurchaseArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_purchase(address)(uint64,uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def redeem(
+        self,
+        args: tuple[int] | RedeemArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "redeem(uint64)void",
+            "args": method_args,
+        }))
+
+    def redeem_batch(
+        self,
+        args: tuple[list[int]] | RedeemBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "redeem_batch(uint32[])uint32[]",
+            "args": method_args,
+        }))
+
     def create_application(
         self,
-        args: tuple[str, int, int] | CreateApplicationArgs,
+        args: tuple[str, int, int, int] | CreateApplicationArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "create_application(string,uint64,uint64)void",
+            "method": "create_application(string,uint64,uint64,uint64)void",
             "args": method_args,
         }))
 
@@ -165,16 +291,79 @@ class EventTicketingCreateTransactionParams:
             "args": method_args,
         }))
 
+    def buy_tickets(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int] | BuyTicketsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "buy_tickets(pay,uint64)void",
+            "args": method_args,
+        }))
+
+    def get_sale_info(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_sale_info()(uint64,uint64,uint64,uint64,string)",
+        }))
+
+    def get_purchase(
+        self,
+        args: tuple[str] | GetPurchaseArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_purchase(address)(uint64,uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def redeem(
+        self,
+        args: tuple[int] | RedeemArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "redeem(uint64)void",
+            "args": method_args,
+        }))
+
+    def redeem_batch(
+        self,
+        args: tuple[list[int]] | RedeemBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "redeem_batch(uint32[])uint32[]",
+            "args": method_args,
+        }))
+
     def create_application(
         self,
-        args: tuple[str, int, int] | CreateApplicationArgs,
+        args: tuple[str, int, int, int] | CreateApplicationArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "create_application(string,uint64,uint64)void",
+            "method": "create_application(string,uint64,uint64,uint64)void",
             "args": method_args,
         }))
 
@@ -223,9 +412,87 @@ class EventTicketingSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
+    def buy_tickets(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int] | BuyTicketsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "buy_tickets(pay,uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def get_sale_info(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[SaleInfo]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_sale_info()(uint64,uint64,uint64,uint64,string)",
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(SaleInfo, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[SaleInfo], parsed_response)
+
+    def get_purchase(
+        self,
+        args: tuple[str] | GetPurchaseArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[PurchaseRecord]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_purchase(address)(uint64,uint64,uint64)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(PurchaseRecord, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[PurchaseRecord], parsed_response)
+
+    def redeem(
+        self,
+        args: tuple[int] | RedeemArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "redeem(uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def redeem_batch(
+        self,
+        args: tuple[list[int]] | RedeemBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[int]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "redeem_batch(uint32[])uint32[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[int]], parsed_response)
+
     def create_application(
         self,
-        args: tuple[str, int, int] | CreateApplicationArgs,
+        args: tuple[str, int, int, int] | CreateApplicationArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[None]:
@@ -233,7 +500,7 @@ class EventTicketingSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "create_application(string,uint64,uint64)void",
+            "method": "create_application(string,uint64,uint64,uint64)void",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
@@ -252,12 +519,14 @@ class EventTicketingSend:
 
 class GlobalStateValue(typing.TypedDict):
     """Shape of global_state state key values"""
-    ticket_asa_id: int
-    ticket_price: int
-    total_tickets: int
+    sale_params: SaleParams
     tickets_sold: int
     event_name: str
 
+class BoxStateValue(typing.TypedDict):
+    """Shape of box state key values"""
+    checkins: bytes
+
 class EventTicketingState:
     """Methods to access state for the current EventTicketing app"""
 
@@ -271,12 +540,21 @@ class EventTicketingState:
             """Methods to access global_state for the current app"""
             return _GlobalState(self.app_client)
 
+    @property
+    def box(
+        self
+    ) -> "_BoxState":
+            """Methods to access box for the current app"""
+            return _BoxState(self.app_client)
+
 class _GlobalState:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
         
         # Pre-generated mapping of value types to their struct classes
-        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {
+            "SaleParams": SaleParams
+        }
 
     def get_all(self) -> GlobalStateValue:
         """Get all current keyed values from global_state state"""
@@ -295,28 +573,12 @@ class _GlobalState:
         return typing.cast(GlobalStateValue, converted)
 
     @property
-    def ticket_asa_id(self) -> int:
-        """Get the current value of the ticket_asa_id key in global_state state"""
-        value = self.app_client.state.global_state.get_value("ticket_asa_id")
-        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
-        return typing.cast(int, value)
-
-    @property
-    def ticket_price(self) -> int:
-        """Get the current value of the ticket_price key in global_state state"""
-        value = self.app_client.state.global_state.get_value("ticket_price")
-        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
-        return typing.cast(int, value)
-
-    @property
-    def total_tickets(self) -> int:
-        """Get the current value of the total_tickets key in global_state state"""
-        value = self.app_client.state.global_state.get_value("total_tickets")
-        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
-        return typing.cast(int, value)
+    def sale_params(self) -> SaleParams:
+        """Get the current value of the sale_params key in global_state state"""
+        value = self.app_client.state.global_state.get_value("sale_params")
+        if isinstance(value, dict) and "SaleParams" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["SaleParams"], value)  # type: ignore
+        return typing.cast(SaleParams, value)
 
     @property
     def tickets_sold(self) -> int:
@@ -334,6 +596,83 @@ class _GlobalState:
             return _init_dataclass(self._struct_classes["AVMString"], value)  # type: ignore
         return typing.cast(str, value)
 
+class _BoxState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {
+            "PurchaseRecord": PurchaseRecord
+        }
+
+    def get_all(self) -> BoxStateValue:
+        """Get all current keyed values from box state"""
+        result = self.app_client.state.box.get_all()
+        if not result:
+            return typing.cast(BoxStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.box.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return typing.cast(BoxStateValue, converted)
+
+    @property
+    def checkins(self) -> bytes:
+        """Get the current value of the checkins key in box state"""
+        value = self.app_client.state.box.get_value("checkins")
+        if isinstance(value, dict) and "AVMBytes" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMBytes"], value)  # type: ignore
+        return typing.cast(bytes, value)
+
+    @property
+    def purchases(self) -> "_MapState[str, PurchaseRecord]":
+        """Get values from the purchases map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "purchases",
+            self._struct_classes.get("PurchaseRecord")
+        )
+
+_KeyType = typing.TypeVar("_KeyType")
+_ValueType = typing.TypeVar("_ValueType")
+
+class _AppClientStateMethodsProtocol(typing.Protocol):
+    def get_map(self, map_name: str) -> dict[typing.Any, typing.Any]:
+        ...
+    def get_map_value(self, map_name: str, key: typing.Any) -> typing.Any | None:
+        ...
+
+class _MapState(typing.Generic[_KeyType, _ValueType]):
+    """Generic class for accessing state maps with strongly typed keys and values"""
+
+    def __init__(self, state_accessor: _AppClientStateMethodsProtocol, map_name: str,
+                struct_class: typing.Type[_ValueType] | None = None):
+        self._state_accessor = state_accessor
+        self._map_name = map_name
+        self._struct_class = struct_class
+
+    def get_map(self) -> dict[_KeyType, _ValueType]:
+        """Get all current values in the map"""
+        result = self._state_accessor.get_map(self._map_name)
+        if self._struct_class and result:
+            return {k: _init_dataclass(self._struct_class, v) if isinstance(v, dict) else v
+                    for k, v in result.items()}  # type: ignore
+        return typing.cast(dict[_KeyType, _ValueType], result or {})
+
+    def get_value(self, key: _KeyType) -> _ValueType | None:
+        """Get a value from the map by key"""
+        key_value = dataclasses.asdict(key) if dataclasses.is_dataclass(key) else key  # type: ignore
+        value = self._state_accessor.get_map_value(self._map_name, key_value)
+        if value is not None and self._struct_class and isinstance(value, dict):
+            return _init_dataclass(self._struct_class, value)  # type: ignore
+        return typing.cast(_ValueType | None, value)
+
+
 class EventTicketingClient:
     """Client for interacting with EventTicketing smart contract"""
 
@@ -492,7 +831,37 @@ class EventTicketingClient:
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["create_application(string,uint64,uint64)void"],
+        method: typing.Literal["buy_tickets(pay,uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_sale_info()(uint64,uint64,uint64,uint64,string)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> SaleInfo | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_purchase(address)(uint64,uint64,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> PurchaseRecord | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["redeem(uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["redeem_batch(uint32[])uint32[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[int] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["create_application(string,uint64,uint64,uint64)void"],
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
@@ -506,7 +875,7 @@ class EventTicketingClient:
         self,
         method: str,
         return_value: algokit_utils.ABIReturn | None
-    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | int:
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | PurchaseRecord | SaleInfo | int | list[int]:
         """Decode ABI return value for the given method."""
         if return_value is None:
             return None
@@ -729,20 +1098,119 @@ class EventTicketingFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def buy_tickets(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int] | BuyTicketsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the buy_tickets(pay,uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "buy_tickets(pay,uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_sale_info(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_sale_info()(uint64,uint64,uint64,uint64,string) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_sale_info()(uint64,uint64,uint64,uint64,string)",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_purchase(
+        self,
+        args: tuple[str] | GetPurchaseArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_purchase(address)(uint64,uint64,uint64) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_purchase(address)(uint64,uint64,uint64)",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def redeem(
+        self,
+        args: tuple[int] | RedeemArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the redeem(uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "redeem(uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def redeem_batch(
+        self,
+        args: tuple[list[int]] | RedeemBatchArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the redeem_batch(uint32[])uint32[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "redeem_batch(uint32[])uint32[]",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def create_application(
         self,
-        args: tuple[str, int, int] | CreateApplicationArgs,
+        args: tuple[str, int, int, int] | CreateApplicationArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the create_application(string,uint64,uint64)void ABI method"""
+        """Creates a new instance using the create_application(string,uint64,uint64,uint64)void ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "create_application(string,uint64,uint64)void",
+                "method": "create_application(string,uint64,uint64,uint64)void",
                 "args": _parse_abi_args(args),
                 }
             ),
@@ -843,19 +1311,19 @@ class EventTicketingFactorySendCreate:
 
     def create_application(
         self,
-        args: tuple[str, int, int] | CreateApplicationArgs,
+        args: tuple[str, int, int, int] | CreateApplicationArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         send_params: algokit_utils.SendParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> tuple[EventTicketingClient, algokit_utils.AppFactoryCreateMethodCallResult[None]]:
-            """Creates and sends a transaction using the create_application(string,uint64,uint64)void ABI method"""
+            """Creates and sends a transaction using the create_application(string,uint64,uint64,uint64)void ABI method"""
             params = params or algokit_utils.CommonAppCallCreateParams()
             client, result = self.app_factory.send.create(
                 algokit_utils.AppFactoryCreateMethodCallParams(
                     **{
                     **dataclasses.asdict(params),
-                    "method": "create_application(string,uint64,uint64)void",
+                    "method": "create_application(string,uint64,uint64,uint64)void",
                     "args": _parse_abi_args(args),
                     }
                 ),
@@ -923,9 +1391,98 @@ class EventTicketingComposer:
         )
         return self
 
+    def buy_tickets(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int] | BuyTicketsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "EventTicketingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.buy_tickets(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "buy_tickets(pay,uint64)void", v
+            )
+        )
+        return self
+
+    def get_sale_info(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "EventTicketingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_sale_info(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_sale_info()(uint64,uint64,uint64,uint64,string)", v
+            )
+        )
+        return self
+
+    def get_purchase(
+        self,
+        args: tuple[str] | GetPurchaseArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "EventTicketingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_purchase(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_purchase(address)(uint64,uint64,uint64)", v
+            )
+        )
+        return self
+
+    def redeem(
+        self,
+        args: tuple[int] | RedeemArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "EventTicketingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.redeem(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "redeem(uint64)void", v
+            )
+        )
+        return self
+
+    def redeem_batch(
+        self,
+        args: tuple[list[int]] | RedeemBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "EventTicketingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.redeem_batch(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "redeem_batch(uint32[])uint32[]", v
+            )
+        )
+        return self
+
     def create_application(
         self,
-        args: tuple[str, int, int] | CreateApplicationArgs,
+        args: tuple[str, int, int, int] | CreateApplicationArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "EventTicketingComposer":
         self._composer.add_app_call_method_call(
@@ -936,7 +1493,7 @@ class EventTicketingComposer:
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "create_application(string,uint64,uint64)void", v
+                "create_application(string,uint64,uint64,uint64)void", v
             )
         )
         return self
@@ -0,0 +1,154 @@
+# smart_contracts/event_registry/contract.py
+
+import algopy
+from algopy import (
+    ARC4Contract,
+    Asset,
+    BoxMap,
+    Global,
+    GlobalState,
+    String,
+    Txn,
+    UInt64,
+    arc4,
+    gtxn,
+    op,
+    subroutine,
+)
+
+# Kutu MBR'si: 2500 + 400 * (ad + değer) µAlgo
+BOX_FLAT_MIN_BALANCE = 2_500
+BOX_BYTE_MIN_BALANCE = 400
+# Kutu adı: b"e" + 8 bayt event_id
+EVENT_BOX_KEY_SIZE = 9
+# EventInfo'nun sabit kısmı: adres (32) + 4 x uint64 (32) + string ofseti (2) + uzunluk öneki (2)
+EVENT_INFO_FIXED_SIZE = 68
+# ARC-4 dönüş değeri log öneki
+ARC4_RETURN_PREFIX_SIZE = 4
+
+
+class EventInfo(arc4.Struct):
+    """Kayıt defterindeki tek bir etkinlik"""
+
+    organizer: arc4.Address
+    ticket_price: arc4.UInt64
+    total_tickets: arc4.UInt64
+    tickets_sold: arc4.UInt64
+    ticket_asa_id: arc4.UInt64
+    event_name: arc4.String
+
+
+class EventRegistry(ARC4Contract):
+    """
+    Çok etkinlikli kayıt defteri.
+    Her etkinlik ayrı bir uygulama yerine bir kutuda (event_id anahtarıyla) tutulur;
+    tek uygulama binlerce küçük etkinliğe hizmet eder.
+    """
+
+    next_event_id: GlobalState[UInt64]
+    events: BoxMap[UInt64, EventInfo]
+
+    def __init__(self) -> None:
+        self.next_event_id = GlobalState(UInt64(1), key=b"next", description="Sıradaki etkinlik ID")
+        self.events        = BoxMap(UInt64, EventInfo, key_prefix=b"e")
+
+    # --- 1) Etkinlik oluşturma (kutu + ASA MBR'si organizatörden) ---
+    @arc4.abimethod
+    def create_event(
+        self,
+        mbr_payment: gtxn.PaymentTransaction,
+        event_name: String,
+        ticket_price: UInt64,
+        total_tickets: UInt64,
+    ) -> UInt64:
+        assert mbr_payment.receiver == Global.current_application_address, "Ödeme bu kontrata yapılmalı"
+        assert mbr_payment.amount >= self._event_deposit(event_name), "Depozito kutu ve ASA MBR'sini karşılamıyor"
+
+        event_id = self.next_event_id.value
+        self.next_event_id.value = event_id + UInt64(1)
+        self.events[event_id] = EventInfo(
+            organizer=arc4.Address(Txn.sender),
+            ticket_price=arc4.UInt64(ticket_price),
+            total_tickets=arc4.UInt64(total_tickets),
+            tickets_sold=arc4.UInt64(0),
+            ticket_asa_id=arc4.UInt64(0),
+            event_name=arc4.String(event_name),
+        )
+        return event_id
+
+    # --- 2) Mint tickets (ASA) ---
+    @arc4.abimethod
+    def mint_tickets(self, event_id: UInt64) -> Asset:
+        # event_id = 0: aynı grupta hemen önce oluşturulan etkinlik (ID istemcide tahmin edilmez)
+        if event_id == UInt64(0):
+            event_id = self._created_in_group()
+        assert event_id in self.events, "Etkinlik bulunamadı"
+        record = self.events[event_id].copy()
+        assert Txn.sender == record.organizer.native, "Sadece etkinlik organizatörü bilet basabilir"
+        assert record.ticket_asa_id.native == UInt64(0), "Biletler zaten basılmış"
+
+        created_asset_id = algopy.itxn.AssetConfig(
+            asset_name=record.event_name.native,
+            unit_name="TICKET",
+            total=record.total_tickets.native,
+            decimals=0,
+            default_frozen=False,
+            manager=Global.current_application_address,
+            reserve=Global.current_application_address,
+            freeze=Global.current_application_address,
+            clawback=Global.current_application_address,
+        ).submit().created_asset.id
+
+        record.ticket_asa_id = arc4.UInt64(created_asset_id)
+        self.events[event_id] = record.copy()
+        return Asset(created_asset_id)
+
+    # --- 3) Buy ticket (ödeme doğrudan organizatöre) ---
+    @arc4.abimethod
+    def buy_ticket(self, event_id: UInt64, payment: gtxn.PaymentTransaction) -> None:
+        assert event_id in self.events, "Etkinlik bulunamadı"
+        record = self.events[event_id].copy()
+        sold = record.tickets_sold.native
+        assert sold < record.total_tickets.native, "Biletler tükendi"
+        asa_id = record.ticket_asa_id.native
+        assert asa_id != UInt64(0), "Bilet satışı henüz başlamadı"
+
+        assert payment.amount == record.ticket_price.native, "Ödeme miktarı bilet fiyatıyla eşleşmiyor"
+        # Gelir uygulamada birikmez; organizatörler arası muhasebe gerekmez
+        assert payment.receiver == record.organizer.native, "Ödeme etkinlik organizatörüne yapılmalı"
+
+        algopy.itxn.AssetTransfer(
+            xfer_asset=asa_id,
+            asset_receiver=Txn.sender,
+            asset_amount=1,
+        ).submit()
+
+        record.tickets_sold = arc4.UInt64(sold + UInt64(1))
+        self.events[event_id] = record.copy()
+
+    # --- 4) Etkinlik bilgisi (salt okunur) ---
+    @arc4.abimethod(readonly=True)
+    def get_event(self, event_id: UInt64) -> EventInfo:
+        assert event_id in self.events, "Etkinlik bulunamadı"
+        return self.events[event_id]
+
+    @subroutine
+    def _created_in_group(self) -> UInt64:
+        # Bir önceki grup işlemi bu uygulamaya create_event çağrısı olmalı; ABI dönüşü son log'dadır
+        assert Txn.group_index > UInt64(0), "Grupta önceki create_event çağrısı yok"
+        call = gtxn.ApplicationCallTransaction(Txn.group_index - UInt64(1))
+        assert call.app_id == Global.current_application_id, "Grupta önceki create_event çağrısı yok"
+        assert call.app_args(0) == arc4.arc4_signature(
+            EventRegistry.create_event
+        ), "Grupta önceki create_event çağrısı yok"
+        return op.btoi(call.last_log[ARC4_RETURN_PREFIX_SIZE:])
+
+    @subroutine
+    def _event_deposit(self, event_name: String) -> UInt64:
+        # Etkinlik kutusu + uygulamanın tutacağı bilet ASA'sı
+        box_bytes = UInt64(EVENT_BOX_KEY_SIZE + EVENT_INFO_FIXED_SIZE) + event_name.bytes.length
+        return (
+            UInt64(BOX_FLAT_MIN_BALANCE)
+            + UInt64(BOX_BYTE_MIN_BALANCE) * box_bytes
+            + Global.asset_create_min_balance
+        )
@@ -0,0 +1,56 @@
+# smart_contracts/event_registry/deploy_config.py
+# Bu dosya, __main__.py tarafından çağrılır.
+
+import logging
+
+from algokit_utils import LogicError, PaymentParams
+from algosdk.account import address_from_private_key
+from algosdk.atomic_transaction_composer import AccountTransactionSigner
+
+from smart_contracts.artifacts.event_registry.event_registry_client import EventRegistryFactory
+from smart_contracts.event_registry.registry import REGISTRY_FUNDING, register_event
+
+# --- Örnek etkinlik (kayıt defterinin ilk kaydı) ---
+EVENT_NAME = "Harika Algorand Konseri"
+TICKET_PRICE = 1_000_000      # 1 ALGO (microAlgo)
+TOTAL_TICKETS = 100
+
+logger = logging.getLogger(__name__)
+
+
+# deploy fonksiyonu __main__.py tarafından bu imzayla çağrılır:
+def deploy(
+    app_factory: EventRegistryFactory,   # __main__ tarafından oluşturulur
+    app_id: int,                         # __main__ tarafından verilir (yeni için 0)
+    creator: AccountTransactionSigner    # __main__ tarafından verilir
+) -> None:
+    """
+    Kayıt defterini oluşturur (bare create), hesabın minimum bakiyesini fonlar ve
+    örnek bir etkinliği tek grupta kaydedip biletlerini basar.
+    """
+    sender = address_from_private_key(creator.private_key)
+
+    # --- 1. Adım: Kayıt defterini oluşturma ---
+    if app_id == 0:
+        logger.info("Kayıt defteri oluşturuluyor (bare create)...")
+        app_client, create_result = app_factory.send.create.bare()
+        app_client.algorand.send.payment(
+            PaymentParams(sender=sender, receiver=app_client.app_address, amount=REGISTRY_FUNDING, signer=creator)
+        )
+        logger.info(
+            f"Kayıt defteri oluşturuldu. App ID: {create_result.app_id}, App Address: {create_result.app_address}"
+        )
+    else:
+        app_client = app_factory.get_app_client_by_id(app_id)
+        logger.info(f"Mevcut kayıt defteri {app_id} kullanılıyor.")
+
+    # --- 2. Adım: Etkinlik kaydı (depozito + create_event + mint_tickets, tek grup) ---
+    try:
+        event_id, asa_id = register_event(app_client, creator, EVENT_NAME, TICKET_PRICE, TOTAL_TICKETS)
+        logger.info(f"Etkinlik {event_id} kaydedildi, bilet ASA ID: {asa_id}")
+    except LogicError as e:
+        logger.error(f"Etkinlik kaydı BAŞARISIZ: {e!s}")
+        return
+
+    logger.info(f"Kayıtlı etkinlik sayısı: {app_client.state.global_state.next_event_id - 1}")
+    logger.info("Deploy betiği başarıyla tamamlandı.")
@@ -0,0 +1,206 @@
+# smart_contracts/event_registry/registry.py
+# EventRegistry istemci yardımcıları: etkinlik kaydı (tek grup: depozito +
+# create_event + mint_tickets), bilet alımı ve etkinlikler arasında sayfalama.
+#
+# Etkinlik ID'leri 1'den başlayarak sıralı verildiğinden bir sayfa, bilinen kutu
+# adlarının paralel okunmasıdır (list_events). Tüm kataloğu gezmek için
+# iter_events() algod'un kutu listeleme uç noktasını (prefix + values) kullanır;
+# binlerce etkinlik birkaç istekte gelir. Uç noktayı desteklemeyen düğümlerde
+# list_events sayfalarına düşülür.
+#
+# Kullanım:
+#   event_id, asa_id = register_event(client, creator, "Konser", 1_000_000, 100)
+#   page = list_events(client, limit=50)
+#   for event_id, info in iter_events(client):
+#       ...
+
+from __future__ import annotations
+
+import base64
+import dataclasses
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+from algokit_utils import AlgoAmount, CommonAppCallParams, PaymentParams, SendParams
+from algosdk import abi
+from algosdk.account import address_from_private_key
+from algosdk.atomic_transaction_composer import AccountTransactionSigner, TransactionSigner
+from algosdk.error import AlgodHTTPError
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.artifacts.event_registry.event_registry_client import EventInfo, EventRegistryClient
+
+EVENT_BOX_PREFIX = b"e"
+EVENT_INFO_TYPE = abi.ABIType.from_string("(address,uint64,uint64,uint64,uint64,string)")
+# Kontrattaki _event_deposit ile aynı hesap: kutu MBR'si + uygulamanın tutacağı ASA
+EVENT_BOX_KEY_SIZE = len(EVENT_BOX_PREFIX) + 8
+EVENT_INFO_FIXED_SIZE = 68
+ASSET_MIN_BALANCE = 100_000
+# Uygulama hesabının kendi minimum bakiyesi (bir kez, kayıt defteri oluşturulurken)
+REGISTRY_FUNDING = AlgoAmount.from_algo(0.1)
+# mint_tickets / buy_ticket içindeki tek inner işlem
+INNER_TXN_FEE = AlgoAmount.from_micro_algo(1_000)
+DEFAULT_PAGE_SIZE = 100
+# mint_tickets'a verildiğinde gruptaki önceki create_event'in etkinliği
+CREATED_IN_GROUP = 0
+
+
+@dataclasses.dataclass(frozen=True)
+class EventPage:
+    events: list[tuple[int, EventInfo]]
+    # Sonraki sayfa için `after` değeri; None = son sayfa
+    next_after: int | None
+
+
+def event_box_name(event_id: int) -> bytes:
+    return EVENT_BOX_PREFIX + event_id.to_bytes(8, "big")
+
+
+def event_deposit(event_name: str) -> AlgoAmount:
+    """create_event ödemesinin en az tutarı (etkinlik başına kilitlenen ALGO)."""
+    box_bytes = EVENT_BOX_KEY_SIZE + EVENT_INFO_FIXED_SIZE + len(event_name.encode())
+    return AlgoAmount.from_micro_algo(2_500 + 400 * box_bytes + ASSET_MIN_BALANCE)
+
+
+def decode_event(value: bytes) -> EventInfo:
+    organizer, price, total, sold, asa_id, name = EVENT_INFO_TYPE.decode(value)
+    return EventInfo(
+        organizer=organizer,
+        ticket_price=price,
+        total_tickets=total,
+        tickets_sold=sold,
+        ticket_asa_id=asa_id,
+        event_name=name,
+    )
+
+
+# --------------------------------------------------------------------
+# Yazma yardımcıları
+# --------------------------------------------------------------------
+def register_event(
+    client: EventRegistryClient,
+    organizer: AccountTransactionSigner,
+    event_name: str,
+    ticket_price: int,
+    total_tickets: int,
+) -> tuple[int, int]:
+    """
+    Depozito ödemesi, create_event ve mint_tickets'ı tek atomik grupta gönderir
+    (tek onay beklemesi). ID istemcide tahmin edilmez: mint_tickets(0) etkinliği
+    zincir üzerinde, aynı gruptaki create_event dönüşünden okur. Kutu referansları
+    gönderimdeki simulate ile doldurulur; ID create_event'in ABI dönüşünden alınır.
+    (event_id, asa_id) döndürür.
+    """
+    sender = address_from_private_key(organizer.private_key)
+    deposit = client.algorand.create_transaction.payment(
+        PaymentParams(sender=sender, receiver=client.app_address, amount=event_deposit(event_name))
+    )
+    result = (
+        client.new_group()
+        .create_event(
+            args=(deposit, event_name, ticket_price, total_tickets),
+            params=CommonAppCallParams(sender=sender, signer=organizer),
+        )
+        .mint_tickets(
+            args=(CREATED_IN_GROUP,),
+            params=CommonAppCallParams(sender=sender, signer=organizer, extra_fee=INNER_TXN_FEE),
+        )
+        .send(SendParams(populate_app_call_resources=True))
+    )
+    return int(result.returns[0].value), int(result.returns[-1].value)
+
+
+def buy_ticket(
+    client: EventRegistryClient, event_id: int, event: EventInfo, buyer: str, signer: TransactionSigner
+) -> int:
+    """Tek bilet alır; ödeme doğrudan organizatöre gider. Onay round'unu döndürür."""
+    payment = client.algorand.create_transaction.payment(
+        PaymentParams(
+            sender=buyer,
+            receiver=event.organizer,
+            amount=AlgoAmount.from_micro_algo(event.ticket_price),
+        )
+    )
+    result = client.send.buy_ticket(
+        args=(event_id, payment),
+        params=CommonAppCallParams(
+            sender=buyer,
+            signer=signer,
+            box_references=[event_box_name(event_id)],
+            asset_references=[event.ticket_asa_id],
+            extra_fee=INNER_TXN_FEE,
+        ),
+    )
+    return int(result.confirmation["confirmed-round"])
+
+
+# --------------------------------------------------------------------
+# Sayfalama
+# --------------------------------------------------------------------
+def list_events(
+    client: EventRegistryClient,
+    *,
+    after: int = 0,
+    limit: int = DEFAULT_PAGE_SIZE,
+    workers: int = 16,
+) -> EventPage:
+    """`after` ID'sinden sonraki en fazla `limit` etkinliği (ID sırasıyla) döndürür."""
+    last_id = client.state.global_state.next_event_id - 1
+    ids = list(range(after + 1, min(after + limit, last_id) + 1))
+    if not ids:
+        return EventPage(events=[], next_after=None)
+
+    algod = client.algorand.client.algod
+    with ThreadPoolExecutor(max_workers=min(workers, len(ids))) as pool:
+        values = list(pool.map(lambda i: _read_event_box(algod, client.app_id, i), ids))
+    events = [(i, decode_event(v)) for i, v in zip(ids, values, strict=True) if v is not None]
+    return EventPage(events=events, next_after=ids[-1] if ids[-1] < last_id else None)
+
+
+def iter_events(client: EventRegistryClient, *, page_size: int = 1_000) -> Iterator[tuple[int, EventInfo]]:
+    """Tüm etkinlikleri ID sırasıyla gezer."""
+    after = 0
+    try:
+        for event_id, value in _list_event_boxes(client.algorand.client.algod, client.app_id, page_size):
+            yield event_id, decode_event(value)
+            after = event_id
+        return
+    except (AlgodHTTPError, KeyError):
+        # Düğüm values/prefix parametrelerini desteklemiyor; kalan kısmı ID sayfalarıyla oku
+        pass
+
+    while True:
+        page = list_events(client, after=after, limit=page_size)
+        yield from page.events
+        if page.next_after is None:
+            return
+        after = page.next_after
+
+
+def _list_event_boxes(algod: AlgodClient, app_id: int, page_size: int) -> Iterator[tuple[int, bytes]]:
+    params: dict[str, str | int] = {
+        "prefix": "b64:" + base64.b64encode(EVENT_BOX_PREFIX).decode(),
+        "values": "true",
+        "max": page_size,
+    }
+    while True:
+        response = algod.algod_request("GET", f"/applications/{app_id}/boxes", params=params)
+        assert isinstance(response, dict)
+        for box in response.get("boxes", []):
+            name = base64.b64decode(box["name"])
+            yield int.from_bytes(name[len(EVENT_BOX_PREFIX) :], "big"), base64.b64decode(box["value"])
+        next_token = response.get("next-token")
+        if not next_token:
+            return
+        params["next"] = next_token
+
+
+def _read_event_box(algod: AlgodClient, app_id: int, event_id: int) -> bytes | None:
+    try:
+        response = algod.application_box_by_name(app_id, event_box_name(event_id))
+    except AlgodHTTPError as e:
+        if e.code == 404:
+            return None
+        raise
+    assert isinstance(response, dict)
+    return base64.b64decode(response["value"])
@@ -0,0 +1,226 @@
+# smart_contracts/event_ticketing/analytics.py
+# Satış geçmişi üzerinde sütunlu (NumPy) analizler: etkinlik başına satış
+# eğrisi (sell-through), saatlik gelir ve tükenme süresi. Satış kayıtları bir
+# kez dizilere yüklenir; gruplamalar Python döngüsü yerine sıralama +
+# bincount / cumsum / reduceat ile yapılır (10 milyon satış saniyeler içinde).
+#
+# Sonuçlar sütun adı -> dizi sözlükleridir (Table); CSV ya da Parquet'e yazılır.
+#
+# Kullanım:
+#   sales = SalesColumns.from_db(SalesIndex(Path("sales.db")))
+#   write_csv(revenue_by_hour(sales), Path("revenue.csv"))
+#   write_parquet(time_to_sellout(sales, totals), Path("sellout.parquet"))
+#
+# NumPy (ve Parquet için pyarrow) isteğe bağlı "analytics" bağımlılık grubundadır:
+#   poetry install --with analytics
+
+from __future__ import annotations
+
+import dataclasses
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+
+from smart_contracts.event_ticketing.sales_db import SalesIndex
+from smart_contracts.event_ticketing.stream import SaleEvent
+
+Table = dict[str, npt.NDArray[np.int64] | npt.NDArray[np.float64]]
+SECONDS_PER_HOUR = 3_600
+# (uygulama, saat) gruplamasında bu kadar hücreye kadar bincount, üstünde sıralama
+DENSE_GROUPS = 1 << 24
+# app_id'ler bu aralığa sığıyorsa sıralamadan (bincount ile) numaralandırılır
+DENSE_APP_RANGE = 1 << 22
+
+
+@dataclasses.dataclass(frozen=True)
+class SalesColumns:
+    """Satış kayıtları, sütun başına bir dizi (aynı uzunlukta)"""
+
+    round: npt.NDArray[np.int64]
+    app_id: npt.NDArray[np.int64]
+    # µAlgo
+    amount: npt.NDArray[np.int64]
+    count: npt.NDArray[np.int64]
+    timestamp: npt.NDArray[np.int64]
+    # buyers[buyer_id[i]] = adres
+    buyer_id: npt.NDArray[np.int64]
+    buyers: npt.NDArray[np.str_]
+
+    def __len__(self) -> int:
+        return len(self.round)
+
+    @classmethod
+    def from_sales(cls, sales: Iterable[SaleEvent]) -> SalesColumns:
+        rows = list(sales)
+        buyers, buyer_id = np.unique(np.array([s.buyer for s in rows], dtype=np.str_), return_inverse=True)
+        return cls(
+            round=np.fromiter((s.round for s in rows), np.int64, len(rows)),
+            app_id=np.fromiter((s.app_id for s in rows), np.int64, len(rows)),
+            amount=np.fromiter((s.amount for s in rows), np.int64, len(rows)),
+            count=np.fromiter((s.count for s in rows), np.int64, len(rows)),
+            timestamp=np.fromiter((s.timestamp for s in rows), np.int64, len(rows)),
+            buyer_id=buyer_id.astype(np.int64),
+            buyers=buyers,
+        )
+
+    @classmethod
+    def from_db(cls, db: SalesIndex) -> SalesColumns:
+        """SQLite satış dizinindeki tüm satışları (round sırasıyla) yükler."""
+        rows = db.sale_rows()
+        numeric = np.array([row[:5] for row in rows], dtype=np.int64).reshape(-1, 5)
+        buyers, buyer_id = np.unique(np.array([row[5] for row in rows], dtype=np.str_), return_inverse=True)
+        return cls(
+            round=numeric[:, 0],
+            app_id=numeric[:, 1],
+            amount=numeric[:, 2],
+            count=numeric[:, 3],
+            timestamp=numeric[:, 4],
+            buyer_id=buyer_id.astype(np.int64),
+            buyers=buyers,
+        )
+
+
+def _factorize(app_id: npt.NDArray[np.int64]) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.intp]]:
+    """Farklı app_id'ler (artan) ve her satırın bu listedeki sırası."""
+    if len(app_id) == 0:
+        return app_id, np.zeros(0, dtype=np.intp)
+    low = int(app_id.min())
+    if int(app_id.max()) - low < DENSE_APP_RANGE:
+        # Dar aralık: sıralamasız O(n) eşleme
+        present = np.bincount(app_id - low) > 0
+        position = np.cumsum(present) - 1
+        return np.flatnonzero(present).astype(np.int64) + low, position[app_id - low]
+    apps, index = np.unique(app_id, return_inverse=True)
+    return apps, index
+
+
+def _by_app_then_round(sales: SalesColumns, app_index: npt.NDArray[np.intp], apps: int) -> npt.NDArray[np.intp]:
+    """Önce app_id, sonra round sırasına göre dizin."""
+    if len(sales) > 1 and not np.all(sales.round[1:] >= sales.round[:-1]):
+        return np.lexsort((sales.round, app_index))
+    # Dizinden/akıştan gelen satırlar zaten round sıralı: tek anahtarlı kararlı sıralama yeter;
+    # 65536'dan az etkinlikte uint16 anahtar NumPy'ın radix sıralamasını kullanır
+    key = app_index.astype(np.uint16) if apps <= 1 << 16 else app_index
+    return np.argsort(key, kind="stable")
+
+
+def _groups(sorted_keys: npt.NDArray[np.int64]) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]:
+    """Sıralı anahtar dizisinde her grubun ilk satırı ve satır sayısı."""
+    if len(sorted_keys) == 0:
+        empty = np.zeros(0, dtype=np.intp)
+        return empty, empty
+    starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+    return starts, np.diff(np.r_[starts, len(sorted_keys)])
+
+
+def _sum_groups(values: npt.NDArray[np.int64], starts: npt.NDArray[np.intp]) -> npt.NDArray[np.int64]:
+    # reduceat boş başlangıç dizisini kabul etmez; tamsayı toplamı kesin kalır (bincount float'a çevirir)
+    return np.add.reduceat(values, starts) if len(starts) else np.zeros(0, dtype=np.int64)
+
+
+def _totals(app_ids: npt.NDArray[np.int64], totals: Mapping[int, int]) -> npt.NDArray[np.int64]:
+    return np.array([totals.get(int(a), 0) for a in app_ids], dtype=np.int64)
+
+
+# --------------------------------------------------------------------
+# Gruplamalar
+# --------------------------------------------------------------------
+def revenue_by_hour(sales: SalesColumns) -> Table:
+    """(app_id, saat) başına gelir ve bilet; saat = blok zamanının saat başı (unix saniye)."""
+    hour = sales.timestamp // SECONDS_PER_HOUR
+    apps, app_index = _factorize(sales.app_id)
+    first_hour = hour.min() if len(sales) else 0
+    span = int(hour.max() - first_hour) + 1 if len(sales) else 1
+    # (uygulama, saat) çiftini tek tamsayı anahtara katla
+    key = app_index * span + (hour - first_hour)
+    if len(apps) * span <= max(DENSE_GROUPS, len(sales)):
+        # Yoğun anahtar uzayı: sıralamasız bincount (float toplam; grup başına 2^53 µAlgo'ya kadar kesin)
+        revenue = np.bincount(key, weights=sales.amount, minlength=len(apps) * span)
+        tickets = np.bincount(key, weights=sales.count, minlength=len(apps) * span)
+        keys = np.flatnonzero(tickets)
+        revenue, tickets = revenue[keys].astype(np.int64), tickets[keys].astype(np.int64)
+    else:
+        order = np.argsort(key, kind="stable")
+        starts, _ = _groups(key[order])
+        keys = key[order][starts]
+        revenue, tickets = _sum_groups(sales.amount[order], starts), _sum_groups(sales.count[order], starts)
+    return {
+        "app_id": apps[keys // span],
+        "hour": (keys % span + first_hour) * SECONDS_PER_HOUR,
+        "revenue": revenue,
+        "tickets": tickets,
+    }
+
+
+def sell_through(sales: SalesColumns, totals: Mapping[int, int]) -> Table:
+    """
+    Etkinlik başına satış eğrisi: her satış satırında o ana kadar satılan bilet
+    ve toplam arza oranı (app_id, round sırasıyla). totals: app_id -> toplam bilet.
+    """
+    apps, app_index = _factorize(sales.app_id)
+    order = _by_app_then_round(sales, app_index, len(apps))
+    app_id = sales.app_id[order]
+    running = np.cumsum(sales.count[order])
+    starts, sizes = _groups(app_id)
+    # Kümülatif toplamı her grubun başında sıfırla
+    sold = running - np.repeat(np.r_[0, running][starts], sizes)
+    group_total = np.repeat(_totals(app_id[starts], totals), sizes)
+    return {
+        "app_id": app_id,
+        "round": sales.round[order],
+        "timestamp": sales.timestamp[order],
+        "sold": sold,
+        "sell_through": np.divide(sold, group_total, out=np.full(len(sold), np.nan), where=group_total > 0),
+    }
+
+
+def time_to_sellout(sales: SalesColumns, totals: Mapping[int, int]) -> Table:
+    """
+    Etkinlik başına ilk satıştan tükenmeye kadar geçen saniye; tükenmemiş
+    etkinliklerde -1. totals: app_id -> toplam bilet.
+    """
+    curve = sell_through(sales, totals)
+    starts, _ = _groups(curve["app_id"].astype(np.int64))
+    if len(starts) == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return {"app_id": empty, "first_sale": empty, "sold_out_at": empty, "seconds": empty, "sold": empty}
+    timestamp = curve["timestamp"]
+    never = np.iinfo(np.int64).max
+    first_sale = np.minimum.reduceat(timestamp, starts)
+    sold_out_at = np.minimum.reduceat(np.where(curve["sell_through"] >= 1.0, timestamp, never), starts)
+    finished = sold_out_at != never
+    return {
+        "app_id": curve["app_id"][starts],
+        "first_sale": first_sale,
+        "sold_out_at": np.where(finished, sold_out_at, -1),
+        "seconds": np.where(finished, sold_out_at - first_sale, -1),
+        "sold": np.maximum.reduceat(curve["sold"], starts),
+    }
+
+
+def top_buyers(sales: SalesColumns, limit: int = 10) -> Table:
+    """Tüm etkinliklerde en çok bilet alanlar (buyer_id ve adet)."""
+    tickets = np.bincount(sales.buyer_id, weights=sales.count, minlength=len(sales.buyers)).astype(np.int64)
+    best = np.argsort(tickets, kind="stable")[::-1][:limit]
+    return {"buyer_id": best.astype(np.int64), "tickets": tickets[best]}
+
+
+# --------------------------------------------------------------------
+# Dışa aktarma
+# --------------------------------------------------------------------
+def write_csv(table: Table, path: Path) -> None:
+    columns = list(table)
+    data = np.column_stack([table[c] for c in columns]) if columns else np.zeros((0, 0))
+    fmt = ["%.6f" if np.issubdtype(table[c].dtype, np.floating) else "%d" for c in columns]
+    np.savetxt(path, data, fmt=fmt, delimiter=",", header=",".join(columns), comments="")
+
+
+def write_parquet(table: Table, path: Path) -> None:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet çıktısı için pyarrow gerekli: poetry install --with analytics") from e
+    pq.write_table(pa.table(dict(table)), path)
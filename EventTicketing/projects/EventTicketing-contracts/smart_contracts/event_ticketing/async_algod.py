@@ -0,0 +1,156 @@
+# smart_contracts/event_ticketing/async_algod.py
+# asyncio için bloklamayan algod istemcisi. algosdk'nın AlgodClient'ı her istekte
+# urllib ile yeni bağlantı açar ve olay döngüsünü bloklar; bu istemci tek bir
+# httpx.AsyncClient (keep-alive bağlantı havuzu) üzerinden çalışır, aynı süreçte
+# yüzlerce eşzamanlı istek tek havuzu paylaşır.
+#
+# Yalnızca bilet satışı için gereken uç noktalar vardır; yanıtlar AlgodClient ile
+# aynı biçimdedir (JSON sözlükleri), hatalar AlgodHTTPError olarak yükseltilir.
+#
+# Kullanım:
+#   async with AsyncAlgodClient.from_algod(algorand.client.algod) as algod:
+#       sp = await algod.suggested_params()
+
+from __future__ import annotations
+
+import base64
+from collections.abc import Sequence
+from typing import Any, cast
+
+import httpx
+from algosdk import constants, encoding, transaction
+from algosdk.error import AlgodHTTPError, ConfirmationTimeoutError, TransactionRejectedError
+from algosdk.v2client import models
+from algosdk.v2client.algod import AlgodClient
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_TIMEOUT = 30.0
+# status_after_block algod tarafında ~1 dakikaya kadar bekletilir
+WAIT_FOR_BLOCK_TIMEOUT = 70.0
+DEFAULT_WAIT_ROUNDS = 10
+
+
+class AsyncAlgodClient:
+    """httpx.AsyncClient tabanlı, bağlantı havuzlu algod istemcisi"""
+
+    def __init__(
+        self,
+        algod_token: str,
+        algod_address: str,
+        *,
+        headers: dict[str, str] | None = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        timeout: float = DEFAULT_TIMEOUT,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.algod_address = algod_address.rstrip("/")
+        self._http = httpx.AsyncClient(
+            base_url=self.algod_address,
+            transport=transport,
+            headers={constants.algod_auth_header: algod_token, **(headers or {})},
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            timeout=timeout,
+        )
+
+    @classmethod
+    def from_algod(cls, algod: AlgodClient, **kwargs: Any) -> AsyncAlgodClient:
+        """Senkron AlgodClient ile aynı düğüme (adres, token, başlıklar) bağlanır."""
+        return cls(algod.algod_token, algod.algod_address, headers=algod.headers, **kwargs)
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
+    async def __aenter__(self) -> AsyncAlgodClient:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.aclose()
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        data: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
+        """JSON yanıtlı bir algod isteği; hata durumunda AlgodHTTPError."""
+        response = await self._http.request(
+            method,
+            "/v2" + path,
+            params=params,
+            content=data,
+            headers=headers,
+            timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+        )
+        if response.is_error:
+            try:
+                body = response.json()
+            except ValueError:
+                body = {}
+            raise AlgodHTTPError(body.get("message", response.text), response.status_code, body.get("data"))
+        return cast(dict[str, Any], response.json()) if response.content else {}
+
+    # --- Düğüm durumu ---
+    async def status(self) -> dict[str, Any]:
+        return await self.request("GET", "/status")
+
+    async def status_after_block(self, block_num: int) -> dict[str, Any]:
+        return await self.request("GET", f"/status/wait-for-block-after/{block_num}", timeout=WAIT_FOR_BLOCK_TIMEOUT)
+
+    async def suggested_params(self) -> transaction.SuggestedParams:
+        res = await self.request("GET", "/transactions/params")
+        return transaction.SuggestedParams(
+            res["fee"],
+            res["last-round"],
+            res["last-round"] + 1000,
+            res["genesis-hash"],
+            res["genesis-id"],
+            flat_fee=False,
+            consensus_version=res["consensus-version"],
+            min_fee=res["min-fee"],
+        )
+
+    # --- İşlemler ---
+    async def send_transactions(self, txns: Sequence[transaction.GenericSignedTransaction]) -> str:
+        """İmzalı grubu tek istekle gönderir; ilk işlemin ID'sini döndürür."""
+        body = b"".join(base64.b64decode(encoding.msgpack_encode(txn)) for txn in txns)
+        res = await self.request("POST", "/transactions", data=body, headers={"Content-Type": "application/x-binary"})
+        return res["txId"]
+
+    async def pending_transaction_info(self, txid: str) -> dict[str, Any]:
+        return await self.request("GET", f"/transactions/pending/{txid}")
+
+    async def wait_for_confirmation(self, txid: str, wait_rounds: int = DEFAULT_WAIT_ROUNDS) -> dict[str, Any]:
+        """algosdk.transaction.wait_for_confirmation'ın async karşılığı."""
+        last_round = int((await self.status())["last-round"])
+        current_round = last_round + 1
+        while True:
+            info = await self.pending_transaction_info(txid)
+            if info.get("confirmed-round", 0) > 0:
+                return info
+            if info.get("pool-error"):
+                raise TransactionRejectedError(txid, info["pool-error"])
+            if current_round > last_round + wait_rounds:
+                raise ConfirmationTimeoutError(f"Wait for transaction id {txid} timed out")
+            await self.status_after_block(current_round)
+            current_round += 1
+
+    async def simulate_transactions(self, request: models.SimulateRequest) -> dict[str, Any]:
+        body = base64.b64decode(encoding.msgpack_encode(request))
+        return await self.request(
+            "POST", "/transactions/simulate", data=body, headers={"Content-Type": "application/msgpack"}
+        )
+
+    # --- Hesap / uygulama durumu ---
+    async def application_info(self, application_id: int) -> dict[str, Any]:
+        return await self.request("GET", f"/applications/{application_id}")
+
+    async def application_box_by_name(self, application_id: int, box_name: bytes) -> dict[str, Any]:
+        params = {"name": "b64:" + base64.b64encode(box_name).decode()}
+        return await self.request("GET", f"/applications/{application_id}/box", params=params)
+
+    async def account_asset_info(self, address: str, asset_id: int) -> dict[str, Any]:
+        return await self.request("GET", f"/accounts/{address}/assets/{asset_id}")
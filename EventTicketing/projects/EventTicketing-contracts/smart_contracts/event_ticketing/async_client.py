@@ -0,0 +1,534 @@
+# smart_contracts/event_ticketing/async_client.py
+# Üretilmiş EventTicketingClient / EventTicketingComposer'ın asyncio karşılığı.
+# Senkron client her çağrıda iş parçacığını (gönderim + onay beklemesi boyunca
+# birkaç saniye) bloklar; yüksek eşzamanlılıkta bu, iş parçacığı havuzu demektir.
+# Buradaki client aynı yüzeyi (send.<metot>, new_group().<metot>...send()/simulate(),
+# state.global_state / state.box) await edilebilir olarak sunar ve tüm istekleri
+# AsyncAlgodClient'ın tek bağlantı havuzundan geçirir: binlerce alım tek iş
+# parçacığında, olay döngüsünde aynı anda beklemede kalabilir.
+#
+# İşlemler algosdk AtomicTransactionComposer ile kurulup imzalanır (CPU işi,
+# senkron); yalnızca ağ adımları (suggested params, gönderim, onay, simulate)
+# await edilir. Salt okunur metotlar (get_sale_info, get_purchase) send
+# üzerinden çağrıldığında senkron client'taki gibi simulate ile çalışır.
+#
+# Gönderimden önce simulate ile kaynak doldurma yapılmaz: buy_ticket / buy_tickets
+# çağrılarına bilet ASA'sı ve alıcının kayıt kutusu (b"p" + adres) otomatik
+# eklenir. ASA ID'si client başına bir kez global state'ten okunur.
+#
+# Kullanım:
+#   async with AsyncAlgodClient.from_algod(algorand.client.algod) as algod:
+#       client = AsyncEventTicketingClient(algod, app_id, default_sender=addr, default_signer=signer)
+#       pay = PaymentParams(sender=addr, receiver=client.app_address, amount=AlgoAmount.from_micro_algo(price))
+#       await client.send.buy_ticket(args=(pay,), params=CommonAppCallParams(extra_fee=INNER_TXN_FEE))
+#       info = (await client.send.get_sale_info()).abi_return
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import copy
+import dataclasses
+import struct
+import typing
+from collections.abc import Callable, Sequence
+
+from algokit_utils import AlgoAmount, BoxReference, CommonAppCallParams, PaymentParams
+from algosdk import encoding, logic, transaction
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    TransactionSigner,
+    TransactionWithSigner,
+)
+from algosdk.error import AlgodHTTPError
+from algosdk.v2client import models
+
+from smart_contracts.artifacts.event_ticketing.event_ticketing_client import (
+    APP_SPEC,
+    BuyTicketArgs,
+    BuyTicketsArgs,
+    GetPurchaseArgs,
+    PurchaseRecord,
+    RedeemArgs,
+    RedeemBatchArgs,
+    SaleInfo,
+    SaleParams,
+)
+from smart_contracts.event_ticketing.async_algod import DEFAULT_WAIT_ROUNDS, AsyncAlgodClient
+from smart_contracts.event_ticketing.ledger import decode_purchase_record, purchase_box_name
+from smart_contracts.event_ticketing.suggested_params import SuggestedParamsProvider
+
+T = typing.TypeVar("T")
+
+PaymentArgument = transaction.Transaction | TransactionWithSigner | PaymentParams
+
+_METHODS = {m.name: m.to_abi_method() for m in APP_SPEC.methods}
+# Tuple dönüşlerin eşlendiği struct'lar (üretilmiş client'taki _init_dataclass karşılığı)
+_RETURN_STRUCTS: dict[str, Callable[..., object]] = {"get_sale_info": SaleInfo, "get_purchase": PurchaseRecord}
+
+_SALE_PARAMS_KEY = b"params"
+_TICKETS_SOLD_KEY = b"sold"
+_EVENT_NAME_KEY = b"name"
+_CHECKINS_BOX = b"checkin"
+# Bilet ASA'sını ve alıcı kutusunu kullanan metotlar
+_PURCHASE_METHODS = frozenset({"buy_ticket", "buy_tickets"})
+
+_Step = Callable[[AtomicTransactionComposer, transaction.SuggestedParams, int], None]
+
+
+@dataclasses.dataclass(frozen=True)
+class AsyncSendResult(typing.Generic[T]):
+    """Tek metot çağrısının sonucu (SendAppTransactionResult karşılığı)"""
+
+    tx_ids: list[str]
+    confirmations: list[dict[str, typing.Any]]
+    abi_return: T | None
+    # Salt okunur çağrılarda simulate yanıtı; onay yoktur
+    simulate_response: dict[str, typing.Any] | None = None
+
+    @property
+    def tx_id(self) -> str:
+        return self.tx_ids[-1]
+
+    @property
+    def confirmation(self) -> dict[str, typing.Any] | None:
+        return self.confirmations[-1] if self.confirmations else None
+
+
+@dataclasses.dataclass(frozen=True)
+class AsyncGroupResult:
+    """Grup sonucu; returns grubun metot çağrılarının çözülmüş dönüşleri (sırayla)"""
+
+    tx_ids: list[str]
+    confirmations: list[dict[str, typing.Any]]
+    returns: list[typing.Any]
+    confirmed_round: int | None = None
+    simulate_response: dict[str, typing.Any] | None = None
+
+
+class AsyncEventTicketingComposer:
+    """
+    EventTicketingComposer karşılığı: metotlar zincirlenir, ağ adımları
+    `await send()` / `await simulate()` sırasında yapılır. Suggested params
+    tüm grup için bir kez alınır.
+    """
+
+    def __init__(self, client: AsyncEventTicketingClient) -> None:
+        self.client = client
+        self._steps: list[_Step] = []
+        self._needs_ticket_asa = False
+
+    # --- Metotlar ---
+    def mint_tickets(self, params: CommonAppCallParams | None = None) -> AsyncEventTicketingComposer:
+        return self._call("mint_tickets", [], params)
+
+    def buy_ticket(
+        self,
+        args: tuple[PaymentArgument] | BuyTicketArgs,
+        params: CommonAppCallParams | None = None,
+    ) -> AsyncEventTicketingComposer:
+        return self._call("buy_ticket", _method_args(args), params)
+
+    def buy_tickets(
+        self,
+        args: tuple[PaymentArgument, int] | BuyTicketsArgs,
+        params: CommonAppCallParams | None = None,
+    ) -> AsyncEventTicketingComposer:
+        return self._call("buy_tickets", _method_args(args), params)
+
+    def get_sale_info(self, params: CommonAppCallParams | None = None) -> AsyncEventTicketingComposer:
+        return self._call("get_sale_info", [], params)
+
+    def get_purchase(
+        self,
+        args: tuple[str] | GetPurchaseArgs,
+        params: CommonAppCallParams | None = None,
+    ) -> AsyncEventTicketingComposer:
+        return self._call("get_purchase", _method_args(args), params)
+
+    def redeem(
+        self,
+        args: tuple[int] | RedeemArgs,
+        params: CommonAppCallParams | None = None,
+    ) -> AsyncEventTicketingComposer:
+        return self._call("redeem", _method_args(args), params)
+
+    def redeem_batch(
+        self,
+        args: tuple[list[int]] | RedeemBatchArgs,
+        params: CommonAppCallParams | None = None,
+    ) -> AsyncEventTicketingComposer:
+        return self._call("redeem_batch", _method_args(args), params)
+
+    def add_transaction(
+        self, txn: transaction.Transaction, signer: TransactionSigner | None = None
+    ) -> AsyncEventTicketingComposer:
+        """Gruba hazır bir işlem ekler (imzalayan verilmezse client'ın varsayılanı)."""
+        txn_signer = self.client._signer(signer)
+        self._steps.append(lambda atc, _sp, _asa: atc.add_transaction(TransactionWithSigner(txn, txn_signer)))
+        return self
+
+    # --- Ağ adımları ---
+    async def send(self, *, wait_rounds: int = DEFAULT_WAIT_ROUNDS) -> AsyncGroupResult:
+        """Grubu imzalayıp gönderir ve onaylanmasını bekler."""
+        atc = await self._build()
+        signed = atc.gather_signatures()
+        tx_ids = [stxn.get_txid() for stxn in signed]
+        algod = self.client.algod
+        await algod.send_transactions(signed)
+        # Grubun tamamı aynı round'da onaylanır; ilk işlemi beklemek yeter
+        first = await algod.wait_for_confirmation(tx_ids[0], wait_rounds)
+        rest = await asyncio.gather(*(algod.pending_transaction_info(txid) for txid in tx_ids[1:]))
+        confirmations = [first, *rest]
+        return AsyncGroupResult(
+            tx_ids=tx_ids,
+            confirmations=confirmations,
+            returns=_decode_returns(atc, tx_ids, confirmations),
+            confirmed_round=int(first["confirmed-round"]),
+        )
+
+    async def simulate(
+        self,
+        *,
+        skip_signatures: bool = True,
+        allow_unnamed_resources: bool = True,
+    ) -> AsyncGroupResult:
+        """Grubu simulate ile çalıştırır; varsayılan olarak imza gerekmez."""
+        atc = await self._build()
+        if skip_signatures:
+            signed: list[transaction.GenericSignedTransaction] = [
+                transaction.SignedTransaction(t.txn, None) for t in atc.build_group()
+            ]
+        else:
+            signed = atc.gather_signatures()
+        request = models.SimulateRequest(
+            txn_groups=[models.SimulateRequestTransactionGroup(txns=signed)],
+            allow_empty_signatures=skip_signatures,
+            allow_unnamed_resources=allow_unnamed_resources,
+        )
+        response = await self.client.algod.simulate_transactions(request)
+        group = response["txn-groups"][0]
+        if group.get("failure-message"):
+            raise AlgodHTTPError(group["failure-message"])
+        results = [r["txn-result"] for r in group["txn-results"]]
+        tx_ids = [stxn.transaction.get_txid() for stxn in signed]
+        return AsyncGroupResult(
+            tx_ids=tx_ids,
+            confirmations=[],
+            returns=_decode_returns(atc, tx_ids, results),
+            simulate_response=response,
+        )
+
+    # --- İç yardımcılar ---
+    def _call(
+        self, name: str, args: list[object], params: CommonAppCallParams | None
+    ) -> AsyncEventTicketingComposer:
+        params = params or CommonAppCallParams()
+        sender = self.client._sender(params.sender)
+        signer = self.client._signer(params.signer)
+        method = _METHODS[name]
+        purchase = name in _PURCHASE_METHODS
+        self._needs_ticket_asa |= purchase
+
+        def add(atc: AtomicTransactionComposer, sp: transaction.SuggestedParams, ticket_asa_id: int) -> None:
+            method_args = [self.client._transaction_argument(a, sp, signer) for a in args]
+            assets = list(params.asset_references or [])
+            boxes = [_box_reference(b) for b in params.box_references or []]
+            if purchase:
+                # inner AssetTransfer ve _record_purchase'ın kutusu
+                if ticket_asa_id and ticket_asa_id not in assets:
+                    assets.append(ticket_asa_id)
+                if (0, purchase_box_name(sender)) not in boxes:
+                    boxes.append((0, purchase_box_name(sender)))
+            atc.add_method_call(
+                app_id=self.client.app_id,
+                method=method,
+                sender=sender,
+                sp=_call_params(sp, params),
+                signer=signer,
+                method_args=method_args,
+                accounts=params.account_references,
+                foreign_apps=params.app_references,
+                foreign_assets=assets,
+                boxes=boxes,
+                note=params.note,
+                lease=params.lease,
+                rekey_to=params.rekey_to,
+            )
+
+        self._steps.append(add)
+        return self
+
+    async def _build(self) -> AtomicTransactionComposer:
+        provider = self.client.params_provider
+        sp = provider.get() if provider is not None else await self.client.algod.suggested_params()
+        ticket_asa_id = await self.client.ticket_asa_id() if self._needs_ticket_asa else 0
+        atc = AtomicTransactionComposer()
+        for step in self._steps:
+            step(atc, sp, ticket_asa_id)
+        return atc
+
+
+class AsyncEventTicketingSend:
+    """EventTicketingSend karşılığı: her metot tek işlemlik (ödeme ile iki) bir grup gönderir"""
+
+    def __init__(self, client: AsyncEventTicketingClient) -> None:
+        self.client = client
+
+    async def mint_tickets(self, params: CommonAppCallParams | None = None) -> AsyncSendResult[int]:
+        return await self._send(self.client.new_group().mint_tickets(params))
+
+    async def buy_ticket(
+        self,
+        args: tuple[PaymentArgument] | BuyTicketArgs,
+        params: CommonAppCallParams | None = None,
+    ) -> AsyncSendResult[None]:
+        return await self._send(self.client.new_group().buy_ticket(args, params))
+
+    async def buy_tickets(
+        self,
+        args: tuple[PaymentArgument, int] | BuyTicketsArgs,
+        params: CommonAppCallParams | None = None,
+    ) -> AsyncSendResult[None]:
+        return await self._send(self.client.new_group().buy_tickets(args, params))
+
+    async def get_sale_info(self, params: CommonAppCallParams | None = None) -> AsyncSendResult[SaleInfo]:
+        return await self._simulate(self.client.new_group().get_sale_info(params))
+
+    async def get_purchase(
+        self,
+        args: tuple[str] | GetPurchaseArgs,
+        params: CommonAppCallParams | None = None,
+    ) -> AsyncSendResult[PurchaseRecord]:
+        return await self._simulate(self.client.new_group().get_purchase(args, params))
+
+    async def redeem(
+        self,
+        args: tuple[int] | RedeemArgs,
+        params: CommonAppCallParams | None = None,
+    ) -> AsyncSendResult[None]:
+        return await self._send(self.client.new_group().redeem(args, params))
+
+    async def redeem_batch(
+        self,
+        args: tuple[list[int]] | RedeemBatchArgs,
+        params: CommonAppCallParams | None = None,
+    ) -> AsyncSendResult[list[int]]:
+        return await self._send(self.client.new_group().redeem_batch(args, params))
+
+    async def _send(self, composer: AsyncEventTicketingComposer) -> AsyncSendResult[typing.Any]:
+        result = await composer.send()
+        return AsyncSendResult(tx_ids=result.tx_ids, confirmations=result.confirmations, abi_return=result.returns[-1])
+
+    async def _simulate(self, composer: AsyncEventTicketingComposer) -> AsyncSendResult[typing.Any]:
+        result = await composer.simulate()
+        return AsyncSendResult(
+            tx_ids=result.tx_ids,
+            confirmations=[],
+            abi_return=result.returns[-1],
+            simulate_response=result.simulate_response,
+        )
+
+
+class AsyncGlobalState:
+    """_GlobalState karşılığı; her okuma tek application_info isteğidir"""
+
+    def __init__(self, client: AsyncEventTicketingClient) -> None:
+        self.client = client
+
+    async def get_all(self) -> dict[str, typing.Any]:
+        info = await self.client.algod.application_info(self.client.app_id)
+        raw = {
+            base64.b64decode(kv["key"]): kv["value"] for kv in info.get("params", {}).get("global-state", [])
+        }
+        values: dict[str, typing.Any] = {}
+        if _SALE_PARAMS_KEY in raw:
+            packed = base64.b64decode(raw[_SALE_PARAMS_KEY]["bytes"])
+            values["sale_params"] = SaleParams(*struct.unpack(">QQQQ", packed[:32]))
+        if _TICKETS_SOLD_KEY in raw:
+            values["tickets_sold"] = int(raw[_TICKETS_SOLD_KEY]["uint"])
+        if _EVENT_NAME_KEY in raw:
+            values["event_name"] = base64.b64decode(raw[_EVENT_NAME_KEY]["bytes"]).decode()
+        return values
+
+    async def sale_params(self) -> SaleParams:
+        return typing.cast(SaleParams, (await self.get_all())["sale_params"])
+
+    async def tickets_sold(self) -> int:
+        return typing.cast(int, (await self.get_all())["tickets_sold"])
+
+    async def event_name(self) -> str:
+        return typing.cast(str, (await self.get_all())["event_name"])
+
+
+class AsyncPurchasesMap:
+    """_MapState[str, PurchaseRecord] karşılığı (tek adres okuması)"""
+
+    def __init__(self, client: AsyncEventTicketingClient) -> None:
+        self.client = client
+
+    async def get_value(self, address: str) -> PurchaseRecord | None:
+        value = await self.client._box(purchase_box_name(address))
+        return decode_purchase_record(value) if value is not None else None
+
+
+class AsyncBoxState:
+    def __init__(self, client: AsyncEventTicketingClient) -> None:
+        self.client = client
+
+    @property
+    def purchases(self) -> AsyncPurchasesMap:
+        return AsyncPurchasesMap(self.client)
+
+    async def checkins(self) -> bytes | None:
+        return await self.client._box(_CHECKINS_BOX)
+
+
+class AsyncEventTicketingState:
+    def __init__(self, client: AsyncEventTicketingClient) -> None:
+        self.global_state = AsyncGlobalState(client)
+        self.box = AsyncBoxState(client)
+
+
+class AsyncEventTicketingClient:
+    """
+    EventTicketingClient'ın asyncio karşılığı. `algod` birden fazla client
+    arasında paylaşılabilir; bağlantı havuzunu kapatmak çağıranın işidir.
+    `params_provider` verilirse suggested params ondan alınır; olay döngüsünü
+    bloklamaması için start() ile arka planda yenilenmelidir.
+    """
+
+    def __init__(
+        self,
+        algod: AsyncAlgodClient,
+        app_id: int,
+        *,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        params_provider: SuggestedParamsProvider | None = None,
+    ) -> None:
+        self.algod = algod
+        self.app_id = app_id
+        self.default_sender = default_sender
+        self.default_signer = default_signer
+        self.params_provider = params_provider
+        # mint_tickets'tan sonra değişmez; 0 = henüz okunmadı ya da basılmadı
+        self._ticket_asa_id = 0
+        self.send = AsyncEventTicketingSend(self)
+        self.state = AsyncEventTicketingState(self)
+
+    @property
+    def app_address(self) -> str:
+        return logic.get_application_address(self.app_id)
+
+    def new_group(self) -> AsyncEventTicketingComposer:
+        return AsyncEventTicketingComposer(self)
+
+    async def ticket_asa_id(self) -> int:
+        """Bilet ASA'sı; basıldıktan sonra ilk okumada saklanır."""
+        if not self._ticket_asa_id:
+            self._ticket_asa_id = (await self.state.global_state.sale_params()).ticket_asa_id
+        return self._ticket_asa_id
+
+    def _sender(self, sender: str | None) -> str:
+        sender = sender or self.default_sender
+        if sender is None:
+            raise ValueError("Gönderici yok: params.sender ya da default_sender verilmeli")
+        return sender
+
+    def _signer(self, signer: TransactionSigner | None) -> TransactionSigner:
+        signer = signer or self.default_signer
+        if signer is None:
+            raise ValueError("İmzalayan yok: params.signer ya da default_signer verilmeli")
+        return signer
+
+    def _transaction_argument(
+        self, value: object, sp: transaction.SuggestedParams, signer: TransactionSigner
+    ) -> object:
+        """pay argümanlarını TransactionWithSigner'a çevirir; diğer ABI değerleri aynen geçer."""
+        if isinstance(value, PaymentParams):
+            pay_signer = value.signer if value.signer is not None else signer
+            return TransactionWithSigner(
+                transaction.PaymentTxn(
+                    value.sender,
+                    _call_params(sp, value),
+                    value.receiver,
+                    value.amount.micro_algo,
+                    close_remainder_to=value.close_remainder_to,
+                    note=value.note,
+                    lease=value.lease,
+                    rekey_to=value.rekey_to,
+                ),
+                getattr(pay_signer, "signer", pay_signer),
+            )
+        if isinstance(value, transaction.Transaction):
+            return TransactionWithSigner(value, signer)
+        return value
+
+    async def _box(self, name: bytes) -> bytes | None:
+        try:
+            box = await self.algod.application_box_by_name(self.app_id, name)
+        except AlgodHTTPError as e:
+            if e.code == 404:
+                return None
+            raise
+        return base64.b64decode(box["value"])
+
+
+def _call_params(
+    sp: transaction.SuggestedParams, params: CommonAppCallParams | PaymentParams
+) -> transaction.SuggestedParams:
+    """static_fee / extra_fee ve geçerlilik aralığını suggested params'a uygular."""
+    fee: AlgoAmount | None = params.static_fee
+    if fee is None and params.extra_fee is not None:
+        fee = AlgoAmount.from_micro_algo(max(sp.min_fee or 0, sp.fee) + params.extra_fee.micro_algo)
+    window = params.validity_window
+    if fee is None and window is None and params.first_valid_round is None and params.last_valid_round is None:
+        return sp
+    sp = copy.copy(sp)
+    if fee is not None:
+        if params.max_fee is not None and fee.micro_algo > params.max_fee.micro_algo:
+            raise ValueError(
+                f"İşlem ücreti {fee.micro_algo} µAlgo, max_fee {params.max_fee.micro_algo} µAlgo'yu aşıyor"
+            )
+        sp.fee, sp.flat_fee = fee.micro_algo, True
+    if params.first_valid_round is not None:
+        sp.first = params.first_valid_round
+    if window is not None:
+        sp.last = sp.first + window
+    if params.last_valid_round is not None:
+        sp.last = params.last_valid_round
+    return sp
+
+
+def _method_args(args: object) -> list[object]:
+    """tuple ya da *Args dataclass'ı -> argüman listesi (PaymentParams gibi dataclass değerlere dokunmaz)."""
+    if isinstance(args, tuple):
+        return list(args)
+    return [getattr(args, field.name) for field in dataclasses.fields(typing.cast(typing.Any, args))]
+
+
+def _box_reference(box: object) -> tuple[int, bytes]:
+    """BoxReference / BoxIdentifier -> add_method_call'ın (app_id, ad) çifti (0 = bu uygulama)."""
+    if isinstance(box, BoxReference):
+        return box.app_index, box.name
+    if isinstance(box, str):
+        return 0, box.encode()
+    if isinstance(box, bytes):
+        return 0, box
+    # İmzalayan hesap: kutu adı hesabın adresi
+    return 0, encoding.decode_address(typing.cast(typing.Any, box).address)
+
+
+def _decode_returns(
+    atc: AtomicTransactionComposer, tx_ids: Sequence[str], results: Sequence[dict[str, typing.Any]]
+) -> list[typing.Any]:
+    returns: list[typing.Any] = []
+    for index, method in atc.method_dict.items():
+        value = atc.parse_result(method, tx_ids[index], results[index])
+        if value.decode_error is not None:
+            raise value.decode_error
+        struct_class = _RETURN_STRUCTS.get(method.name)
+        returns.append(struct_class(*value.return_value) if struct_class else value.return_value)
+    return returns
+
@@ -0,0 +1,177 @@
+# smart_contracts/event_ticketing/batch_signer.py
+# Büyük önceden hazırlanmış partiler (ikramlar, airdrop'lar, blok rezervasyonlar)
+# için çevrimdışı, çok çekirdekli imzalama.
+#
+# AccountTransactionSigner her işlemde özel anahtarı base64'ten çözüp ed25519
+# anahtarını yeniden kurar ve tek çekirdekte çalışır. BatchSigner imzasız grupları
+# bir süreç havuzuna dağıtır; her işçi anahtarlarını yalnızca başlarken bir kez
+# yükler (adres -> SigningKey). Sonuç, grup sırası korunmuş, gönderilmeye hazır
+# imzalı baytlardır (grup başına art arda eklenmiş msgpack).
+#
+# Gruplar build() ile kurulduğundan kaynak doldurma (simulate) yapılmaz: alım
+# çağrıları bilet ASA'sını ve alıcı kutusunu asset_references / box_references
+# ile taşımalı ya da unsigned_group'a algod verilerek simulate ile doldurulmalıdır.
+#
+# Kullanım:
+#   groups = [unsigned_group(client.new_group().buy_ticket(...)..., algod) for ...]
+#   with BatchSigner(private_keys, workers=8) as signer:
+#       for signed in signer.sign_groups(groups):
+#           signed.send(algod)
+
+from __future__ import annotations
+
+import base64
+import dataclasses
+import os
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+
+from algokit_utils import populate_app_call_resources
+from algosdk import account, constants, encoding
+from algosdk.transaction import ApplicationCallTxn, SignedTransaction, Transaction
+from algosdk.v2client.algod import AlgodClient
+from nacl.signing import SigningKey
+
+from smart_contracts.artifacts.event_ticketing.event_ticketing_client import APP_SPEC, EventTicketingComposer
+
+# Süreçler arası iletişim maliyeti için görev başına grup sayısı
+DEFAULT_CHUNK_GROUPS = 32
+# Bilet ASA'sı (inner transfer) ve alıcı kutusu (_record_purchase) gerektiren metotlar
+_PURCHASE_SELECTORS = frozenset(
+    m.to_abi_method().get_selector() for m in APP_SPEC.methods if m.name in ("buy_ticket", "buy_tickets")
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class SignedGroup:
+    # Gruptaki işlemlerin ID'leri (sırasıyla)
+    tx_ids: list[str]
+    # İmzalı işlemlerin art arda eklenmiş msgpack baytları
+    blob: bytes
+
+    def send(self, algod: AlgodClient) -> str:
+        """Grubu gönderir; ilk işlemin ID'sini döndürür."""
+        algod.send_raw_transaction(base64.b64encode(self.blob).decode())
+        return self.tx_ids[0]
+
+
+def unsigned_group(composer: EventTicketingComposer, algod: AlgodClient | None = None) -> list[Transaction]:
+    """
+    Composer'daki grubu grup ID'si atanmış, imzasız işlemler olarak döndürür.
+    `algod` verilirse uygulama çağrılarının kaynakları simulate ile doldurulur;
+    verilmezse referanssız bir alım çağrısı ValueError verir.
+    """
+    atc = composer.composer().build().atc
+    if algod is not None:
+        return [t.txn for t in populate_app_call_resources(atc, algod).build_group()]
+    txns = [t.txn for t in atc.build_group()]
+    for txn in txns:
+        if _is_purchase(txn) and not (txn.foreign_assets and txn.boxes):
+            raise ValueError(
+                "Alım çağrısında bilet ASA'sı ya da alıcı kutusu referansı yok: "
+                "asset_references / box_references verin ya da algod ile doldurun"
+            )
+    return txns
+
+
+def _is_purchase(txn: Transaction) -> bool:
+    return isinstance(txn, ApplicationCallTxn) and bool(txn.app_args) and txn.app_args[0] in _PURCHASE_SELECTORS
+
+
+# --- İşçi süreç tarafı ---
+# Her işçi sürecinde _init_worker ile bir kez doldurulur
+_keys: dict[str, SigningKey] = {}
+
+
+def _init_worker(private_keys: Sequence[str]) -> None:
+    _keys.clear()
+    _keys.update(_signing_keys(private_keys))
+
+
+def _signing_keys(private_keys: Iterable[str]) -> dict[str, SigningKey]:
+    return {
+        account.address_from_private_key(key): SigningKey(base64.b64decode(key)[: constants.key_len_bytes])
+        for key in private_keys
+    }
+
+
+def _sign_chunk(groups: Sequence[Sequence[Transaction]]) -> list[SignedGroup]:
+    return [_sign_group(group, _keys) for group in groups]
+
+
+def _sign_group(group: Sequence[Transaction], keys: dict[str, SigningKey]) -> SignedGroup:
+    tx_ids: list[str] = []
+    blob = bytearray()
+    for txn in group:
+        key = keys.get(txn.sender)
+        if key is None:
+            raise ValueError(f"{txn.sender} için imzalama anahtarı yok")
+        # İmzalanan baytlar tx ID'sinin de kaynağı; işlem bir kez kodlanır
+        to_sign = txn.bytes_to_sign()
+        signature = key.sign(to_sign).signature
+        signed = SignedTransaction(txn, base64.b64encode(signature).decode())
+        tx_ids.append(base64.b32encode(encoding.checksum(to_sign)).decode().rstrip("="))
+        blob += base64.b64decode(encoding.msgpack_encode(signed))
+    return SignedGroup(tx_ids=tx_ids, blob=bytes(blob))
+
+
+class BatchSigner:
+    """
+    İmzasız işlem gruplarını bir süreç havuzunda imzalar. Her işlem, göndereninin
+    anahtarıyla imzalanır; anahtarı verilmemiş bir gönderen ValueError verir.
+    `workers=0` imzalamayı çağıran süreçte yapar (karşılaştırma ve küçük partiler için).
+    """
+
+    def __init__(
+        self,
+        private_keys: Iterable[str],
+        *,
+        workers: int | None = None,
+        chunk_groups: int = DEFAULT_CHUNK_GROUPS,
+    ) -> None:
+        if chunk_groups < 1:
+            raise ValueError("chunk_groups en az 1 olmalı")
+        keys = list(private_keys)
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.chunk_groups = chunk_groups
+        self._local_keys = _signing_keys(keys) if self.workers == 0 else {}
+        self._pool = (
+            ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker, initargs=(keys,))
+            if self.workers > 0
+            else None
+        )
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+
+    def __enter__(self) -> BatchSigner:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def sign_groups(self, groups: Iterable[Sequence[Transaction]]) -> Iterator[SignedGroup]:
+        """İmzalı grupları verilen sırayla üretir."""
+        if self._pool is None:
+            for group in groups:
+                yield _sign_group(group, self._local_keys)
+            return
+        for chunk in self._pool.map(_sign_chunk, _chunked(groups, self.chunk_groups)):
+            yield from chunk
+
+    def sign_composers(
+        self, composers: Iterable[EventTicketingComposer], algod: AlgodClient | None = None
+    ) -> Iterator[SignedGroup]:
+        return self.sign_groups(unsigned_group(c, algod) for c in composers)
+
+
+def _chunked(groups: Iterable[Sequence[Transaction]], size: int) -> Iterator[list[Sequence[Transaction]]]:
+    chunk: list[Sequence[Transaction]] = []
+    for group in groups:
+        chunk.append(group)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
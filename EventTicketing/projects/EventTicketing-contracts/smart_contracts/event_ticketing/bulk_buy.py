@@ -0,0 +1,325 @@
+# smart_contracts/event_ticketing/bulk_buy.py
+# Toplu bilet alımı: alıcıları 16 işlemlik (8 pay + app call çifti) atomik
+# gruplara paketler, grupları bir iş parçacığı havuzunda imzalar, sınırlı sayıda
+# grubu aynı anda gönderir ve onayları toplu olarak bekler. Etkinlikte adres başına
+# sınır (max_per_address) varsa, sınırı aşacak alımlar gönderilmeden elenir; tek
+# bir başarısız çağrı tüm atomik grubu düşüreceğinden bu ön kontrol önemlidir.
+#
+# Kullanım:
+#   buyer = BulkBuyer(app_client, workers=8, max_in_flight=16)
+#   for r in buyer.run(buyers):
+#       ...
+#   print(buyer.report)
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from algokit_utils import AlgoAmount, CommonAppCallParams, PaymentParams, SigningAccount
+from algosdk.atomic_transaction_composer import TransactionSigner, TransactionWithSigner
+from algosdk.error import AlgodHTTPError
+from algosdk.transaction import GenericSignedTransaction
+
+from smart_contracts.artifacts.event_ticketing.event_ticketing_client import (
+    EventTicketingClient,
+    EventTicketingComposer,
+)
+from smart_contracts.event_ticketing.ledger import (
+    SCAN_THRESHOLD,
+    list_purchases,
+    purchase_box_name,
+    read_purchases,
+)
+
+logger = logging.getLogger(__name__)
+
+MAX_GROUP_SIZE = 16
+PAIRS_PER_GROUP = MAX_GROUP_SIZE // 2
+# buy_ticket / buy_tickets içindeki inner AssetTransfer ücreti
+INNER_TXN_FEE = AlgoAmount.from_micro_algo(1_000)
+
+
+@dataclasses.dataclass(frozen=True)
+class Buyer:
+    address: str
+    signer: TransactionSigner
+    count: int = 1
+
+    @classmethod
+    def from_account(cls, account: SigningAccount, count: int = 1) -> Buyer:
+        return cls(address=account.address, signer=account.signer, count=count)
+
+
+@dataclasses.dataclass(frozen=True)
+class BuyResult:
+    buyer: Buyer
+    group_index: int
+    tx_id: str
+    confirmed_round: int | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.confirmed_round is not None
+
+
+@dataclasses.dataclass
+class BulkBuyReport:
+    groups: int = 0
+    tickets_confirmed: int = 0
+    tickets_failed: int = 0
+    # Ön kontrolde adres sınırı nedeniyle hiç gönderilmeyen biletler
+    tickets_skipped: int = 0
+    seconds: float = 0.0
+
+    @property
+    def tickets_per_second(self) -> float:
+        return self.tickets_confirmed / self.seconds if self.seconds else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.groups} grup, {self.tickets_confirmed} bilet onaylandı, {self.tickets_failed} başarısız, "
+            f"{self.tickets_skipped} gönderilmedi (adres sınırı), "
+            f"{self.seconds:.2f} sn, {self.tickets_per_second:.1f} bilet/sn"
+        )
+
+
+@dataclasses.dataclass
+class _SignedGroup:
+    index: int
+    buyers: Sequence[Buyer]
+    # Her alıcının app call işleminin tx ID'si (sonuçlar bununla eşleşir)
+    tx_ids: list[str]
+    signed: list[GenericSignedTransaction]
+
+
+class BulkBuyer:
+    """EventTicketingComposer üzerine kurulu, boru hatlı (pipelined) toplu alım motoru"""
+
+    def __init__(
+        self,
+        client: EventTicketingClient,
+        *,
+        workers: int = 8,
+        max_in_flight: int = 16,
+        wait_rounds: int = 10,
+        precheck: bool = True,
+    ) -> None:
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight en az 1 olmalı")
+        self.client = client
+        self.workers = workers
+        self.max_in_flight = max_in_flight
+        self.wait_rounds = wait_rounds
+        self.precheck = precheck
+        self.report = BulkBuyReport()
+        self._price: int | None = None
+        self._limit: int | None = None
+        self._asa_id: int | None = None
+        # Adres -> zincirdeki + bu çalıştırmada gönderilmiş bilet sayısı
+        self._bought: dict[str, int] = {}
+        # Çalıştırma başına bir kez listelenen zincir sayaçları (None: henüz listelenmedi)
+        self._listed: dict[str, int] | None = None
+        self._listing_supported = True
+
+    # --- Grup oluşturma ve imzalama ---
+    def _price_of(self) -> int:
+        if self._price is None:
+            self._price = self.client.state.global_state.sale_params.ticket_price
+        return self._price
+
+    def _asa_of(self) -> int:
+        if self._asa_id is None:
+            self._asa_id = self.client.state.global_state.sale_params.ticket_asa_id
+        return self._asa_id
+
+    def _limit_of(self) -> int:
+        if self._limit is None:
+            self._limit = self.client.state.global_state.sale_params.max_per_address
+        return self._limit
+
+    # --- Adres sınırı ön kontrolü ---
+    def _admit(self, buyers: Iterable[Buyer], skipped: list[BuyResult]) -> Iterator[Buyer]:
+        """
+        Sınırı aşmayacak alıcıları geçirir, diğerlerini `skipped` listesine ekler.
+        Mevcut sayaçlar bir dalga büyüklüğündeki pencereler halinde toplu okunur.
+        """
+        limit = self._limit_of()
+        if not self.precheck or limit == 0:
+            yield from buyers
+            return
+
+        for window in _chunked(buyers, PAIRS_PER_GROUP * self.max_in_flight):
+            unknown = {b.address for b in window} - self._bought.keys()
+            self._bought.update(self._chain_counts(unknown))
+            for buyer in window:
+                if self._bought[buyer.address] + buyer.count > limit:
+                    skipped.append(BuyResult(buyer, -1, "", error=f"adres başına {limit} bilet sınırı aşılır"))
+                    self.report.tickets_skipped += buyer.count
+                    continue
+                self._bought[buyer.address] += buyer.count
+                yield buyer
+
+    def _chain_counts(self, addresses: set[str]) -> dict[str, int]:
+        """
+        Adreslerin zincirdeki bilet sayıları. Büyük bir pencere geldiğinde kutular
+        bir kez listelenir ve sonraki pencereler bu haritadan yanıtlanır (bu
+        çalıştırmanın alımları zaten _bought'ta); aksi halde kutular tek tek okunur.
+        """
+        if self._listed is None and self._listing_supported and len(addresses) >= SCAN_THRESHOLD:
+            try:
+                self._listed = {a: r.count for a, r in list_purchases(self.client).items()}
+            except (AlgodHTTPError, KeyError):
+                # Düğüm listelemeyi desteklemiyor
+                self._listing_supported = False
+        if self._listed is not None:
+            return {a: self._listed.get(a, 0) for a in addresses}
+        records = read_purchases(self.client, addresses, scan=False)
+        return {a: r.count if r else 0 for a, r in records.items()}
+
+    def _compose(self, buyers: Sequence[Buyer], tag: str) -> EventTicketingComposer:
+        price = self._price_of()
+        asa_id = self._asa_of()
+        group = self.client.new_group()
+        for i, buyer in enumerate(buyers):
+            payment = self.client.algorand.create_transaction.payment(
+                PaymentParams(
+                    sender=buyer.address,
+                    receiver=self.client.app_address,
+                    amount=AlgoAmount.from_micro_algo(price * buyer.count),
+                    # Aynı grupta özdeş işlemler (aynı txid) olmasın diye
+                    note=f"{tag}:{i}".encode(),
+                )
+            )
+            params = CommonAppCallParams(
+                sender=buyer.address,
+                signer=buyer.signer,
+                extra_fee=INNER_TXN_FEE,
+                note=f"{tag}:{i}".encode(),
+                # Bilet ASA'sı ve alıcı kayıt kutusu; grup build() ile imzalandığından referanslar elle verilir
+                asset_references=[asa_id],
+                box_references=[purchase_box_name(buyer.address)],
+            )
+            if buyer.count == 1:
+                group.buy_ticket(args=(TransactionWithSigner(payment, buyer.signer),), params=params)
+            else:
+                group.buy_tickets(args=(TransactionWithSigner(payment, buyer.signer), buyer.count), params=params)
+        return group
+
+    def _build_and_sign(self, index: int, buyers: Sequence[Buyer], run_tag: str) -> _SignedGroup:
+        built = self._compose(buyers, f"{run_tag}:{index}").composer().build()
+        txns = [t.txn for t in built.transactions]
+        signed: list[GenericSignedTransaction | None] = [None] * len(txns)
+
+        # Aynı imzalayıcıya düşen işlemler tek çağrıda imzalanır
+        by_signer: dict[int, tuple[TransactionSigner, list[int]]] = {}
+        for i, tws in enumerate(built.transactions):
+            by_signer.setdefault(id(tws.signer), (tws.signer, []))[1].append(i)
+        for signer, indexes in by_signer.values():
+            for i, stxn in zip(indexes, signer.sign_transactions(txns, indexes), strict=True):
+                signed[i] = stxn
+
+        # Her çiftin ikinci işlemi app call'dur
+        tx_ids = [txns[2 * i + 1].get_txid() for i in range(len(buyers))]
+        return _SignedGroup(index=index, buyers=buyers, tx_ids=tx_ids, signed=[s for s in signed if s is not None])
+
+    # --- Gönderme ve onay ---
+    def _submit(self, group: _SignedGroup) -> str | None:
+        try:
+            self.client.algorand.client.algod.send_transactions(group.signed)
+            return None
+        except Exception as e:  # hata alıcı sonucuna yansıtılır
+            return str(e)
+
+    def _confirm(self, groups: Sequence[_SignedGroup], errors: Sequence[str | None]) -> Iterator[BuyResult]:
+        algod = self.client.algorand.client.algod
+        pending: dict[str, _SignedGroup] = {}
+        for group, error in zip(groups, errors, strict=True):
+            if error is None:
+                pending[group.tx_ids[0]] = group
+            else:
+                yield from self._results(group, error=error)
+
+        last_round = int(algod.status()["last-round"])
+        deadline = last_round + self.wait_rounds
+        while pending and last_round <= deadline:
+            for tx_id in list(pending):
+                info = algod.pending_transaction_info(tx_id)
+                assert isinstance(info, dict)
+                if info.get("confirmed-round"):
+                    yield from self._results(pending.pop(tx_id), confirmed_round=int(info["confirmed-round"]))
+                elif info.get("pool-error"):
+                    yield from self._results(pending.pop(tx_id), error=str(info["pool-error"]))
+            if pending:
+                algod.status_after_block(last_round)
+                last_round += 1
+
+        for group in pending.values():
+            yield from self._results(group, error=f"{self.wait_rounds} round içinde onaylanmadı")
+
+    def _results(
+        self, group: _SignedGroup, *, confirmed_round: int | None = None, error: str | None = None
+    ) -> Iterator[BuyResult]:
+        for buyer, tx_id in zip(group.buyers, group.tx_ids, strict=True):
+            result = BuyResult(buyer, group.index, tx_id, confirmed_round, error)
+            if result.ok:
+                self.report.tickets_confirmed += buyer.count
+            else:
+                self.report.tickets_failed += buyer.count
+                if buyer.address in self._bought:
+                    self._bought[buyer.address] -= buyer.count
+            yield result
+
+    # --- Ana döngü ---
+    def run(self, buyers: Iterable[Buyer]) -> Iterator[BuyResult]:
+        """
+        Alıcıları 8'li çiftler halinde gruplar ve her alıcı için bir BuyResult üretir.
+        Bellek kullanımı `max_in_flight` grupla sınırlıdır; bir sonraki grup
+        dalgası, mevcut dalga onaylanırken arka planda imzalanır.
+        """
+        self.report = BulkBuyReport()
+        self._bought = {}
+        run_tag = f"bulk:{time.time_ns()}"
+        skipped: list[BuyResult] = []
+        chunks = _chunked(self._admit(buyers, skipped), PAIRS_PER_GROUP)
+        started = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+
+            def sign_wave() -> list[Future[_SignedGroup]]:
+                wave: list[Future[_SignedGroup]] = []
+                for chunk in chunks:
+                    wave.append(pool.submit(self._build_and_sign, self.report.groups, chunk, run_tag))
+                    self.report.groups += 1
+                    if len(wave) == self.max_in_flight:
+                        break
+                return wave
+
+            wave = sign_wave()
+            while wave:
+                groups = [f.result() for f in wave]
+                errors = list(pool.map(self._submit, groups))
+                # Bir sonraki dalgayı onay beklenirken imzala
+                wave = sign_wave()
+                yield from self._confirm(groups, errors)
+                yield from skipped
+                skipped.clear()
+        yield from skipped
+
+        self.report.seconds = time.perf_counter() - started
+        logger.info(f"Toplu alım tamamlandı: {self.report}")
+
+
+def _chunked(items: Iterable[Buyer], size: int) -> Iterator[list[Buyer]]:
+    chunk: list[Buyer] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
@@ -0,0 +1,131 @@
+# smart_contracts/event_ticketing/checkin.py
+# Kapıda giriş kontrolü: kontrattaki "checkin" bit haritası kutusu.
+# Bilet i kullanıldıysa bayt i // 8'in (en anlamlı bitten sayarak) i % 8. biti 1'dir.
+#
+# Okuyucular haritanın tamamını tek kutu okumasıyla indirip yerelde önbelleğe alır:
+#   bitmap = fetch_checkins(client)
+#   bitmap.is_redeemed(1234)
+# Okutulan biletler partiler halinde zincire yazılır (çağrı başına REDEEM_BATCH_SIZE):
+#   rejected = redeem_tickets(client, [12, 13, 99])   # zaten kullanılmış olanlar
+
+from __future__ import annotations
+
+import base64
+import dataclasses
+import math
+from collections.abc import Iterable, Sequence
+
+from algokit_utils import AlgoAmount, CommonAppCallParams
+
+from smart_contracts.artifacts.event_ticketing.event_ticketing_client import EventTicketingClient
+
+CHECKIN_BOX_NAME = b"checkin"
+# Kutu G/Ç bütçesi: her kutu referansı 1 KB; bir app call en fazla 8 referans taşır
+BOX_REF_BYTES = 1_024
+MAX_BOX_REFS = 8
+CHECKIN_MAX_TICKETS = MAX_BOX_REFS * BOX_REF_BYTES * 8
+# Çağrı başına okutulan bilet (uint32 dizisi: 2 + 4 * n bayt argüman)
+REDEEM_BATCH_SIZE = 32
+# Kontrattaki REDEEM_OPS_PER_TICKET ile aynı; op-up inner çağrılarının ücreti için
+REDEEM_OPS_PER_TICKET = 40
+APP_CALL_BUDGET = 700
+MAX_GROUP_SIZE = 16
+
+
+def checkin_bitmap_size(total_tickets: int) -> int:
+    return (total_tickets + 7) // 8
+
+
+def checkin_box_mbr(total_tickets: int) -> int:
+    """Bit haritası kutusunun MBR'si (µAlgo): 2500 + 400 * (ad + değer)."""
+    return 2_500 + 400 * (len(CHECKIN_BOX_NAME) + checkin_bitmap_size(total_tickets))
+
+
+def checkin_box_references(total_tickets: int) -> list[bytes]:
+    """
+    Bit haritasına dokunan bir çağrının taşıması gereken kutu referansları:
+    kutunun kendisi + G/Ç bütçesi için boş adlı referanslar.
+    """
+    refs = max(1, math.ceil(checkin_bitmap_size(total_tickets) / BOX_REF_BYTES))
+    if refs > MAX_BOX_REFS:
+        raise ValueError(f"Giriş bit haritası en fazla {CHECKIN_MAX_TICKETS} bilet destekler")
+    return [CHECKIN_BOX_NAME] + [b""] * (refs - 1)
+
+
+@dataclasses.dataclass
+class CheckinBitmap:
+    """Bit haritasının yerel kopyası ve okunduğu round"""
+
+    bits: bytearray
+    total_tickets: int
+    round: int
+
+    def is_redeemed(self, ticket_index: int) -> bool:
+        self._check(ticket_index)
+        return bool(self.bits[ticket_index >> 3] >> (7 - (ticket_index & 7)) & 1)
+
+    def mark(self, ticket_index: int) -> None:
+        """Yerel kopyada işaretler (zincire yazmadan önce çift okutmayı engellemek için)."""
+        self._check(ticket_index)
+        self.bits[ticket_index >> 3] |= 1 << (7 - (ticket_index & 7))
+
+    @property
+    def redeemed_count(self) -> int:
+        return int.from_bytes(self.bits, "big").bit_count()
+
+    def _check(self, ticket_index: int) -> None:
+        if not 0 <= ticket_index < self.total_tickets:
+            raise IndexError(f"Geçersiz bilet numarası: {ticket_index}")
+
+
+def fetch_checkins(client: EventTicketingClient, total_tickets: int | None = None) -> CheckinBitmap:
+    """Bit haritasının tamamını tek algod kutu okumasıyla indirir."""
+    if total_tickets is None:
+        total_tickets = client.state.global_state.sale_params.total_tickets
+    response = client.algorand.client.algod.application_box_by_name(client.app_id, CHECKIN_BOX_NAME)
+    assert isinstance(response, dict)
+    return CheckinBitmap(
+        bits=bytearray(base64.b64decode(response["value"])),
+        total_tickets=total_tickets,
+        round=int(response.get("round", 0)),
+    )
+
+
+def redeem_tickets(
+    client: EventTicketingClient,
+    indices: Iterable[int],
+    *,
+    total_tickets: int | None = None,
+    batch_size: int = REDEEM_BATCH_SIZE,
+) -> list[int]:
+    """
+    Biletleri REDEEM_BATCH_SIZE'lık redeem_batch çağrılarıyla, 16 çağrılık atomik
+    gruplar halinde işaretler. Zaten kullanılmış biletleri döndürür.
+    Çağrılar client'ın varsayılan göndericisiyle (kontrat kurucusu) imzalanır.
+    """
+    if total_tickets is None:
+        total_tickets = client.state.global_state.sale_params.total_tickets
+    box_refs = checkin_box_references(total_tickets)
+    min_fee = client.algorand.get_suggested_params().min_fee
+
+    pending = list(indices)
+    batches = [pending[i : i + batch_size] for i in range(0, len(pending), batch_size)]
+    rejected: list[int] = []
+    for start in range(0, len(batches), MAX_GROUP_SIZE):
+        group = client.new_group()
+        for batch in batches[start : start + MAX_GROUP_SIZE]:
+            group.redeem_batch(
+                args=(batch,),
+                params=CommonAppCallParams(
+                    box_references=box_refs, extra_fee=AlgoAmount.from_micro_algo(_opup_fee(batch, min_fee))
+                ),
+            )
+        result = group.send()
+        for value in result.returns:
+            rejected.extend(int(i) for i in value.value)
+    return rejected
+
+
+def _opup_fee(batch: Sequence[int], min_fee: int) -> int:
+    # ensure_budget'ın en kötü durumda açacağı op-up inner çağrıları
+    return math.ceil(len(batch) * REDEEM_OPS_PER_TICKET / APP_CALL_BUDGET) * min_fee
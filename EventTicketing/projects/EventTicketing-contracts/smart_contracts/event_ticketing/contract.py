@@ -4,15 +4,77 @@ import algopy
 from algopy import (
     ARC4Contract,
     arc4,
+    Account,
+    BoxMap,
     Global,
     Txn,
     UInt64,
     String,
     Asset,
+    Box,
+    Bytes,
     gtxn,
     GlobalState,
+    OpUpFeeSource,
+    ensure_budget,
+    op,
+    subroutine,
 )
 
+# Bilet başına giriş biti: 50k koltuk ~6 KB. redeem/redeem_batch çağrıları kutu
+# boyutunun her 1 KB'ı için bir kutu referansı taşımalıdır (çağrı başına en fazla 8).
+CHECKIN_MAX_TICKETS = 8 * 1024 * 8
+# redeem_batch içinde tek bilet için üst sınır opcode maliyeti (op-up hesabı için)
+REDEEM_OPS_PER_TICKET = 40
+# Giriş bit haritasında kullanılmış biletin bit değeri
+CHECKED_IN = True
+
+
+class SaleInfo(arc4.Struct):
+    """Satış durumunun tek seferde okunabilen anlık görüntüsü"""
+
+    ticket_asa_id: arc4.UInt64
+    ticket_price: arc4.UInt64
+    total_tickets: arc4.UInt64
+    tickets_sold: arc4.UInt64
+    event_name: arc4.String
+
+
+class SaleParams(arc4.Struct, frozen=True):
+    """
+    Satış parametreleri tek global değerde (sabit genişlik, 4 x uint64 = 32 bayt).
+    Alım yolunda ayrı ayrı dört anahtar yerine tek app_global_get_ex yapılır.
+    """
+
+    ticket_price: arc4.UInt64
+    total_tickets: arc4.UInt64
+    ticket_asa_id: arc4.UInt64
+    max_per_address: arc4.UInt64
+
+
+class PurchaseRecord(arc4.Struct):
+    """Bir alıcının aldığı toplam bilet ve ilk/son alım round'u"""
+
+    count: arc4.UInt64
+    first_round: arc4.UInt64
+    last_round: arc4.UInt64
+
+
+class TicketSold(arc4.Struct):
+    """ARC-28 olayı: buy_ticket / buy_tickets başına bir log kaydı"""
+
+    buyer: arc4.Address
+    count: arc4.UInt64
+    sold_after: arc4.UInt64
+
+
+class TicketsMinted(arc4.Struct):
+    """ARC-28 olayı: mint_tickets sonunda bilet ASA'sı ve toplam arz"""
+
+    asa_id: arc4.UInt64
+    total: arc4.UInt64
+
+
 class EventTicketing(ARC4Contract):
     """
     Event Ticketing Akıllı Kontratı
@@ -20,45 +82,56 @@ class EventTicketing(ARC4Contract):
     """
 
     # Storage tanımları (proxy'ler)
-    ticket_asa_id: GlobalState[UInt64]
-    ticket_price: GlobalState[UInt64]
-    total_tickets: GlobalState[UInt64]
+    # Değişmeyen parametreler paketli tek değerde; sold sık yazıldığı için ayrı sayaç
+    sale_params: GlobalState[SaleParams]
     tickets_sold: GlobalState[UInt64]
     event_name: GlobalState[String]
+    purchases: BoxMap[Account, PurchaseRecord]
+    checkins: Box[Bytes]
 
     def __init__(self) -> None:
-        self.ticket_asa_id = GlobalState(UInt64, key=b"asa_id", description="Mint edilen bilet ASA ID")
-        self.ticket_price   = GlobalState(UInt64, key=b"price",  description="Bilet fiyatı (µAlgo)")
-        self.total_tickets  = GlobalState(UInt64, key=b"total",  description="Toplam bilet")
+        self.sale_params    = GlobalState(SaleParams, key=b"params", description="Fiyat, toplam, ASA, sınır")
         self.tickets_sold   = GlobalState(UInt64, key=b"sold",   description="Satılan bilet")
         self.event_name     = GlobalState(String, key=b"name",   description="Etkinlik adı")
+        # Alıcı başına kayıt: kutu adı = b"p" + 32 bayt adres
+        self.purchases      = BoxMap(Account, PurchaseRecord, key_prefix=b"p")
+        # Bilet i -> bayt i // 8, bit i % 8 (en anlamlı bitten başlayarak); 1 = kullanıldı
+        self.checkins       = Box(Bytes, key=b"checkin")
 
     # --- 1) Create / Init ---
     @arc4.abimethod(create="require")
     def create_application(
-        self: "EventTicketing",
+        self,
         event_name: String,
         ticket_price: UInt64,
         total_tickets: UInt64,
+        max_per_address: UInt64,
     ) -> None:
         self.event_name.value = event_name
-        self.ticket_price.value = ticket_price
-        self.total_tickets.value = total_tickets
+        self.sale_params.value = SaleParams(
+            ticket_price=arc4.UInt64(ticket_price),
+            total_tickets=arc4.UInt64(total_tickets),
+            ticket_asa_id=arc4.UInt64(0),
+            max_per_address=arc4.UInt64(max_per_address),
+        )
         self.tickets_sold.value = UInt64(0)
-        self.ticket_asa_id.value = UInt64(0)
 
     # --- 2) Mint tickets (ASA) ---
     @arc4.abimethod
-    def mint_tickets(self: "EventTicketing") -> Asset:
+    def mint_tickets(self) -> Asset:
         # Sadece kurucu
         assert Txn.sender == Global.creator_address, "Sadece kontrat kurucusu bilet basabilir"
+        params = self.sale_params.value
         # Daha önce basılmadı mı?
-        assert self.ticket_asa_id.value == UInt64(0), "Biletler zaten basılmış"
+        assert params.ticket_asa_id.native == UInt64(0), "Biletler zaten basılmış"
+        assert (
+            params.total_tickets.native <= UInt64(CHECKIN_MAX_TICKETS)
+        ), "Giriş bit haritası için bilet sayısı çok büyük"
 
         created_asset_id = algopy.itxn.AssetConfig(
             asset_name=self.event_name.value,
             unit_name="TICKET",
-            total=self.total_tickets.value,
+            total=params.total_tickets.native,
             decimals=0,
             default_frozen=False,
             manager=Global.current_application_address,
@@ -67,23 +140,138 @@ class EventTicketing(ARC4Contract):
             clawback=Global.current_application_address,
         ).submit().created_asset.id
 
-        self.ticket_asa_id.value = created_asset_id
+        self.sale_params.value = SaleParams(
+            ticket_price=params.ticket_price,
+            total_tickets=params.total_tickets,
+            ticket_asa_id=arc4.UInt64(created_asset_id),
+            max_per_address=params.max_per_address,
+        )
+        # Sıfırlarla dolu giriş bit haritası (kimse henüz girmedi)
+        assert self.checkins.create(
+            size=(params.total_tickets.native + UInt64(7)) // UInt64(8)
+        ), "Giriş bit haritası zaten var"
+        arc4.emit(TicketsMinted(asa_id=arc4.UInt64(created_asset_id), total=params.total_tickets))
         return Asset(created_asset_id)
 
     # --- 3) Buy ticket (atomic with payment) ---
     @arc4.abimethod
-    def buy_ticket(self: "EventTicketing", payment: gtxn.PaymentTransaction) -> None:
-        assert self.tickets_sold.value < self.total_tickets.value, "Biletler tükendi"
-        assert self.ticket_asa_id.value != UInt64(0), "Bilet satışı henüz başlamadı"
+    def buy_ticket(self, payment: gtxn.PaymentTransaction) -> None:
+        # İki global okuma: paketli parametreler + sayaç
+        params = self.sale_params.value
+        sold = self.tickets_sold.value
+        assert sold < params.total_tickets.native, "Biletler tükendi"
+        asa_id = params.ticket_asa_id.native
+        assert asa_id != UInt64(0), "Bilet satışı henüz başlamadı"
 
-        assert payment.amount == self.ticket_price.value, "Ödeme miktarı bilet fiyatıyla eşleşmiyor"
+        assert payment.amount == params.ticket_price.native, "Ödeme miktarı bilet fiyatıyla eşleşmiyor"
         assert payment.receiver == Global.current_application_address, "Ödeme bu kontrata yapılmalı"
 
         # NFT transferi (inner tx)
         algopy.itxn.AssetTransfer(
-            xfer_asset=self.ticket_asa_id.value,
+            xfer_asset=asa_id,
             asset_receiver=Txn.sender,
             asset_amount=1,
         ).submit()
 
-        self.tickets_sold.value = self.tickets_sold.value + UInt64(1)
+        self.tickets_sold.value = sold + UInt64(1)
+        self._record_purchase(Txn.sender, UInt64(1), params.max_per_address.native)
+        arc4.emit(TicketSold(buyer=arc4.Address(Txn.sender), count=arc4.UInt64(1), sold_after=arc4.UInt64(sold + 1)))
+
+    # --- 4) Buy many tickets (tek ödeme + tek inner tx) ---
+    @arc4.abimethod
+    def buy_tickets(self, payment: gtxn.PaymentTransaction, count: UInt64) -> None:
+        assert count > UInt64(0), "Bilet adedi sıfır olamaz"
+        params = self.sale_params.value
+        asa_id = params.ticket_asa_id.native
+        assert asa_id != UInt64(0), "Bilet satışı henüz başlamadı"
+
+        # Kalan arz tek seferde kontrol edilir
+        sold = self.tickets_sold.value
+        assert sold + count <= params.total_tickets.native, "Yeterli bilet kalmadı"
+
+        assert (
+            payment.amount == count * params.ticket_price.native
+        ), "Ödeme miktarı bilet adedi x fiyat ile eşleşmiyor"
+        assert payment.receiver == Global.current_application_address, "Ödeme bu kontrata yapılmalı"
+
+        # Tüm biletler tek bir inner AssetTransfer ile gönderilir
+        algopy.itxn.AssetTransfer(
+            xfer_asset=asa_id,
+            asset_receiver=Txn.sender,
+            asset_amount=count,
+        ).submit()
+
+        self.tickets_sold.value = sold + count
+        self._record_purchase(Txn.sender, count, params.max_per_address.native)
+        arc4.emit(
+            TicketSold(buyer=arc4.Address(Txn.sender), count=arc4.UInt64(count), sold_after=arc4.UInt64(sold + count))
+        )
+
+    # --- 5) Satış bilgisi (salt okunur, tek çağrıda tüm durum) ---
+    @arc4.abimethod(readonly=True)
+    def get_sale_info(self) -> SaleInfo:
+        params = self.sale_params.value
+        return SaleInfo(
+            ticket_asa_id=params.ticket_asa_id,
+            ticket_price=params.ticket_price,
+            total_tickets=params.total_tickets,
+            tickets_sold=arc4.UInt64(self.tickets_sold.value),
+            event_name=arc4.String(self.event_name.value),
+        )
+
+    # --- 6) Alıcı kaydı (salt okunur; kaydı olmayan adres için sıfır kayıt) ---
+    @arc4.abimethod(readonly=True)
+    def get_purchase(self, buyer: arc4.Address) -> PurchaseRecord:
+        return self.purchases.get(
+            buyer.native,
+            default=PurchaseRecord(arc4.UInt64(0), arc4.UInt64(0), arc4.UInt64(0)),
+        )
+
+    @subroutine
+    def _record_purchase(self, buyer: Account, count: UInt64, limit: UInt64) -> None:
+        # Tek kutu okuması: kayıt yoksa ilk alım bu round'dur
+        record = self.purchases.get(
+            buyer,
+            default=PurchaseRecord(arc4.UInt64(0), arc4.UInt64(Global.round), arc4.UInt64(0)),
+        ).copy()
+        new_count = record.count.native + count
+        # Alıcı kaydındaki sayaç, adres başına sınırın da sayacıdır (0 = sınırsız)
+        assert limit == UInt64(0) or new_count <= limit, "Adres başına bilet sınırı aşıldı"
+        self.purchases[buyer] = PurchaseRecord(
+            count=arc4.UInt64(new_count),
+            first_round=record.first_round,
+            last_round=arc4.UInt64(Global.round),
+        )
+
+    # --- 7) Kapıda bilet okutma (bit haritası) ---
+    @arc4.abimethod
+    def redeem(self, ticket_index: UInt64) -> None:
+        assert Txn.sender == Global.creator_address, "Sadece kontrat kurucusu bilet okutabilir"
+        total = self.sale_params.value.total_tickets.native
+        assert self._redeem(ticket_index, total), "Bilet zaten kullanılmış"
+
+    @arc4.abimethod
+    def redeem_batch(
+        self, indices: arc4.DynamicArray[arc4.UInt32]
+    ) -> arc4.DynamicArray[arc4.UInt32]:
+        # Geçerli biletleri işaretler; zaten kullanılmış olanları döndürür (grup düşmez)
+        assert Txn.sender == Global.creator_address, "Sadece kontrat kurucusu bilet okutabilir"
+        # Uzun partilerde eksik bütçe grup ücret kredisinden op-up ile tamamlanır
+        ensure_budget(indices.length * UInt64(REDEEM_OPS_PER_TICKET), OpUpFeeSource.GroupCredit)
+        total = self.sale_params.value.total_tickets.native
+        rejected = arc4.DynamicArray[arc4.UInt32]()
+        for index in indices:
+            if not self._redeem(index.native, total):
+                rejected.append(index)
+        return rejected
+
+    @subroutine
+    def _redeem(self, ticket_index: UInt64, total: UInt64) -> bool:
+        assert ticket_index < total, "Geçersiz bilet numarası"
+        offset = ticket_index // UInt64(8)
+        bit = ticket_index % UInt64(8)
+        chunk = self.checkins.extract(offset, UInt64(1))
+        if op.getbit(chunk, bit) == UInt64(1):
+            return False
+        self.checkins.replace(offset, op.setbit_bytes(chunk, bit, CHECKED_IN))
+        return True
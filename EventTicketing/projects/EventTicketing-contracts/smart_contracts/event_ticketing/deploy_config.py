@@ -2,99 +2,140 @@
 # Bu dosya, __main__.py tarafından çağrılır.
 
 import logging
-from algokit_utils import AlgorandClient, SendParams, CommonAppCallCreateParams
+
+from algokit_utils import AlgoAmount, AlgorandClient, CommonAppCallParams, LogicError, PaymentParams
+from algosdk.account import address_from_private_key
 from algosdk.atomic_transaction_composer import AccountTransactionSigner
+
 from smart_contracts.artifacts.event_ticketing.event_ticketing_client import (
     EventTicketingClient,
+    EventTicketingFactory,
 )
+from smart_contracts.event_ticketing.checkin import checkin_box_mbr, checkin_box_references
+from smart_contracts.event_ticketing.ledger import PURCHASE_BOX_MBR
 
 # --- Kontrat Ayarları ---
 EVENT_NAME = "Harika Algorand Konseri"
 TICKET_PRICE = 1_000_000      # 1 ALGO (microAlgo)
 TOTAL_TICKETS = 100
+# Adres başına en fazla bilet (0 = sınırsız); bot taramalarını zincirde keser
+MAX_PER_ADDRESS = 4
 # 0.1 (Min Bakiye) + 0.1 (ASA Oluşturma Ücreti)
 APP_FUNDING_ALGOS = 0.2
+# mint_tickets içindeki inner işlem sayısı (AssetConfig); ücretleri dış çağrı öder
+MINT_INNER_TXNS = 1
 
 logger = logging.getLogger(__name__)
 
+
+def app_funding(total_tickets: int, ticket_price: int) -> AlgoAmount:
+    """
+    Temel fonlama + giriş bit haritası MBR'si. Alıcı kayıt kutusunun MBR'sini
+    kutuyu açan alımın ödemesi karşılar; kontratta çekim yolu olmadığından
+    fazladan rezerv uygulamada kalıcı olarak kilitlenir. Yalnızca bilet fiyatı
+    kutu MBR'sinden düşükse, her bilet için aradaki fark eklenir.
+    """
+    shortfall = max(0, PURCHASE_BOX_MBR - ticket_price)
+    return AlgoAmount.from_micro_algo(
+        AlgoAmount.from_algo(APP_FUNDING_ALGOS).micro_algo
+        + checkin_box_mbr(total_tickets)
+        + total_tickets * shortfall
+    )
+
+
+def mint_call_params(algo: AlgorandClient, total_tickets: int) -> CommonAppCallParams:
+    """
+    mint_tickets çağrısının ortak parametreleri: inner AssetConfig ücreti
+    suggested params'taki min_fee'den havuzlanır, giriş bit haritası kutusu
+    referans verilir. Tekli deploy ve filo aynı ücret hesabını kullanır.
+    """
+    min_fee = algo.get_suggested_params().min_fee
+    return CommonAppCallParams(
+        extra_fee=AlgoAmount.from_micro_algo(MINT_INNER_TXNS * min_fee),
+        # mint_tickets giriş bit haritası kutusunu oluşturur
+        box_references=checkin_box_references(total_tickets),
+    )
+
+
+def fund_and_mint(
+    app_client: EventTicketingClient,
+    creator: AccountTransactionSigner,
+    total_tickets: int | None = None,
+    ticket_price: int | None = None,
+) -> int:
+    """
+    Fonlama ödemesini ve mint_tickets çağrısını tek atomik grupta gönderir
+    (tek onay beklemesi). Inner AssetConfig ücreti, app call ücretine
+    havuzlanarak (fee pooling) ödenir. Oluşturulan ASA ID'sini döndürür.
+    total_tickets ya da ticket_price verilmezse global state'ten okunur.
+    """
+    algo = app_client.algorand
+    sender = address_from_private_key(creator.private_key)
+    if total_tickets is None or ticket_price is None:
+        sale_params = app_client.state.global_state.sale_params
+        total_tickets = sale_params.total_tickets if total_tickets is None else total_tickets
+        ticket_price = sale_params.ticket_price if ticket_price is None else ticket_price
+
+    funding = algo.create_transaction.payment(
+        PaymentParams(
+            sender=sender,
+            receiver=app_client.app_address,
+            amount=app_funding(total_tickets, ticket_price),
+        )
+    )
+    result = (
+        app_client.new_group()
+        .add_transaction(funding, creator)
+        .mint_tickets(params=mint_call_params(algo, total_tickets))
+        .send()
+    )
+    return int(result.returns[-1].value)
+
+
 # deploy fonksiyonu __main__.py tarafından bu imzayla çağrılır:
 def deploy(
-    app_client: EventTicketingClient, # __main__ tarafından oluşturulur
-    app_id: int,                      # __main__ tarafından verilir (yeni için 0)
-    creator: AccountTransactionSigner # __main__ tarafından verilir (artık doğru tipte)
+    app_factory: EventTicketingFactory,  # __main__ tarafından oluşturulur
+    app_id: int,                         # __main__ tarafından verilir (yeni için 0)
+    creator: AccountTransactionSigner    # __main__ tarafından verilir (artık doğru tipte)
 ) -> None:
     """
-    Akıllı kontratı dağıtır, fonlar ve biletleri basar.
+    Akıllı kontratı dağıtır, ardından fonlama + mint işlemlerini tek grupta yapar.
     """
 
-    # algo client'ı app_client'tan alabiliriz
-    algo = app_client.algorand
-
     # --- 1. Adım: Kontratı Oluşturma (Create) ---
-    # __main__.py zaten 'build' adımını çalıştırdı.
-    # __main__.py'nin 'deploy_contract' fonksiyonu bizim için 'create' işlemini
-    # (veya update/delete) zaten yapmalı.
-    
-    # ChatGPT'nin __main__.py'si 'app_client'ı app_id=0 ile oluşturur.
-    # Bizim create_application'ı burada çağırmamız gerekiyor.
-    
+    total_tickets: int | None = None
+    ticket_price: int | None = None
     if app_id == 0:
         logger.info("Kontrat oluşturuluyor (create_application çağrılıyor)...")
-        # app_client zaten 'creator'ı signer olarak biliyor
-        create_result = app_client.create_application(
-            args=(EVENT_NAME, TICKET_PRICE, TOTAL_TICKETS),
-            # 'params'a gerek yok, __main__ zaten 'signer=creator' ile kurdu
+        app_client, create_result = app_factory.send.create.create_application(
+            args=(EVENT_NAME, TICKET_PRICE, TOTAL_TICKETS, MAX_PER_ADDRESS),
         )
-        app_id = create_result.app_id
-        app_addr = create_result.app_address
-        logger.info(f"Kontrat başarıyla oluşturuldu. App ID: {app_id}, App Address: {app_addr}")
-    else:
-        app_addr = app_client.app_address
-        logger.info(f"Mevcut kontrat {app_id} güncelleniyor (eğer gerekiyorsa)...")
-        # (Güncelleme mantığı buraya eklenebilir, şimdilik atlıyoruz)
-        logger.info("Kontrat güncellendi.")
-
-
-    # --- 2. Adım: Kontratı Fonlama (Funding) ---
-    logger.info(f"Kontrat {app_id} fonlanıyor ({APP_FUNDING_ALGOS} ALGO gönderiliyor)...")
-    
-    # 'algo' istemcisi __main__.py'den gelir ve varsayılan imzalayıcıyı
-    # (creator) bilmesi gerekir.
-    try:
-        algo.send.payment(
-            app_addr,
-            int(APP_FUNDING_ALGOS * 1_000_000)
+        total_tickets, ticket_price = TOTAL_TICKETS, TICKET_PRICE
+        logger.info(
+            f"Kontrat başarıyla oluşturuldu. App ID: {create_result.app_id}, App Address: {create_result.app_address}"
         )
-        logger.info("Fonlama başarılı.")
-    except Exception as e:
-        logger.error(f"Fonlama BAŞARISIZ: {e}")
-        # 'AttributeError: str object has no attribute signer' alırsak,
-        # __main__.py'nin 'algo' nesnesini doğru ayarlamadığı anlamına gelir.
-        raise
+    else:
+        app_client = app_factory.get_app_client_by_id(app_id)
+        logger.info(f"Mevcut kontrat {app_id} kullanılıyor.")
 
-    # --- 3. Adım: Biletleri Basma (Minting) ---
-    logger.info(f"Biletler basılıyor ('mint_tickets' çağrılıyor)...")
+    # --- 2. Adım: Fonlama + Biletleri Basma (tek atomik grup) ---
+    logger.info(f"Kontrat {app_client.app_id} fonlanıyor ve biletler basılıyor (tek grup)...")
     try:
-        # 'app_client' zaten 'creator'ı signer olarak biliyor.
-        mint_result = app_client.mint_tickets(
-            send_params=SendParams(extra_fee=2_000) # Sadece ekstra ücreti ver
-        )
-        logger.info("Bilet basma (Mint) OK.")
-        logger.info(f"Oluşturulan ASA ID: {mint_result.return_value}")
+        asa_id = fund_and_mint(app_client, creator, total_tickets, ticket_price)
+        logger.info("Fonlama + bilet basma (Mint) OK.")
+        logger.info(f"Oluşturulan ASA ID: {asa_id}")
     except LogicError as e:
-        logger.error(f"Bilet basma (Mint) BAŞARISIZ: {str(e)}")
+        logger.error(f"Bilet basma (Mint) BAŞARISIZ: {e!s}")
         return
     except Exception as e:
-        logger.error(f"Bilet basma sırasında beklenmeyen hata: {e}")
+        logger.error(f"Fonlama/mint sırasında beklenmeyen hata: {e}")
         raise
 
-    # --- 4. Adım: Global State'i Doğrula ---
+    # --- 3. Adım: Global State'i Doğrula ---
     logger.info("Global State okunuyor...")
-    gs = app_client.get_global_state()
+    gs = app_client.state.global_state.get_all()
     logger.info("Global State:")
     for k, v in gs.items():
-        # Değerleri daha okunaklı hale getir
-        key_str = k.decode('utf-8') if isinstance(k, bytes) else k
-        logger.info(f"  {key_str}: {v}")
+        logger.info(f"  {k}: {v}")
 
     logger.info("Deploy betiği başarıyla tamamlandı.")
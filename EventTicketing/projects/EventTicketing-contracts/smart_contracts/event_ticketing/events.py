@@ -0,0 +1,64 @@
+# smart_contracts/event_ticketing/events.py
+# Kontratın ARC-28 olayları (ARC-56 spesifikasyonundaki "events"):
+#   TicketSold(buyer, count, sold_after)  - buy_ticket / buy_tickets
+#   TicketsMinted(asa_id, total)          - mint_tickets
+# Her log kaydı 4 baytlık olay seçicisi + ARC-4 kodlu argümanlardır; bir satış
+# inner işlem ağacını gezmeden tek log kaydından çözülür.
+#
+# Kullanım:
+#   result = client.send.buy_ticket(args=(payment,))
+#   for event in decode_logs(result.confirmation["logs"]):
+#       ...
+
+from __future__ import annotations
+
+import base64
+import dataclasses
+from collections.abc import Iterable, Iterator
+
+from algosdk import abi, encoding
+
+
+@dataclasses.dataclass(frozen=True)
+class TicketSold:
+    buyer: str
+    count: int
+    sold_after: int
+
+
+@dataclasses.dataclass(frozen=True)
+class TicketsMinted:
+    asa_id: int
+    total: int
+
+
+Event = TicketSold | TicketsMinted
+
+
+def _selector(signature: str) -> bytes:
+    """ARC-28: olay imzasının sha512/256 özetinin ilk 4 baytı."""
+    return encoding.checksum(signature.encode())[:4]
+
+
+TICKET_SOLD_SELECTOR = _selector("TicketSold(address,uint64,uint64)")
+TICKETS_MINTED_SELECTOR = _selector("TicketsMinted(uint64,uint64)")
+_TICKET_SOLD_TYPE = abi.ABIType.from_string("(address,uint64,uint64)")
+_TICKETS_MINTED_TYPE = abi.ABIType.from_string("(uint64,uint64)")
+
+
+def decode_event(log: bytes) -> Event | None:
+    """Tek log kaydını çözer; bu kontratın olayı değilse None döndürür."""
+    prefix, payload = log[:4], log[4:]
+    if prefix == TICKET_SOLD_SELECTOR:
+        return TicketSold(*_TICKET_SOLD_TYPE.decode(payload))
+    if prefix == TICKETS_MINTED_SELECTOR:
+        return TicketsMinted(*_TICKETS_MINTED_TYPE.decode(payload))
+    return None
+
+
+def decode_logs(logs: Iterable[bytes | str]) -> Iterator[Event]:
+    """Onay yanıtındaki (base64) ya da bloktaki (ham bayt) log listesinden olayları üretir."""
+    for log in logs:
+        event = decode_event(base64.b64decode(log) if isinstance(log, str) else log)
+        if event is not None:
+            yield event
@@ -0,0 +1,362 @@
+# smart_contracts/event_ticketing/fleet.py
+# Manifest tabanlı filo dağıtımı: CSV/JSON'daki yüzlerce etkinlik için
+#   1) create_application çağrılarını 16'lık gruplar halinde eşzamanlı gönderir,
+#   2) app_funding() ödemelerini (temel + giriş bit haritası MBR'si) 16'lık atomik gruplarla yapar,
+#   3) mint_tickets çağrılarını sınırlı sayıda iş parçacığıyla paralel çalıştırır.
+# Her adımdan sonra checkpoint dosyası güncellenir; yarıda kalan bir çalıştırma
+# tekrar başlatıldığında zaten oluşturulmuş/fonlanmış/basılmış etkinlikler atlanır.
+# Her grup gönderilmeden önce geçerlilik penceresi checkpoint'e yazılır; gönderim
+# ile checkpoint güncellemesi arasında çöken bir çalıştırmanın sonucu, devam
+# ederken fleet:/fleet-fund: notlarıyla indexer'dan ve uygulama durumundan okunur.
+#
+# Kullanım:
+#   poetry run python -m smart_contracts.event_ticketing.fleet events.csv --workers 8
+#
+# Manifest alanları: name, ticket_price, total_tickets (isteğe bağlı: key, max_per_address)
+
+from __future__ import annotations
+
+import argparse
+import base64
+import csv
+import dataclasses
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, TypeVar
+
+from algokit_utils import (
+    AlgoAmount,
+    AlgorandClient,
+    CommonAppCallCreateParams,
+    PaymentParams,
+    SigningAccount,
+    TransactionComposer,
+)
+from algosdk.logic import get_application_address
+
+from smart_contracts.artifacts.event_ticketing.event_ticketing_client import (
+    EventTicketingClient,
+    EventTicketingFactory,
+)
+from smart_contracts.event_ticketing.deploy_config import app_funding, mint_call_params
+
+logger = logging.getLogger(__name__)
+
+MAX_GROUP_SIZE = 16
+DEFAULT_CHECKPOINT = "fleet_checkpoint.json"
+# Adım -> (not öneki, indexer işlem türü); uzlaştırma notla arama yapar
+NOTE_PREFIXES = {"create": ("fleet:", "appl"), "fund": ("fleet-fund:", "pay")}
+
+T = TypeVar("T")
+
+
+# --------------------------------------------------------------------
+# Manifest
+# --------------------------------------------------------------------
+@dataclasses.dataclass(frozen=True)
+class EventSpec:
+    key: str
+    name: str
+    ticket_price: int
+    total_tickets: int
+    max_per_address: int = 0
+
+
+def _spec_from_row(row: dict[str, Any]) -> EventSpec:
+    name = str(row["name"]).strip()
+    return EventSpec(
+        key=str(row.get("key") or name).strip(),
+        name=name,
+        ticket_price=int(row["ticket_price"]),
+        total_tickets=int(row["total_tickets"]),
+        max_per_address=int(row.get("max_per_address") or 0),
+    )
+
+
+def load_manifest(path: Path) -> list[EventSpec]:
+    """CSV (başlık satırlı) veya JSON (nesne listesi) manifesti okur."""
+    if path.suffix.lower() == ".json":
+        rows = json.loads(path.read_text(encoding="utf-8"))
+    else:
+        with path.open(newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+    specs = [_spec_from_row(r) for r in rows]
+    keys = [s.key for s in specs]
+    duplicates = {k for k in keys if keys.count(k) > 1}
+    if duplicates:
+        raise ValueError(f"Manifestte tekrarlanan etkinlik anahtarları: {sorted(duplicates)}")
+    return specs
+
+
+# --------------------------------------------------------------------
+# Checkpoint
+# --------------------------------------------------------------------
+class Checkpoint:
+    """
+    Etkinlik anahtarı -> {app_id, funded, asa_id, <adım>_window}; her güncellemede
+    atomik olarak yazılır. <adım>_window, o adımın son gönderilen grubunun
+    [first_valid, last_valid] round aralığıdır.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self.events: dict[str, dict[str, Any]] = {}
+        if path.exists():
+            self.events = json.loads(path.read_text(encoding="utf-8")).get("events", {})
+
+    def get(self, key: str, field: str) -> Any:  # noqa: ANN401
+        return self.events.get(key, {}).get(field)
+
+    def update(self, updates: dict[str, dict[str, Any]]) -> None:
+        with self._lock:
+            for key, fields in updates.items():
+                self.events.setdefault(key, {}).update(fields)
+            tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+            tmp.write_text(json.dumps({"events": self.events}, indent=2), encoding="utf-8")
+            os.replace(tmp, self.path)
+
+
+# --------------------------------------------------------------------
+# Filo dağıtımı
+# --------------------------------------------------------------------
+@dataclasses.dataclass
+class FleetReport:
+    events: int = 0
+    created: int = 0
+    funded: int = 0
+    minted: int = 0
+    failed: int = 0
+    # Önceki çalıştırmadaki gönderimin sonucu henüz bilinmediği için atlananlar
+    unsettled: int = 0
+    seconds: float = 0.0
+
+    @property
+    def events_per_minute(self) -> float:
+        return self.minted / self.seconds * 60 if self.seconds else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.events} etkinlik: {self.created} oluşturuldu, {self.funded} fonlandı, "
+            f"{self.minted} basıldı, {self.failed} hata, {self.unsettled} bekliyor | {self.seconds:.1f} sn, "
+            f"{self.events_per_minute:.1f} etkinlik/dk"
+        )
+
+
+class FleetDeployer:
+    def __init__(
+        self,
+        algorand: AlgorandClient,
+        deployer: SigningAccount,
+        checkpoint: Checkpoint,
+        *,
+        workers: int = 8,
+        funding: AlgoAmount | None = None,
+    ) -> None:
+        self.algorand = algorand
+        self.deployer = deployer
+        self.checkpoint = checkpoint
+        self.workers = workers
+        # None: her etkinlik kendi bilet sayısına göre fonlanır
+        self.funding = funding
+        self.factory = EventTicketingFactory(
+            algorand, default_sender=deployer.address, default_signer=deployer.signer
+        )
+        self.report = FleetReport()
+        # Sayaçlar iş parçacıklarından güncellenir
+        self._report_lock = threading.Lock()
+
+    def _count(self, field: str, n: int = 1) -> None:
+        with self._report_lock:
+            setattr(self.report, field, getattr(self.report, field) + n)
+
+    def _parallel(self, jobs: Sequence[T], fn: Callable[[T], None], phase: str) -> None:
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = {pool.submit(fn, job): job for job in jobs}
+            for fut in as_completed(futures):
+                try:
+                    fut.result()
+                except Exception as e:
+                    logger.error(f"{phase} BAŞARISIZ: {e}")
+                    self._count("failed")
+
+    # --- 0) Çökme sonrası uzlaştırma ---
+    def _mark_sending(self, composer: TransactionComposer, specs: Sequence[EventSpec], phase: str) -> None:
+        txns = [t.txn for t in composer.build().transactions]
+        window = [min(t.first_valid_round for t in txns), max(t.last_valid_round for t in txns)]
+        self.checkpoint.update({spec.key: {f"{phase}_window": window} for spec in specs})
+
+    def _landed_by_note(
+        self, phase: str, pending: dict[str, list[int]]
+    ) -> tuple[dict[str, dict[str, Any]], int]:
+        prefix, txn_type = NOTE_PREFIXES[phase]
+        try:
+            indexer = self.algorand.client.indexer
+        except ValueError:
+            logger.warning(f"Indexer yapılandırılmamış; {phase} sonuçları doğrulanamıyor")
+            return {}, 0
+        found: dict[str, dict[str, Any]] = {}
+        next_page = None
+        while True:
+            page = indexer.search_transactions(
+                address=self.deployer.address,
+                address_role="sender",
+                note_prefix=prefix.encode(),
+                txn_type=txn_type,
+                min_round=min(first for first, _ in pending.values()),
+                next_page=next_page,
+            )
+            for txn in page["transactions"]:
+                key = base64.b64decode(txn.get("note", "")).decode(errors="replace")[len(prefix) :]
+                window = pending.get(key)
+                if window is None or not window[0] <= txn["confirmed-round"] <= window[1]:
+                    continue
+                if phase == "create":
+                    found[key] = {"app_id": int(txn["created-application-index"])}
+                else:
+                    found[key] = {"funded": True}
+            next_page = page.get("next-token")
+            if not page["transactions"] or not next_page:
+                return found, int(page["current-round"])
+
+    def _landed_mints(self, pending: dict[str, list[int]]) -> tuple[dict[str, dict[str, Any]], int]:
+        # Durum okumaları bu round'dan sonrasını yansıtır
+        seen_round = int(self.algorand.client.algod.status()["last-round"])
+        found: dict[str, dict[str, Any]] = {}
+        for key in pending:
+            client = self.factory.get_app_client_by_id(int(self.checkpoint.get(key, "app_id")))
+            asa_id = client.state.global_state.sale_params.ticket_asa_id
+            if asa_id:
+                found[key] = {"asa_id": asa_id}
+        return found, seen_round
+
+    def reconcile(self, specs: Sequence[EventSpec]) -> set[str]:
+        """
+        Gönderilmiş ama sonucu checkpoint'e yazılamamış grupları zincirden tamamlar.
+        Sonucu henüz bilinemeyen (geçerlilik penceresi açık ve zincirde yok)
+        etkinliklerin anahtarlarını döndürür; bunlar bu çalıştırmada atlanmalıdır.
+        """
+        unsettled: set[str] = set()
+        for phase, done in (("create", "app_id"), ("fund", "funded"), ("mint", "asa_id")):
+            pending = {
+                s.key: self.checkpoint.get(s.key, f"{phase}_window")
+                for s in specs
+                if self.checkpoint.get(s.key, f"{phase}_window") and not self.checkpoint.get(s.key, done)
+            }
+            if not pending:
+                continue
+            found, seen_round = self._landed_mints(pending) if phase == "mint" else self._landed_by_note(phase, pending)
+            if found:
+                logger.info(f"{phase}: {len(found)} etkinliğin sonucu zincirden kurtarıldı")
+                self.checkpoint.update(found)
+            # Pencere kapandıysa işlem artık onaylanamaz; adım normal şekilde yeniden denenir
+            unsettled |= {key for key, (_, last) in pending.items() if key not in found and seen_round <= last}
+        return unsettled
+
+    # --- 1) Create ---
+    def _create_group(self, specs: Sequence[EventSpec]) -> None:
+        group = self.algorand.new_group()
+        for spec in specs:
+            group.add_app_create_method_call(
+                self.factory.params.create.create_application(
+                    args=(spec.name, spec.ticket_price, spec.total_tickets, spec.max_per_address),
+                    params=CommonAppCallCreateParams(note=f"{NOTE_PREFIXES['create'][0]}{spec.key}".encode()),
+                )
+            )
+        self._mark_sending(group, specs, "create")
+        result = group.send()
+        app_ids = {
+            spec.key: {"app_id": int(c["application-index"])}
+            for spec, c in zip(specs, result.confirmations, strict=True)
+        }
+        self.checkpoint.update(app_ids)
+        self._count("created", len(specs))
+        logger.info(f"{len(specs)} uygulama oluşturuldu")
+
+    # --- 2) Fund ---
+    def _fund_group(self, specs: Sequence[EventSpec]) -> None:
+        group = self.algorand.new_group()
+        for spec in specs:
+            app_id = int(self.checkpoint.get(spec.key, "app_id"))
+            group.add_payment(
+                PaymentParams(
+                    sender=self.deployer.address,
+                    receiver=get_application_address(app_id),
+                    amount=self.funding or app_funding(spec.total_tickets, spec.ticket_price),
+                    note=f"{NOTE_PREFIXES['fund'][0]}{spec.key}".encode(),
+                )
+            )
+        self._mark_sending(group, specs, "fund")
+        group.send()
+        self.checkpoint.update({spec.key: {"funded": True} for spec in specs})
+        self._count("funded", len(specs))
+
+    # --- 3) Mint ---
+    def _mint(self, spec: EventSpec) -> None:
+        client: EventTicketingClient = self.factory.get_app_client_by_id(int(self.checkpoint.get(spec.key, "app_id")))
+        group = client.new_group().mint_tickets(params=mint_call_params(self.algorand, spec.total_tickets))
+        self._mark_sending(group.composer(), [spec], "mint")
+        result = group.send()
+        self.checkpoint.update({spec.key: {"asa_id": int(result.returns[0].value or 0)}})
+        self._count("minted")
+
+    def deploy(self, specs: Sequence[EventSpec]) -> FleetReport:
+        self.report = FleetReport(events=len(specs))
+        started = time.perf_counter()
+
+        unsettled = self.reconcile(specs)
+        if unsettled:
+            logger.warning(f"Önceki gönderimi henüz kesinleşmeyen etkinlikler atlanıyor: {sorted(unsettled)}")
+            self.report.unsettled = len(unsettled)
+            specs = [s for s in specs if s.key not in unsettled]
+
+        to_create = [s for s in specs if not self.checkpoint.get(s.key, "app_id")]
+        logger.info(f"Oluşturulacak: {len(to_create)} / {len(specs)}")
+        self._parallel(list(_chunked(to_create, MAX_GROUP_SIZE)), self._create_group, "create")
+
+        to_fund = [
+            s for s in specs if self.checkpoint.get(s.key, "app_id") and not self.checkpoint.get(s.key, "funded")
+        ]
+        logger.info(f"Fonlanacak: {len(to_fund)}")
+        self._parallel(list(_chunked(to_fund, MAX_GROUP_SIZE)), self._fund_group, "fund")
+
+        to_mint = [
+            s for s in specs if self.checkpoint.get(s.key, "funded") and not self.checkpoint.get(s.key, "asa_id")
+        ]
+        logger.info(f"Basılacak: {len(to_mint)}")
+        self._parallel(to_mint, self._mint, "mint")
+
+        self.report.seconds = time.perf_counter() - started
+        logger.info(f"Filo dağıtımı tamamlandı: {self.report}")
+        return self.report
+
+
+def _chunked(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Manifestten toplu EventTicketing dağıtımı")
+    parser.add_argument("manifest", type=Path, help="CSV veya JSON etkinlik manifesti")
+    parser.add_argument("--checkpoint", type=Path, default=Path(DEFAULT_CHECKPOINT))
+    parser.add_argument("--workers", type=int, default=8, help="eşzamanlı grup/mint sayısı")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)-8s: %(message)s")
+    algorand = AlgorandClient.from_environment()
+    deployer = algorand.account.from_environment("DEPLOYER")
+
+    fleet = FleetDeployer(algorand, deployer, Checkpoint(args.checkpoint), workers=args.workers)
+    report = fleet.deploy(load_manifest(args.manifest))
+    print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+# smart_contracts/event_ticketing/gate.py
+# Kapı okutma servisi: "bu adres X biletini tutuyor mu?" sorusunu algod'a
+# gitmeden, bellekteki bir sahip dizininden (holder index) yanıtlar.
+#
+#   1) Açılışta bilet ASA'sının sahipleri indexer'dan bir kez okunur
+#      (ya da kayıtlı anlık görüntü yüklenip eksik bloklar uygulanır),
+#   2) ardından yeni bloklar izlenir; her bloktaki (inner işlemler dahil)
+#      AssetTransfer'lar bakiyelere artımlı olarak uygulanır,
+#   3) dizin belirli aralıklarla diske yazılır; yeniden başlatmada tam tarama gerekmez.
+#
+# Dizin 32 baytlık açık anahtarları tutar; sorgu bir sözlük aramasıdır.
+#
+# Kullanım:
+#   service = GateScanService(app_client, snapshot_path=Path("gate.snapshot"))
+#   service.start()
+#   service.holds("ABC...XYZ")   # True / False
+#   service.stop()
+
+from __future__ import annotations
+
+import logging
+import os
+import struct
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from algosdk import encoding
+
+from smart_contracts.artifacts.event_ticketing.event_ticketing_client import EventTicketingClient
+from smart_contracts.event_ticketing.stream import read_block
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC = b"GATE1\n"
+# asset_id, round, kayıt sayısı
+SNAPSHOT_HEADER = struct.Struct(">QQQ")
+# açık anahtar, bakiye
+SNAPSHOT_ENTRY = struct.Struct(">32sQ")
+# Arşiv olmayan düğümler yaklaşık bu kadar geçmiş blok tutar; daha büyük
+# boşluklarda anlık görüntü yerine tam tarama yapılır
+MAX_CATCHUP_ROUNDS = 1_000
+INDEXER_PAGE_SIZE = 1_000
+DEFAULT_SNAPSHOT_EVERY = 20
+
+
+class HolderIndex:
+    """Bir ASA için açık anahtar -> bakiye (yalnızca > 0) ve geçerli olduğu round"""
+
+    def __init__(
+        self,
+        asset_id: int,
+        round: int = 0,  # noqa: A002 - algod terimi
+        balances: dict[bytes, int] | None = None,
+        *,
+        exclude: Iterable[bytes] = (),
+    ) -> None:
+        self.asset_id = asset_id
+        self.round = round
+        self._balances: dict[bytes, int] = {k: v for k, v in (balances or {}).items() if v > 0}
+        # Satılmamış biletleri tutan uygulama hesabı gibi "sahip" sayılmayanlar
+        self._exclude = frozenset(exclude)
+
+    def __len__(self) -> int:
+        return sum(1 for k in self._balances if k not in self._exclude)
+
+    def holds_key(self, public_key: bytes) -> bool:
+        return public_key in self._balances and public_key not in self._exclude
+
+    def holds(self, address: str) -> bool:
+        return self.holds_key(encoding.decode_address(address))
+
+    def balance(self, address: str) -> int:
+        return self._balances.get(encoding.decode_address(address), 0)
+
+    # --- Blok deltaları ---
+    def apply_block(self, round: int, block: dict[str, Any]) -> int:  # noqa: A002
+        """Bir bloğun (msgpack çözülmüş "block" alanı) bu ASA'ya ait transferlerini uygular."""
+        changes = 0
+        for stxn in block.get("txns", []):
+            changes += self._apply_signed(stxn)
+        self.round = round
+        return changes
+
+    def _apply_signed(self, stxn: dict[str, Any]) -> int:
+        changes = 0
+        txn = stxn.get("txn", {})
+        eval_delta = stxn.get("dt", {})
+        if txn.get("type") == "axfer" and txn.get("xaid") == self.asset_id:
+            changes += self._apply_transfer(stxn)
+        # buy_ticket / buy_tickets biletleri inner işlemle gönderir
+        for inner in eval_delta.get("itx", []):
+            changes += self._apply_signed(inner)
+        return changes
+
+    def _apply_transfer(self, stxn: dict[str, Any]) -> int:
+        txn = stxn["txn"]
+        # Clawback'te kaynak "asnd", normal transferde gönderici
+        source = txn.get("asnd") or txn["snd"]
+        amount = int(txn.get("aamt", 0))
+        changes = 0
+        if amount:
+            receiver = txn.get("arcv", source)
+            self._move(source, receiver, amount)
+            changes += 1
+        close_to = txn.get("aclose")
+        if close_to:
+            # Kapanış miktarı ApplyData'dadır ("ca" ile aynı düzeyde; "dt" yalnızca EvalDelta taşır)
+            remaining = self._balances.get(source, 0)
+            self._move(source, close_to, int(stxn.get("aca", remaining)))
+            self._balances.pop(source, None)
+            changes += 1
+        return changes
+
+    def _move(self, source: bytes, receiver: bytes, amount: int) -> None:
+        left = self._balances.get(source, 0) - amount
+        if left > 0:
+            self._balances[source] = left
+        else:
+            self._balances.pop(source, None)
+        if amount:
+            self._balances[receiver] = self._balances.get(receiver, 0) + amount
+
+    # --- Anlık görüntü ---
+    def save(self, path: Path) -> None:
+        """İkili anlık görüntüyü atomik olarak yazar (sahip başına 40 bayt)."""
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        with tmp.open("wb") as f:
+            f.write(SNAPSHOT_MAGIC)
+            f.write(SNAPSHOT_HEADER.pack(self.asset_id, self.round, len(self._balances)))
+            for key, amount in self._balances.items():
+                f.write(SNAPSHOT_ENTRY.pack(key, amount))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path, *, exclude: Iterable[bytes] = ()) -> HolderIndex:
+        data = path.read_bytes()
+        if not data.startswith(SNAPSHOT_MAGIC):
+            raise ValueError(f"Geçersiz anlık görüntü: {path}")
+        offset = len(SNAPSHOT_MAGIC)
+        asset_id, round_, count = SNAPSHOT_HEADER.unpack_from(data, offset)
+        offset += SNAPSHOT_HEADER.size
+        balances = dict(SNAPSHOT_ENTRY.iter_unpack(data[offset : offset + count * SNAPSHOT_ENTRY.size]))
+        return cls(asset_id, round_, balances, exclude=exclude)
+
+
+class GateScanService:
+    """EventTicketingClient'ın bilet ASA'sı için canlı tutulan HolderIndex"""
+
+    def __init__(
+        self,
+        client: EventTicketingClient,
+        *,
+        snapshot_path: Path | None = None,
+        snapshot_every: int = DEFAULT_SNAPSHOT_EVERY,
+    ) -> None:
+        self.client = client
+        self.algod = client.algorand.client.algod
+        self.snapshot_path = snapshot_path
+        self.snapshot_every = snapshot_every
+        self.asset_id = client.state.global_state.sale_params.ticket_asa_id
+        self._exclude = [encoding.decode_address(client.app_address)]
+        self.index = HolderIndex(self.asset_id, exclude=self._exclude)
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def holds(self, address: str) -> bool:
+        return self.index.holds(address)
+
+    # --- Yükleme ---
+    def load(self) -> HolderIndex:
+        """Anlık görüntü kullanılabiliyorsa onu yükleyip eksik blokları uygular, değilse tam tarar."""
+        last_round = int(self.algod.status()["last-round"])
+        snapshot = self._read_snapshot()
+        if snapshot is not None and last_round - snapshot.round <= MAX_CATCHUP_ROUNDS:
+            self.index = snapshot
+            applied = self.catch_up(last_round)
+            logger.info(f"Anlık görüntü yüklendi (round {snapshot.round}), {applied} blok uygulandı")
+        else:
+            self.index = self.full_scan()
+            self.catch_up(last_round)
+            logger.info(f"Tam tarama: {len(self.index)} sahip (round {self.index.round})")
+        self.save()
+        return self.index
+
+    def full_scan(self) -> HolderIndex:
+        """Bilet ASA'sının sahiplerini indexer'dan sayfa sayfa okur."""
+        indexer = self.client.algorand.client.indexer
+        balances: dict[bytes, int] = {}
+        scan_round = 0
+        next_page: str | None = None
+        while True:
+            response = indexer.asset_balances(
+                self.asset_id, limit=INDEXER_PAGE_SIZE, next_page=next_page, min_balance=0
+            )
+            assert isinstance(response, dict)
+            scan_round = int(response.get("current-round", scan_round))
+            for holding in response.get("balances", []):
+                if not holding.get("deleted") and holding["amount"] > 0:
+                    balances[encoding.decode_address(holding["address"])] = int(holding["amount"])
+            next_page = response.get("next-token")
+            if not next_page:
+                break
+        return HolderIndex(self.asset_id, scan_round, balances, exclude=self._exclude)
+
+    def catch_up(self, until: int) -> int:
+        """index.round + 1 .. until arasındaki blokları uygular; uygulanan blok sayısını döndürür."""
+        applied = 0
+        for round_, block in self._blocks(self.index.round + 1, until):
+            self.index.apply_block(round_, block)
+            applied += 1
+        return applied
+
+    # --- Canlı izleme ---
+    def start(self) -> None:
+        self.load()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._follow, name="gate-scan", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.save()
+
+    def save(self) -> None:
+        if self.snapshot_path is not None:
+            self.index.save(self.snapshot_path)
+
+    def _follow(self) -> None:
+        since_snapshot = 0
+        while not self._stop.is_set():
+            try:
+                # Bir sonraki blok gelene (ya da algod zaman aşımına) kadar bekler
+                status = self.algod.status_after_block(self.index.round)
+                applied = self.catch_up(int(status["last-round"]))
+            except Exception as e:
+                logger.warning(f"Blok izleme hatası, yeniden denenecek: {e}")
+                time.sleep(1)
+                continue
+            since_snapshot += applied
+            if since_snapshot >= self.snapshot_every:
+                self.save()
+                since_snapshot = 0
+
+    def _blocks(self, start: int, end: int) -> Iterator[tuple[int, dict[str, Any]]]:
+        for round_ in range(start, end + 1):
+            yield round_, read_block(self.algod, round_)
+
+    def _read_snapshot(self) -> HolderIndex | None:
+        if self.snapshot_path is None or not self.snapshot_path.exists():
+            return None
+        try:
+            snapshot = HolderIndex.load(self.snapshot_path, exclude=self._exclude)
+        except (ValueError, struct.error) as e:
+            logger.warning(f"Anlık görüntü okunamadı, tam tarama yapılacak: {e}")
+            return None
+        return snapshot if snapshot.asset_id == self.asset_id else None
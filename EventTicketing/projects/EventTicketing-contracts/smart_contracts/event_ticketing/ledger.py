@@ -0,0 +1,120 @@
+# smart_contracts/event_ticketing/ledger.py
+# Alıcı başına satın alma kayıtları (kontrattaki "purchases" BoxMap'i).
+# Tek adres için typed client yeterlidir:
+#   client.state.box.purchases.get_value(address)
+#   client.send.get_purchase(args=(address,))
+# Çok sayıda adres için read_purchases() kullanılır: algod'un kutu listeleme
+# uç noktası (prefix + values) "p" önekli tüm kutuları değerleriyle birlikte
+# sayfa sayfa döndürür, binlerce alıcı birkaç istekle çözülür. Az sayıda adres
+# için ya da bu uç noktayı desteklemeyen düğümlerde kutular paralel tek tek okunur.
+# Listeleme tüm kutuları gezdiğinden, aynı çalıştırmada tekrar tekrar sorgu yapan
+# çağıranlar list_purchases() ile bir kez listeleyip sonucu yeniden kullanmalı,
+# sonraki sorgularda read_purchases(..., scan=False) ile tek tek okumalıdır.
+
+from __future__ import annotations
+
+import base64
+import struct
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+from algosdk import encoding
+from algosdk.error import AlgodHTTPError
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.artifacts.event_ticketing.event_ticketing_client import (
+    EventTicketingClient,
+    PurchaseRecord,
+)
+
+PURCHASE_BOX_PREFIX = b"p"
+# arc4 (uint64,uint64,uint64)
+PURCHASE_RECORD_SIZE = 24
+# Kutu MBR'si: 2500 + 400 * (ad + değer) µAlgo; her yeni alıcı bir kutu açar
+PURCHASE_BOX_MBR = 2_500 + 400 * (len(PURCHASE_BOX_PREFIX) + 32 + PURCHASE_RECORD_SIZE)
+# Bu sayıdan az adres için listeleme yerine tek tek okuma yapılır
+SCAN_THRESHOLD = 64
+
+
+def purchase_box_name(address: str) -> bytes:
+    return PURCHASE_BOX_PREFIX + encoding.decode_address(address)
+
+
+def decode_purchase_record(value: bytes) -> PurchaseRecord:
+    count, first_round, last_round = struct.unpack(">QQQ", value[:PURCHASE_RECORD_SIZE])
+    return PurchaseRecord(count=count, first_round=first_round, last_round=last_round)
+
+
+def read_purchases(
+    client: EventTicketingClient,
+    addresses: Iterable[str],
+    *,
+    page_size: int = 1_000,
+    workers: int = 16,
+    scan: bool = True,
+) -> dict[str, PurchaseRecord | None]:
+    """
+    Her adres için kaydı (hiç alım yapmamışsa None) döndürür. scan=False iken
+    adres sayısından bağımsız olarak yalnızca istenen kutular okunur.
+    """
+    algod = client.algorand.client.algod
+    wanted = {purchase_box_name(a): a for a in addresses}
+    result: dict[str, PurchaseRecord | None] = dict.fromkeys(wanted.values())
+    if not wanted:
+        return result
+
+    if scan and len(wanted) >= SCAN_THRESHOLD:
+        try:
+            for name, value in _list_purchase_boxes(algod, client.app_id, page_size):
+                if name in wanted:
+                    result[wanted[name]] = decode_purchase_record(value)
+            return result
+        except (AlgodHTTPError, KeyError):
+            # Düğüm values/prefix parametrelerini desteklemiyor; tek tek okumaya düş
+            pass
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for address, record in zip(
+            wanted.values(), pool.map(lambda n: _read_box(algod, client.app_id, n), wanted), strict=True
+        ):
+            result[address] = record
+    return result
+
+
+def list_purchases(client: EventTicketingClient, *, page_size: int = 1_000) -> dict[str, PurchaseRecord]:
+    """
+    Uygulamadaki tüm alıcı kayıtları (adres -> kayıt), tek listeleme ile.
+    Düğüm prefix/values parametrelerini desteklemiyorsa AlgodHTTPError ya da KeyError yükselir.
+    """
+    return {
+        encoding.encode_address(name[len(PURCHASE_BOX_PREFIX) :]): decode_purchase_record(value)
+        for name, value in _list_purchase_boxes(client.algorand.client.algod, client.app_id, page_size)
+    }
+
+
+def _list_purchase_boxes(algod: AlgodClient, app_id: int, page_size: int) -> Iterator[tuple[bytes, bytes]]:
+    params: dict[str, str | int] = {
+        "prefix": "b64:" + base64.b64encode(PURCHASE_BOX_PREFIX).decode(),
+        "values": "true",
+        "max": page_size,
+    }
+    while True:
+        response = algod.algod_request("GET", f"/applications/{app_id}/boxes", params=params)
+        assert isinstance(response, dict)
+        for box in response.get("boxes", []):
+            yield base64.b64decode(box["name"]), base64.b64decode(box["value"])
+        next_token = response.get("next-token")
+        if not next_token:
+            return
+        params["next"] = next_token
+
+
+def _read_box(algod: AlgodClient, app_id: int, name: bytes) -> PurchaseRecord | None:
+    try:
+        response = algod.application_box_by_name(app_id, name)
+    except AlgodHTTPError as e:
+        if e.code == 404:
+            return None
+        raise
+    assert isinstance(response, dict)
+    return decode_purchase_record(base64.b64decode(response["value"]))
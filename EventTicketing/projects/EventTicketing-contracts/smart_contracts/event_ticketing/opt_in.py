@@ -0,0 +1,184 @@
+# smart_contracts/event_ticketing/opt_in.py
+# İlk kez alım yapanlar için otomatik bilet ASA opt-in'i.
+#
+# buy_ticket bileti inner AssetTransfer ile Txn.sender'a gönderir; alıcı
+# ticket_asa_id'ye opt-in yapmamışsa grup ancak bir gidiş-dönüş sonra reddedilir.
+# buy_with_opt_in() alıcının opt-in durumunu hesap-varlık önbelleğinden kontrol
+# eder; gerekiyorsa aynı atomik grubun başına bir opt-in işlemi ekler. Opt-in
+# yapmış olduğu bilinen (tekrar gelen) alıcılar için algod'a hiç gidilmez.
+# Bilet ASA'sı ve fiyat basımdan sonra değişmediğinden SaleParams client başına
+# bir kez okunur (ya da `sale` argümanıyla verilir).
+#
+# Kullanım:
+#   result = buy_with_opt_in(app_client, Buyer.from_account(account))
+#   print(opt_in_cache().stats)
+
+from __future__ import annotations
+
+import dataclasses
+import threading
+import weakref
+from collections import OrderedDict
+
+from algokit_utils import (
+    AlgoAmount,
+    AssetOptInParams,
+    CommonAppCallParams,
+    PaymentParams,
+    SendAtomicTransactionComposerResults,
+    SendParams,
+)
+from algosdk.error import AlgodHTTPError
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.artifacts.event_ticketing.event_ticketing_client import (
+    EventTicketingClient,
+    EventTicketingComposer,
+    SaleParams,
+)
+from smart_contracts.event_ticketing.bulk_buy import INNER_TXN_FEE, Buyer
+from smart_contracts.event_ticketing.ledger import purchase_box_name
+
+DEFAULT_MAX_ENTRIES = 100_000
+
+
+@dataclasses.dataclass
+class OptInStats:
+    # algod'a gitmeden önbellekten yanıtlanan kontroller
+    hits: int = 0
+    # account_asset_info sorguları
+    lookups: int = 0
+    # Alım grubuna eklenen opt-in işlemleri
+    bundled: int = 0
+
+
+class OptInCache:
+    """
+    Opt-in yaptığı bilinen (adres, ASA) çiftleri. Yalnızca olumlu sonuçlar
+    saklanır: opt-in yapmamış bir alıcı, opt-in'i içeren alımı onaylanınca
+    kaydedilir. LRU sınırı vardır; birden fazla client arasında paylaşılabilir.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries en az 1 olmalı")
+        self.max_entries = max_entries
+        self.stats = OptInStats()
+        self._entries: OrderedDict[tuple[str, int], None] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def is_opted_in(self, algod: AlgodClient, address: str, asset_id: int) -> bool:
+        key = (address, asset_id)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return True
+            self.stats.lookups += 1
+        try:
+            algod.account_asset_info(address, asset_id)
+        except AlgodHTTPError as e:
+            if e.code == 404:
+                return False
+            raise
+        self.mark(address, asset_id)
+        return True
+
+    def mark(self, address: str, asset_id: int, *, bundled: bool = False) -> None:
+        with self._lock:
+            self._entries[(address, asset_id)] = None
+            self._entries.move_to_end((address, asset_id))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            if bundled:
+                self.stats.bundled += 1
+
+    def forget(self, address: str, asset_id: int) -> None:
+        with self._lock:
+            self._entries.pop((address, asset_id), None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_shared_cache = OptInCache()
+
+
+# Client -> basım sonrası SaleParams (client kapanınca kendiliğinden düşer)
+_sale_params: weakref.WeakKeyDictionary[EventTicketingClient, SaleParams] = weakref.WeakKeyDictionary()
+_sale_params_lock = threading.Lock()
+
+
+def sale_params_of(client: EventTicketingClient) -> SaleParams:
+    """Client'ın SaleParams değeri; biletler basıldıktan sonra client başına bir kez okunur."""
+    with _sale_params_lock:
+        sale = _sale_params.get(client)
+    if sale is None:
+        sale = client.state.global_state.sale_params
+        # Basımdan önce ticket_asa_id 0'dır ve değişecektir; önbelleğe alınmaz
+        if sale.ticket_asa_id:
+            with _sale_params_lock:
+                _sale_params[client] = sale
+    return sale
+
+
+def opt_in_cache() -> OptInCache:
+    """buy_with_opt_in'in varsayılan olarak kullandığı, süreç genelinde paylaşılan önbellek."""
+    return _shared_cache
+
+
+def compose_purchase(
+    client: EventTicketingClient, buyer: Buyer, sale: SaleParams, *, opt_in: bool
+) -> EventTicketingComposer:
+    """[opt-in], ödeme, buy_ticket / buy_tickets grubunu kurar (gönderilmez)."""
+    group = client.new_group()
+    if opt_in:
+        group.composer().add_asset_opt_in(
+            AssetOptInParams(sender=buyer.address, signer=buyer.signer, asset_id=sale.ticket_asa_id)
+        )
+    payment = client.algorand.create_transaction.payment(
+        PaymentParams(
+            sender=buyer.address,
+            receiver=client.app_address,
+            amount=AlgoAmount.from_micro_algo(sale.ticket_price * buyer.count),
+        )
+    )
+    params = CommonAppCallParams(
+        sender=buyer.address,
+        signer=buyer.signer,
+        extra_fee=INNER_TXN_FEE,
+        asset_references=[sale.ticket_asa_id],
+        box_references=[purchase_box_name(buyer.address)],
+    )
+    if buyer.count == 1:
+        group.buy_ticket(args=(payment,), params=params)
+    else:
+        group.buy_tickets(args=(payment, buyer.count), params=params)
+    return group
+
+
+def buy_with_opt_in(
+    client: EventTicketingClient,
+    buyer: Buyer,
+    *,
+    cache: OptInCache | None = None,
+    sale: SaleParams | None = None,
+    send_params: SendParams | None = None,
+) -> SendAtomicTransactionComposerResults:
+    """
+    `buyer.count` bilet alır; alıcı bilet ASA'sına opt-in yapmamışsa opt-in aynı
+    atomik grupta gönderilir. Grup reddedilirse önbellekteki kayıt silinir
+    (ör. alıcı sonradan opt-out yaptıysa bir sonraki alım yeniden sorgular).
+    `sale` verilmezse sale_params_of(client) kullanılır.
+    """
+    cache = cache if cache is not None else _shared_cache
+    sale = sale if sale is not None else sale_params_of(client)
+    opted_in = cache.is_opted_in(client.algorand.client.algod, buyer.address, sale.ticket_asa_id)
+    group = compose_purchase(client, buyer, sale, opt_in=not opted_in)
+    try:
+        result = group.send(send_params)
+    except Exception:
+        cache.forget(buyer.address, sale.ticket_asa_id)
+        raise
+    cache.mark(buyer.address, sale.ticket_asa_id, bundled=not opted_in)
+    return result
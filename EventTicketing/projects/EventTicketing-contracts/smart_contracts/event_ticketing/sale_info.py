@@ -0,0 +1,47 @@
+# smart_contracts/event_ticketing/sale_info.py
+# get_sale_info() salt okunur metodunu simulate ile çağırarak satış durumunun
+# tek algod isteğiyle, belirli bir round'a bağlı anlık görüntüsünü döndürür.
+
+from __future__ import annotations
+
+import dataclasses
+import typing
+
+from algokit_utils import CommonAppCallParams
+
+from smart_contracts.artifacts.event_ticketing.event_ticketing_client import (
+    EventTicketingClient,
+    SaleInfo,
+)
+
+SALE_INFO_METHOD = "get_sale_info()(uint64,uint64,uint64,uint64,string)"
+
+
+@dataclasses.dataclass(frozen=True)
+class SaleSnapshot:
+    """get_sale_info() sonucu ve simulate'in çalıştığı round"""
+
+    info: SaleInfo
+    round: int
+
+    @property
+    def tickets_left(self) -> int:
+        return self.info.total_tickets - self.info.tickets_sold
+
+
+def fetch_sale_info(client: EventTicketingClient, *, sender: str | None = None) -> SaleSnapshot:
+    """
+    Satış durumunu (paketli parametreler, sayaç, ad) tek bir simulate çağrısıyla okur.
+    İmza gerekmez; `sender` verilmezse client'ın varsayılan göndericisi kullanılır.
+    """
+    params = CommonAppCallParams(sender=sender) if sender else None
+    result = (
+        client.new_group()
+        .get_sale_info(params=params)
+        .simulate(skip_signatures=True, allow_unnamed_resources=True)
+    )
+    info = client.decode_return_value(SALE_INFO_METHOD, result.returns[0])
+    return SaleSnapshot(
+        info=typing.cast(SaleInfo, info),
+        round=int(result.simulate_response["last-round"]),
+    )
@@ -0,0 +1,290 @@
+# smart_contracts/event_ticketing/sales_db.py
+# Yerel satış dizini (SQLite): EventTicketing satışlarını (buy_ticket /
+# buy_tickets) ve bilet ASA transferlerini bloklardan okuyup tablolara yazar.
+# Raporlar (dakika başına satış, en çok alanlar, gelir) geçmişi algod'dan
+# yeniden çekmeden milisaniyeler içinde yerel sorgularla yanıtlanır.
+#
+#   - WAL kipi: raporlar, ingest sürerken okunabilir.
+#   - Bloklar COMMIT_EVERY_ROUNDS'luk partiler halinde tek işlemde (executemany)
+#     yazılır; checkpoint aynı işlemde güncellenir, yarıda kalan çalışma tekrar
+#     edildiğinde ne eksik ne çift kayıt olur.
+#   - Her çalıştırma yalnızca checkpoint'ten sonraki round'ları işler.
+#
+# Kullanım:
+#   db = SalesIndex(Path("sales.db"))
+#   db.ingest(algod, {app_id}, start_round=creation_round)   # ilk çalıştırma
+#   db.ingest(algod, {app_id})                               # sonrakiler
+#   db.top_buyers(app_id, limit=10)
+
+from __future__ import annotations
+
+import base64
+import dataclasses
+import sqlite3
+from collections.abc import Collection, Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from algosdk import encoding
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.event_ticketing.events import TicketsMinted, decode_logs
+from smart_contracts.event_ticketing.stream import SaleEvent, decode_sales, follow_blocks
+
+COMMIT_EVERY_ROUNDS = 500
+# Kontrattaki paketli SaleParams: fiyat, toplam, ASA, sınır (4 x uint64)
+SALE_PARAMS_KEY = b"params"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sales (
+    round       INTEGER NOT NULL,
+    txn_index   INTEGER NOT NULL,
+    app_id      INTEGER NOT NULL,
+    buyer       TEXT    NOT NULL,
+    count       INTEGER NOT NULL,
+    amount      INTEGER NOT NULL,
+    sold_after  INTEGER,
+    timestamp   INTEGER NOT NULL,
+    txid        TEXT    NOT NULL,
+    PRIMARY KEY (round, txn_index)
+) WITHOUT ROWID;
+-- Rapor sütunları indekste de tutulur; etkinlik raporları tabloya dönmeden yanıtlanır
+CREATE INDEX IF NOT EXISTS sales_app_round ON sales (app_id, round, timestamp, count, amount);
+CREATE INDEX IF NOT EXISTS sales_buyer ON sales (buyer);
+
+CREATE TABLE IF NOT EXISTS transfers (
+    asset_id    INTEGER NOT NULL,
+    round       INTEGER NOT NULL,
+    sender      TEXT    NOT NULL,
+    receiver    TEXT    NOT NULL,
+    amount      INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS transfers_asset_round ON transfers (asset_id, round);
+CREATE INDEX IF NOT EXISTS transfers_receiver ON transfers (receiver);
+
+CREATE TABLE IF NOT EXISTS apps (
+    app_id      INTEGER PRIMARY KEY,
+    asa_id      INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS checkpoint (
+    id          INTEGER PRIMARY KEY CHECK (id = 1),
+    round       INTEGER NOT NULL
+);
+"""
+
+_INSERT_SALE = "INSERT OR IGNORE INTO sales VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+_INSERT_TRANSFER = "INSERT INTO transfers VALUES (?, ?, ?, ?, ?)"
+
+
+@dataclasses.dataclass(frozen=True)
+class SalesSummary:
+    tickets: int
+    # µAlgo
+    revenue: int
+    buyers: int
+    first_round: int | None
+    last_round: int | None
+
+
+@dataclasses.dataclass(frozen=True)
+class BuyerTotal:
+    buyer: str
+    tickets: int
+    spent: int
+
+
+class SalesIndex:
+    """SQLite satış dizini; tek yazıcı, WAL sayesinde eşzamanlı okuyucular"""
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = path
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # WAL ile NORMAL: her commit'te fsync yok, çökmede yalnızca son işlem kaybolabilir
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> SalesIndex:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # --- Yazma ---
+    @property
+    def checkpoint(self) -> int | None:
+        """Tamamen işlenmiş son round."""
+        row = self._conn.execute("SELECT round FROM checkpoint WHERE id = 1").fetchone()
+        return row[0] if row else None
+
+    def insert_sales(self, sales: Iterable[SaleEvent], *, checkpoint: int | None = None) -> None:
+        """Satışları tek işlemde toplu ekler; checkpoint verilirse aynı işlemde günceller."""
+        self._write([_sale_row(s) for s in sales], [], {}, checkpoint)
+
+    def ingest(
+        self,
+        algod: AlgodClient,
+        app_ids: Collection[int],
+        *,
+        start_round: int | None = None,
+        until_round: int | None = None,
+        commit_every: int = COMMIT_EVERY_ROUNDS,
+    ) -> int:
+        """
+        Checkpoint'ten (yoksa start_round'dan) until_round'a (varsayılan: son round)
+        kadar blokları işler. İşlenen blok sayısını döndürür.
+        """
+        checkpoint = self.checkpoint
+        if checkpoint is not None:
+            start = checkpoint + 1
+        elif start_round is not None:
+            start = start_round
+        else:
+            raise ValueError("İlk ingest için start_round gerekli")
+        if until_round is None:
+            until_round = int(algod.status()["last-round"])
+
+        app_ids = frozenset(app_ids)
+        apps = self._apps(algod, app_ids)
+        sales: list[tuple[Any, ...]] = []
+        transfers: list[tuple[Any, ...]] = []
+        new_apps: dict[int, int] = {}
+        processed = 0
+        for round_, block in follow_blocks(algod, start, until_round):
+            sales.extend(_sale_row(s) for s in decode_sales(round_, block, app_ids))
+            for app_id, minted in _minted(block, app_ids):
+                apps[app_id] = new_apps[app_id] = minted.asa_id
+            transfers.extend(_transfers(round_, block, set(apps.values())))
+            processed += 1
+            if processed % commit_every == 0 or round_ == until_round:
+                self._write(sales, transfers, new_apps, round_)
+                sales, transfers, new_apps = [], [], {}
+        return processed
+
+    def _write(
+        self,
+        sales: list[tuple[Any, ...]],
+        transfers: list[tuple[Any, ...]],
+        apps: dict[int, int],
+        checkpoint: int | None,
+    ) -> None:
+        with self._conn:
+            self._conn.executemany(_INSERT_SALE, sales)
+            self._conn.executemany(_INSERT_TRANSFER, transfers)
+            self._conn.executemany("INSERT OR REPLACE INTO apps VALUES (?, ?)", apps.items())
+            if checkpoint is not None:
+                self._conn.execute("INSERT OR REPLACE INTO checkpoint VALUES (1, ?)", (checkpoint,))
+
+    def _apps(self, algod: AlgodClient, app_ids: frozenset[int]) -> dict[int, int]:
+        """Uygulama -> bilet ASA'sı; bilinmeyenler bir kez global state'ten okunur."""
+        known = dict(self._conn.execute("SELECT app_id, asa_id FROM apps").fetchall())
+        missing = {app_id: _ticket_asa_id(algod, app_id) for app_id in app_ids if app_id not in known}
+        if missing:
+            self._write([], [], missing, None)
+        return {app_id: asa_id for app_id, asa_id in {**known, **missing}.items() if app_id in app_ids and asa_id}
+
+    # --- Raporlar ---
+    def summary(self, app_id: int) -> SalesSummary:
+        row = self._conn.execute(
+            "SELECT COALESCE(SUM(count), 0), COALESCE(SUM(amount), 0), MIN(round), MAX(round)"
+            " FROM sales WHERE app_id = ?",
+            (app_id,),
+        ).fetchone()
+        (buyers,) = self._conn.execute(
+            "SELECT COUNT(DISTINCT buyer) FROM sales WHERE app_id = ?", (app_id,)
+        ).fetchone()
+        return SalesSummary(tickets=row[0], revenue=row[1], buyers=buyers, first_round=row[2], last_round=row[3])
+
+    def sales_per_minute(self, app_id: int) -> list[tuple[int, int]]:
+        """(dakika başlangıcı unix saniye, satılan bilet) listesi."""
+        return self._conn.execute(
+            "SELECT timestamp / 60 * 60 AS minute, SUM(count) FROM sales"
+            " WHERE app_id = ? GROUP BY minute ORDER BY minute",
+            (app_id,),
+        ).fetchall()
+
+    def top_buyers(self, app_id: int, limit: int = 10) -> list[BuyerTotal]:
+        rows = self._conn.execute(
+            "SELECT buyer, SUM(count) AS tickets, SUM(amount) FROM sales"
+            " WHERE app_id = ? GROUP BY buyer ORDER BY tickets DESC, buyer LIMIT ?",
+            (app_id, limit),
+        ).fetchall()
+        return [BuyerTotal(*row) for row in rows]
+
+    def revenue(self, app_id: int, *, from_round: int = 0, to_round: int | None = None) -> int:
+        (total,) = self._conn.execute(
+            "SELECT COALESCE(SUM(amount), 0) FROM sales WHERE app_id = ? AND round BETWEEN ? AND ?",
+            (app_id, from_round, to_round if to_round is not None else 2**63 - 1),
+        ).fetchone()
+        return total
+
+    def sale_rows(self) -> list[tuple[int, int, int, int, int, str]]:
+        """Tüm satışlar zincir sırasıyla: (round, app_id, amount, count, timestamp, buyer)."""
+        return self._conn.execute(
+            "SELECT round, app_id, amount, count, timestamp, buyer FROM sales ORDER BY round, txn_index"
+        ).fetchall()
+
+    def purchases_of(self, buyer: str) -> list[tuple[int, int, int]]:
+        """Bir alıcının tüm etkinliklerdeki alımları: (app_id, round, adet)."""
+        return self._conn.execute(
+            "SELECT app_id, round, count FROM sales WHERE buyer = ? ORDER BY round", (buyer,)
+        ).fetchall()
+
+
+def _sale_row(sale: SaleEvent) -> tuple[Any, ...]:
+    return (
+        sale.round,
+        sale.cursor.txn_index,
+        sale.app_id,
+        sale.buyer,
+        sale.count,
+        sale.amount,
+        sale.sold_after,
+        sale.timestamp,
+        sale.txid,
+    )
+
+
+def _minted(block: dict[str, Any], app_ids: frozenset[int]) -> Iterator[tuple[int, TicketsMinted]]:
+    for stxn in block.get("txns", []):
+        app_id = stxn["txn"].get("apid")
+        if stxn["txn"].get("type") == "appl" and app_id in app_ids:
+            for event in decode_logs(stxn.get("dt", {}).get("lg", [])):
+                if isinstance(event, TicketsMinted):
+                    yield app_id, event
+
+
+def _transfers(round: int, block: dict[str, Any], asset_ids: set[int]) -> Iterator[tuple[Any, ...]]:  # noqa: A002
+    """Bloktaki (inner dahil) bilet ASA transferleri: (asset_id, round, gönderen, alıcı, miktar)."""
+    if not asset_ids:
+        return
+
+    def walk(stxns: list[dict[str, Any]]) -> Iterator[tuple[Any, ...]]:
+        for stxn in stxns:
+            # ApplyData alanları ("aca" dahil) işlemle aynı düzeydedir; "dt" yalnızca EvalDelta (lg, itx, ...)
+            txn, eval_delta = stxn.get("txn", {}), stxn.get("dt", {})
+            if txn.get("type") == "axfer" and txn.get("xaid") in asset_ids:
+                source = encoding.encode_address(txn.get("asnd") or txn["snd"])
+                if txn.get("aamt"):
+                    receiver = encoding.encode_address(txn.get("arcv", txn["snd"]))
+                    yield txn["xaid"], round, source, receiver, int(txn["aamt"])
+                if txn.get("aclose") and stxn.get("aca"):
+                    close_to = encoding.encode_address(txn["aclose"])
+                    yield txn["xaid"], round, source, close_to, int(stxn["aca"])
+            yield from walk(eval_delta.get("itx", []))
+
+    yield from walk(block.get("txns", []))
+
+
+def _ticket_asa_id(algod: AlgodClient, app_id: int) -> int:
+    """Uygulamanın paketli SaleParams değerinden bilet ASA ID'si (henüz basılmadıysa 0)."""
+    info = algod.application_info(app_id)
+    assert isinstance(info, dict)
+    for entry in info["params"].get("global-state", []):
+        if base64.b64decode(entry["key"]) == SALE_PARAMS_KEY:
+            return int.from_bytes(base64.b64decode(entry["value"]["bytes"])[16:24], "big")
+    return 0
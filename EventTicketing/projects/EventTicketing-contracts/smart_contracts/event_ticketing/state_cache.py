@@ -0,0 +1,251 @@
+# smart_contracts/event_ticketing/state_cache.py
+# _GlobalState için isteğe bağlı (opt-in), round farkında önbellek.
+#
+# Global state en fazla round başına bir kez değişebilir; bu yüzden okumalar
+# app ID başına önbelleğe alınır ve şu durumlarda geçersiz kılınır:
+#   * TTL dolduğunda (varsayılan ~1 blok süresi),
+#   * bu uygulama için daha yeni bir round gözlendiğinde (observe_round),
+#   * kendi buy_ticket / buy_tickets / mint_tickets çağrımız onaylandığında.
+#
+# Kullanım:
+#   cache = enable_state_cache(app_client, ttl=3.0)
+#   app_client.state.global_state.tickets_sold   # algod'a gider (miss)
+#   app_client.state.global_state.sale_params    # önbellekten (hit)
+#   app_client.state.global_state.ticket_price   # sale_params alanı, önbellekten (hit)
+
+from __future__ import annotations
+
+import dataclasses
+import threading
+import time
+import typing
+from collections import OrderedDict
+from collections.abc import Callable
+
+import algokit_utils
+
+from smart_contracts.artifacts.event_ticketing.event_ticketing_client import (
+    EventTicketingClient,
+    EventTicketingSend,
+    EventTicketingState,
+    GlobalStateValue,
+    SaleParams,
+    _GlobalState,
+)
+
+DEFAULT_TTL_SECONDS = 3.0
+DEFAULT_MAX_APPS = 1024
+
+
+@dataclasses.dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclasses.dataclass
+class _Entry:
+    values: GlobalStateValue
+    round: int
+    expires_at: float
+
+
+class GlobalStateCache:
+    """
+    app ID -> (global state değerleri, son görülen round) eşlemesi.
+    TTL ve LRU sınırı vardır; birden fazla client arasında paylaşılabilir.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        max_apps: int = DEFAULT_MAX_APPS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_apps < 1:
+            raise ValueError("max_apps en az 1 olmalı")
+        self.ttl = ttl
+        self.max_apps = max_apps
+        self.stats = CacheStats()
+        self._clock = clock
+        self._entries: OrderedDict[int, _Entry] = OrderedDict()
+        # app ID -> bu uygulama için gözlenen en yeni round
+        self._latest_round: dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, app_id: int) -> GlobalStateValue | None:
+        with self._lock:
+            entry = self._entries.get(app_id)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            if entry.expires_at <= self._clock() or entry.round < self._latest_round.get(app_id, 0):
+                del self._entries[app_id]
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(app_id)
+            self.stats.hits += 1
+            return entry.values
+
+    def put(self, app_id: int, values: GlobalStateValue, round: int | None = None) -> None:  # noqa: A002
+        with self._lock:
+            seen = self._latest_round.get(app_id, 0)
+            self._entries[app_id] = _Entry(
+                values=values,
+                round=max(seen, round or 0),
+                expires_at=self._clock() + self.ttl,
+            )
+            self._entries.move_to_end(app_id)
+            while len(self._entries) > self.max_apps:
+                evicted, _ = self._entries.popitem(last=False)
+                self._latest_round.pop(evicted, None)
+                self.stats.evictions += 1
+
+    def observe_round(self, app_id: int, round: int) -> None:  # noqa: A002
+        """Uygulamanın `round`'da değiştiği biliniyorsa daha eski kayıt geçersiz olur."""
+        with self._lock:
+            if round <= self._latest_round.get(app_id, 0):
+                return
+            self._latest_round[app_id] = round
+            entry = self._entries.get(app_id)
+            if entry is not None and entry.round < round:
+                del self._entries[app_id]
+                self.stats.invalidations += 1
+
+    def invalidate(self, app_id: int | None = None) -> None:
+        with self._lock:
+            if app_id is None:
+                self.stats.invalidations += len(self._entries)
+                self._entries.clear()
+            elif self._entries.pop(app_id, None) is not None:
+                self.stats.invalidations += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# --------------------------------------------------------------------
+# Typed client entegrasyonu
+# --------------------------------------------------------------------
+class SaleGlobalState(_GlobalState):
+    """Paketli sale_params'ın alanlarını eski tekil adlarıyla da sunan _GlobalState"""
+
+    @property
+    def ticket_price(self) -> int:
+        return self.sale_params.ticket_price
+
+    @property
+    def total_tickets(self) -> int:
+        return self.sale_params.total_tickets
+
+    @property
+    def ticket_asa_id(self) -> int:
+        return self.sale_params.ticket_asa_id
+
+
+class SaleEventTicketingState(EventTicketingState):
+    @property
+    def global_state(self) -> SaleGlobalState:
+        return SaleGlobalState(self.app_client)
+
+
+class CachedGlobalState(SaleGlobalState):
+    """Okumaları GlobalStateCache üzerinden yapan _GlobalState"""
+
+    def __init__(self, app_client: algokit_utils.AppClient, cache: GlobalStateCache):
+        super().__init__(app_client)
+        self.cache = cache
+
+    def get_all(self) -> GlobalStateValue:
+        app_id = self.app_client.app_id
+        cached = self.cache.get(app_id)
+        if cached is not None:
+            return cached
+        values = super().get_all()
+        self.cache.put(app_id, values)
+        return values
+
+    def _value(self, key: str) -> object:
+        return self.get_all().get(key)
+
+    @property
+    def sale_params(self) -> SaleParams:
+        return typing.cast(SaleParams, self._value("sale_params"))
+
+    @property
+    def tickets_sold(self) -> int:
+        return typing.cast(int, self._value("tickets_sold"))
+
+    @property
+    def event_name(self) -> str:
+        return typing.cast(str, self._value("event_name"))
+
+
+class CachedEventTicketingState(EventTicketingState):
+    def __init__(self, app_client: algokit_utils.AppClient, cache: GlobalStateCache):
+        super().__init__(app_client)
+        self.cache = cache
+
+    @property
+    def global_state(self) -> CachedGlobalState:
+        return CachedGlobalState(self.app_client, self.cache)
+
+
+class CachedEventTicketingSend(EventTicketingSend):
+    """State değiştiren çağrılar onaylandığında önbelleği geçersiz kılar"""
+
+    def __init__(self, app_client: algokit_utils.AppClient, cache: GlobalStateCache):
+        super().__init__(app_client)
+        self.cache = cache
+
+    def _confirmed(self, result: algokit_utils.SendAppTransactionResult[typing.Any]) -> None:
+        confirmed_round = (result.confirmation or {}).get("confirmed-round")
+        if confirmed_round:
+            self.cache.observe_round(self.app_client.app_id, int(confirmed_round))
+        else:
+            self.cache.invalidate(self.app_client.app_id)
+
+    def mint_tickets(self, *args: typing.Any, **kwargs: typing.Any) -> algokit_utils.SendAppTransactionResult[int]:
+        result = super().mint_tickets(*args, **kwargs)
+        self._confirmed(result)
+        return result
+
+    def buy_ticket(self, *args: typing.Any, **kwargs: typing.Any) -> algokit_utils.SendAppTransactionResult[None]:
+        result = super().buy_ticket(*args, **kwargs)
+        self._confirmed(result)
+        return result
+
+    def buy_tickets(self, *args: typing.Any, **kwargs: typing.Any) -> algokit_utils.SendAppTransactionResult[None]:
+        result = super().buy_tickets(*args, **kwargs)
+        self._confirmed(result)
+        return result
+
+
+def enable_sale_fields(client: EventTicketingClient) -> None:
+    """`client.state.global_state.ticket_price` gibi tekil alan okumalarını açar (önbelleksiz)."""
+    client.state = SaleEventTicketingState(client.app_client)
+
+
+def enable_state_cache(
+    client: EventTicketingClient,
+    cache: GlobalStateCache | None = None,
+    *,
+    ttl: float = DEFAULT_TTL_SECONDS,
+    max_apps: int = DEFAULT_MAX_APPS,
+) -> GlobalStateCache:
+    """
+    `client.state.global_state` okumalarını önbelleğe bağlar ve `client.send`
+    yazma çağrılarının önbelleği geçersiz kılmasını sağlar. Aynı `cache`
+    birden fazla client'a verilebilir.
+    """
+    cache = cache or GlobalStateCache(ttl=ttl, max_apps=max_apps)
+    client.state = CachedEventTicketingState(client.app_client, cache)
+    client.send = CachedEventTicketingSend(client.app_client, cache)
+    return cache
@@ -0,0 +1,169 @@
+# smart_contracts/event_ticketing/suggested_params.py
+# Paylaşılan suggested params sağlayıcısı.
+#
+# Typed client ile kurulan her grup (buy_ticket, fonlama ödemesi, mint_tickets)
+# işlemleri oluşturmadan önce algod'dan suggested params ister; bu değer ise
+# round başına en fazla bir kez değişir. Sağlayıcı parametreleri bir kez alır ve
+# tüm client'lara kopyasını verir:
+#   * arka planda round başına bir kez (start(); status_after_block ile), ya da
+#   * istek anında, TTL dolmuşsa (varsayılan ~1 blok süresi) yeniler.
+# Verilen kopyada first = parametrelerin alındığı round (hiçbir zaman düğümün
+# önünde değil), last = first + validity_window olur. algokit composer'ı last'ı
+# kendi geçerlilik penceresiyle (first'ten) yeniden hesaplar.
+#
+# Kullanım:
+#   provider = enable_params_cache(app_client.algorand)   # client + factory + composer
+#   provider.start()                                       # isteğe bağlı: round başına yenile
+#   ...
+#   print(provider.stats)                                  # kaç algod isteği kazanıldı
+
+from __future__ import annotations
+
+import copy
+import dataclasses
+import logging
+import threading
+import time
+
+from algokit_utils import AlgorandClient
+from algosdk.transaction import SuggestedParams
+from algosdk.v2client.algod import AlgodClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 3.0
+# algod'un varsayılan geçerlilik penceresi; MaxTxnLife (1000) aşılamaz
+DEFAULT_VALIDITY_WINDOW = 1_000
+MAX_VALIDITY_WINDOW = 1_000
+# Arka plan döngüsü hata sonrası bu kadar bekler
+RETRY_SECONDS = 1.0
+
+
+@dataclasses.dataclass(frozen=True)
+class ParamsStats:
+    # get() çağrıları
+    served: int
+    # algod'a giden suggested_params istekleri
+    fetches: int
+    # Son alınan parametrelerin round'u
+    round: int | None
+
+    @property
+    def saved(self) -> int:
+        """Önbellek sayesinde algod'a gitmeyen istekler."""
+        return max(0, self.served - self.fetches)
+
+    def __str__(self) -> str:
+        return f"{self.served} istek, {self.fetches} algod çağrısı, {self.saved} kazanıldı (round {self.round})"
+
+
+class SuggestedParamsProvider:
+    """Birden fazla AlgorandClient / iş parçacığı tarafından paylaşılabilir (iş parçacığı güvenli)"""
+
+    def __init__(
+        self,
+        algod: AlgodClient,
+        *,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        validity_window: int = DEFAULT_VALIDITY_WINDOW,
+    ) -> None:
+        if not 0 < validity_window <= MAX_VALIDITY_WINDOW:
+            raise ValueError(f"validity_window 1..{MAX_VALIDITY_WINDOW} aralığında olmalı: {validity_window}")
+        self.algod = algod
+        self.ttl = ttl
+        self.validity_window = validity_window
+        self._params: SuggestedParams | None = None
+        self._fetched_at = 0.0
+        self._lock = threading.Lock()
+        self._served = 0
+        self._fetches = 0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def stats(self) -> ParamsStats:
+        with self._lock:
+            return ParamsStats(
+                served=self._served,
+                fetches=self._fetches,
+                round=self._params.first if self._params else None,
+            )
+
+    def get(self) -> SuggestedParams:
+        """Önbellekteki parametrelerin kopyası; gerekirse önce yeniler."""
+        with self._lock:
+            self._served += 1
+            if self._params is None or (self._thread is None and time.monotonic() - self._fetched_at >= self.ttl):
+                self._fetch()
+            assert self._params is not None
+            sp = copy.deepcopy(self._params)
+        sp.last = sp.first + self.validity_window
+        return sp
+
+    def invalidate(self) -> None:
+        """Bir sonraki get() algod'dan yeni parametre alır (ör. ücret hatası sonrası)."""
+        with self._lock:
+            self._params = None
+
+    # --- Arka plan yenileme ---
+    def start(self) -> SuggestedParamsProvider:
+        """Her yeni round'da parametreleri arka planda yeniler; get() artık beklemez."""
+        if self._thread is None:
+            self._stop.clear()
+            with self._lock:
+                self._fetch()
+            self._thread = threading.Thread(target=self._follow_rounds, name="suggested-params", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> SuggestedParamsProvider:
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    def _follow_rounds(self) -> None:
+        while not self._stop.is_set():
+            try:
+                with self._lock:
+                    last_round = self._params.first if self._params else 0
+                # Yeni blok gelene (ya da algod zaman aşımına) kadar bekler
+                status = self.algod.status_after_block(last_round)
+                if self._stop.is_set():
+                    return
+                if int(status["last-round"]) > last_round:
+                    with self._lock:
+                        self._fetch()
+            except Exception:
+                logger.exception("Suggested params yenilenemedi; tekrar denenecek")
+                self._stop.wait(RETRY_SECONDS)
+
+    def _fetch(self) -> None:
+        # Çağıran _lock'u tutar; aynı anda tek algod isteği gider
+        self._params = self.algod.suggested_params()
+        self._fetched_at = time.monotonic()
+        self._fetches += 1
+
+
+def enable_params_cache(
+    algorand: AlgorandClient,
+    provider: SuggestedParamsProvider | None = None,
+    *,
+    ttl: float = DEFAULT_TTL_SECONDS,
+    validity_window: int = DEFAULT_VALIDITY_WINDOW,
+) -> SuggestedParamsProvider:
+    """
+    `algorand` üzerinden kurulan tüm gruplar (typed client, factory, composer,
+    create_transaction) parametreleri `provider`'dan alır. Aynı `provider`
+    birden fazla AlgorandClient'a verilebilir.
+    """
+    provider = provider or SuggestedParamsProvider(algorand.client.algod, ttl=ttl, validity_window=validity_window)
+    # AlgorandClient.new_group() get_suggested_params'ı her grupta çağırır
+    algorand.get_suggested_params = provider.get  # type: ignore[method-assign]
+    return provider
@@ -0,0 +1,279 @@
+# smart_contracts/event_ticketing/transport.py
+# AlgorandClient örnekleri arasında paylaşılan, keep-alive'lı algod taşıma katmanı.
+#
+# algosdk'nın AlgodClient'ı her istekte urllib ile yeni bir TCP bağlantısı açar;
+# her AlgorandClient da kendi AlgodClient'ını kurar. AlgodTransport tek bir
+# httpx.Client bağlantı havuzunu (üst sınırlı, keep-alive) tüm client'lara açar:
+#   * uç nokta başına eşzamanlılık sınırı (ör. uzun süren wait-for-block
+#     istekleri havuzu tüketmesin),
+#   * isteğe bağlı istek birleştirme: aynı anda uçuşta olan özdeş GET'ler
+#     (suggested params, hesap bilgisi, uygulama durumu) tek istekle yanıtlanır,
+#   * havuz metrikleri: açık bağlantı, bekleme süresi, bağlantı yeniden kullanım oranı.
+#
+# Kullanım:
+#   algorand = pooled(AlgorandClient.default_localnet())   # paylaşılan taşıma
+#   factory = algorand.client.get_typed_app_factory(EventTicketingFactory, ...)
+#   print(shared_transport().metrics)
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import re
+import threading
+import time
+from collections.abc import Mapping
+from concurrent.futures import Future
+from typing import Any
+from urllib import parse
+
+import httpx
+from algokit_utils import AlgorandClient
+from algosdk import constants, error
+from algosdk.v2client.algod import AlgodClient, AlgodResponseType, ParamsType, api_version_path_prefix
+
+DEFAULT_MAX_CONNECTIONS = 32
+# Uzun bekleyen (long-poll) istekler bu kadar bağlantıyla sınırlı
+DEFAULT_ENDPOINT_LIMITS: Mapping[str, int] = {"/v2/status/wait-for-block-after/*": 4}
+DEFAULT_TIMEOUT = 30.0
+
+# Sayısal kimlikler, adresler ve işlem ID'leri uç nokta anahtarında "*" olur
+_ID_SEGMENT = re.compile(r"^(\d+|[A-Z2-7]{52}|[A-Z2-7]{58})$")
+
+
+def endpoint_of(path: str) -> str:
+    """'/v2/accounts/ABC.../assets/5' -> '/v2/accounts/*/assets/*'"""
+    path = path.split("?", 1)[0]
+    return "/".join("*" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/"))
+
+
+@dataclasses.dataclass(frozen=True)
+class PoolMetrics:
+    # Sunucuya giden istekler (birleştirilenler hariç)
+    requests: int
+    # Uçuştaki özdeş bir GET'in yanıtını paylaşan istekler
+    coalesced: int
+    connections_opened: int
+    open_connections: int
+    # Uç nokta sınırı ve havuzdan bağlantı almak için beklenen toplam süre
+    wait_seconds: float
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Var olan bir keep-alive bağlantı üzerinden giden isteklerin oranı."""
+        if not self.requests:
+            return 0.0
+        return max(0.0, 1 - self.connections_opened / self.requests)
+
+    @property
+    def mean_wait_ms(self) -> float:
+        return self.wait_seconds / self.requests * 1_000 if self.requests else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.requests} istek ({self.coalesced} birleştirildi), {self.open_connections} açık bağlantı, "
+            f"yeniden kullanım %{self.reuse_ratio * 100:.1f}, ort. bekleme {self.mean_wait_ms:.2f} ms"
+        )
+
+
+class AlgodTransport:
+    """Birden fazla AlgodClient'ın paylaştığı bağlantı havuzu (iş parçacığı güvenli)"""
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        endpoint_limits: Mapping[str, int] = DEFAULT_ENDPOINT_LIMITS,
+        coalesce_gets: bool = True,
+        timeout: float = DEFAULT_TIMEOUT,
+        transport: httpx.BaseTransport | None = None,
+    ) -> None:
+        if transport is None:
+            limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+            transport = httpx.HTTPTransport(limits=limits)
+        self._http = httpx.Client(timeout=timeout, transport=transport)
+        # httpcore bağlantı havuzu (açık bağlantı sayısı için); özel taşımalarda yok
+        self._pool = getattr(transport, "_pool", None)
+        self._slots = {endpoint: threading.BoundedSemaphore(limit) for endpoint, limit in endpoint_limits.items()}
+        self.coalesce_gets = coalesce_gets
+        self._in_flight: dict[tuple[str, tuple[tuple[str, str], ...]], Future[httpx.Response]] = {}
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._coalesced = 0
+        self._opened = 0
+        self._wait = 0.0
+
+    @property
+    def metrics(self) -> PoolMetrics:
+        with self._lock:
+            return PoolMetrics(
+                requests=self._requests,
+                coalesced=self._coalesced,
+                connections_opened=self._opened,
+                open_connections=len(self._pool.connections) if self._pool is not None else self._opened,
+                wait_seconds=self._wait,
+            )
+
+    def close(self) -> None:
+        self._http.close()
+
+    def __enter__(self) -> AlgodTransport:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Mapping[str, str],
+        data: bytes | None = None,
+        timeout: float | None = None,
+    ) -> httpx.Response:
+        if method != "GET" or not self.coalesce_gets:
+            return self._send(method, url, headers, data, timeout)
+
+        key = (url, tuple(sorted(headers.items())))
+        with self._lock:
+            leader = key not in self._in_flight
+            if leader:
+                future: Future[httpx.Response] = Future()
+                self._in_flight[key] = future
+            else:
+                future = self._in_flight[key]
+                self._coalesced += 1
+        if not leader:
+            return future.result()
+        try:
+            response = self._send(method, url, headers, data, timeout)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+    def _send(
+        self, method: str, url: str, headers: Mapping[str, str], data: bytes | None, timeout: float | None
+    ) -> httpx.Response:
+        slot = self._slots.get(endpoint_of(parse.urlsplit(url).path))
+        started = time.perf_counter()
+        first_event: list[float] = []
+
+        def trace(event: str, _info: Mapping[str, Any]) -> None:
+            # Havuzdan bağlantı alındıktan sonraki ilk olay: yeni bağlantı ya da istek başlığı
+            if not first_event:
+                first_event.append(time.perf_counter())
+            if event == "connection.connect_tcp.complete":
+                with self._lock:
+                    self._opened += 1
+
+        if slot is not None:
+            slot.acquire()
+        try:
+            response = self._http.request(
+                method,
+                url,
+                headers=dict(headers),
+                content=data,
+                timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+                extensions={"trace": trace},
+            )
+        finally:
+            if slot is not None:
+                slot.release()
+            with self._lock:
+                self._requests += 1
+                self._wait += (first_event[0] if first_event else time.perf_counter()) - started
+        return response
+
+
+class PooledAlgodClient(AlgodClient):
+    """İstekleri paylaşılan AlgodTransport üzerinden gönderen AlgodClient"""
+
+    def __init__(
+        self,
+        algod_token: str,
+        algod_address: str,
+        headers: dict[str, str] | None = None,
+        *,
+        transport: AlgodTransport | None = None,
+    ) -> None:
+        super().__init__(algod_token, algod_address, headers)
+        self.transport = transport or shared_transport()
+
+    def algod_request(
+        self,
+        method: str,
+        requrl: str,
+        params: ParamsType | None = None,
+        data: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        response_format: str | None = "json",
+        timeout: int | None = 30,
+    ) -> AlgodResponseType:
+        # AlgodClient.algod_request ile aynı başlık / yol / hata davranışı
+        header = {"User-Agent": "py-algorand-sdk", **(self.headers or {}), **(headers or {})}
+        if requrl not in constants.no_auth:
+            header[constants.algod_auth_header] = self.algod_token
+        if requrl not in constants.unversioned_paths:
+            requrl = api_version_path_prefix + requrl
+        if params:
+            requrl = requrl + "?" + parse.urlencode(params)
+
+        response = self.transport.request(
+            method, self.algod_address + requrl, headers=header, data=data, timeout=timeout
+        )
+        if response.is_error:
+            body: dict[str, Any] = {}
+            message: object = response.text
+            try:
+                body = response.json()
+                message = body["message"]
+            except (ValueError, KeyError):
+                pass
+            raise error.AlgodHTTPError(message, response.status_code, body.get("data"))
+        if response_format != "json":
+            return response.content
+        if not response.content:
+            return {}
+        try:
+            return json.loads(response.content)
+        except ValueError as e:
+            raise error.AlgodResponseError(f"Failed to parse JSON response from algod: {e}") from e
+
+
+_shared: AlgodTransport | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_transport() -> AlgodTransport:
+    """Süreç genelinde paylaşılan varsayılan taşıma (ilk çağrıda kurulur)."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = AlgodTransport()
+        return _shared
+
+
+def pooled(algorand: AlgorandClient, transport: AlgodTransport | None = None) -> AlgorandClient:
+    """
+    `algorand` ile aynı düğümlere bağlı, algod isteklerini `transport` (varsayılan:
+    shared_transport()) üzerinden gönderen yeni bir AlgorandClient döndürür.
+    Bundan türetilen EventTicketingClient / EventTicketingFactory'ler havuzu paylaşır.
+    """
+    algod = algorand.client.algod
+    try:
+        kmd = algorand.client.kmd
+    except ValueError:
+        kmd = None
+    return AlgorandClient.from_clients(
+        algod=PooledAlgodClient(algod.algod_token, algod.algod_address, algod.headers, transport=transport),
+        indexer=algorand.client.indexer_if_present,
+        kmd=kmd,
+    )
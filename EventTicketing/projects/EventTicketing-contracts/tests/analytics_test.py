@@ -0,0 +1,90 @@
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from smart_contracts.event_ticketing.analytics import (  # noqa: E402
+    SalesColumns,
+    revenue_by_hour,
+    sell_through,
+    time_to_sellout,
+    top_buyers,
+    write_csv,
+)
+from smart_contracts.event_ticketing.stream import SaleCursor, SaleEvent  # noqa: E402
+
+APP_A, APP_B = 1001, 2002
+HOUR = 3_600
+
+
+def _sale(app_id: int, round_: int, timestamp: int, buyer: str, count: int = 1) -> SaleEvent:
+    return SaleEvent(
+        app_id=app_id,
+        buyer=buyer,
+        count=count,
+        amount=count * 1_000,
+        round=round_,
+        timestamp=timestamp,
+        txid=f"TX{round_}",
+        cursor=SaleCursor(round_, 0),
+    )
+
+
+@pytest.fixture()
+def sales() -> SalesColumns:
+    return SalesColumns.from_sales(
+        [
+            _sale(APP_B, 1, 10, "bob", 2),
+            _sale(APP_A, 2, 20, "alice"),
+            _sale(APP_A, 3, HOUR + 5, "bob", 2),
+            _sale(APP_B, 4, HOUR + 30, "alice"),
+        ]
+    )
+
+
+def test_revenue_by_hour(sales: SalesColumns) -> None:
+    table = revenue_by_hour(sales)
+
+    assert table["app_id"].tolist() == [APP_A, APP_A, APP_B, APP_B]
+    assert table["hour"].tolist() == [0, HOUR, 0, HOUR]
+    assert table["revenue"].tolist() == [1_000, 2_000, 2_000, 1_000]
+
+
+def test_sell_through_resets_per_event(sales: SalesColumns) -> None:
+    curve = sell_through(sales, {APP_A: 3, APP_B: 4})
+
+    assert curve["app_id"].tolist() == [APP_A, APP_A, APP_B, APP_B]
+    assert curve["sold"].tolist() == [1, 3, 2, 3]
+    assert curve["sell_through"].tolist() == [pytest.approx(1 / 3), 1.0, 0.5, 0.75]
+
+
+def test_time_to_sellout(sales: SalesColumns) -> None:
+    table = time_to_sellout(sales, {APP_A: 3, APP_B: 4})
+
+    assert table["seconds"].tolist() == [HOUR + 5 - 20, -1]
+    assert table["sold"].tolist() == [3, 3]
+
+
+def test_top_buyers(sales: SalesColumns) -> None:
+    table = top_buyers(sales, limit=1)
+
+    assert sales.buyers[table["buyer_id"]].tolist() == ["bob"]
+    assert table["tickets"].tolist() == [4]
+
+
+def test_empty_history() -> None:
+    empty = SalesColumns.from_sales([])
+
+    assert len(revenue_by_hour(empty)["revenue"]) == 0
+    assert len(time_to_sellout(empty, {})["app_id"]) == 0
+
+
+def test_write_csv(sales: SalesColumns, tmp_path: Path) -> None:
+    path = tmp_path / "revenue.csv"
+
+    write_csv(revenue_by_hour(sales), path)
+
+    lines = path.read_text().splitlines()
+    assert lines[0] == "app_id,hour,revenue,tickets"
+    assert lines[1] == f"{APP_A},0,1000,1"
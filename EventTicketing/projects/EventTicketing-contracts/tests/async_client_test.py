@@ -0,0 +1,155 @@
+import asyncio
+import base64
+import json
+import struct
+
+import httpx
+import msgpack
+import pytest
+from algokit_utils import AlgoAmount, CommonAppCallParams, PaymentParams
+from algosdk import account, encoding
+from algosdk.atomic_transaction_composer import AccountTransactionSigner
+from algosdk.error import AlgodHTTPError
+
+from smart_contracts.artifacts.event_ticketing.event_ticketing_client import SaleInfo, SaleParams
+from smart_contracts.event_ticketing.async_algod import AsyncAlgodClient
+from smart_contracts.event_ticketing.async_client import AsyncEventTicketingClient
+
+APP_ID = 1001
+PRIVATE_KEY, BUYER = account.generate_account()
+SIGNER = AccountTransactionSigner(PRIVATE_KEY)
+RETURN_PREFIX = bytes.fromhex("151f7c75")
+SALE_INFO_LOG = RETURN_PREFIX + struct.pack(">QQQQHH", 77, 1_000, 10, 3, 34, 6) + b"Konser"
+
+
+class FakeAlgod:
+    """httpx.MockTransport arkasında çalışan en küçük algod taklidi"""
+
+    def __init__(self) -> None:
+        self.sent: list[list[dict]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # Diğer isteklerin araya girebilmesi için olay döngüsüne dön
+            await asyncio.sleep(0)
+            return self._route(request)
+        finally:
+            self.in_flight -= 1
+
+    def _route(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == "/v2/transactions/params":
+            return _json(
+                {
+                    "fee": 0,
+                    "min-fee": 1_000,
+                    "last-round": 10,
+                    "genesis-hash": base64.b64encode(bytes(32)).decode(),
+                    "genesis-id": "test-v1",
+                    "consensus-version": "future",
+                }
+            )
+        if path == "/v2/transactions" and request.method == "POST":
+            group = [msgpack.unpackb(b, raw=False) for b in _split(request.content)]
+            self.sent.append(group)
+            return _json({"txId": "TX"})
+        if path == "/v2/status":
+            return _json({"last-round": 10})
+        if path.startswith("/v2/transactions/pending/"):
+            return _json({"confirmed-round": 11, "logs": []})
+        if path == "/v2/transactions/simulate":
+            log = base64.b64encode(SALE_INFO_LOG).decode()
+            return _json({"last-round": 10, "txn-groups": [{"txn-results": [{"txn-result": {"logs": [log]}}]}]})
+        if path == f"/v2/applications/{APP_ID}":
+            params = base64.b64encode(struct.pack(">QQQQ", 1_000, 10, 77, 2)).decode()
+            state = [
+                {"key": base64.b64encode(b"params").decode(), "value": {"type": 1, "bytes": params}},
+                {"key": base64.b64encode(b"sold").decode(), "value": {"type": 2, "uint": 3}},
+                {"key": base64.b64encode(b"name").decode(), "value": {"type": 1, "bytes": "S29uc2Vy"}},
+            ]
+            return _json({"params": {"global-state": state}})
+        return _json({"message": "bulunamadı"}, status=404)
+
+
+def _json(body: dict, status: int = 200) -> httpx.Response:
+    return httpx.Response(status, content=json.dumps(body).encode())
+
+
+def _split(body: bytes) -> list[bytes]:
+    unpacker = msgpack.Unpacker(raw=False)
+    unpacker.feed(body)
+    return [msgpack.packb(obj) for obj in unpacker]
+
+
+def _client(fake: FakeAlgod) -> AsyncEventTicketingClient:
+    algod = AsyncAlgodClient("a" * 64, "http://algod", transport=httpx.MockTransport(fake))
+    return AsyncEventTicketingClient(algod, APP_ID, default_sender=BUYER, default_signer=SIGNER)
+
+
+def test_buy_ticket_sends_payment_and_call_as_one_group() -> None:
+    fake = FakeAlgod()
+    client = _client(fake)
+    pay = PaymentParams(sender=BUYER, receiver=client.app_address, amount=AlgoAmount.from_micro_algo(1_000))
+
+    result = asyncio.run(
+        client.send.buy_ticket(args=(pay,), params=CommonAppCallParams(extra_fee=AlgoAmount.from_micro_algo(1_000)))
+    )
+
+    (group,) = fake.sent
+    payment, call = (stxn["txn"] for stxn in group)
+    assert payment["type"] == "pay" and payment["grp"] == call["grp"]
+    assert call["apid"] == APP_ID and call["fee"] == 2_000
+    # Bilet ASA'sı ve alıcı kutusu otomatik eklenir
+    assert call["apas"] == [77]
+    assert call["apbx"] == [{"n": b"p" + encoding.decode_address(BUYER)}]
+    assert result.confirmation == {"confirmed-round": 11, "logs": []}
+    assert result.abi_return is None
+
+
+def test_concurrent_buys_share_one_event_loop() -> None:
+    fake = FakeAlgod()
+    client = _client(fake)
+
+    async def buy_many() -> None:
+        pay = PaymentParams(sender=BUYER, receiver=client.app_address, amount=AlgoAmount.from_micro_algo(1_000))
+        await asyncio.gather(*(client.send.buy_tickets(args=(pay, 2)) for _ in range(50)))
+
+    asyncio.run(buy_many())
+
+    assert len(fake.sent) == 50
+    assert fake.max_in_flight > 1
+
+
+def test_readonly_method_is_simulated_and_decoded_to_struct() -> None:
+    fake = FakeAlgod()
+
+    result = asyncio.run(_client(fake).send.get_sale_info())
+
+    assert fake.sent == []
+    assert result.abi_return == SaleInfo(
+        ticket_asa_id=77, ticket_price=1_000, total_tickets=10, tickets_sold=3, event_name="Konser"
+    )
+
+
+def test_global_state_is_decoded() -> None:
+    state = asyncio.run(_client(FakeAlgod()).state.global_state.get_all())
+
+    assert state == {
+        "sale_params": SaleParams(ticket_price=1_000, total_tickets=10, ticket_asa_id=77, max_per_address=2),
+        "tickets_sold": 3,
+        "event_name": "Konser",
+    }
+
+
+def test_http_errors_raise_algod_http_error() -> None:
+    client = _client(FakeAlgod())
+
+    with pytest.raises(AlgodHTTPError) as e:
+        asyncio.run(client.algod.request("GET", "/nope"))
+
+    assert e.value.code == 404
+    assert encoding.is_valid_address(client.app_address)
@@ -0,0 +1,96 @@
+import base64
+import math
+
+import pytest
+from algokit_utils import AlgoAmount, AlgorandClient, CommonAppCallParams, PaymentParams
+from algosdk import account, encoding
+from algosdk.atomic_transaction_composer import AccountTransactionSigner, TransactionWithSigner
+from algosdk.transaction import SuggestedParams, Transaction
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.artifacts.event_ticketing.event_ticketing_client import EventTicketingClient
+from smart_contracts.event_ticketing.batch_signer import BatchSigner, unsigned_group
+from smart_contracts.event_ticketing.ledger import purchase_box_name
+
+APP_ID = 1_234
+ASA_ID = 77
+SP = SuggestedParams(0, 100, 1_100, base64.b64encode(bytes(32)).decode(), min_fee=1_000, flat_fee=False)
+
+
+def _client() -> EventTicketingClient:
+    # Sabit suggested params ile algod'a hiç gidilmeden gruplar kurulur
+    algorand = AlgorandClient.from_clients(AlgodClient("a" * 64, "http://127.0.0.1:1"))
+    algorand.set_suggested_params_cache(SP, until=math.inf)
+    return EventTicketingClient(app_id=APP_ID, algorand=algorand)
+
+
+def _groups(
+    client: EventTicketingClient, keys: list[str], count: int, *, references: bool = True
+) -> list[list[Transaction]]:
+    groups = []
+    for n in range(count):
+        group = client.new_group()
+        for i, key in enumerate(keys):
+            sender = account.address_from_private_key(key)
+            signer = AccountTransactionSigner(key)
+            payment = client.algorand.create_transaction.payment(
+                PaymentParams(
+                    sender=sender,
+                    receiver=client.app_address,
+                    amount=AlgoAmount.from_micro_algo(1_000),
+                    note=f"{n}:{i}".encode(),
+                )
+            )
+            group.buy_ticket(
+                args=(TransactionWithSigner(payment, signer),),
+                params=CommonAppCallParams(
+                    sender=sender,
+                    signer=signer,
+                    note=f"{n}:{i}".encode(),
+                    asset_references=[ASA_ID] if references else None,
+                    box_references=[purchase_box_name(sender)] if references else None,
+                ),
+            )
+        groups.append(unsigned_group(group))
+    return groups
+
+
+def _reference(groups: list[list[Transaction]], keys: list[str]) -> list[bytes]:
+    signers = {account.address_from_private_key(k): AccountTransactionSigner(k) for k in keys}
+    blobs = []
+    for group in groups:
+        blob = b""
+        for txn in group:
+            (signed,) = signers[txn.sender].sign_transactions([txn], [0])
+            blob += base64.b64decode(encoding.msgpack_encode(signed))
+        blobs.append(blob)
+    return blobs
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_matches_account_signer_and_keeps_order(workers: int) -> None:
+    keys = [account.generate_account()[0] for _ in range(3)]
+    groups = _groups(_client(), keys, 10)
+
+    with BatchSigner(keys, workers=workers, chunk_groups=3) as signer:
+        signed = list(signer.sign_groups(groups))
+
+    assert [s.blob for s in signed] == _reference(groups, keys)
+    assert [s.tx_ids for s in signed] == [[t.get_txid() for t in g] for g in groups]
+    # Her grup kendi grup ID'sini taşır
+    assert len({g[0].group for g in groups}) == 10
+
+
+def test_unknown_sender_is_rejected() -> None:
+    keys = [account.generate_account()[0]]
+    groups = _groups(_client(), keys, 1)
+
+    with BatchSigner([account.generate_account()[0]], workers=1) as signer, pytest.raises(ValueError):
+        list(signer.sign_groups(groups))
+
+
+def test_purchase_without_references_is_rejected() -> None:
+    keys = [account.generate_account()[0]]
+
+    with pytest.raises(ValueError, match="referans"):
+        _groups(_client(), keys, 1, references=False)
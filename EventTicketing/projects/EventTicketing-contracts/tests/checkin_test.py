@@ -0,0 +1,43 @@
+import pytest
+
+from smart_contracts.event_ticketing.checkin import (
+    CHECKIN_BOX_NAME,
+    CHECKIN_MAX_TICKETS,
+    CheckinBitmap,
+    checkin_bitmap_size,
+    checkin_box_mbr,
+    checkin_box_references,
+)
+
+
+def test_bitmap_for_50k_seats_is_about_6kb() -> None:
+    assert checkin_bitmap_size(50_000) == 6_250
+    # 2500 + 400 * (7 bayt ad + 6250 bayt değer)
+    assert checkin_box_mbr(50_000) == 2_505_300
+
+
+def test_box_references_cover_io_budget() -> None:
+    assert checkin_box_references(100) == [CHECKIN_BOX_NAME]
+    refs = checkin_box_references(50_000)
+    assert refs[0] == CHECKIN_BOX_NAME
+    assert len(refs) == 7
+    with pytest.raises(ValueError):
+        checkin_box_references(CHECKIN_MAX_TICKETS + 1)
+
+
+def test_bitmap_bit_order_matches_contract() -> None:
+    bitmap = CheckinBitmap(bits=bytearray(b"\x91\x00\x00"), total_tickets=20, round=1)
+
+    assert [i for i in range(20) if bitmap.is_redeemed(i)] == [0, 3, 7]
+    assert bitmap.redeemed_count == 3
+
+
+def test_mark_updates_local_copy() -> None:
+    bitmap = CheckinBitmap(bits=bytearray(3), total_tickets=20, round=1)
+
+    bitmap.mark(9)
+
+    assert bytes(bitmap.bits) == b"\x00\x40\x00"
+    assert bitmap.is_redeemed(9)
+    with pytest.raises(IndexError):
+        bitmap.is_redeemed(20)
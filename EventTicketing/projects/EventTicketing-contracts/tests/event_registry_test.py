@@ -0,0 +1,148 @@
+from collections.abc import Iterator
+
+import pytest
+from algopy import Bytes, Global, String, UInt64, arc4, op
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.event_registry.contract import (
+    BOX_BYTE_MIN_BALANCE,
+    BOX_FLAT_MIN_BALANCE,
+    EVENT_BOX_KEY_SIZE,
+    EVENT_INFO_FIXED_SIZE,
+    EventRegistry,
+)
+
+ARC4_RETURN_PREFIX = Bytes(b"\x15\x1f\x7c\x75")
+
+
+@pytest.fixture()
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as ctx:
+        yield ctx
+
+
+def _deposit(event_name: str = "Konser") -> int:
+    # Kontrattaki _event_deposit: kutu MBR'si + uygulamanın tutacağı ASA
+    box_bytes = EVENT_BOX_KEY_SIZE + EVENT_INFO_FIXED_SIZE + len(event_name.encode())
+    return BOX_FLAT_MIN_BALANCE + BOX_BYTE_MIN_BALANCE * box_bytes + Global.asset_create_min_balance.value
+
+
+def _create_event(
+    context: AlgopyTestContext, contract: EventRegistry, price: int = 10, total: int = 100, deposit: int | None = None
+) -> UInt64:
+    app = context.ledger.get_app(contract)
+    amount = _deposit() if deposit is None else deposit
+    payment = context.any.txn.payment(receiver=app.address, amount=UInt64(amount))
+    return contract.create_event(payment, String("Konser"), UInt64(price), UInt64(total))
+
+
+def _start_sale(context: AlgopyTestContext, contract: EventRegistry, price: int = 10, total: int = 100) -> UInt64:
+    event_id = _create_event(context, contract, price=price, total=total)
+    asset = context.any.asset(total=UInt64(total))
+    record = contract.events[event_id].copy()
+    record.ticket_asa_id = arc4.UInt64(asset.id)
+    contract.events[event_id] = record.copy()
+    return event_id
+
+
+def test_create_event_assigns_sequential_ids(context: AlgopyTestContext) -> None:
+    contract = EventRegistry()
+
+    first = _create_event(context, contract)
+    second = _create_event(context, contract)
+
+    assert (first, second) == (1, 2)
+    assert contract.next_event_id.value == 3
+
+
+def test_create_event_stores_organizer_and_parameters(context: AlgopyTestContext) -> None:
+    contract = EventRegistry()
+
+    event_id = _create_event(context, contract, price=10, total=100)
+
+    info = contract.get_event(event_id)
+    assert info.organizer == arc4.Address(context.default_sender)
+    assert info.ticket_price == 10
+    assert info.total_tickets == 100
+    assert info.tickets_sold == 0
+    assert info.ticket_asa_id == 0
+    assert info.event_name == "Konser"
+
+
+def test_create_event_rejects_short_deposit(context: AlgopyTestContext) -> None:
+    contract = EventRegistry()
+
+    with pytest.raises(AssertionError, match="karşılamıyor"):
+        _create_event(context, contract, deposit=_deposit() - 1)
+
+
+def test_buy_ticket_pays_organizer_and_transfers_one_ticket(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = EventRegistry()
+    event_id = _start_sale(context, contract, price=10)
+    payment = context.any.txn.payment(receiver=context.default_sender, amount=UInt64(10))
+
+    # Act
+    contract.buy_ticket(event_id, payment)
+
+    # Assert
+    transfer = context.txn.last_group.last_itxn.asset_transfer
+    info = contract.get_event(event_id)
+    assert info.tickets_sold == 1
+    assert transfer.xfer_asset.id == info.ticket_asa_id.native
+    assert transfer.asset_amount == 1
+
+
+def test_buy_ticket_rejects_payment_to_registry(context: AlgopyTestContext) -> None:
+    contract = EventRegistry()
+    event_id = _start_sale(context, contract, price=10)
+    app = context.ledger.get_app(contract)
+
+    with pytest.raises(AssertionError, match="organizatörüne"):
+        contract.buy_ticket(event_id, context.any.txn.payment(receiver=app.address, amount=UInt64(10)))
+
+
+def test_buy_ticket_rejects_unknown_event(context: AlgopyTestContext) -> None:
+    contract = EventRegistry()
+    _start_sale(context, contract)
+
+    with pytest.raises(AssertionError, match="bulunamadı"):
+        contract.buy_ticket(UInt64(99), context.any.txn.payment(receiver=context.default_sender, amount=UInt64(10)))
+
+
+def test_events_are_independent(context: AlgopyTestContext) -> None:
+    contract = EventRegistry()
+    first = _start_sale(context, contract, price=10)
+    second = _start_sale(context, contract, price=20)
+
+    contract.buy_ticket(second, context.any.txn.payment(receiver=context.default_sender, amount=UInt64(20)))
+
+    assert contract.get_event(first).tickets_sold == 0
+    assert contract.get_event(second).tickets_sold == 1
+
+
+def test_mint_tickets_zero_uses_event_created_earlier_in_group(context: AlgopyTestContext) -> None:
+    # Arrange: grupta önce create_event çağrısı (ABI dönüşü son log'da), ardından mint_tickets(0)
+    contract = EventRegistry()
+    event_id = _create_event(context, contract)
+    create_call = context.any.txn.application_call(
+        app_id=context.ledger.get_app(contract),
+        app_args=[arc4.arc4_signature(EventRegistry.create_event)],
+        logs=[ARC4_RETURN_PREFIX + op.itob(event_id)],
+    )
+    mint = context.txn.defer_app_call(contract.mint_tickets, UInt64(0))
+
+    # Act
+    with context.txn.create_group([create_call, mint]):
+        asset = mint.submit()
+
+    # Assert
+    assert contract.get_event(event_id).ticket_asa_id == asset.id
+
+
+def test_mint_tickets_zero_requires_create_event_in_group(context: AlgopyTestContext) -> None:
+    contract = EventRegistry()
+    _create_event(context, contract)
+
+    with pytest.raises(AssertionError, match="create_event"):
+        contract.mint_tickets(UInt64(0))
@@ -1,15 +1,21 @@
-import algokit_utils
 import pytest
 from algokit_utils import (
     AlgoAmount,
     AlgorandClient,
+    AssetOptInParams,
+    CommonAppCallParams,
+    PaymentParams,
     SigningAccount,
 )
 
+from benchmarks.costs import DEFAULT_THRESHOLD, compare, load_baseline, measure_costs
 from smart_contracts.artifacts.event_ticketing.event_ticketing_client import (
     EventTicketingClient,
     EventTicketingFactory,
 )
+from smart_contracts.event_ticketing.deploy_config import fund_and_mint
+
+TICKET_PRICE = 1_000
 
 
 @pytest.fixture()
@@ -29,27 +35,42 @@ def event_ticketing_client(
         EventTicketingFactory, default_sender=deployer.address
     )
 
-    client, _ = factory.deploy(
-        on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
-        on_update=algokit_utils.OnUpdate.AppendApp,
-    )
+    client, _ = factory.send.create.create_application(args=("Test Konseri", TICKET_PRICE, 10, 0))
+    fund_and_mint(client, deployer.signer)
     return client
 
 
-def test_says_hello(event_ticketing_client: EventTicketingClient) -> None:
-    result = event_ticketing_client.send.hello(args=("World",))
-    assert result.abi_return == "Hello, World"
-
-
-def test_simulate_says_hello_with_correct_budget_consumed(
-    event_ticketing_client: EventTicketingClient,
+def test_buy_ticket_transfers_one_ticket(
+    algorand_client: AlgorandClient, event_ticketing_client: EventTicketingClient
 ) -> None:
-    result = (
-        event_ticketing_client.new_group()
-        .hello(args=("World",))
-        .hello(args=("Jane",))
-        .simulate()
+    buyer = algorand_client.account.random()
+    algorand_client.account.ensure_funded_from_environment(
+        account_to_fund=buyer.address, min_spending_balance=AlgoAmount.from_algo(1)
+    )
+    asa_id = event_ticketing_client.state.global_state.sale_params.ticket_asa_id
+    algorand_client.send.asset_opt_in(AssetOptInParams(sender=buyer.address, asset_id=asa_id))
+
+    payment = algorand_client.create_transaction.payment(
+        PaymentParams(
+            sender=buyer.address,
+            receiver=event_ticketing_client.app_address,
+            amount=AlgoAmount.from_micro_algo(TICKET_PRICE),
+        )
     )
-    assert result.returns[0].value == "Hello, World"
-    assert result.returns[1].value == "Hello, Jane"
-    assert result.simulate_response["txn-groups"][0]["app-budget-consumed"] < 100
+    event_ticketing_client.send.buy_ticket(
+        args=(payment,),
+        params=CommonAppCallParams(sender=buyer.address, extra_fee=AlgoAmount.from_micro_algo(1_000)),
+    )
+
+    assert event_ticketing_client.state.global_state.tickets_sold == 1
+    holding = algorand_client.asset.get_account_information(buyer.address, asa_id)
+    assert holding.balance == 1
+
+
+def test_simulated_costs_do_not_regress(algorand_client: AlgorandClient, deployer: SigningAccount) -> None:
+    baseline = load_baseline()
+    assert baseline is not None, "benchmarks/cost_baseline.json yok; 'python -m benchmarks.costs --update' çalıştırın"
+
+    current = measure_costs(algorand_client, deployer)
+
+    assert compare(current, baseline, DEFAULT_THRESHOLD) == []
@@ -1,9 +1,10 @@
 from collections.abc import Iterator
 
 import pytest
+from algopy import Asset, String, UInt64, arc4
 from algopy_testing import AlgopyTestContext, algopy_testing_context
 
-from smart_contracts.event_ticketing.contract import EventTicketing
+from smart_contracts.event_ticketing.contract import EventTicketing, SaleParams
 
 
 @pytest.fixture()
@@ -12,13 +13,173 @@ def context() -> Iterator[AlgopyTestContext]:
         yield ctx
 
 
-def test_hello(context: AlgopyTestContext) -> None:
+def test_create_application_stores_sale_params(context: AlgopyTestContext) -> None:
     # Arrange
-    dummy_input = context.any.string(length=10)
     contract = EventTicketing()
 
     # Act
-    output = contract.hello(dummy_input)
+    contract.create_application(String("Konser"), UInt64(10), UInt64(100), UInt64(4))
 
     # Assert
-    assert output == f"Hello, {dummy_input}"
+    params = contract.sale_params.value
+    assert contract.event_name.value == "Konser"
+    assert params.ticket_price == 10
+    assert params.total_tickets == 100
+    assert params.ticket_asa_id == 0
+    assert params.max_per_address == 4
+    assert contract.tickets_sold.value == 0
+
+
+def _start_sale(
+    context: AlgopyTestContext, contract: EventTicketing, price: int = 10, total: int = 100, max_per_address: int = 0
+) -> Asset:
+    contract.create_application(String("Konser"), UInt64(price), UInt64(total), UInt64(max_per_address))
+    asset = context.any.asset(total=UInt64(total))
+    contract.sale_params.value = SaleParams(
+        ticket_price=arc4.UInt64(price),
+        total_tickets=arc4.UInt64(total),
+        ticket_asa_id=arc4.UInt64(asset.id),
+        max_per_address=arc4.UInt64(max_per_address),
+    )
+    return asset
+
+
+def test_buy_tickets_sends_all_units_in_one_transfer(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = EventTicketing()
+    asset = _start_sale(context, contract)
+    app = context.ledger.get_app(contract)
+    payment = context.any.txn.payment(receiver=app.address, amount=UInt64(60))
+
+    # Act
+    contract.buy_tickets(payment, UInt64(6))
+
+    # Assert
+    assert contract.tickets_sold.value == 6
+    transfer = context.txn.last_group.last_itxn.asset_transfer
+    assert transfer.xfer_asset == asset
+    assert transfer.asset_amount == 6
+
+
+def test_buy_tickets_rejects_wrong_payment_amount(context: AlgopyTestContext) -> None:
+    contract = EventTicketing()
+    _start_sale(context, contract)
+    app = context.ledger.get_app(contract)
+    payment = context.any.txn.payment(receiver=app.address, amount=UInt64(10))
+
+    with pytest.raises(AssertionError, match="eşleşmiyor"):
+        contract.buy_tickets(payment, UInt64(6))
+
+
+def test_buy_tickets_rejects_more_than_remaining(context: AlgopyTestContext) -> None:
+    contract = EventTicketing()
+    _start_sale(context, contract, total=5)
+    app = context.ledger.get_app(contract)
+    payment = context.any.txn.payment(receiver=app.address, amount=UInt64(60))
+
+    with pytest.raises(AssertionError, match="kalmadı"):
+        contract.buy_tickets(payment, UInt64(6))
+
+
+def test_get_sale_info_returns_all_fields(context: AlgopyTestContext) -> None:
+    contract = EventTicketing()
+    asset = _start_sale(context, contract, price=10, total=100)
+    contract.tickets_sold.value = UInt64(7)
+
+    info = contract.get_sale_info()
+
+    assert info.ticket_asa_id == asset.id
+    assert info.ticket_price == 10
+    assert info.total_tickets == 100
+    assert info.tickets_sold == 7
+    assert info.event_name == "Konser"
+
+
+def test_purchases_are_recorded_per_buyer(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = EventTicketing()
+    _start_sale(context, contract, price=10)
+    app = context.ledger.get_app(contract)
+
+    # Act
+    context.ledger.patch_global_fields(round=UInt64(10))
+    contract.buy_ticket(context.any.txn.payment(receiver=app.address, amount=UInt64(10)))
+    context.ledger.patch_global_fields(round=UInt64(12))
+    contract.buy_tickets(context.any.txn.payment(receiver=app.address, amount=UInt64(30)), UInt64(3))
+
+    # Assert
+    record = contract.get_purchase(arc4.Address(context.default_sender))
+    assert record.count == 4
+    assert record.first_round == 10
+    assert record.last_round == 12
+
+
+def test_get_purchase_returns_zero_record_for_unknown_buyer(context: AlgopyTestContext) -> None:
+    contract = EventTicketing()
+    _start_sale(context, contract)
+
+    record = contract.get_purchase(arc4.Address(context.any.account()))
+
+    assert record.count == 0
+    assert record.first_round == 0
+
+
+def test_buy_tickets_enforces_max_per_address(context: AlgopyTestContext) -> None:
+    contract = EventTicketing()
+    _start_sale(context, contract, price=10, max_per_address=3)
+    app = context.ledger.get_app(contract)
+    contract.buy_tickets(context.any.txn.payment(receiver=app.address, amount=UInt64(20)), UInt64(2))
+
+    with pytest.raises(AssertionError, match="sınırı aşıldı"):
+        contract.buy_tickets(context.any.txn.payment(receiver=app.address, amount=UInt64(20)), UInt64(2))
+
+
+def test_zero_max_per_address_means_unlimited(context: AlgopyTestContext) -> None:
+    contract = EventTicketing()
+    _start_sale(context, contract, price=10, max_per_address=0)
+    app = context.ledger.get_app(contract)
+
+    contract.buy_tickets(context.any.txn.payment(receiver=app.address, amount=UInt64(500)), UInt64(50))
+
+    assert contract.get_purchase(arc4.Address(context.default_sender)).count == 50
+
+
+def _open_gates(contract: EventTicketing, total: int) -> None:
+    contract.checkins.create(size=UInt64((total + 7) // 8))
+
+
+def test_redeem_marks_ticket_once(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = EventTicketing()
+    _start_sale(context, contract, total=20)
+    _open_gates(contract, 20)
+
+    # Act
+    contract.redeem(UInt64(9))
+
+    # Assert: bilet 9 -> bayt 1, en anlamlı bitten 1. bit
+    assert contract.checkins.value == b"\x00\x40\x00"
+    with pytest.raises(AssertionError, match="zaten kullanılmış"):
+        contract.redeem(UInt64(9))
+
+
+def test_redeem_rejects_index_past_total(context: AlgopyTestContext) -> None:
+    contract = EventTicketing()
+    _start_sale(context, contract, total=20)
+    _open_gates(contract, 20)
+
+    with pytest.raises(AssertionError, match="Geçersiz bilet numarası"):
+        contract.redeem(UInt64(20))
+
+
+def test_redeem_batch_returns_already_used_tickets(context: AlgopyTestContext) -> None:
+    contract = EventTicketing()
+    _start_sale(context, contract, total=20)
+    _open_gates(contract, 20)
+    contract.redeem(UInt64(3))
+
+    indices = arc4.DynamicArray[arc4.UInt32](arc4.UInt32(0), arc4.UInt32(3), arc4.UInt32(7), arc4.UInt32(7))
+    rejected = contract.redeem_batch(indices)
+
+    assert [int(i.native) for i in rejected] == [3, 7]
+    assert contract.checkins.value == b"\x91\x00\x00"
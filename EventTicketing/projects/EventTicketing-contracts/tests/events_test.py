@@ -0,0 +1,38 @@
+import base64
+
+from algosdk import abi, account
+
+from smart_contracts.event_ticketing.events import (
+    TICKET_SOLD_SELECTOR,
+    TICKETS_MINTED_SELECTOR,
+    TicketsMinted,
+    TicketSold,
+    decode_event,
+    decode_logs,
+)
+
+BUYER = account.generate_account()[1]
+
+
+def _sold_log(count: int, sold_after: int) -> bytes:
+    return TICKET_SOLD_SELECTOR + abi.ABIType.from_string("(address,uint64,uint64)").encode([BUYER, count, sold_after])
+
+
+def test_selectors_follow_arc28() -> None:
+    # sha512/256("TicketSold(address,uint64,uint64)")[:4]; ABI yöntem seçicisinden farklı olarak dönüş tipi yok
+    assert TICKET_SOLD_SELECTOR != abi.Method.from_signature("TicketSold(address,uint64,uint64)void").get_selector()
+    assert len(TICKETS_MINTED_SELECTOR) == 4
+
+
+def test_decode_event() -> None:
+    minted = TICKETS_MINTED_SELECTOR + (42).to_bytes(8, "big") + (100).to_bytes(8, "big")
+
+    assert decode_event(_sold_log(3, 10)) == TicketSold(buyer=BUYER, count=3, sold_after=10)
+    assert decode_event(minted) == TicketsMinted(asa_id=42, total=100)
+    assert decode_event(b"\x00\x01\x02\x03") is None
+
+
+def test_decode_logs_accepts_base64_from_confirmation() -> None:
+    logs = [base64.b64encode(_sold_log(1, 5)).decode(), base64.b64encode(b"baska log").decode()]
+
+    assert list(decode_logs(logs)) == [TicketSold(buyer=BUYER, count=1, sold_after=5)]
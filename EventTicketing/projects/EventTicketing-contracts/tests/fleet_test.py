@@ -0,0 +1,113 @@
+import base64
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from algokit_utils import AlgorandClient, SigningAccount
+from algosdk.account import generate_account
+
+from smart_contracts.event_ticketing.fleet import Checkpoint, EventSpec, FleetDeployer, load_manifest
+
+
+def _fleet(tmp_path: Path, algorand: AlgorandClient | None = None) -> FleetDeployer:
+    private_key, _ = generate_account()
+    return FleetDeployer(
+        algorand or AlgorandClient.default_localnet(),
+        SigningAccount(private_key=private_key),
+        Checkpoint(tmp_path / "c.json"),
+    )
+
+
+class FakeIndexer:
+    """search_transactions için tek sayfalık sabit yanıt."""
+
+    def __init__(self, transactions: list[dict[str, Any]], current_round: int) -> None:
+        self.transactions = transactions
+        self.current_round = current_round
+        self.queries: list[dict[str, Any]] = []
+
+    def search_transactions(self, **kwargs: Any) -> dict[str, Any]:
+        self.queries.append(kwargs)
+        return {"transactions": self.transactions, "current-round": self.current_round}
+
+
+def _created(key: str, confirmed_round: int, app_id: int) -> dict[str, Any]:
+    return {
+        "note": base64.b64encode(f"fleet:{key}".encode()).decode(),
+        "confirmed-round": confirmed_round,
+        "created-application-index": app_id,
+    }
+
+
+def test_load_csv_manifest_defaults_key_to_name(tmp_path: Path) -> None:
+    manifest = tmp_path / "events.csv"
+    manifest.write_text("name,ticket_price,total_tickets\nKonser A,1000000,100\nKonser B,500000,50\n", encoding="utf-8")
+
+    specs = load_manifest(manifest)
+
+    assert specs == [
+        EventSpec(key="Konser A", name="Konser A", ticket_price=1_000_000, total_tickets=100),
+        EventSpec(key="Konser B", name="Konser B", ticket_price=500_000, total_tickets=50),
+    ]
+
+
+def test_load_json_manifest_rejects_duplicate_keys(tmp_path: Path) -> None:
+    manifest = tmp_path / "events.json"
+    manifest.write_text(
+        json.dumps([{"key": "e1", "name": "A", "ticket_price": 1, "total_tickets": 1}] * 2), encoding="utf-8"
+    )
+
+    with pytest.raises(ValueError, match="e1"):
+        load_manifest(manifest)
+
+
+def test_checkpoint_survives_restart(tmp_path: Path) -> None:
+    path = tmp_path / "checkpoint.json"
+    Checkpoint(path).update({"e1": {"app_id": 1001}})
+    Checkpoint(path).update({"e1": {"funded": True}})
+
+    resumed = Checkpoint(path)
+
+    assert resumed.get("e1", "app_id") == 1001
+    assert resumed.get("e1", "funded") is True
+    assert resumed.get("e2", "app_id") is None
+
+
+def test_parallel_failures_are_all_counted(tmp_path: Path) -> None:
+    fleet = _fleet(tmp_path)
+
+    def fail(_: int) -> None:
+        raise RuntimeError("algod yok")
+
+    fleet._parallel(list(range(200)), fail, "test")
+
+    assert fleet.report.failed == 200
+
+
+def test_reconcile_recovers_creates_sent_before_a_crash(tmp_path: Path) -> None:
+    spec = [EventSpec(key=k, name=k, ticket_price=1, total_tickets=1) for k in ("e1", "e2", "e3")]
+    # e3'ün penceresi kapandı; onaylanmadıysa artık onaylanamaz
+    indexer = FakeIndexer([_created("e1", 12, 77), _created("e2", 5, 78)], current_round=20)
+    fleet = _fleet(tmp_path, AlgorandClient.from_clients(algod=None, indexer=indexer))  # type: ignore[arg-type]
+    fleet.checkpoint.update({"e1": {"create_window": [10, 1010]}, "e2": {"create_window": [10, 1010]}})
+    fleet.checkpoint.update({"e3": {"create_window": [1, 15]}})
+
+    unsettled = fleet.reconcile(spec)
+
+    assert fleet.checkpoint.get("e1", "app_id") == 77
+    # Pencere dışında onaylanan not başka bir gönderime aittir
+    assert fleet.checkpoint.get("e2", "app_id") is None
+    assert unsettled == {"e2"}
+    assert indexer.queries[0]["note_prefix"] == b"fleet:"
+    assert indexer.queries[0]["min_round"] == 1
+
+
+def test_reconcile_skips_pending_sends_without_indexer(tmp_path: Path) -> None:
+    fleet = _fleet(tmp_path, AlgorandClient.from_clients(algod=None))  # type: ignore[arg-type]
+    fleet.checkpoint.update({"e1": {"app_id": 5, "fund_window": [10, 1010]}})
+
+    unsettled = fleet.reconcile([EventSpec(key="e1", name="A", ticket_price=1, total_tickets=1)])
+
+    assert unsettled == {"e1"}
+    assert fleet.checkpoint.get("e1", "funded") is None
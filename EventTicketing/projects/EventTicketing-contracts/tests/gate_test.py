@@ -0,0 +1,76 @@
+from pathlib import Path
+
+import pytest
+from algosdk import account, encoding
+
+from smart_contracts.event_ticketing.gate import HolderIndex
+
+ASA = 1234
+APP, ALICE, BOB = (encoding.decode_address(account.generate_account()[1]) for _ in range(3))
+
+
+def _axfer(snd: bytes, arcv: bytes, amount: int, asset_id: int = ASA, **extra: object) -> dict:
+    txn = {"type": "axfer", "snd": snd, "arcv": arcv, "xaid": asset_id, **extra}
+    if amount:
+        txn["aamt"] = amount
+    return {"txn": txn}
+
+
+def _index() -> HolderIndex:
+    return HolderIndex(ASA, 10, {APP: 100}, exclude=[APP])
+
+
+def test_inner_transfer_from_buy_call_adds_holder() -> None:
+    index = _index()
+    app_call = {"txn": {"type": "appl", "snd": ALICE}, "dt": {"itx": [_axfer(APP, ALICE, 2)]}}
+
+    assert index.apply_block(11, {"txns": [app_call]}) == 1
+
+    assert index.round == 11
+    assert index.holds_key(ALICE)
+    assert index.holds(encoding.encode_address(ALICE))
+    assert not index.holds_key(APP)  # satılmamış biletler sahip sayılmaz
+    assert len(index) == 1
+
+
+def test_transfer_out_and_close_remove_holder() -> None:
+    index = HolderIndex(ASA, 10, {APP: 98, ALICE: 2}, exclude=[APP])
+
+    index.apply_block(11, {"txns": [_axfer(ALICE, BOB, 1)]})
+    assert index.holds_key(ALICE) and index.holds_key(BOB)
+
+    index.apply_block(12, {"txns": [{**_axfer(ALICE, ALICE, 0, aclose=BOB), "aca": 1}]})
+    assert not index.holds_key(ALICE)
+    assert index.balance(encoding.encode_address(BOB)) == 2
+
+
+def test_close_amount_is_read_from_apply_data() -> None:
+    # İndeks ALICE'in bakiyesini bilmiyor; kapanış miktarı yalnızca bloktaki "aca"dan gelir
+    index = _index()
+    close = {**_axfer(ALICE, ALICE, 0, aclose=BOB), "aca": 3, "dt": {"lg": []}}
+
+    index.apply_block(11, {"txns": [close]})
+
+    assert index.balance(encoding.encode_address(BOB)) == 3
+
+
+def test_other_assets_and_opt_ins_are_ignored() -> None:
+    index = _index()
+    block = {"txns": [_axfer(APP, ALICE, 5, asset_id=ASA + 1), _axfer(BOB, BOB, 0)]}
+
+    assert index.apply_block(11, block) == 0
+    assert len(index) == 0
+
+
+def test_snapshot_round_trip(tmp_path: Path) -> None:
+    index = HolderIndex(ASA, 42, {APP: 97, ALICE: 2, BOB: 1}, exclude=[APP])
+    path = tmp_path / "gate.snapshot"
+
+    index.save(path)
+    loaded = HolderIndex.load(path, exclude=[APP])
+
+    assert (loaded.asset_id, loaded.round, len(loaded)) == (ASA, 42, 2)
+    assert loaded.holds_key(ALICE) and loaded.holds_key(BOB)
+    path.write_bytes(b"bozuk")
+    with pytest.raises(ValueError):
+        HolderIndex.load(path)
@@ -0,0 +1,127 @@
+import base64
+import struct
+from types import SimpleNamespace
+from typing import Any
+
+from algosdk import account, encoding
+from algosdk.error import AlgodHTTPError
+
+from smart_contracts.event_ticketing.bulk_buy import BulkBuyer, Buyer
+from smart_contracts.event_ticketing.checkin import checkin_box_mbr, checkin_box_references
+from smart_contracts.event_ticketing.deploy_config import app_funding, mint_call_params
+from smart_contracts.event_ticketing.ledger import (
+    PURCHASE_BOX_MBR,
+    SCAN_THRESHOLD,
+    decode_purchase_record,
+    list_purchases,
+    purchase_box_name,
+    read_purchases,
+)
+
+
+class FakeAlgod:
+    """Sayfalı kutu listesi ve tek kutu okuması; istekleri sayar."""
+
+    def __init__(self, records: dict[str, int]) -> None:
+        self.boxes = {purchase_box_name(a): struct.pack(">QQQ", n, 1, 2) for a, n in records.items()}
+        self.listings = 0
+        self.reads = 0
+
+    def algod_request(self, method: str, path: str, params: dict[str, Any]) -> dict[str, Any]:
+        self.listings += 1
+        names = sorted(self.boxes)
+        start = int(params.get("next", 0))
+        page = names[start : start + int(params["max"])]
+        response: dict[str, Any] = {
+            "boxes": [
+                {"name": base64.b64encode(n).decode(), "value": base64.b64encode(self.boxes[n]).decode()}
+                for n in page
+            ]
+        }
+        if start + len(page) < len(names):
+            response["next-token"] = str(start + len(page))
+        return response
+
+    def application_box_by_name(self, app_id: int, name: bytes) -> dict[str, Any]:
+        self.reads += 1
+        if name not in self.boxes:
+            raise AlgodHTTPError("box not found", code=404)
+        return {"value": base64.b64encode(self.boxes[name]).decode()}
+
+
+def _client(algod: FakeAlgod) -> Any:  # noqa: ANN401
+    return SimpleNamespace(app_id=1001, algorand=SimpleNamespace(client=SimpleNamespace(algod=algod)))
+
+
+def test_purchase_box_name_is_prefix_plus_public_key() -> None:
+    _, address = account.generate_account()
+
+    name = purchase_box_name(address)
+
+    assert name == b"p" + encoding.decode_address(address)
+    assert len(name) == 33
+
+
+def test_decode_purchase_record() -> None:
+    record = decode_purchase_record(struct.pack(">QQQ", 4, 10, 12))
+
+    assert (record.count, record.first_round, record.last_round) == (4, 10, 12)
+
+
+def test_purchase_box_mbr() -> None:
+    # 2500 + 400 * (33 bayt ad + 24 bayt değer)
+    assert PURCHASE_BOX_MBR == 25_300
+
+
+def test_app_funding_reserves_box_mbr_only_for_cheap_tickets() -> None:
+    base = 200_000 + checkin_box_mbr(100)
+
+    # Alımın ödemesi kendi kutusunun MBR'sini karşılar
+    assert app_funding(100, 1_000_000).micro_algo == base
+    assert app_funding(100, 1_000).micro_algo == base + 100 * (PURCHASE_BOX_MBR - 1_000)
+
+
+def test_mint_fee_follows_suggested_min_fee() -> None:
+    algo: Any = SimpleNamespace(get_suggested_params=lambda: SimpleNamespace(min_fee=2_000))
+
+    params = mint_call_params(algo, 100)
+
+    assert params.extra_fee is not None
+    assert params.extra_fee.micro_algo == 2_000
+    assert params.box_references == checkin_box_references(100)
+
+
+def test_list_purchases_pages_through_all_boxes() -> None:
+    buyers = {account.generate_account()[1]: n for n in range(1, 4)}
+    algod = FakeAlgod(buyers)
+
+    records = list_purchases(_client(algod), page_size=2)
+
+    assert {a: r.count for a, r in records.items()} == buyers
+    assert algod.listings == 2
+
+
+def test_read_purchases_without_scan_reads_only_wanted_boxes() -> None:
+    addresses = [account.generate_account()[1] for _ in range(SCAN_THRESHOLD)]
+    algod = FakeAlgod({addresses[0]: 3})
+
+    records = read_purchases(_client(algod), addresses, scan=False)
+
+    assert records[addresses[0]].count == 3
+    assert records[addresses[1]] is None
+    assert (algod.listings, algod.reads) == (0, SCAN_THRESHOLD)
+
+
+def test_bulk_buyer_lists_purchase_boxes_once_per_run() -> None:
+    addresses = [account.generate_account()[1] for _ in range(SCAN_THRESHOLD * 3)]
+    algod = FakeAlgod({addresses[0]: 2})
+    bulk = BulkBuyer(_client(algod), max_in_flight=SCAN_THRESHOLD // 8)
+    bulk._limit = 2
+    skipped: list = []
+
+    admitted = list(bulk._admit((Buyer(a, signer=None) for a in addresses), skipped))  # type: ignore[arg-type]
+
+    # Her pencere SCAN_THRESHOLD alıcı; kutular yalnızca ilk pencerede listelenir
+    assert (algod.listings, algod.reads) == (1, 0)
+    assert [r.buyer.address for r in skipped] == [addresses[0]]
+    assert len(admitted) == len(addresses) - 1
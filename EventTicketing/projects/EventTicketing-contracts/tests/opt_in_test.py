@@ -0,0 +1,134 @@
+import base64
+import math
+
+import pytest
+from algokit_utils import AlgorandClient
+from algosdk import account
+from algosdk.atomic_transaction_composer import AccountTransactionSigner
+from algosdk.error import AlgodHTTPError
+from algosdk.transaction import ApplicationCallTxn, AssetTransferTxn, PaymentTxn, SuggestedParams
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.artifacts.event_ticketing.event_ticketing_client import EventTicketingClient, SaleParams
+from smart_contracts.event_ticketing.bulk_buy import Buyer
+from smart_contracts.event_ticketing.opt_in import OptInCache, compose_purchase, sale_params_of
+
+ASA_ID = 77
+SALE = SaleParams(ticket_price=1_000, total_tickets=100, ticket_asa_id=ASA_ID, max_per_address=0)
+
+
+class FakeAlgod(AlgodClient):
+    """Yalnızca `opted_in` adresleri için hesap-varlık kaydı döndürür"""
+
+    def __init__(self, opted_in: set[str]) -> None:
+        super().__init__("a" * 64, "http://127.0.0.1:1")
+        self.opted_in = opted_in
+        self.lookups = 0
+
+    def account_asset_info(self, address: str, asset_id: int, **kwargs: object) -> dict:
+        self.lookups += 1
+        if address not in self.opted_in:
+            raise AlgodHTTPError("account asset info not found", 404)
+        return {"asset-holding": {"asset-id": asset_id, "amount": 0}}
+
+
+class FakeAppAlgod(AlgodClient):
+    """Paketli SaleParams global değerini döndürür; application_info çağrılarını sayar"""
+
+    def __init__(self, asa_id: int) -> None:
+        super().__init__("a" * 64, "http://127.0.0.1:1")
+        self.asa_id = asa_id
+        self.app_reads = 0
+
+    def application_info(self, application_id: int, **kwargs: object) -> dict:
+        self.app_reads += 1
+        packed = b"".join(v.to_bytes(8, "big") for v in (1_000, 100, self.asa_id, 0))
+        value = {"type": 1, "bytes": base64.b64encode(packed).decode(), "uint": 0}
+        schema = {"num-uint": 0, "num-byte-slice": 0}
+        return {
+            "id": application_id,
+            "params": {
+                "approval-program": "",
+                "clear-state-program": "",
+                "creator": "",
+                "local-state-schema": schema,
+                "global-state-schema": schema,
+                "global-state": [{"key": base64.b64encode(b"params").decode(), "value": value}],
+            },
+        }
+
+
+def _buyer(count: int = 1) -> Buyer:
+    key, address = account.generate_account()
+    return Buyer(address=address, signer=AccountTransactionSigner(key), count=count)
+
+
+def test_repeat_buyers_skip_the_lookup() -> None:
+    returning, new = _buyer(), _buyer()
+    algod = FakeAlgod({returning.address})
+    cache = OptInCache()
+
+    assert cache.is_opted_in(algod, returning.address, ASA_ID)
+    assert not cache.is_opted_in(algod, new.address, ASA_ID)
+    for _ in range(5):
+        assert cache.is_opted_in(algod, returning.address, ASA_ID)
+
+    assert algod.lookups == 2
+    assert (cache.stats.hits, cache.stats.lookups) == (5, 2)
+
+
+def test_bundled_opt_in_is_remembered_and_forgotten() -> None:
+    buyer = _buyer()
+    algod = FakeAlgod(set())
+    cache = OptInCache()
+
+    cache.mark(buyer.address, ASA_ID, bundled=True)
+    assert cache.is_opted_in(algod, buyer.address, ASA_ID)
+    cache.forget(buyer.address, ASA_ID)
+    assert not cache.is_opted_in(algod, buyer.address, ASA_ID)
+    assert (cache.stats.bundled, algod.lookups) == (1, 1)
+
+
+def test_lru_limit() -> None:
+    cache = OptInCache(max_entries=2)
+    for address in "ABC":
+        cache.mark(address, ASA_ID)
+    assert len(cache) == 2
+    assert not cache.is_opted_in(FakeAlgod(set()), "A", ASA_ID)
+
+
+@pytest.mark.parametrize(("opt_in", "count"), [(True, 1), (False, 1), (True, 3)])
+def test_compose_prepends_opt_in_to_the_same_group(opt_in: bool, count: int) -> None:  # noqa: FBT001
+    algorand = AlgorandClient.from_clients(AlgodClient("a" * 64, "http://127.0.0.1:1"))
+    sp = SuggestedParams(0, 100, 1_100, base64.b64encode(bytes(32)).decode(), min_fee=1_000, flat_fee=False)
+    algorand.set_suggested_params_cache(sp, until=math.inf)
+    client = EventTicketingClient(app_id=1_234, algorand=algorand)
+    buyer = _buyer(count)
+
+    built = compose_purchase(client, buyer, SALE, opt_in=opt_in).composer().build()
+    txns = [t.txn for t in built.transactions]
+
+    expected = [PaymentTxn, ApplicationCallTxn]
+    if opt_in:
+        expected.insert(0, AssetTransferTxn)
+        opt_in_txn = txns[0]
+        assert isinstance(opt_in_txn, AssetTransferTxn)
+        assert (opt_in_txn.index, opt_in_txn.receiver, opt_in_txn.amount) == (ASA_ID, buyer.address, 0)
+    assert [type(t) for t in txns] == expected
+    assert {t.sender for t in txns} == {buyer.address}
+    assert len({t.group for t in txns}) == 1
+    assert txns[-2].amt == SALE.ticket_price * count
+    assert txns[-1].foreign_assets == [ASA_ID]
+
+
+def test_sale_params_are_read_once_per_client_after_mint() -> None:
+    algod = FakeAppAlgod(asa_id=0)
+    client = EventTicketingClient(app_id=1_234, algorand=AlgorandClient.from_clients(algod))
+
+    # Basımdan önce önbelleğe alınmaz
+    assert sale_params_of(client).ticket_asa_id == 0
+    algod.asa_id = ASA_ID
+    for _ in range(3):
+        assert sale_params_of(client) == SALE
+
+    assert algod.app_reads == 2
@@ -0,0 +1,46 @@
+from pathlib import Path
+
+from benchmarks.profiler import LineProfile, ProgramMap
+
+
+def _first_pc(program: ProgramMap, subroutine: str) -> int:
+    return next(pc for pc, name in program.subroutines if name == subroutine)
+
+
+def _routing_pcs(program: ProgramMap) -> tuple[int, int]:
+    # ARC-4 yönlendirmesinin kaynak satırına eşlenen ilk iki opcode'u
+    start = _first_pc(program, "approval_program")
+    first, second = sorted(pc for pc in program.pc_to_line if pc >= start)[:2]
+    return first, second
+
+
+def test_program_map_resolves_lines_and_subroutines() -> None:
+    program = ProgramMap.load()
+    first, second = _routing_pcs(program)
+    buy_ticket = _first_pc(program, "buy_ticket[routing]")
+
+    assert program.source.name == "contract.py"
+    # intcblock/bytecblock kaynak satırına eşlenmez
+    assert _first_pc(program, "approval_program") not in program.pc_to_line
+    # ARC-4 yönlendirmesinin ilk opcode'ları aynı satıra (sınıf tanımı) eşlenir
+    assert program.pc_to_line[first] == program.pc_to_line[second]
+    assert program.source_text(program.pc_to_line[first]).startswith("class EventTicketing(")
+    assert program.subroutine_of(first) == "approval_program"
+    assert program.subroutine_of(buy_ticket) == "buy_ticket[routing]"
+    assert program.subroutine_of(buy_ticket - 1) != "buy_ticket[routing]"
+
+
+def test_line_profile_counts_ops_and_writes_collapsed_stacks(tmp_path: Path) -> None:
+    program = ProgramMap.load()
+    profile = LineProfile(program)
+    first, second = _routing_pcs(program)
+
+    profile.add_trace("buy_ticket", [first, second, _first_pc(program, "buy_ticket[routing]")])
+
+    assert profile.total_ops == 3
+    assert profile.ops_by_line[program.pc_to_line[first]] >= 2
+    out = tmp_path / "profile.folded"
+    profile.write_collapsed(out)
+    lines = out.read_text(encoding="utf-8").splitlines()
+    assert f"buy_ticket;approval_program;contract.py:{program.pc_to_line[first]} 2" in lines
+    assert any(line.startswith("buy_ticket;buy_ticket[routing];contract.py:") for line in lines)
@@ -0,0 +1,23 @@
+from algosdk import account
+
+from smart_contracts.event_registry.registry import EVENT_INFO_TYPE, decode_event, event_box_name, event_deposit
+
+
+def test_event_box_name_is_prefix_plus_big_endian_id() -> None:
+    assert event_box_name(1) == b"e" + bytes(7) + b"\x01"
+    assert event_box_name(258) == b"e" + bytes(6) + b"\x01\x02"
+
+
+def test_decode_event() -> None:
+    _, organizer = account.generate_account()
+
+    info = decode_event(EVENT_INFO_TYPE.encode([organizer, 10, 100, 7, 1234, "Konser"]))
+
+    assert info.organizer == organizer
+    assert (info.ticket_price, info.total_tickets, info.tickets_sold, info.ticket_asa_id) == (10, 100, 7, 1234)
+    assert info.event_name == "Konser"
+
+
+def test_event_deposit_covers_box_and_asset() -> None:
+    # 2500 + 400 * (9 bayt ad + 68 + 6 bayt "Konser") + 100_000 ASA MBR
+    assert event_deposit("Konser").micro_algo == 135_700
@@ -0,0 +1,99 @@
+from pathlib import Path
+
+import pytest
+from algosdk import account, encoding
+
+from smart_contracts.event_ticketing.sales_db import BuyerTotal, SalesIndex, _transfers
+from smart_contracts.event_ticketing.stream import SaleCursor, SaleEvent
+
+APP_ID = 1001
+ALICE = "A" * 58
+BOB = "B" * 58
+ASA_ID = 2002
+
+
+def _sale(round_: int, index: int, buyer: str, count: int = 1, app_id: int = APP_ID) -> SaleEvent:
+    return SaleEvent(
+        app_id=app_id,
+        buyer=buyer,
+        count=count,
+        amount=count * 1_000,
+        round=round_,
+        timestamp=round_ * 10,
+        txid=f"TX{round_}-{index}",
+        cursor=SaleCursor(round_, index),
+    )
+
+
+@pytest.fixture()
+def db(tmp_path: Path) -> SalesIndex:
+    index = SalesIndex(tmp_path / "sales.db")
+    index.insert_sales(
+        [_sale(1, 0, ALICE), _sale(1, 1, BOB, 3), _sale(9, 0, ALICE, 2), _sale(9, 1, BOB, app_id=APP_ID + 1)],
+        checkpoint=9,
+    )
+    return index
+
+
+def test_uses_wal(db: SalesIndex) -> None:
+    assert db._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_reports(db: SalesIndex) -> None:
+    summary = db.summary(APP_ID)
+
+    assert (summary.tickets, summary.revenue, summary.buyers) == (6, 6_000, 2)
+    assert (summary.first_round, summary.last_round) == (1, 9)
+    assert db.sales_per_minute(APP_ID) == [(0, 4), (60, 2)]
+    assert db.top_buyers(APP_ID, limit=1) == [BuyerTotal(buyer=ALICE, tickets=3, spent=3_000)]
+    assert db.revenue(APP_ID, from_round=5) == 2_000
+    assert db.purchases_of(BOB) == [(APP_ID, 1, 3), (APP_ID + 1, 9, 1)]
+
+
+def test_checkpoint_survives_reopen_and_reinsert_is_idempotent(db: SalesIndex, tmp_path: Path) -> None:
+    db.close()
+
+    reopened = SalesIndex(tmp_path / "sales.db")
+    reopened.insert_sales([_sale(1, 0, ALICE)])
+
+    assert reopened.checkpoint == 9
+    assert reopened.summary(APP_ID).tickets == 6
+
+
+def test_first_ingest_needs_start_round(tmp_path: Path) -> None:
+    with SalesIndex(tmp_path / "empty.db") as db, pytest.raises(ValueError):
+        db.ingest(None, {APP_ID})
+
+
+def test_transfers_read_close_amounts_from_block_apply_data() -> None:
+    app_address, alice_address, bob_address = (account.generate_account()[1] for _ in range(3))
+    app, alice, bob = (encoding.decode_address(a) for a in (app_address, alice_address, bob_address))
+    # algod bloğundaki SignedTxnInBlock düzeni: ApplyData ("aca") işlemle aynı düzeyde, "dt" EvalDelta
+    block = {
+        "txns": [
+            {
+                "txn": {"type": "appl", "snd": alice, "apid": APP_ID},
+                "sig": b"\x00" * 64,
+                "hgi": True,
+                "dt": {
+                    "lg": [],
+                    "itx": [
+                        {"txn": {"type": "axfer", "snd": app, "arcv": alice, "xaid": ASA_ID, "aamt": 2}},
+                        {"txn": {"type": "axfer", "snd": app, "xaid": ASA_ID, "aclose": bob}, "aca": 5},
+                    ],
+                },
+            },
+            {
+                "txn": {"type": "axfer", "snd": alice, "arcv": alice, "xaid": ASA_ID, "aclose": bob},
+                "sig": b"\x00" * 64,
+                "hgi": True,
+                "aca": 2,
+            },
+        ]
+    }
+
+    assert list(_transfers(7, block, {ASA_ID})) == [
+        (ASA_ID, 7, app_address, alice_address, 2),
+        (ASA_ID, 7, app_address, bob_address, 5),
+        (ASA_ID, 7, alice_address, bob_address, 2),
+    ]
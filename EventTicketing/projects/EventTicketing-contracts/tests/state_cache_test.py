@@ -0,0 +1,82 @@
+import types
+import typing
+
+import algokit_utils
+import pytest
+
+from smart_contracts.artifacts.event_ticketing.event_ticketing_client import GlobalStateValue, SaleParams
+from smart_contracts.event_ticketing.state_cache import CachedGlobalState, GlobalStateCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _state(sold: int) -> GlobalStateValue:
+    return typing.cast(
+        GlobalStateValue,
+        {"sale_params": SaleParams(10, 100, 1, 0), "tickets_sold": sold, "event_name": "Konser"},
+    )
+
+
+@pytest.fixture()
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+def test_hit_within_ttl_and_miss_after_expiry(clock: FakeClock) -> None:
+    cache = GlobalStateCache(ttl=3.0, clock=clock)
+    assert cache.get(1) is None
+
+    cache.put(1, _state(5))
+    clock.now = 2.9
+    assert cache.get(1) == _state(5)
+
+    clock.now = 3.0
+    assert cache.get(1) is None
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+
+
+def test_newer_round_invalidates_entry(clock: FakeClock) -> None:
+    cache = GlobalStateCache(clock=clock)
+    cache.put(1, _state(5), round=10)
+
+    cache.observe_round(1, 10)
+    assert cache.get(1) == _state(5)
+
+    cache.observe_round(1, 11)
+    assert cache.get(1) is None
+    assert cache.stats.invalidations == 1
+
+
+def test_put_after_write_is_not_treated_as_stale(clock: FakeClock) -> None:
+    cache = GlobalStateCache(clock=clock)
+    cache.observe_round(1, 20)
+    cache.put(1, _state(6))
+    assert cache.get(1) == _state(6)
+
+
+def test_lru_bound_evicts_least_recently_used(clock: FakeClock) -> None:
+    cache = GlobalStateCache(max_apps=2, clock=clock)
+    cache.put(1, _state(1))
+    cache.put(2, _state(2))
+    cache.get(1)
+    cache.put(3, _state(3))
+
+    assert cache.get(2) is None
+    assert cache.get(1) == _state(1)
+    assert cache.get(3) == _state(3)
+    assert cache.stats.evictions == 1
+
+
+def test_single_field_reads_decode_sale_params(clock: FakeClock) -> None:
+    cache = GlobalStateCache(clock=clock)
+    cache.put(1, _state(5))
+    state = CachedGlobalState(typing.cast(algokit_utils.AppClient, types.SimpleNamespace(app_id=1)), cache)
+
+    assert (state.ticket_price, state.total_tickets, state.ticket_asa_id) == (10, 100, 1)
+    assert cache.stats.misses == 0
@@ -0,0 +1,135 @@
+import asyncio
+import base64
+import threading
+from collections.abc import Iterator
+
+import msgpack
+from algosdk import abi, account, encoding, transaction
+
+from smart_contracts.event_ticketing.events import TICKET_SOLD_SELECTOR
+from smart_contracts.event_ticketing.stream import (
+    BUY_TICKET_SELECTOR,
+    BUY_TICKETS_SELECTOR,
+    SaleCursor,
+    _prefetched,
+    afollow_sales,
+    follow_sales,
+)
+
+APP_ID = 1001
+GENESIS_HASH = bytes(range(32))
+SP = transaction.SuggestedParams(
+    fee=1_000, first=1, last=1_000, gh=base64.b64encode(GENESIS_HASH).decode(), gen="test-v1", flat_fee=True
+)
+BUYER = account.generate_account()[1]
+APP_ADDRESS = account.generate_account()[1]
+
+
+class FakeAlgod:
+    """Yalnızca status / status_after_block / block_info sunan yerel algod taklidi"""
+
+    def __init__(self, blocks: dict[int, list[transaction.Transaction]]) -> None:
+        self.blocks = {r: _pack_block(txns) for r, txns in blocks.items()}
+        self.reads: list[int] = []
+
+    def status(self) -> dict:
+        return {"last-round": max(self.blocks)}
+
+    def status_after_block(self, round_num: int) -> dict:
+        raise AssertionError("until_round aşıldı")
+
+    def block_info(self, block: int, response_format: str = "json") -> bytes:
+        assert response_format == "msgpack"
+        self.reads.append(block)
+        return self.blocks.get(block, _pack_block([]))
+
+
+def _pack_block(txns: list[transaction.Transaction], logs: dict[int, list[bytes]] | None = None) -> bytes:
+    stxns = []
+    for i, txn in enumerate(txns):
+        # algod gibi kanonik kodlama: sıfır değerli alanlar yok
+        fields = msgpack.unpackb(base64.b64decode(encoding.msgpack_encode(txn)), raw=False)
+        del fields["gh"], fields["gen"]
+        stxn: dict = {"hgi": True, "txn": fields}
+        if logs and i in logs:
+            stxn["dt"] = {"lg": logs[i]}
+        stxns.append(stxn)
+    block = {"gh": GENESIS_HASH, "gen": "test-v1", "txns": stxns}
+    return msgpack.packb({"block": block}, use_bin_type=True)
+
+
+def _buy(count: int, app_id: int = APP_ID) -> list[transaction.Transaction]:
+    payment = transaction.PaymentTxn(BUYER, SP, APP_ADDRESS, 1_000 * count)
+    args = [BUY_TICKET_SELECTOR] if count == 1 else [BUY_TICKETS_SELECTOR, count.to_bytes(8, "big")]
+    call = transaction.ApplicationCallTxn(BUYER, SP, app_id, transaction.OnComplete.NoOpOC, app_args=args)
+    return transaction.assign_group_id([payment, call])
+
+
+def test_decodes_single_and_batch_purchases() -> None:
+    single, batch, other_app = _buy(1), _buy(3), _buy(1, app_id=APP_ID + 1)
+    algod = FakeAlgod({5: single + other_app, 6: batch})
+
+    sales = list(follow_sales(algod, {APP_ID}, after=SaleCursor.start(5), until_round=6))
+
+    assert [(s.round, s.count, s.amount) for s in sales] == [(5, 1, 1_000), (6, 3, 3_000)]
+    assert sales[0].buyer == BUYER
+    assert sales[0].txid == single[1].get_txid()
+    assert sales[1].cursor == SaleCursor(6, 1)
+
+
+def test_resumes_after_cursor_within_round() -> None:
+    algod = FakeAlgod({7: _buy(1) + _buy(2) + _buy(4)})
+
+    first = next(follow_sales(algod, {APP_ID}, after=SaleCursor.start(7), until_round=7, prefetch=0))
+    resumed = follow_sales(algod, {APP_ID}, after=SaleCursor.parse(str(first.cursor)), until_round=7)
+
+    assert [s.count for s in resumed] == [2, 4]
+
+
+def test_prefers_ticket_sold_log() -> None:
+    sold = TICKET_SOLD_SELECTOR + abi.ABIType.from_string("(address,uint64,uint64)").encode([BUYER, 1, 7])
+    algod = FakeAlgod({})
+    algod.blocks[9] = _pack_block(_buy(1), logs={1: [sold]})
+
+    (sale,) = follow_sales(algod, {APP_ID}, after=SaleCursor.start(9), until_round=9)
+
+    assert (sale.count, sale.sold_after) == (1, 7)
+
+
+def test_prefetch_is_bounded() -> None:
+    algod = FakeAlgod({r: _buy(1) for r in range(1, 101)})
+
+    sales = follow_sales(algod, {APP_ID}, after=SaleCursor.start(1), until_round=100, prefetch=2)
+    next(sales)
+    sales.close()
+
+    # Tüketilen 1 blok + kuyrukta 2 + üreticinin elindeki 1
+    assert len(algod.reads) <= 4
+
+
+def test_prefetch_closes_source_and_joins_thread() -> None:
+    closed = threading.Event()
+
+    def source() -> Iterator[int]:
+        try:
+            yield from range(100)
+        finally:
+            closed.set()
+
+    items = _prefetched(source(), depth=1)
+    assert next(items) == 0
+    items.close()
+
+    # Kaynak üreteç kapatıldı ve ön okuma iş parçacığı beklendi
+    assert closed.is_set()
+    assert not any(t.name == "sales-prefetch" for t in threading.enumerate())
+
+
+def test_async_iterator() -> None:
+    algod = FakeAlgod({3: _buy(2)})
+
+    async def collect() -> list[int]:
+        sales = afollow_sales(algod, {APP_ID}, after=SaleCursor.start(3), until_round=3)
+        return [s.count async for s in sales]
+
+    assert asyncio.run(collect()) == [2]
@@ -0,0 +1,96 @@
+import base64
+import threading
+import time
+
+import pytest
+from algokit_utils import AlgorandClient
+from algosdk.transaction import SuggestedParams
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.event_ticketing.suggested_params import SuggestedParamsProvider, enable_params_cache
+
+
+class FakeAlgod(AlgodClient):
+    """suggested_params çağrılarını sayan, round'u elle ilerletilen algod taklidi"""
+
+    def __init__(self) -> None:
+        super().__init__("a" * 64, "http://localhost:4001")
+        self.round = 100
+        self.fetches = 0
+        self.new_round = threading.Event()
+
+    def suggested_params(self, **kwargs: object) -> SuggestedParams:
+        self.fetches += 1
+        return SuggestedParams(0, self.round, self.round + 1_000, base64.b64encode(bytes(32)).decode(), min_fee=1_000)
+
+    def status_after_block(self, block_num: int, **kwargs: object) -> dict:
+        self.new_round.wait(timeout=0.05)
+        self.new_round.clear()
+        return {"last-round": self.round}
+
+
+def test_serves_cached_params_within_ttl() -> None:
+    algod = FakeAlgod()
+    provider = SuggestedParamsProvider(algod, ttl=60, validity_window=10)
+
+    params = [provider.get() for _ in range(50)]
+
+    assert algod.fetches == 1
+    assert provider.stats.saved == 49
+    assert {(sp.first, sp.last) for sp in params} == {(100, 110)}
+    # Her çağıran kendi kopyasını alır
+    params[0].fee = 5_000
+    assert provider.get().fee == 0
+
+
+def test_refetches_after_ttl() -> None:
+    algod = FakeAlgod()
+    provider = SuggestedParamsProvider(algod, ttl=0.01)
+
+    provider.get()
+    algod.round = 101
+    time.sleep(0.02)
+
+    assert provider.get().first == 101
+    assert algod.fetches == 2
+
+
+def test_background_refresh_follows_rounds() -> None:
+    algod = FakeAlgod()
+    with SuggestedParamsProvider(algod, ttl=0) as provider:
+        algod.round = 101
+        algod.new_round.set()
+        deadline = time.monotonic() + 2
+        while provider.get().first != 101 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert provider.get().first == 101
+
+
+def test_rejects_window_beyond_max_txn_life() -> None:
+    with pytest.raises(ValueError):
+        SuggestedParamsProvider(FakeAlgod(), validity_window=1_001)
+
+
+def test_enable_routes_algorand_client_through_provider() -> None:
+    algod = FakeAlgod()
+    algorand = AlgorandClient.from_clients(algod)
+
+    provider = enable_params_cache(algorand, ttl=60)
+    algorand.get_suggested_params()
+    algorand.get_suggested_params()
+
+    assert provider.stats.served == 2
+    assert algod.fetches == 1
+
+
+def test_enable_shares_one_provider_across_clients() -> None:
+    algod = FakeAlgod()
+    provider = enable_params_cache(AlgorandClient.from_clients(algod), ttl=60)
+    second = AlgorandClient.from_clients(FakeAlgod())
+
+    assert enable_params_cache(second, provider) is provider
+    second.get_suggested_params()
+
+    assert provider.stats.served == 1
+    assert algod.fetches == 1
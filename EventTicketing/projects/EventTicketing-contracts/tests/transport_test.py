@@ -0,0 +1,121 @@
+import json
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import ClassVar
+
+import pytest
+from algokit_utils import AlgorandClient
+from algosdk.error import AlgodHTTPError
+
+from smart_contracts.event_ticketing.transport import AlgodTransport, PooledAlgodClient, endpoint_of, pooled
+
+PARAMS = {
+    "fee": 0,
+    "min-fee": 1_000,
+    "last-round": 5,
+    "genesis-hash": "A" * 43 + "=",
+    "genesis-id": "test-v1",
+    "consensus-version": "future",
+}
+
+
+class FakeAlgod(BaseHTTPRequestHandler):
+    """Keep-alive (HTTP/1.1) yanıt veren, istekleri sayan yerel algod taklidi"""
+
+    protocol_version = "HTTP/1.1"
+    paths: ClassVar[list[str]] = []
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+
+    def handle_get(self) -> None:
+        cls = type(self)
+        with cls.lock:
+            cls.paths.append(self.path)
+            cls.active += 1
+            cls.max_active = max(cls.max_active, cls.active)
+        time.sleep(0.05)
+        with cls.lock:
+            cls.active -= 1
+        if self.path.startswith("/v2/transactions/params"):
+            self._reply(200, PARAMS)
+        elif self.path.startswith("/v2/status"):
+            self._reply(200, {"last-round": 5})
+        else:
+            self._reply(404, {"message": "bulunamadı"})
+
+    # BaseHTTPRequestHandler GET isteklerini do_GET adıyla çağırır
+    do_GET = handle_get  # noqa: N815
+
+    def _reply(self, status: int, body: dict) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture()
+def address() -> Iterator[str]:
+    FakeAlgod.paths, FakeAlgod.max_active = [], 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeAlgod)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_identical_gets_are_coalesced_over_reused_connections(address: str) -> None:
+    with AlgodTransport(max_connections=4) as transport:
+        algod = PooledAlgodClient("a" * 64, address, transport=transport)
+        with ThreadPoolExecutor(16) as pool:
+            results = list(pool.map(lambda _: algod.suggested_params(), range(64)))
+        for _ in range(10):
+            algod.status()
+        metrics = transport.metrics
+
+    assert all(sp.min_fee == 1_000 for sp in results)
+    assert metrics.requests + metrics.coalesced == 74
+    assert metrics.requests == len(FakeAlgod.paths) < 74
+    assert metrics.connections_opened <= 4
+    assert metrics.reuse_ratio > 0.5
+
+
+def test_endpoint_limit_caps_concurrency(address: str) -> None:
+    limits = {"/v2/status/wait-for-block-after/*": 2}
+    with AlgodTransport(endpoint_limits=limits, coalesce_gets=False) as transport:
+        algod = PooledAlgodClient("a" * 64, address, transport=transport)
+        with ThreadPoolExecutor(8) as pool:
+            list(pool.map(algod.status_after_block, range(8)))
+
+    assert FakeAlgod.max_active == 2
+
+
+def test_errors_match_algod_client(address: str) -> None:
+    with AlgodTransport() as transport:
+        algod = PooledAlgodClient("a" * 64, address, transport=transport)
+        with pytest.raises(AlgodHTTPError) as e:
+            algod.application_info(1)
+
+    assert e.value.code == 404
+    assert str(e.value) == "bulunamadı"
+
+
+def test_pooled_clients_share_one_transport(address: str) -> None:
+    base = AlgorandClient.from_clients(PooledAlgodClient("a" * 64, address))
+    with AlgodTransport() as transport:
+        first, second = pooled(base, transport), pooled(base, transport)
+
+        assert first.client.algod.transport is second.client.algod.transport is transport
+        assert first.client.algod.algod_address == address
+
+
+def test_endpoint_of_masks_ids() -> None:
+    assert endpoint_of("/v2/accounts/" + "A" * 58 + "/assets/5?format=json") == "/v2/accounts/*/assets/*"
+    assert endpoint_of("/v2/transactions/params") == "/v2/transactions/params"